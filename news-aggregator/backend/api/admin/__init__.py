@@ -3,7 +3,7 @@
 This package contains admin endpoints split by concern:
 - items: Item deletion, reanalysis, classification
 - health: System health checks
-- stats: Database and system statistics
+- stats: Database, system and outbound HTTP client statistics
 - logs: Application log viewing
 - workers: Scheduler and worker control
 - housekeeping: Data retention and cleanup
@@ -45,6 +45,7 @@ class HealthCheckResponse(BaseModel):
     database_info: DatabaseInfo
     items_count: int
     sources_count: int
+    browser_pool: dict = {}
 
 
 @router.get("/admin/health", response_model=HealthCheckResponse)
@@ -55,6 +56,7 @@ async def get_system_health(
 
     Combines scheduler, LLM, proxy, and database status in one call.
     """
+    from services.browser_pool import browser_pool
     from services.scheduler import scheduler, get_job_status
     from services.proxy_manager import proxy_manager
     from services.llm.ollama import OllamaProvider
@@ -65,6 +67,11 @@ async def get_system_health(
     sched_stats = await read_stats("scheduler")
     scheduler_running = sched_state.get("running", False) or scheduler.running
     scheduler_jobs = get_job_status() if scheduler.running else sched_stats.get("jobs", [])
+    # Browsers run on the leader: launch times and memory, live or as synced
+    browser_pool_status = (
+        await browser_pool.health_check() if scheduler.running
+        else sched_stats.get("browser_pool", {})
+    )
 
     # LLM status
     llm_available = False
@@ -128,4 +135,5 @@ async def get_system_health(
         database_info=DatabaseInfo(**db_info),
         items_count=items_count,
         sources_count=sources_count,
+        browser_pool=browser_pool_status,
     )
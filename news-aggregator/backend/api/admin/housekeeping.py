@@ -1,15 +1,22 @@
 """Admin endpoints for housekeeping and data management."""
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
-from sqlalchemy import delete, select, func, and_
+from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db
-from models import Item, Priority, Setting
+from models import Item, Setting
+from services.retention import (
+    RETENTION_KEYS,
+    count_expired,
+    get_purge_status,
+    purge_items,
+    retention_conditions,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -127,79 +134,37 @@ async def save_housekeeping_config(db: AsyncSession, config: HousekeepingConfig)
 async def get_items_to_delete(
     db: AsyncSession,
     config: dict,
-    execute: bool = False,
-) -> tuple[int, dict[str, int], str | None, list[int]]:
-    """Get or delete items based on retention config.
+) -> tuple[int, dict[str, int], str | None]:
+    """Count items past their retention period.
+
+    Deleting is done by services.retention.purge_items() in batches.
 
     Args:
         db: Database session
         config: Housekeeping configuration
-        execute: If True, delete the items; if False, just count them
 
     Returns:
-        Tuple of (total_count, by_priority_counts, oldest_date, deleted_ids)
-        deleted_ids is only populated when execute=True
+        Tuple of (total_count, by_priority_counts, oldest_date)
     """
     now = datetime.utcnow()
     by_priority: dict[str, int] = {}
     total = 0
     oldest_date: datetime | None = None
-    all_deleted_ids: list[int] = []
-
-    exclude_starred = config.get("exclude_starred", True)
-
-    # Process each priority level
-    for priority, days_key in [
-        (Priority.HIGH, "retention_days_high"),
-        (Priority.MEDIUM, "retention_days_medium"),
-        (Priority.LOW, "retention_days_low"),
-        (Priority.NONE, "retention_days_none"),
-    ]:
-        retention_days = config.get(days_key, 30)
-        cutoff = now - timedelta(days=retention_days)
-
-        # Build the where clause
-        conditions = [
-            Item.priority == priority,
-            Item.fetched_at < cutoff,
-        ]
-        if exclude_starred:
-            conditions.append(Item.is_starred == False)  # noqa: E712
-
-        if execute:
-            # First, collect the IDs to delete (needed for vector index cleanup)
-            id_stmt = select(Item.id).where(and_(*conditions))
-            result = await db.execute(id_stmt)
-            ids_to_delete = [row[0] for row in result.fetchall()]
-
-            if ids_to_delete:
-                # Delete items
-                stmt = delete(Item).where(Item.id.in_(ids_to_delete))
-                await db.execute(stmt)
-                count = len(ids_to_delete)
-                all_deleted_ids.extend(ids_to_delete)
-            else:
-                count = 0
-        else:
-            # Count items
-            count_stmt = select(func.count(Item.id)).where(and_(*conditions))
-            count = await db.scalar(count_stmt) or 0
 
-            # Get oldest date for this priority
-            if count > 0:
-                oldest_stmt = (
-                    select(func.min(Item.fetched_at))
-                    .where(and_(*conditions))
-                )
-                priority_oldest = await db.scalar(oldest_stmt)
-                if priority_oldest and (oldest_date is None or priority_oldest < oldest_date):
-                    oldest_date = priority_oldest
+    for priority, _ in RETENTION_KEYS:
+        conditions = retention_conditions(priority, config, now)
+        count = await count_expired(db, conditions)
 
         if count > 0:
             by_priority[priority.value] = count
             total += count
 
-    return total, by_priority, oldest_date.isoformat() if oldest_date else None, all_deleted_ids
+            # Get oldest date for this priority
+            priority_oldest = await db.scalar(select(func.min(Item.fetched_at)).where(*conditions))
+            if priority_oldest and (oldest_date is None or priority_oldest < oldest_date):
+                oldest_date = priority_oldest
+
+    return total, by_priority, oldest_date.isoformat() if oldest_date else None
 
 
 @router.get("/admin/housekeeping", response_model=HousekeepingConfig)
@@ -228,7 +193,7 @@ async def preview_cleanup(
 ) -> CleanupPreview:
     """Preview items that would be deleted based on current retention settings."""
     config = await get_housekeeping_config(db)
-    total, by_priority, oldest_date, _ = await get_items_to_delete(db, config, execute=False)
+    total, by_priority, oldest_date = await get_items_to_delete(db, config)
 
     return CleanupPreview(
         total=total,
@@ -243,37 +208,28 @@ async def execute_cleanup(
 ) -> CleanupResult:
     """Execute cleanup based on current retention settings.
 
-    Deletes items from both PostgreSQL and vector indexes (search + duplicate).
+    Deletes items from PostgreSQL in batches and removes each batch from the
+    vector indexes (search + duplicate). Progress: GET
+    /admin/housekeeping/cleanup/status.
     """
-    from services.relevance_filter import create_relevance_filter
-
     config = await get_housekeeping_config(db)
-    total, by_priority, _, deleted_ids = await get_items_to_delete(db, config, execute=True)
-
-    # Clean up vector indexes
-    if deleted_ids:
-        try:
-            relevance_filter = await create_relevance_filter()
-            if relevance_filter:
-                # Convert int IDs to strings for the classifier API
-                str_ids = [str(id) for id in deleted_ids]
-                deleted_search, deleted_dup = await relevance_filter.delete_items(str_ids)
-                logger.info(
-                    f"Vector index cleanup: {deleted_search} from search, "
-                    f"{deleted_dup} from duplicate index"
-                )
-        except Exception as e:
-            logger.warning(f"Failed to clean up vector indexes: {e}")
+    # The purge uses its own short transactions
+    await db.close()
+    result = await purge_items(config, trigger="manual")
 
-    await db.commit()
-
-    logger.info(f"Housekeeping cleanup completed: deleted {total} items ({by_priority})")
     return CleanupResult(
-        deleted=total,
-        by_priority=by_priority,
+        deleted=result["deleted"],
+        by_priority=result["by_priority"],
     )
 
 
+@router.get("/admin/housekeeping/cleanup/status")
+async def get_cleanup_status() -> dict:
+    """Progress of the running or last retention purge (manual or scheduled)."""
+    status = await get_purge_status()
+    return status or {"running": False, "deleted": 0, "total": 0}
+
+
 @router.get("/admin/storage", response_model=StorageStats)
 async def get_storage_stats(
     db: AsyncSession = Depends(get_db),
@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from database import get_db
-from models import Channel, Item, Source, Priority
+from models import Channel, Item, Source, Priority, RetryPriority
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -319,10 +319,7 @@ async def classify_items_for_confidence(
 
     # Filter by confidence (unless force)
     if not force:
-        from database import json_extract_path
-        query = query.where(
-            json_extract_path(Item.metadata_, "pre_filter", "relevance_confidence").is_(None)
-        )
+        query = query.where(Item.classified_at.is_(None))
 
     # Filter to retry queue only
     if retry_queue_only:
@@ -358,6 +355,7 @@ async def classify_items_for_confidence(
             )
 
             # Store classifier results in metadata
+            item.classified_at = datetime.utcnow()
             new_metadata = dict(item.metadata_) if item.metadata_ else {}
             new_metadata["pre_filter"] = {
                 "relevance_confidence": classification.get("relevance_confidence"),
@@ -365,18 +363,18 @@ async def classify_items_for_confidence(
                 "ak_confidence": classification.get("ak_confidence"),
                 "priority_suggestion": classification.get("priority"),
                 "priority_confidence": classification.get("priority_confidence"),
-                "classified_at": datetime.utcnow().isoformat(),
+                "classified_at": item.classified_at.isoformat(),
             }
 
             # Update retry_priority based on confidence
             if update_retry_priority:
                 confidence = classification.get("relevance_confidence", 0.5)
                 if confidence >= 0.5:
-                    new_metadata["retry_priority"] = "high"
+                    item.retry_priority = RetryPriority.HIGH
                 elif confidence >= 0.25:
-                    new_metadata["retry_priority"] = "edge_case"
+                    item.retry_priority = RetryPriority.EDGE_CASE
                 else:
-                    new_metadata["retry_priority"] = "low"
+                    item.retry_priority = RetryPriority.LOW
                     item.needs_llm_processing = False
 
             item.metadata_ = new_metadata
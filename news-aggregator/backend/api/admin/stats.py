@@ -8,8 +8,8 @@ from pydantic import BaseModel
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database import get_db, json_extract_path
-from models import Item, Source, Rule
+from database import get_db
+from models import Item, ItemStatsRollup, Source, Rule
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -129,14 +129,12 @@ async def get_system_stats(
     )
 
     # Processing queue stats — combine into fewer queries
-    retry_priority = json_extract_path(Item.metadata_, "retry_priority")
-
     queue_total = await db.scalar(
         select(func.count(Item.id)).where(Item.needs_llm_processing == True)  # noqa: E712
     ) or 0
 
     retry_result = await db.execute(
-        select(retry_priority.label("rp"), func.count(Item.id))
+        select(Item.retry_priority.label("rp"), func.count(Item.id))
         .where(Item.needs_llm_processing == True)  # noqa: E712
         .group_by("rp")
     )
@@ -147,14 +145,14 @@ async def get_system_stats(
     queue_row = (await db.execute(
         select(
             func.count(Item.id).filter(
-                json_extract_path(Item.metadata_, "pre_filter").is_(None)
+                Item.classified_at.is_(None)
             ).label("awaiting_classifier"),
             func.count(Item.id).filter(
                 Item.similar_to_id.is_(None),
-                json_extract_path(Item.metadata_, "duplicate_checked").is_(None),
+                Item.duplicate_checked_at.is_(None),
             ).label("awaiting_dedup"),
             func.count(Item.id).filter(
-                json_extract_path(Item.metadata_, "vectordb_indexed").is_(None)
+                Item.indexed_at.is_(None)
             ).label("awaiting_vectordb"),
         ).where(Item.fetched_at >= recent_cutoff)
     )).one()
@@ -167,18 +165,23 @@ async def get_system_stats(
         awaiting_vectordb=queue_row.awaiting_vectordb,
     )
 
-    # Item stats — single query for all counts
+    # Item stats — from the stats rollup (per day/channel buckets, not items)
     item_row = (await db.execute(
         select(
-            func.count(Item.id).label("total"),
-            func.count(Item.id).filter(Item.is_read == False).label("unread"),  # noqa: E712
-            func.count(Item.id).filter(Item.is_starred == True).label("starred"),  # noqa: E712
+            func.coalesce(func.sum(ItemStatsRollup.item_count), 0).label("total"),
+            func.coalesce(func.sum(ItemStatsRollup.item_count).filter(
+                ItemStatsRollup.is_read == False  # noqa: E712
+            ), 0).label("unread"),
+            func.coalesce(func.sum(ItemStatsRollup.item_count).filter(
+                ItemStatsRollup.is_starred == True  # noqa: E712
+            ), 0).label("starred"),
         )
     )).one()
 
     priority_result = await db.execute(
-        select(Item.priority, func.count(Item.id))
-        .group_by(Item.priority)
+        select(ItemStatsRollup.priority, func.sum(ItemStatsRollup.item_count))
+        .group_by(ItemStatsRollup.priority)
+        .having(func.sum(ItemStatsRollup.item_count) > 0)
     )
     by_priority = {}
     for row in priority_result.fetchall():
@@ -206,3 +209,84 @@ async def get_system_stats(
         items=item_stats,
         timestamp=datetime.utcnow().isoformat(),
     )
+
+
+@router.get("/admin/http-clients")
+async def get_http_client_stats() -> dict:
+    """Get outbound HTTP client stats (connection reuse, per-host throttling).
+
+    Connectors run on the leader: served live there, otherwise from the
+    copy the leader syncs to the DB with the scheduler stats.
+    """
+    from services.http_clients import get_http_registry
+    from services.scheduler import scheduler
+    from services.worker_status import read_stats
+
+    if scheduler.running:
+        return {"source": "live", **get_http_registry().get_stats()}
+
+    sched_stats = await read_stats("scheduler")
+    return {
+        "source": "synced",
+        "synced_at": sched_stats.get("synced_at"),
+        **sched_stats.get("http_clients", {}),
+    }
+
+
+@router.get("/admin/parse-pool")
+async def get_parse_pool_stats() -> dict:
+    """Get parse pool stats (tasks, timeouts and timings per parser).
+
+    Served live on the leader (where connectors parse feeds and pages),
+    otherwise from the copy synced with the scheduler stats.
+    """
+    from services.parse_pool import get_parse_pool
+    from services.scheduler import scheduler
+    from services.worker_status import read_stats
+
+    if scheduler.running:
+        return {"source": "live", **get_parse_pool().get_stats()}
+
+    sched_stats = await read_stats("scheduler")
+    return {
+        "source": "synced",
+        "synced_at": sched_stats.get("synced_at"),
+        **sched_stats.get("parse_pool", {}),
+    }
+
+
+@router.get("/admin/article-cache")
+async def get_article_cache_stats() -> dict:
+    """Get article extraction cache stats.
+
+    Entry counts and size come from the shared cache file. Hit/miss counters
+    are per process: the leader's (where connectors extract articles) live
+    or synced with the scheduler stats.
+    """
+    from services.article_cache import get_article_cache
+    from services.scheduler import scheduler
+    from services.worker_status import read_stats
+
+    cache = get_article_cache()
+    store = await cache.get_store_stats()
+
+    if scheduler.running:
+        return {"source": "live", **cache.get_stats(), "store": store}
+
+    sched_stats = await read_stats("scheduler")
+    return {
+        "source": "synced",
+        "synced_at": sched_stats.get("synced_at"),
+        **sched_stats.get("article_cache", {}),
+        "store": store,
+    }
+
+
+@router.delete("/admin/article-cache")
+async def clear_article_cache() -> dict:
+    """Remove all cached extraction results (e.g. after changing the extractor)."""
+    from services.article_cache import get_article_cache
+
+    removed = await get_article_cache().clear()
+    logger.info(f"Article cache cleared: {removed} entries")
+    return {"status": "cleared", "removed": removed}
@@ -52,6 +52,9 @@ async def set_poll_interval(request: PollIntervalRequest):
             ))
         await db.commit()
 
+    from services.event_bus import EVENT_CONFIG_CHANGED, get_event_bus
+    await get_event_bus().publish(EVENT_CONFIG_CHANGED, key="worker_status_poll_interval")
+
     return {"interval": request.interval, "message": f"Poll interval set to {request.interval}s"}
 
 
@@ -105,7 +108,8 @@ async def start_llm_worker_endpoint():
 
     # Try local start first (works if we're on leader)
     if worker is not None or get_worker() is not None:
-        await start_worker()
+        from config import settings
+        await start_worker(concurrency=settings.llm_worker_concurrency)
         return {"status": "started", "message": "LLM worker started"}
 
     # Not on leader - queue command
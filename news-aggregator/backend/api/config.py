@@ -445,6 +445,13 @@ async def import_config(
         # Commit the transaction
         await db.commit()
 
+        # Rules and settings were replaced underneath the running processes
+        from services.event_bus import EVENT_CONFIG_CHANGED, get_event_bus
+        from services.rule_engine import invalidate_rules
+
+        invalidate_rules()
+        await get_event_bus().publish(EVENT_CONFIG_CHANGED, key=None)
+
         total_imported = sum(imported.values())
         total_skipped = sum(skipped.values())
 
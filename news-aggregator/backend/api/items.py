@@ -1,15 +1,19 @@
 """API endpoints for news items."""
 
+import base64
+import json
 import logging
+import time
 from datetime import datetime, timedelta
+from typing import Any
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
-from sqlalchemy import case, func, select
+from sqlalchemy import and_, case, func, literal_column, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from database import get_db, async_session_maker, json_extract_path, json_array_overlaps
-from models import Channel, Item, ItemEvent, Priority, Source
+from models import SEARCH_CONFIG, Channel, Item, ItemEvent, Priority, Source
 from pydantic import BaseModel
 from schemas import BulkArchiveRequest, BulkArchiveResponse, DuplicateBrief, ItemListResponse, ItemResponse, ItemUpdate, SourceBrief, TopicGroupsResponse, TopicGroup, TopicItemBrief
 
@@ -46,6 +50,119 @@ def _build_item_response(item: Item) -> ItemResponse:
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Sort rank for sort_by=priority (high first)
+_PRIORITY_ORDER = {"high": 1, "medium": 2, "low": 3, "none": 4}
+
+# Short-lived cache of list_items totals, keyed by the normalized filter set.
+# Dashboard polling and deep pages reuse the count instead of re-scanning.
+COUNT_CACHE_TTL = 15.0
+COUNT_CACHE_MAX_ENTRIES = 256
+_count_cache: dict[tuple, tuple[float, int]] = {}
+
+
+def _count_cache_key(**filters: Any) -> tuple:
+    """Normalize list_items filters into a hashable cache key."""
+    normalized = []
+    for name, value in sorted(filters.items()):
+        if isinstance(value, str) and name in ("priority", "assigned_ak"):
+            value = tuple(sorted(v.strip() for v in value.split(",") if v.strip()))
+        elif isinstance(value, str) and name == "search":
+            value = value.strip().lower()
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        normalized.append((name, value))
+    return tuple(normalized)
+
+
+async def _cached_count(db: AsyncSession, key: tuple, query) -> int:
+    """Return the row count of query, cached for COUNT_CACHE_TTL seconds."""
+    now = time.monotonic()
+    cached = _count_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    total = await db.scalar(select(func.count()).select_from(query.subquery())) or 0
+
+    if len(_count_cache) >= COUNT_CACHE_MAX_ENTRIES:
+        for stale_key in [k for k, (expires, _) in _count_cache.items() if expires <= now]:
+            del _count_cache[stale_key]
+        if len(_count_cache) >= COUNT_CACHE_MAX_ENTRIES:
+            _count_cache.pop(next(iter(_count_cache)))
+    _count_cache[key] = (now + COUNT_CACHE_TTL, total)
+    return total
+
+
+def invalidate_item_counts() -> None:
+    """Drop cached list totals (called once item state changes are committed)."""
+    _count_cache.clear()
+
+
+# Full-text search (items.search_vector, GIN-indexed)
+_SEARCH_REGCONFIG = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+# ts_headline options for result snippets; matches are wrapped in <mark>
+SNIPPET_OPTIONS = (
+    "MaxFragments=2, MaxWords=25, MinWords=10, FragmentDelimiter=\" … \", "
+    "StartSel=<mark>, StopSel=</mark>"
+)
+# Characters of content parsed for a snippet
+SNIPPET_SOURCE_CHARS = 20000
+
+
+def _search_query(search: str):
+    """Parse user search input (quotes, OR, -exclusion) into a tsquery."""
+    return func.websearch_to_tsquery(_SEARCH_REGCONFIG, search)
+
+
+def _search_condition(search: str):
+    """Items matching a search: full-text match, or title substring.
+
+    The title substring (trigram-indexed) keeps matches inside German
+    compounds, e.g. "kita" in "Kitagebühren", which stemming does not split.
+    """
+    return or_(
+        Item.search_vector.op("@@")(_search_query(search)),
+        Item.title.ilike(f"%{search.strip()}%"),
+    )
+
+
+async def _search_snippets(db: AsyncSession, item_ids: list[int], search: str) -> dict[int, str]:
+    """Highlighted content excerpts around the search terms, per item ID."""
+    if not item_ids:
+        return {}
+    text_source = func.left(func.coalesce(Item.content, Item.summary, ""), SNIPPET_SOURCE_CHARS)
+    result = await db.execute(
+        select(
+            Item.id,
+            func.ts_headline(
+                _SEARCH_REGCONFIG, text_source, _search_query(search), SNIPPET_OPTIONS
+            ),
+        ).where(Item.id.in_(item_ids))
+    )
+    return {item_id: snippet for item_id, snippet in result if snippet}
+
+
+def _encode_cursor(sort_by: str, sort_order: str, sort_key: Any, item_id: int) -> str:
+    """Build an opaque keyset cursor pointing after the given item."""
+    if isinstance(sort_key, datetime):
+        sort_key = sort_key.isoformat()
+    payload = json.dumps([sort_by, sort_order, sort_key, item_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort_by: str, sort_order: str) -> tuple[Any, int]:
+    """Decode a cursor into (sort_key, item_id); 400 if invalid or for another sort."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, cursor_order, sort_key, item_id = json.loads(base64.urlsafe_b64decode(padded))
+        sort_key = datetime.fromisoformat(sort_key) if cursor_sort == "date" else int(sort_key)
+        item_id = int(item_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if (cursor_sort, cursor_order) != (sort_by, sort_order):
+        raise HTTPException(status_code=400, detail="Cursor does not match sort_by/sort_order")
+    return sort_key, item_id
+
 
 def get_client_ip(request: Request) -> str | None:
     """Extract client IP from request, handling proxies."""
@@ -75,9 +192,17 @@ async def list_items(
     relevant_only: bool = Query(True, description="Exclude LOW priority items (not Liga-relevant)"),
     connector_type: str | None = Query(None, description="Filter by connector type (rss, x_scraper, etc.)"),
     assigned_ak: str | None = Query(None, description="Filter by Arbeitskreis (comma-separated: AK1,AK2,AK3)"),
-    sort_by: str = Query("date", description="Sort by: date, priority, source"),
+    sort_by: str = Query(
+        "date", description="Sort by: date, priority, source, relevance (with search)"
+    ),
     sort_order: str = Query("desc", description="Sort order: asc, desc"),
     group_duplicates: bool = Query(True, description="Group duplicate articles under primary item"),
+    pagination: str = Query(
+        "page", description="Pagination mode: page (offset) or cursor (keyset)"
+    ),
+    cursor: str | None = Query(
+        None, description="Opaque next_cursor from the previous page (implies cursor mode)"
+    ),
 ) -> ItemListResponse:
     """List items with filtering and pagination.
 
@@ -86,6 +211,12 @@ async def list_items(
     By default, archived items are excluded. Set is_archived=true to show only archived,
     or is_archived=false to explicitly exclude them.
     When group_duplicates=true (default), duplicate articles are nested under their primary item.
+    With pagination=cursor (sort_by date or priority), pages are fetched by keyset
+    and the response carries next_cursor (null on the last page); page is ignored.
+    The total is cached for a few seconds per filter set.
+    search is a full-text query (German stemming; "phrases", OR and -exclusion
+    work) that also matches title substrings. Results carry a highlighted
+    search_snippet, and sort_by=relevance ranks them by match quality.
     """
     query = select(Item).options(
         selectinload(Item.channel).selectinload(Channel.source),
@@ -133,10 +264,7 @@ async def list_items(
         until_naive = until.replace(tzinfo=None) if until.tzinfo else until
         query = query.where(Item.published_at <= until_naive)
     if search:
-        search_pattern = f"%{search}%"
-        query = query.where(
-            (Item.title.ilike(search_pattern)) | (Item.content.ilike(search_pattern))
-        )
+        query = query.where(_search_condition(search))
     if connector_type is not None:
         # Filter by connector type through channel
         if channel_id is None and source_id is None:
@@ -145,7 +273,6 @@ async def list_items(
     if assigned_ak is not None:
         # Support comma-separated AK values
         ak_values = [ak.strip() for ak in assigned_ak.split(",") if ak.strip()]
-        from sqlalchemy import or_
         # Filter by assigned_aks (JSON array) or fall back to legacy assigned_ak/metadata
         query = query.where(
             or_(
@@ -155,24 +282,56 @@ async def list_items(
             )
         )
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query) or 0
+    # Get total count (short-TTL cache keyed by the filter set)
+    total = await _cached_count(db, _count_cache_key(
+        group_duplicates=group_duplicates,
+        source_id=source_id,
+        channel_id=channel_id,
+        priority=priority,
+        is_read=is_read,
+        is_starred=is_starred,
+        is_archived=is_archived,
+        days=days,
+        since=since,
+        until=until,
+        search=search,
+        relevant_only=relevant_only,
+        connector_type=connector_type,
+        assigned_ak=assigned_ak,
+    ), query)
+
+    use_cursor = pagination == "cursor" or cursor is not None
+    if use_cursor and sort_by not in ("date", "priority"):
+        raise HTTPException(
+            status_code=400,
+            detail="Cursor pagination supports sort_by=date or sort_by=priority",
+        )
+    after = _decode_cursor(cursor, sort_by, sort_order) if cursor else None
 
     # Apply ordering based on sort_by parameter
-    if sort_by == "priority":
+    if sort_by == "relevance" and search:
+        # Best full-text rank first (title matches weigh most), then newest
+        rank = func.ts_rank_cd(Item.search_vector, _search_query(search), 32)
+        query = query.order_by(rank.desc(), Item.published_at.desc(), Item.id.desc())
+    elif sort_by == "priority":
         # Priority order: high > medium > low > none
         priority_order = case(
-            (Item.priority == "high", 1),
-            (Item.priority == "medium", 2),
-            (Item.priority == "low", 3),
-            (Item.priority == "none", 4),
+            *((Item.priority == value, rank) for value, rank in _PRIORITY_ORDER.items()),
             else_=5,
         )
         if sort_order == "asc":
             query = query.order_by(priority_order.desc(), Item.id.desc())
         else:
             query = query.order_by(priority_order.asc(), Item.id.desc())
+        if after:
+            after_rank, after_id = after
+            if sort_order == "asc":
+                rank_cmp = priority_order < after_rank
+            else:
+                rank_cmp = priority_order > after_rank
+            query = query.where(
+                or_(rank_cmp, and_(priority_order == after_rank, Item.id < after_id))
+            )
     elif sort_by == "source":
         # Need to join Channel and Source if not already joined
         if channel_id is None and source_id is None and connector_type is None:
@@ -191,19 +350,44 @@ async def list_items(
             query = query.order_by(Item.published_at.asc(), Item.id.asc())
         else:
             query = query.order_by(Item.published_at.desc(), Item.id.desc())
-    query = query.offset((page - 1) * page_size).limit(page_size)
-
-    result = await db.execute(query)
-    items = result.scalars().all()
+        if after:
+            position = tuple_(Item.published_at, Item.id)
+            query = query.where(position > after if sort_order == "asc" else position < after)
+
+    next_cursor = None
+    if use_cursor:
+        # Keyset mode: fetch one extra row to know whether another page exists
+        result = await db.execute(query.limit(page_size + 1))
+        items = result.scalars().all()
+        if len(items) > page_size:
+            items = items[:page_size]
+            last = items[-1]
+            if sort_by == "priority":
+                sort_key = _PRIORITY_ORDER.get(getattr(last.priority, "value", last.priority), 5)
+            else:
+                sort_key = last.published_at
+            next_cursor = _encode_cursor(sort_by, sort_order, sort_key, last.id)
+    else:
+        query = query.offset((page - 1) * page_size).limit(page_size)
+        result = await db.execute(query)
+        items = result.scalars().all()
 
     total_pages = (total + page_size - 1) // page_size
 
+    responses = [_build_item_response(item) for item in items]
+    if search:
+        # Only for the returned page: ts_headline re-parses each document
+        snippets = await _search_snippets(db, [item.id for item in items], search)
+        for response in responses:
+            response.search_snippet = snippets.get(response.id)
+
     return ItemListResponse(
-        items=[_build_item_response(item) for item in items],
+        items=responses,
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
     )
 
 
@@ -214,13 +398,13 @@ async def get_retry_queue_stats(
     """Get statistics about items waiting for LLM retry processing.
 
     Returns counts by retry priority (high, unknown, edge_case).
-    Items without retry_priority metadata are counted as "unknown".
+    Items without a retry_priority are counted as "unknown".
     """
     from sqlalchemy import literal_column
 
     # Count by retry priority, using COALESCE to treat NULL as 'unknown'
     priority_expr = func.coalesce(
-        json_extract_path(Item.metadata_, "retry_priority"),
+        Item.retry_priority,
         literal_column("'unknown'")
     ).label("priority")
 
@@ -545,6 +729,8 @@ async def update_item(
             data={"changes": changes},
             ip_address=get_client_ip(request),
         )
+    await db.commit()
+    invalidate_item_counts()
 
     # Re-fetch with duplicates loaded
     query = (
@@ -586,6 +772,8 @@ async def mark_as_read(
         EVENT_READ,
         ip_address=get_client_ip(request),
     )
+    await db.commit()
+    invalidate_item_counts()
 
     return {"status": "ok"}
 
@@ -616,6 +804,8 @@ async def toggle_archive(
         data={"is_archived": item.is_archived},
         ip_address=get_client_ip(request),
     )
+    await db.commit()
+    invalidate_item_counts()
 
     return {"status": "ok", "is_archived": item.is_archived}
 
@@ -690,6 +880,8 @@ async def bulk_archive(
             if item.is_archived == request_body.is_archived  # Only items that changed
         ]
         record_events_batch(db, events_data)
+        await db.commit()
+        invalidate_item_counts()
 
     return BulkArchiveResponse(
         archived=archived_count,
@@ -743,7 +935,7 @@ async def _refetch_rss_item_task(item_id: int):
                 return
 
             extractor = ArticleExtractor()
-            article = await extractor.fetch_article(item.url)
+            article = await extractor.fetch_article(item.url, use_cache=False)
 
             if article and article.content and len(article.content) > 100:
                 # Combine RSS summary with full article
@@ -808,7 +1000,7 @@ async def _refetch_social_item_task(item_id: int):
                     continue
 
                 try:
-                    article = await extractor.fetch_article(link_url)
+                    article = await extractor.fetch_article(link_url, use_cache=False)
                     if article and article.is_article and len(article.content) > 100:
                         # Keep original post, append article
                         original_content = item.content
@@ -905,7 +1097,7 @@ async def _refetch_item_task(item_id: int):
             # Try to fetch first valid article
             for link_url in links[:3]:
                 try:
-                    article = await extractor.fetch_article(link_url)
+                    article = await extractor.fetch_article(link_url, use_cache=False)
                     if article and article.is_article:
                         # Update item content with article
                         author = item.author or "Unknown"
@@ -1120,6 +1312,8 @@ async def bulk_update_items(
                 for item in items
             ]
             record_events_batch(db, events_data)
+        await db.commit()
+        invalidate_item_counts()
 
     return {"updated": updated}
 
@@ -1146,6 +1340,8 @@ async def mark_all_as_read(
 
         for item in items:
             item.is_read = True
+        await db.commit()
+        invalidate_item_counts()
 
         return {"marked": len(items)}
 
@@ -1164,6 +1360,8 @@ async def mark_all_as_read(
 
     for item in items:
         item.is_read = True
+    await db.commit()
+    invalidate_item_counts()
 
     return {"marked": len(items)}
 
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from config import settings
 from database import get_db
 from models import Item, Priority, Setting
+from services.event_bus import EVENT_CONFIG_CHANGED, get_event_bus
 from services.llm.ollama import OllamaProvider
 
 logger = logging.getLogger(__name__)
@@ -487,6 +488,7 @@ async def enable_llm(
         db.add(timestamp_setting)
 
     await db.commit()
+    await get_event_bus().publish(EVENT_CONFIG_CHANGED, key=LLM_ENABLED_KEY)
     logger.info("LLM processing enabled via API")
 
     # Count unprocessed items
@@ -527,6 +529,7 @@ async def disable_llm(db: AsyncSession = Depends(get_db)) -> LLMToggleResponse:
         db.add(setting)
 
     await db.commit()
+    await get_event_bus().publish(EVENT_CONFIG_CHANGED, key=LLM_ENABLED_KEY)
     logger.info("LLM processing disabled via API")
 
     # Count unprocessed items
@@ -635,7 +638,7 @@ async def get_classifier_worker_status() -> ClassifierWorkerStatusResponse:
     """Get classifier worker status and statistics.
 
     The classifier worker processes items that have never been classified
-    (no pre_filter metadata) and updates their priority based on classifier confidence.
+    (classified_at is NULL) and updates their priority based on classifier confidence.
     """
     from services.worker_status import read_state, read_stats
 
@@ -694,7 +697,7 @@ async def resume_classifier_worker() -> dict:
 async def get_classifier_unclassified_count() -> dict:
     """Get count of items that have not been classified yet.
 
-    These items have no pre_filter metadata and will be processed
+    These items have no classifier results yet and will be processed
     by the classifier worker.
     """
     from services.classifier_worker import get_unclassified_count
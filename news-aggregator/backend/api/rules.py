@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
 from models import Rule
 from schemas import RuleCreate, RuleResponse, RuleUpdate
+from services.rule_engine import invalidate_rules
 
 router = APIRouter()
 
@@ -63,6 +64,8 @@ async def create_rule(
     db.add(rule)
     await db.flush()
     await db.refresh(rule)
+    await db.commit()
+    invalidate_rules()
 
     return RuleResponse.model_validate(rule)
 
@@ -87,6 +90,8 @@ async def update_rule(
 
     await db.flush()
     await db.refresh(rule)
+    await db.commit()
+    invalidate_rules()
 
     return RuleResponse.model_validate(rule)
 
@@ -105,6 +110,8 @@ async def delete_rule(
         raise HTTPException(status_code=404, detail="Rule not found")
 
     await db.delete(rule)
+    await db.commit()
+    invalidate_rules()
 
 
 @router.post("/rules/{rule_id}/test")
@@ -155,4 +162,7 @@ async def reorder_rules(
         if rule:
             rule.order = new_order
 
+    # Commit before invalidating so a concurrent reload can't cache old rules
+    await db.commit()
+    invalidate_rules()
     return {"status": "ok"}
@@ -1,12 +1,17 @@
 """API endpoints for scheduler control."""
 
 import logging
+from datetime import datetime
 
 from apscheduler.triggers.interval import IntervalTrigger
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
+from sqlalchemy import Integer, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import settings
+from database import get_db
+from models import Channel, Source
 from services.scheduler import scheduler, get_job_status, start_scheduler, stop_scheduler
 
 logger = logging.getLogger(__name__)
@@ -45,6 +50,27 @@ async def get_scheduler_status() -> SchedulerStatusResponse:
     )
 
 
+@router.get("/scheduler/queue")
+async def get_fetch_queue_stats() -> dict:
+    """Get fetch queue depth, wait times and outcomes per connector type.
+
+    Served live on the leader (where the fetch workers run), otherwise from
+    the copy synced with the scheduler stats.
+    """
+    from services.fetch_queue import get_fetch_queue
+    from services.worker_status import read_stats
+
+    if scheduler.running:
+        return {"source": "live", **get_fetch_queue().get_stats()}
+
+    sched_stats = await read_stats("scheduler")
+    return {
+        "source": "synced",
+        "synced_at": sched_stats.get("synced_at"),
+        **sched_stats.get("fetch_queue", {}),
+    }
+
+
 @router.post("/scheduler/start")
 async def start_scheduler_endpoint() -> dict[str, str]:
     """Start the scheduler if not already running."""
@@ -103,3 +129,70 @@ async def update_fetch_interval(request: IntervalUpdateRequest) -> IntervalUpdat
     except Exception as e:
         logger.error(f"Failed to update interval: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to update interval: {e}")
+
+
+@router.get("/scheduler/schedule")
+async def get_fetch_schedule(
+    limit: int = Query(20, ge=1, le=200, description="Upcoming channels to list"),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Adaptive fetch schedule of enabled channels.
+
+    Counts channels that are due, fetched more often than configured
+    (tightened) or less often (widened), and lists the next channels due
+    with their configured and effective intervals.
+    """
+    now = datetime.utcnow()
+    effective = Channel.fetch_stats["interval_minutes"].astext.cast(Integer)
+    enabled = (Channel.enabled == True, Source.enabled == True)  # noqa: E712
+
+    counts = (await db.execute(
+        select(
+            func.count(),
+            func.count().filter(or_(Channel.next_fetch_at.is_(None), Channel.next_fetch_at <= now)),
+            func.count().filter(effective < Channel.fetch_interval_minutes),
+            func.count().filter(effective > Channel.fetch_interval_minutes),
+        )
+        .select_from(Channel)
+        .join(Source)
+        .where(*enabled)
+    )).one()
+
+    result = await db.execute(
+        select(
+            Channel.id,
+            Channel.name,
+            Channel.connector_type,
+            Source.name.label("source_name"),
+            Channel.fetch_interval_minutes,
+            Channel.fetch_stats,
+            Channel.next_fetch_at,
+        )
+        .join(Source)
+        .where(*enabled)
+        .order_by(Channel.next_fetch_at.asc().nulls_first())
+        .limit(limit)
+    )
+
+    return {
+        "adaptive": settings.adaptive_fetch_enabled,
+        "channels": counts[0],
+        "due": counts[1],
+        "tightened": counts[2],
+        "widened": counts[3],
+        "upcoming": [
+            {
+                "channel_id": row.id,
+                "name": row.name,
+                "connector_type": row.connector_type,
+                "source_name": row.source_name,
+                "configured_interval_minutes": row.fetch_interval_minutes,
+                "interval_minutes": (row.fetch_stats or {}).get(
+                    "interval_minutes", row.fetch_interval_minutes
+                ),
+                "avg_new_items": (row.fetch_stats or {}).get("avg_new_items"),
+                "next_fetch_at": row.next_fetch_at.isoformat() if row.next_fetch_at else None,
+            }
+            for row in result
+        ],
+    }
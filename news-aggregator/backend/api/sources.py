@@ -3,8 +3,6 @@
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException
-
-logger = logging.getLogger(__name__)
 from sqlalchemy import and_, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -19,6 +17,9 @@ from schemas import (
     SourceResponse,
     SourceUpdate,
 )
+from services.fetch_schedule import reset_interval
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -460,9 +461,17 @@ async def update_channel(
 
         update_data["source_identifier"] = new_identifier
 
+    interval_changed = (
+        "fetch_interval_minutes" in update_data
+        and update_data["fetch_interval_minutes"] != channel.fetch_interval_minutes
+    )
+
     for key, value in update_data.items():
         setattr(channel, key, value)
 
+    if interval_changed:
+        reset_interval(channel)
+
     await db.flush()
     await db.refresh(channel)
 
@@ -1,18 +1,43 @@
-"""API endpoints for dashboard statistics."""
+"""API endpoints for dashboard statistics.
+
+Item counts come from the item_stats_rollup table (see models.ItemStatsRollup),
+summed over channels x days instead of counting items. Its buckets are whole
+UTC days, so a `days` filter covers the last N days plus today's part.
+"""
 
 from datetime import datetime, timedelta
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import and_, case, func, select, text
+from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db
-from models import Channel, Item, Priority, Rule, Source
+from models import Channel, Item, ItemStatsRollup, Priority, Rule, Source
 from schemas import ChannelStats, SourceStats, StatsResponse
 
 router = APIRouter()
 
+Rollup = ItemStatsRollup
+
+
+def _rollup_count(*conditions):
+    """Sum of rollup counts, optionally filtered (0 when no rows match)."""
+    total = func.sum(Rollup.item_count)
+    if conditions:
+        total = total.filter(*conditions)
+    return func.coalesce(total, 0)
+
+
+def _rollup_filters(days: int | None, priority: str | None) -> list:
+    """Rollup conditions for the endpoints' days/priority query parameters."""
+    conditions = []
+    if days is not None:
+        conditions.append(Rollup.day >= (datetime.utcnow() - timedelta(days=days)).date())
+    if priority:
+        conditions.append(Rollup.priority.in_([p.strip() for p in priority.split(",")]))
+    return conditions
+
 
 @router.get("/stats", response_model=StatsResponse)
 async def get_stats(
@@ -24,25 +49,21 @@ async def get_stats(
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     week_start = today_start - timedelta(days=today_start.weekday())
 
-    # Optional time filter for item counts
-    time_filter = []
-    if days is not None:
-        cutoff = now - timedelta(days=days)
-        time_filter.append(Item.fetched_at >= cutoff)
-
-    # Combine all item counts into a single query
+    # Combine all item counts into a single query over the rollup
     base = select(
-        func.count(Item.id).label("total"),
-        func.count(Item.id).filter(Item.priority != Priority.NONE).label("relevant"),
-        func.count(Item.id).filter(Item.is_read == False, Item.priority != Priority.NONE).label("unread"),  # noqa: E712
-        func.count(Item.id).filter(Item.is_starred == True).label("starred"),  # noqa: E712
-        func.count(Item.id).filter(Item.priority == Priority.HIGH).label("high"),
-        func.count(Item.id).filter(Item.priority == Priority.MEDIUM).label("medium"),
-        func.count(Item.id).filter(Item.priority == Priority.LOW).label("low"),
-        func.count(Item.id).filter(Item.priority == Priority.NONE).label("none_p"),
-        func.count(Item.id).filter(Item.fetched_at >= today_start).label("today"),
-        func.count(Item.id).filter(Item.fetched_at >= week_start).label("week"),
+        _rollup_count().label("total"),
+        _rollup_count(Rollup.priority != Priority.NONE).label("relevant"),
+        _rollup_count(Rollup.is_read == False, Rollup.priority != Priority.NONE).label("unread"),  # noqa: E712
+        _rollup_count(Rollup.is_starred == True).label("starred"),  # noqa: E712
+        _rollup_count(Rollup.priority == Priority.HIGH).label("high"),
+        _rollup_count(Rollup.priority == Priority.MEDIUM).label("medium"),
+        _rollup_count(Rollup.priority == Priority.LOW).label("low"),
+        _rollup_count(Rollup.priority == Priority.NONE).label("none_p"),
+        _rollup_count(Rollup.day >= today_start.date()).label("today"),
+        _rollup_count(Rollup.day >= week_start.date()).label("week"),
     )
+    # Optional time filter for item counts
+    time_filter = _rollup_filters(days, None)
     if time_filter:
         base = base.where(*time_filter)
     item_stats_row = (await db.execute(base)).one()
@@ -176,23 +197,17 @@ async def get_stats_by_source(
         days: Filter items to last N days
         priority: Comma-separated priority filter (e.g. 'high,medium')
     """
-    # Build item filter conditions
-    item_conditions = [Channel.id == Item.channel_id]
-    if days is not None:
-        cutoff = datetime.utcnow() - timedelta(days=days)
-        item_conditions.append(Item.fetched_at >= cutoff)
-    if priority:
-        priorities = [p.strip() for p in priority.split(",")]
-        item_conditions.append(Item.priority.in_(priorities))
+    # Rollup filter conditions
+    rollup_conditions = [Channel.id == Rollup.channel_id, *_rollup_filters(days, priority)]
 
     # Subquery to count items per source through channels
     item_counts = (
         select(
             Channel.source_id,
-            func.count(Item.id).label("item_count"),
-            func.sum(case((Item.is_read == False, 1), else_=0)).label("unread_count"),  # noqa: E712
+            _rollup_count().label("item_count"),
+            _rollup_count(Rollup.is_read == False).label("unread_count"),  # noqa: E712
         )
-        .outerjoin(Item, and_(*item_conditions))
+        .outerjoin(Rollup, and_(*rollup_conditions))
         .group_by(Channel.source_id)
         .subquery()
     )
@@ -253,13 +268,7 @@ async def get_source_donut(
         priority: Comma-separated priority filter.
         resolve_ga: None (default), 'keyword' (GA channel name), or 'source' (source_domain).
     """
-    base_conditions = [Item.priority != Priority.NONE]
-    if days is not None:
-        cutoff = datetime.utcnow() - timedelta(days=days)
-        base_conditions.append(Item.fetched_at >= cutoff)
-    if priority:
-        priorities = [p.strip() for p in priority.split(",")]
-        base_conditions.append(Item.priority.in_(priorities))
+    base_conditions = [Rollup.priority != Priority.NONE, *_rollup_filters(days, priority)]
 
     results: dict[str, dict] = {}  # name -> {count, is_ga}
 
@@ -274,13 +283,14 @@ async def get_source_donut(
         non_ga_query = (
             select(
                 Source.name.label("name"),
-                func.count(Item.id).label("count"),
+                _rollup_count().label("count"),
             )
-            .select_from(Item)
-            .join(Channel, Channel.id == Item.channel_id)
+            .select_from(Rollup)
+            .join(Channel, Channel.id == Rollup.channel_id)
             .join(Source, Source.id == Channel.source_id)
             .where(Source.id.not_in(ga_source_ids), *base_conditions)
             .group_by(Source.name)
+            .having(func.sum(Rollup.item_count) > 0)
         )
         for row in (await db.execute(non_ga_query)).all():
             entry = results.get(row.name, {"count": 0, "is_ga": False})
@@ -289,6 +299,12 @@ async def get_source_donut(
 
         # GA items: resolve by keyword or source domain
         if resolve_ga == "source":
+            # The domain is only in the item metadata: count the GA items themselves
+            item_conditions = [Item.priority != Priority.NONE]
+            if days is not None:
+                item_conditions.append(Item.fetched_at >= datetime.utcnow() - timedelta(days=days))
+            if priority:
+                item_conditions.append(Item.priority.in_([p.strip() for p in priority.split(",")]))
             source_domain = Item.metadata_["source_domain"].as_string()
             ga_query = (
                 select(
@@ -301,7 +317,7 @@ async def get_source_donut(
                     Channel.source_id.in_(ga_source_ids),
                     source_domain.isnot(None),
                     source_domain != "",
-                    *base_conditions,
+                    *item_conditions,
                 )
                 .group_by(source_domain)
             )
@@ -310,12 +326,13 @@ async def get_source_donut(
             ga_query = (
                 select(
                     Channel.name.label("name"),
-                    func.count().label("count"),
+                    _rollup_count().label("count"),
                 )
-                .select_from(Item)
-                .join(Channel, Channel.id == Item.channel_id)
+                .select_from(Rollup)
+                .join(Channel, Channel.id == Rollup.channel_id)
                 .where(Channel.source_id.in_(ga_source_ids), *base_conditions)
                 .group_by(Channel.name)
+                .having(func.sum(Rollup.item_count) > 0)
             )
         for row in (await db.execute(ga_query)).all():
             name = row.name or "Unbekannt"
@@ -328,15 +345,15 @@ async def get_source_donut(
         query = (
             select(
                 Source.name.label("name"),
-                func.count(Item.id).label("count"),
+                _rollup_count().label("count"),
             )
-            .select_from(Item)
-            .join(Channel, Channel.id == Item.channel_id)
+            .select_from(Rollup)
+            .join(Channel, Channel.id == Rollup.channel_id)
             .join(Source, Source.id == Channel.source_id)
+            .where(*base_conditions)
+            .group_by(Source.name)
+            .having(func.sum(Rollup.item_count) > 0)
         )
-        if base_conditions:
-            query = query.where(*base_conditions)
-        query = query.group_by(Source.name)
         for row in (await db.execute(query)).all():
             results[row.name] = {"count": row.count, "is_ga": False}
 
@@ -352,6 +369,10 @@ async def get_stats_by_channel(
 ) -> list[ChannelStats]:
     """Get item counts grouped by channel.
 
+    Feed channels also report conditional GET counters: fetches answered with
+    304 (feed_not_modified) or an identical body (feed_unchanged), and the
+    resulting hit rate.
+
     Args:
         source_id: Filter by specific source ID
         connector_type: Filter by connector type (e.g., 'rss', 'x_scraper')
@@ -366,11 +387,12 @@ async def get_stats_by_channel(
             Channel.enabled,
             Channel.last_fetch_at,
             Channel.last_error,
-            func.count(Item.id).label("item_count"),
-            func.sum(case((Item.is_read == False, 1), else_=0)).label("unread_count"),  # noqa: E712
+            Channel.feed_cache,
+            _rollup_count().label("item_count"),
+            _rollup_count(Rollup.is_read == False).label("unread_count"),  # noqa: E712
         )
         .join(Source, Channel.source_id == Source.id)
-        .outerjoin(Item, Channel.id == Item.channel_id)
+        .outerjoin(Rollup, Channel.id == Rollup.channel_id)
         .group_by(Channel.id, Source.name)
     )
 
@@ -384,6 +406,17 @@ async def get_stats_by_channel(
     result = await db.execute(query)
     rows = result.all()
 
+    def feed_stats(feed_cache: dict | None) -> dict:
+        feed_cache = feed_cache or {}
+        requests = feed_cache.get("requests", 0)
+        hits = feed_cache.get("not_modified", 0) + feed_cache.get("unchanged", 0)
+        return {
+            "feed_requests": requests,
+            "feed_not_modified": feed_cache.get("not_modified", 0),
+            "feed_unchanged": feed_cache.get("unchanged", 0),
+            "feed_cache_hit_rate": round(hits / requests, 3) if requests else None,
+        }
+
     return [
         ChannelStats(
             channel_id=row.id,
@@ -396,6 +429,7 @@ async def get_stats_by_channel(
             unread_count=row.unread_count or 0,
             last_fetch_at=row.last_fetch_at,
             last_error=row.last_error,
+            **feed_stats(row.feed_cache),
         )
         for row in rows
     ]
@@ -410,10 +444,10 @@ async def get_stats_by_connector(
         select(
             Channel.connector_type,
             func.count(Channel.id.distinct()).label("channel_count"),
-            func.count(Item.id).label("item_count"),
-            func.sum(case((Item.is_read == False, 1), else_=0)).label("unread_count"),  # noqa: E712
+            _rollup_count().label("item_count"),
+            _rollup_count(Rollup.is_read == False).label("unread_count"),  # noqa: E712
         )
-        .outerjoin(Item, Channel.id == Item.channel_id)
+        .outerjoin(Rollup, Channel.id == Rollup.channel_id)
         .group_by(Channel.connector_type)
         .order_by(Channel.connector_type)
     )
@@ -437,12 +471,13 @@ async def get_stats_by_priority(
     db: AsyncSession = Depends(get_db),
 ) -> dict[str, int]:
     """Get item counts grouped by priority."""
-    result = {}
+    result = {priority.value: 0 for priority in Priority}
 
-    for priority in Priority:
-        count = await db.scalar(
-            select(func.count(Item.id)).where(Item.priority == priority)
-        ) or 0
-        result[priority.value] = count
+    rows = await db.execute(
+        select(Rollup.priority, _rollup_count()).group_by(Rollup.priority)
+    )
+    for priority, count in rows.all():
+        if priority in result:
+            result[priority] = count
 
     return result
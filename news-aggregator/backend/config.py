@@ -88,6 +88,7 @@ class Settings(BaseSettings):
 
     # LLM - General
     llm_enabled: bool = True  # Set to False to disable all LLM processing
+    llm_streaming: bool = True  # Stream analysis and stop once the JSON is complete
 
     # LLM - Ollama (primary)
     ollama_base_url: str = "http://gpu1:11434"
@@ -99,6 +100,12 @@ class Settings(BaseSettings):
     openrouter_model: str = "mistralai/mistral-7b-instruct:free"
     openrouter_timeout: int = 60
 
+    # LLM - HTTP connection pool (one long-lived client per provider)
+    llm_http_max_connections: int = 10
+    llm_http_max_keepalive: int = 5
+    llm_http_keepalive_expiry: float = 60.0  # Seconds an idle connection is kept open
+    llm_http2: bool = True  # Only used if the h2 package is installed
+
     # Relevance Pre-filter (embedding classifier)
     classifier_url: str = "http://gpu1:8082"
     classifier_threshold: float = 0.8  # Skip LLM if irrelevant confidence > this
@@ -126,10 +133,59 @@ class Settings(BaseSettings):
     fetch_interval_minutes: int = 30
     cleanup_days: int = 30
 
+    # Adaptive fetch intervals (per channel, around its configured interval)
+    adaptive_fetch_enabled: bool = True
+    adaptive_fetch_target_items: float = 2.0  # New items per fetch to aim for
+    adaptive_fetch_min_factor: float = 0.25  # Busy channels: down to configured x this
+    adaptive_fetch_max_factor: float = 8.0  # Quiet channels: up to configured x this
+    adaptive_fetch_min_minutes: int = 5
+    adaptive_fetch_max_minutes: int = 720
+
     # Workers
     llm_worker_enabled: bool = True  # Set to False to disable LLM worker on startup
+    llm_worker_concurrency: int = 2  # In-flight LLM items; match OLLAMA_NUM_PARALLEL on gpu1
     classifier_worker_enabled: bool = True  # Set to False to disable classifier on startup
     worker_status_poll_interval: int = 10  # Seconds between DB status sync/command polls
+    work_claim_lease_seconds: int = 300  # Item claims expire unless renewed (heartbeat every third)
+
+    # Event bus (PostgreSQL LISTEN/NOTIFY between processes and instances)
+    event_bus_enabled: bool = True  # False = fall back to DB polling and local fresh queue
+    event_bus_keepalive_seconds: float = 60.0  # Idle listener connection check interval
+
+    # Outbound HTTP (shared clients for connectors and article extraction)
+    http_max_connections: int = 100
+    http_max_keepalive: int = 20
+    http_keepalive_expiry: float = 30.0  # Seconds an idle connection is kept open
+    http_per_host_concurrency: int = 4  # Max in-flight requests per host
+    http_per_host_rate: float = 5.0  # Sustained requests/second per host (0 = unlimited)
+    http_per_host_burst: int = 10  # Requests per host allowed before rate limiting
+
+    # Browser pool (warm Chromium instances for Playwright scrapers)
+    browser_pool_size: int = 4  # Max browsers (= concurrent Playwright fetches)
+    browser_max_uses: int = 50  # Checkouts before a browser is relaunched
+    browser_max_rss_mb: float = 1024.0  # Relaunch when the browser process tree exceeds this
+    browser_max_idle_seconds: float = 600.0  # Close browsers unused for this long
+    browser_block_resources: bool = True  # Abort non-essential requests in scraper contexts
+    browser_blocked_resource_types: list[str] = ["image", "media", "font", "manifest", "texttrack"]
+    # Per connector: resource types or host suffixes (contain a dot) never blocked
+    browser_resource_allowlist: dict[str, list[str]] = {}
+
+    # Parse pool (feed/HTML/article/PDF parsing off the event loop)
+    parse_pool_workers: int = 2  # Worker processes per app process (0 = use a thread)
+    parse_pool_max_pending: int = 32  # Queued + running parse tasks per app process
+    parse_pool_max_tasks_per_child: int = 500  # Replace worker processes after this many tasks
+    parse_timeout_seconds: float = 30.0  # Per task (PDFs get 4x)
+
+    # Article extraction cache (SQLite file shared by all workers)
+    article_cache_enabled: bool = True
+    article_cache_path: str = ""  # Default: data/article_cache.db in the backend directory
+    article_cache_max_mb: float = 256.0  # LRU eviction above this size
+    article_cache_ttl_hours: float = 48.0  # Lifetime of extracted articles
+    article_cache_negative_ttl_hours: float = 6.0  # Lifetime of "not an article" / 404 results
+
+    # Retention purge (housekeeping): deleted in batches, one transaction each
+    purge_batch_size: int = 1000  # Items per DELETE ... RETURNING batch
+    purge_batch_pause_seconds: float = 0.2  # Pause between batches
 
     # Proxy Pool
     proxy_pool_min: int = 20  # Minimum working proxies to maintain
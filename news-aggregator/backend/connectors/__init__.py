@@ -19,6 +19,8 @@ Usage:
 """
 
 from .base import BaseConnector, RawItem
+from .feed_cache import FeedNotModifiedError, FeedValidators
+from .known_entries import KnownEntries
 from .registry import ConnectorRegistry
 
 # Import all connectors to register them
@@ -40,6 +42,9 @@ __all__ = [
     "BaseConnector",
     "RawItem",
     "ConnectorRegistry",
+    "FeedNotModifiedError",
+    "FeedValidators",
+    "KnownEntries",
     # Connectors
     "RSSConnector",
     "HTMLConnector",
@@ -6,6 +6,9 @@ from typing import Any, ClassVar
 
 from pydantic import BaseModel, Field
 
+from .feed_cache import FeedValidators
+from .known_entries import KnownEntries
+
 
 class RawItem(BaseModel):
     """Normalized item format returned by all connectors."""
@@ -34,6 +37,19 @@ class BaseConnector(ABC):
     description: ClassVar[str]  # Shown in UI
     config_schema: ClassVar[type[BaseModel]]  # Pydantic model for config
 
+    # Stored conditional GET validators of the channel being fetched. Set by the
+    # scheduler; feed connectors send and refresh them (see feed_cache.py).
+    feed_validators: FeedValidators | None = None
+
+    # Connectors that follow links per entry set this so the scheduler loads the
+    # channel's stored external_ids into known_entries before fetch()
+    uses_known_entries: ClassVar[bool] = False
+    known_entries: KnownEntries | None = None
+
+    def is_known_entry(self, external_id: str) -> bool:
+        """True if the entry is already stored for this channel (skip enrichment)."""
+        return self.known_entries is not None and self.known_entries.seen(external_id)
+
     @abstractmethod
     async def fetch(self, config: BaseModel) -> list[RawItem]:
         """Fetch items from the configured source.
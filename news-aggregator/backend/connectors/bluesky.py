@@ -4,11 +4,14 @@ import logging
 from datetime import datetime
 from time import mktime
 
-import feedparser
 import httpx
 from pydantic import BaseModel, Field, field_validator
 
+from services.http_clients import get_http_client
+from services.parse_pool import parse_feed
+
 from .base import BaseConnector, RawItem
+from .feed_cache import fetch_feed_text
 from .registry import ConnectorRegistry
 
 logger = logging.getLogger(__name__)
@@ -42,6 +45,7 @@ class BlueskyConnector(BaseConnector):
     display_name = "Bluesky"
     description = "Follow Bluesky accounts via RSS"
     config_schema = BlueskyConfig
+    uses_known_entries = True
 
     def _get_rss_url(self, handle: str) -> str:
         """Get RSS feed URL for a Bluesky handle."""
@@ -67,15 +71,16 @@ class BlueskyConnector(BaseConnector):
 
         rss_url = self._get_rss_url(config.handle)
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                rss_url,
-                headers={"User-Agent": "NewsAggregator/1.0"},
-                follow_redirects=True,
-            )
-            response.raise_for_status()
+        client = get_http_client(timeout=30.0)
+        # Raises FeedNotModifiedError if unchanged since the last fetch
+        feed_text = await fetch_feed_text(
+            client,
+            rss_url,
+            self.feed_validators,
+            headers={"User-Agent": "NewsAggregator/1.0"},
+        )
 
-        feed = feedparser.parse(response.text)
+        feed = await parse_feed(feed_text)
         items = []
 
         for entry in feed.entries:
@@ -92,9 +97,11 @@ class BlueskyConnector(BaseConnector):
             title = content[:100] + "..." if len(content) > 100 else content
 
             # Try to fetch full article content if link following is enabled
+            # (not for entries already stored, the pipeline drops those)
+            external_id = entry.get("id", entry.link)
             final_content = content
             article_fetched = False
-            if article_extractor:
+            if article_extractor and not self.is_known_entry(external_id):
                 urls = article_extractor.extract_urls_from_text(content)
                 # Filter out internal Bluesky links
                 external_urls = [
@@ -116,7 +123,7 @@ class BlueskyConnector(BaseConnector):
 
             items.append(
                 RawItem(
-                    external_id=entry.get("id", entry.link),
+                    external_id=external_id,
                     title=title,
                     content=final_content,
                     url=entry.link,
@@ -144,19 +151,19 @@ class BlueskyConnector(BaseConnector):
         try:
             rss_url = self._get_rss_url(config.handle)
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    rss_url,
-                    headers={"User-Agent": "NewsAggregator/1.0"},
-                    follow_redirects=True,
-                )
+            client = get_http_client(timeout=10.0)
+            response = await client.get(
+                rss_url,
+                headers={"User-Agent": "NewsAggregator/1.0"},
+                follow_redirects=True,
+            )
 
-                if response.status_code == 404:
-                    return False, f"Account not found: @{config.handle}"
+            if response.status_code == 404:
+                return False, f"Account not found: @{config.handle}"
 
-                response.raise_for_status()
+            response.raise_for_status()
 
-            feed = feedparser.parse(response.text)
+            feed = await parse_feed(response.text)
             return True, f"Found {len(feed.entries)} posts from @{config.handle}"
 
         except httpx.TimeoutException:
@@ -0,0 +1,112 @@
+"""Conditional GET support for feed-based connectors.
+
+The scheduler hands a connector the validators stored for its channel
+(ETag, Last-Modified, SHA-256 of the last body). Feed connectors send them as
+If-None-Match / If-Modified-Since and raise FeedNotModifiedError on a 304 or
+when the body hash is unchanged, so parsing, article following and the
+pipeline are skipped. Updated validators are left on the connector for the scheduler
+to persist once the fetch has been processed successfully.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Any
+
+from services.http_clients import PooledHttpClient
+
+
+class FeedNotModifiedError(Exception):
+    """The feed is unchanged since the last successful fetch."""
+
+    def __init__(self, reason: str):
+        """
+        Args:
+            reason: "not_modified" (HTTP 304) or "unchanged" (same body hash)
+        """
+        super().__init__(f"Feed {reason}")
+        self.reason = reason
+
+
+@dataclass
+class FeedValidators:
+    """Cache validators of one feed URL."""
+
+    url: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    body_hash: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "FeedValidators":
+        data = data or {}
+        return cls(
+            url=data.get("url"),
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+            body_hash=data.get("body_hash"),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "url": self.url,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "body_hash": self.body_hash,
+        }
+
+    def request_headers(self, url: str) -> dict[str, str]:
+        """Conditional request headers (only valid for the URL they were stored for)."""
+        if url != self.url:
+            return {}
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+async def fetch_feed_text(
+    client: PooledHttpClient,
+    url: str,
+    validators: FeedValidators | None,
+    headers: dict[str, str] | None = None,
+) -> str:
+    """GET a feed, honouring and refreshing the channel's validators.
+
+    Args:
+        client: Shared HTTP client to use
+        url: Feed URL
+        validators: Stored validators (None = unconditional fetch, nothing recorded)
+        headers: Extra request headers
+
+    Returns:
+        Response body text
+
+    Raises:
+        FeedNotModifiedError: Server answered 304 or the body is byte-identical
+        httpx.HTTPStatusError: Any other non-2xx response
+    """
+    request_headers = dict(headers or {})
+    if validators is not None:
+        request_headers.update(validators.request_headers(url))
+
+    response = await client.get(url, headers=request_headers, follow_redirects=True)
+    if response.status_code == 304 and validators is not None and validators.url == url:
+        raise FeedNotModifiedError("not_modified")
+    response.raise_for_status()
+
+    if validators is None:
+        return response.text
+
+    body_hash = hashlib.sha256(response.content).hexdigest()
+    unchanged = validators.url == url and validators.body_hash == body_hash
+
+    validators.url = url
+    validators.etag = response.headers.get("etag")
+    validators.last_modified = response.headers.get("last-modified")
+    validators.body_hash = body_hash
+
+    if unchanged:
+        raise FeedNotModifiedError("unchanged")
+    return response.text
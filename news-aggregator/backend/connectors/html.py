@@ -5,9 +5,11 @@ from datetime import datetime
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
 from pydantic import BaseModel, Field, HttpUrl
 
+from services.http_clients import get_http_client
+from services.parse_pool import count_html_items, extract_html_items
+
 from .base import BaseConnector, RawItem
 from .registry import ConnectorRegistry
 
@@ -55,63 +57,47 @@ class HTMLConnector(BaseConnector):
         Returns:
             List of RawItem objects from the page
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                str(config.url),
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                },
-                follow_redirects=True,
-            )
-            response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "lxml")
+        client = get_http_client(timeout=30.0)
+        response = await client.get(
+            str(config.url),
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+            },
+            follow_redirects=True,
+        )
+        response.raise_for_status()
+
+        # Selector matching runs in the parse pool
+        selected = await extract_html_items(response.text, {
+            "item": config.item_selector,
+            "title": config.title_selector,
+            "link": config.link_selector,
+            "content": config.content_selector,
+            "date": config.date_selector,
+        })
         items = []
         base_url = str(config.url)
 
-        for element in soup.select(config.item_selector):
-            # Extract title
-            title_el = element.select_one(config.title_selector)
-            if not title_el:
-                continue
-
-            title = title_el.get_text(strip=True)
-            if not title:
-                continue
+        for entry in selected:
+            title = entry["title"]
 
             # Generate external ID from title hash
             external_id = hashlib.md5(title.encode()).hexdigest()[:16]
 
-            # Extract link
+            # Resolve link
             link = base_url
-            if config.link_selector:
-                link_el = element.select_one(config.link_selector)
-                if link_el:
-                    href = link_el.get("href")
-                    if href:
-                        link = urljoin(base_url, href)
-            elif title_el.get("href"):
-                link = urljoin(base_url, title_el["href"])
-            elif title_el.name == "a":
-                link = urljoin(base_url, title_el.get("href", ""))
-
-            # Extract content
-            content = ""
-            if config.content_selector:
-                content_el = element.select_one(config.content_selector)
-                if content_el:
-                    content = content_el.get_text(strip=True)
-
-            # Extract date
+            if entry["href"] is not None:
+                link = urljoin(base_url, entry["href"])
+
+            content = entry["content"]
+
+            # Parse date
             published_at = None
-            if config.date_selector and config.date_format:
-                date_el = element.select_one(config.date_selector)
-                if date_el:
-                    date_text = date_el.get_text(strip=True)
-                    try:
-                        published_at = datetime.strptime(date_text, config.date_format)
-                    except ValueError:
-                        pass
+            if entry["date_text"] and config.date_format:
+                try:
+                    published_at = datetime.strptime(entry["date_text"], config.date_format)
+                except ValueError:
+                    pass
 
             items.append(
                 RawItem(
@@ -139,23 +125,22 @@ class HTMLConnector(BaseConnector):
             Tuple of (success, message)
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    str(config.url),
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                    },
-                    follow_redirects=True,
-                )
-                response.raise_for_status()
+            client = get_http_client(timeout=10.0)
+            response = await client.get(
+                str(config.url),
+                headers={
+                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+                },
+                follow_redirects=True,
+            )
+            response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "lxml")
-            items = soup.select(config.item_selector)
+            count = await count_html_items(response.text, config.item_selector)
 
-            if not items:
+            if not count:
                 return False, f"No items found with selector: {config.item_selector}"
 
-            return True, f"Found {len(items)} items"
+            return True, f"Found {count} items"
 
         except httpx.TimeoutException:
             return False, "Connection timeout"
@@ -8,6 +8,8 @@ import httpx
 from bs4 import BeautifulSoup
 from pydantic import BaseModel, Field, field_validator
 
+from services.http_clients import PooledHttpClient, get_http_client
+
 from .base import BaseConnector, RawItem
 from .registry import ConnectorRegistry
 
@@ -94,7 +96,7 @@ class InstagramConnector(BaseConnector):
         return None
 
     async def _fetch_from_picuki(
-        self, client: httpx.AsyncClient, config: InstagramConfig
+        self, client: PooledHttpClient, config: InstagramConfig
     ) -> list[RawItem]:
         """Fetch posts from Picuki."""
         url = f"https://www.picuki.com/profile/{config.username}"
@@ -174,7 +176,7 @@ class InstagramConnector(BaseConnector):
         return items
 
     async def _fetch_from_picnob(
-        self, client: httpx.AsyncClient, config: InstagramConfig
+        self, client: PooledHttpClient, config: InstagramConfig
     ) -> list[RawItem]:
         """Fetch posts from Picnob."""
         url = f"https://www.picnob.com/profile/{config.username}/"
@@ -239,7 +241,7 @@ class InstagramConnector(BaseConnector):
         return items
 
     async def _fetch_from_imginn(
-        self, client: httpx.AsyncClient, config: InstagramConfig
+        self, client: PooledHttpClient, config: InstagramConfig
     ) -> list[RawItem]:
         """Fetch posts from Imginn."""
         url = f"https://imginn.com/{config.username}/"
@@ -321,17 +323,17 @@ class InstagramConnector(BaseConnector):
             "Accept-Language": "en-US,en;q=0.5",
         }
 
-        async with httpx.AsyncClient(timeout=30.0, headers=headers) as client:
-            # Try configured instance first
-            if config.proxy_instance == "picuki.com":
-                return await self._fetch_from_picuki(client, config)
-            elif config.proxy_instance == "picnob.com":
-                return await self._fetch_from_picnob(client, config)
-            elif config.proxy_instance == "imginn.com":
-                return await self._fetch_from_imginn(client, config)
-            else:
-                # Default to picuki
-                return await self._fetch_from_picuki(client, config)
+        client = get_http_client(timeout=30.0, headers=headers)
+        # Try configured instance first
+        if config.proxy_instance == "picuki.com":
+            return await self._fetch_from_picuki(client, config)
+        elif config.proxy_instance == "picnob.com":
+            return await self._fetch_from_picnob(client, config)
+        elif config.proxy_instance == "imginn.com":
+            return await self._fetch_from_imginn(client, config)
+        else:
+            # Default to picuki
+            return await self._fetch_from_picuki(client, config)
 
     async def validate(self, config: InstagramConfig) -> tuple[bool, str]:
         """Validate Instagram account via proxy.
@@ -358,33 +360,33 @@ class InstagramConnector(BaseConnector):
             try:
                 test_config = config.model_copy(update={"proxy_instance": instance})
 
-                async with httpx.AsyncClient(timeout=15.0, headers=headers) as client:
-                    url = self._get_profile_url(test_config)
-                    response = await client.get(url, follow_redirects=True)
+                client = get_http_client(timeout=15.0, headers=headers)
+                url = self._get_profile_url(test_config)
+                response = await client.get(url, follow_redirects=True)
 
-                    if response.status_code == 404:
-                        return False, f"Account not found: @{config.username}"
+                if response.status_code == 404:
+                    return False, f"Account not found: @{config.username}"
 
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, "html.parser")
-
-                        # Check for "not found" or "private" indicators
-                        page_text = soup.get_text().lower()
-                        if "not found" in page_text or "doesn't exist" in page_text:
-                            return False, f"Account not found: @{config.username}"
-                        if "private" in page_text and "account is private" in page_text:
-                            return False, f"Account @{config.username} is private"
-
-                        # Check for posts
-                        posts = soup.select(".box-photo, .item, .post-item, .photo-item")
-                        if posts:
-                            msg = f"Found {len(posts)} posts"
-                            if instance != config.proxy_instance:
-                                msg += f" (using {instance})"
-                            return True, msg
-
-                        # Profile exists but no posts visible
-                        return True, f"Profile found, but no public posts visible (using {instance})"
+                if response.status_code == 200:
+                    soup = BeautifulSoup(response.text, "html.parser")
+
+                    # Check for "not found" or "private" indicators
+                    page_text = soup.get_text().lower()
+                    if "not found" in page_text or "doesn't exist" in page_text:
+                        return False, f"Account not found: @{config.username}"
+                    if "private" in page_text and "account is private" in page_text:
+                        return False, f"Account @{config.username} is private"
+
+                    # Check for posts
+                    posts = soup.select(".box-photo, .item, .post-item, .photo-item")
+                    if posts:
+                        msg = f"Found {len(posts)} posts"
+                        if instance != config.proxy_instance:
+                            msg += f" (using {instance})"
+                        return True, msg
+
+                    # Profile exists but no posts visible
+                    return True, f"Profile found, but no public posts visible (using {instance})"
 
             except httpx.HTTPStatusError as e:
                 last_error = f"HTTP {e.response.status_code}"
@@ -17,6 +17,7 @@ from pydantic import BaseModel, Field, field_validator
 from .base import BaseConnector, RawItem
 from .registry import ConnectorRegistry
 from services.browser_pool import browser_pool
+from services.resource_blocking import block_resources
 
 logger = logging.getLogger(__name__)
 
@@ -110,6 +111,7 @@ class InstagramScraperConnector(BaseConnector):
         viewport = random.choice(self.VIEWPORTS)
 
         items = []
+        metrics = None
 
         # Use shared browser pool instead of creating new Playwright instance
         async with browser_pool.get_browser() as browser:
@@ -125,6 +127,8 @@ class InstagramScraperConnector(BaseConnector):
                     context_args["proxy"] = {"server": proxy_server}
 
                 context = await browser.new_context(**context_args)
+                # Skip images/video/fonts and trackers, count bytes and load time
+                metrics = await block_resources(context, self.connector_type)
                 page = await context.new_page()
 
                 # Apply stealth mode
@@ -135,7 +139,7 @@ class InstagramScraperConnector(BaseConnector):
                 url = f"https://www.instagram.com/{config.username}/"
                 logger.info(f"Fetching Instagram profile: {url}")
 
-                await page.goto(url, wait_until="domcontentloaded", timeout=45000)
+                await metrics.goto(page, url, wait_until="domcontentloaded", timeout=45000)
 
                 # Wait for page to load and check for errors
                 await page.wait_for_timeout(3000)
@@ -168,6 +172,8 @@ class InstagramScraperConnector(BaseConnector):
                 logger.error(f"Error scraping @{config.username}: {e}")
                 raise
             finally:
+                if metrics:
+                    await metrics.finish()
                 # Close context (browser is closed by pool)
                 try:
                     await context.close()
@@ -324,35 +330,31 @@ class InstagramScraperConnector(BaseConnector):
     async def validate(self, config: InstagramScraperConfig) -> tuple[bool, str]:
         """Validate configuration by checking if profile exists."""
         try:
-            async with browser_pool.get_browser() as browser:
-                context = await browser.new_context(
-                    user_agent=random.choice(self.USER_AGENTS),
-                )
-                try:
-                    page = await context.new_page()
+            async with browser_pool.new_context(
+                user_agent=random.choice(self.USER_AGENTS),
+            ) as context:
+                page = await context.new_page()
 
-                    stealth = Stealth()
-                    await stealth.apply_stealth_async(page)
+                stealth = Stealth()
+                await stealth.apply_stealth_async(page)
 
-                    url = f"https://www.instagram.com/{config.username}/"
-                    await page.goto(url, timeout=20000)
-                    await page.wait_for_timeout(2000)
+                url = f"https://www.instagram.com/{config.username}/"
+                await page.goto(url, timeout=20000)
+                await page.wait_for_timeout(2000)
 
-                    content = await page.content()
+                content = await page.content()
 
-                    if "Sorry, this page isn't available" in content:
-                        return False, f"Profile @{config.username} not found"
+            if "Sorry, this page isn't available" in content:
+                return False, f"Profile @{config.username} not found"
 
-                    if "This Account is Private" in content:
-                        return False, f"Profile @{config.username} is private"
+            if "This Account is Private" in content:
+                return False, f"Profile @{config.username} is private"
 
-                    # Check for posts
-                    if "/p/" in content:
-                        return True, f"Profile @{config.username} found with posts"
+            # Check for posts
+            if "/p/" in content:
+                return True, f"Profile @{config.username} found with posts"
 
-                    return True, f"Profile @{config.username} found (may have no posts)"
-                finally:
-                    await context.close()
+            return True, f"Profile @{config.username} found (may have no posts)"
 
         except PlaywrightTimeout:
             return False, "Connection timeout - Instagram may be blocking"
@@ -0,0 +1,46 @@
+"""Compact set of a channel's already stored entries.
+
+Loaded by the scheduler once per fetch and handed to the connector, so link
+following and other per-entry enrichment only run for entries the pipeline
+will not drop as duplicates anyway.
+"""
+
+import hashlib
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+
+
+def _entry_key(external_id: str) -> int:
+    """64-bit signed hash of an external_id."""
+    digest = hashlib.blake2b(external_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class KnownEntries:
+    """Sorted array of 64-bit external_id hashes (8 bytes per entry).
+
+    Membership is a binary search. A hash collision only means one new entry
+    keeps its feed summary instead of the followed article.
+    """
+
+    def __init__(self, external_ids: Iterable[str]):
+        self._keys = array("q", sorted({_entry_key(e) for e in external_ids if e}))
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, external_id: object) -> bool:
+        if not isinstance(external_id, str) or not self._keys:
+            return False
+        key = _entry_key(external_id)
+        index = bisect_left(self._keys, key)
+        return index < len(self._keys) and self._keys[index] == key
+
+    def seen(self, external_id: str) -> bool:
+        """Check an entry and count the hit (for logging)."""
+        if external_id in self:
+            self.hits += 1
+            return True
+        return False
@@ -8,10 +8,12 @@ from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
 
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import TimeoutError as PlaywrightTimeout
 from playwright_stealth import Stealth
 from pydantic import BaseModel, Field, field_validator
 
+from services.browser_pool import browser_pool
+
 from .base import BaseConnector, RawItem
 from .registry import ConnectorRegistry
 
@@ -191,29 +193,19 @@ class LinkedInConnector(BaseConnector):
 
         items = []
 
-        try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        "--disable-blink-features=AutomationControlled",
-                        "--no-sandbox",
-                        "--disable-setuid-sandbox",
-                    ],
-                )
-
-                context_args = {
-                    "user_agent": user_agent,
-                    "viewport": viewport,
-                    "locale": locale,
-                    "timezone_id": "Europe/Berlin",
-                }
-
-                if proxy_server:
-                    context_args["proxy"] = {"server": proxy_server}
+        context_args = {
+            "user_agent": user_agent,
+            "viewport": viewport,
+            "locale": locale,
+            "timezone_id": "Europe/Berlin",
+        }
 
-                context = await browser.new_context(**context_args)
+        if proxy_server:
+            context_args["proxy"] = {"server": proxy_server}
 
+        try:
+            # Warm browser from the shared pool, isolated context per fetch
+            async with browser_pool.new_context(**context_args) as context:
                 # Inject cookies
                 await context.add_cookies(cookies)
                 logger.info("Injected LinkedIn cookies for authenticated access")
@@ -252,7 +244,6 @@ class LinkedInConnector(BaseConnector):
                     )
                     if not posts_exist:
                         logger.warning(f"No posts found for {config.profile_url}")
-                        await browser.close()
                         return []
 
                 # Scroll to load more posts
@@ -263,8 +254,6 @@ class LinkedInConnector(BaseConnector):
                 # Extract posts
                 items = await self._extract_posts(page, config)
 
-                await browser.close()
-
         except PlaywrightTimeout as e:
             logger.error(f"Timeout scraping {config.profile_url}: {e}")
             raise
@@ -479,11 +468,9 @@ Verlinkter Artikel von {article.source_domain}:
 
         # Try to load the page
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    user_agent=random.choice(self.USER_AGENTS),
-                )
+            async with browser_pool.new_context(
+                user_agent=random.choice(self.USER_AGENTS),
+            ) as context:
                 await context.add_cookies(cookies)
                 page = await context.new_page()
                 stealth = Stealth()
@@ -494,16 +481,13 @@ Verlinkter Artikel von {article.source_domain}:
                 # Check for login redirect
                 current_url = page.url
                 if "login" in current_url or "authwall" in current_url:
-                    await browser.close()
                     return False, "Cookies expired or invalid. Re-run cookie extraction."
 
-                await browser.close()
-
-                if response and response.status == 200:
-                    return True, f"LinkedIn {config.profile_type} profile accessible: {config.profile_id}"
-                else:
-                    status = response.status if response else "error"
-                    return False, f"Profile not accessible (HTTP {status})"
+            if response and response.status == 200:
+                return True, f"LinkedIn {config.profile_type} profile accessible: {config.profile_id}"
+            else:
+                status = response.status if response else "error"
+                return False, f"Profile not accessible (HTTP {status})"
 
         except Exception as e:
             return False, f"Validation error: {str(e)}"
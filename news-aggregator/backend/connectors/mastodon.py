@@ -5,11 +5,14 @@ import re
 from datetime import datetime
 from time import mktime
 
-import feedparser
 import httpx
 from pydantic import BaseModel, Field, field_validator
 
+from services.http_clients import get_http_client
+from services.parse_pool import parse_feed
+
 from .base import BaseConnector, RawItem
+from .feed_cache import fetch_feed_text
 from .registry import ConnectorRegistry
 
 logger = logging.getLogger(__name__)
@@ -64,6 +67,7 @@ class MastodonConnector(BaseConnector):
     display_name = "Mastodon"
     description = "Follow Mastodon/Fediverse accounts"
     config_schema = MastodonConfig
+    uses_known_entries = True
 
     def _strip_html(self, html: str) -> str:
         """Remove HTML tags from string."""
@@ -100,15 +104,16 @@ class MastodonConnector(BaseConnector):
         """Fetch posts via RSS feed."""
         rss_url = self._get_rss_url(config)
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                rss_url,
-                headers={"User-Agent": "NewsAggregator/1.0"},
-                follow_redirects=True,
-            )
-            response.raise_for_status()
+        client = get_http_client(timeout=30.0)
+        # Raises FeedNotModifiedError if unchanged since the last fetch
+        feed_text = await fetch_feed_text(
+            client,
+            rss_url,
+            self.feed_validators,
+            headers={"User-Agent": "NewsAggregator/1.0"},
+        )
 
-        feed = feedparser.parse(response.text)
+        feed = await parse_feed(feed_text)
         items = []
 
         for entry in feed.entries:
@@ -125,9 +130,11 @@ class MastodonConnector(BaseConnector):
             title = plain_content[:100] + "..." if len(plain_content) > 100 else plain_content
 
             # Try to fetch full article content if link following is enabled
+            # (not for entries already stored, the pipeline drops those)
+            external_id = entry.get("id", entry.link)
             final_content = plain_content
             article_fetched = False
-            if article_extractor:
+            if article_extractor and not self.is_known_entry(external_id):
                 urls = article_extractor.extract_urls_from_text(content)
                 # Filter out internal Mastodon links (same instance, known Mastodon domains)
                 external_urls = [
@@ -151,7 +158,7 @@ class MastodonConnector(BaseConnector):
 
             items.append(
                 RawItem(
-                    external_id=entry.get("id", entry.link),
+                    external_id=external_id,
                     title=title,
                     content=final_content,
                     url=entry.link,
@@ -176,27 +183,27 @@ class MastodonConnector(BaseConnector):
         if config.api_token:
             headers["Authorization"] = f"Bearer {config.api_token}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # First, look up account ID
-            lookup_url = f"{api_base}/accounts/lookup"
-            response = await client.get(
-                lookup_url,
-                params={"acct": config.username},
-                headers=headers,
-            )
-            response.raise_for_status()
-            account = response.json()
-            account_id = account["id"]
-
-            # Fetch statuses
-            statuses_url = f"{api_base}/accounts/{account_id}/statuses"
-            response = await client.get(
-                statuses_url,
-                params={"limit": 40, "exclude_replies": True},
-                headers=headers,
-            )
-            response.raise_for_status()
-            statuses = response.json()
+        client = get_http_client(timeout=30.0)
+        # First, look up account ID
+        lookup_url = f"{api_base}/accounts/lookup"
+        response = await client.get(
+            lookup_url,
+            params={"acct": config.username},
+            headers=headers,
+        )
+        response.raise_for_status()
+        account = response.json()
+        account_id = account["id"]
+
+        # Fetch statuses
+        statuses_url = f"{api_base}/accounts/{account_id}/statuses"
+        response = await client.get(
+            statuses_url,
+            params={"limit": 40, "exclude_replies": True},
+            headers=headers,
+        )
+        response.raise_for_status()
+        statuses = response.json()
 
         items = []
         for status in statuses:
@@ -218,9 +225,10 @@ class MastodonConnector(BaseConnector):
                     pass
 
             # Try to fetch full article content if link following is enabled
+            # (not for entries already stored, the pipeline drops those)
             final_content = plain_content
             article_fetched = False
-            if article_extractor:
+            if article_extractor and not self.is_known_entry(str(status["id"])):
                 urls = article_extractor.extract_urls_from_text(html_content)
                 # Filter out internal Mastodon links (same instance, known Mastodon domains)
                 external_urls = [
@@ -278,19 +286,19 @@ class MastodonConnector(BaseConnector):
         try:
             rss_url = self._get_rss_url(config)
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    rss_url,
-                    headers={"User-Agent": "NewsAggregator/1.0"},
-                    follow_redirects=True,
-                )
+            client = get_http_client(timeout=10.0)
+            response = await client.get(
+                rss_url,
+                headers={"User-Agent": "NewsAggregator/1.0"},
+                follow_redirects=True,
+            )
 
-                if response.status_code == 404:
-                    return False, f"Account not found: @{config.handle}"
+            if response.status_code == 404:
+                return False, f"Account not found: @{config.handle}"
 
-                response.raise_for_status()
+            response.raise_for_status()
 
-            feed = feedparser.parse(response.text)
+            feed = await parse_feed(response.text)
             return True, f"Valid Mastodon account @{config.handle} ({len(feed.entries)} posts)"
 
         except httpx.TimeoutException:
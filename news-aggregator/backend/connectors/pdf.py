@@ -1,13 +1,14 @@
 """PDF document connector for extracting text from PDFs."""
 
 import hashlib
-import io
 from datetime import datetime
 
 import httpx
-import pymupdf
 from pydantic import BaseModel, Field, HttpUrl
 
+from services.http_clients import get_http_client
+from services.parse_pool import extract_pdf
+
 from .base import BaseConnector, RawItem
 from .registry import ConnectorRegistry
 
@@ -28,7 +29,7 @@ class PDFConfig(BaseModel):
 class PDFConnector(BaseConnector):
     """PDF document connector.
 
-    Extracts text content from PDF documents using PyMuPDF.
+    Extracts text content from PDF documents using PyMuPDF (in the parse pool).
     """
 
     connector_type = "pdf"
@@ -51,54 +52,43 @@ class PDFConnector(BaseConnector):
                 "PDF link extraction from HTML not yet implemented"
             )
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(
-                str(config.url),
-                headers={"User-Agent": "NewsAggregator/1.0"},
-                follow_redirects=True,
-            )
-            response.raise_for_status()
-
-        # Parse PDF
-        pdf_bytes = io.BytesIO(response.content)
-        doc = pymupdf.open(stream=pdf_bytes, filetype="pdf")
-
-        try:
-            # Extract text from all pages
-            full_text = ""
-            for page in doc:
-                full_text += page.get_text()
-
-            # Get metadata
-            metadata = doc.metadata or {}
-            page_count = len(doc)
-
-            # Use metadata title or first line as title
-            title = metadata.get("title", "").strip()
-            if not title:
-                first_line = full_text.split("\n")[0].strip()[:100]
-                title = first_line if first_line else "PDF Document"
-
-            # Generate unique ID from content hash
-            external_id = hashlib.md5(response.content).hexdigest()[:16]
-
-            # Get author
-            author = metadata.get("author")
-
-            # Try to parse creation date
-            published_at = None
-            if metadata.get("creationDate"):
-                try:
-                    # PDF date format: D:YYYYMMDDHHmmSS
-                    date_str = metadata["creationDate"]
-                    if date_str.startswith("D:"):
-                        date_str = date_str[2:16]  # Extract YYYYMMDDHHmmSS
-                        published_at = datetime.strptime(date_str, "%Y%m%d%H%M%S")
-                except (ValueError, IndexError):
-                    pass
-
-        finally:
-            doc.close()
+        client = get_http_client(timeout=60.0)
+        response = await client.get(
+            str(config.url),
+            headers={"User-Agent": "NewsAggregator/1.0"},
+            follow_redirects=True,
+        )
+        response.raise_for_status()
+
+        # Parse PDF (text extraction runs in the parse pool)
+        parsed = await extract_pdf(response.content)
+        full_text = parsed["text"]
+        metadata = parsed["metadata"]
+        page_count = parsed["page_count"]
+
+        # Use metadata title or first line as title
+        title = (metadata.get("title") or "").strip()
+        if not title:
+            first_line = full_text.split("\n")[0].strip()[:100]
+            title = first_line if first_line else "PDF Document"
+
+        # Generate unique ID from content hash
+        external_id = hashlib.md5(response.content).hexdigest()[:16]
+
+        # Get author
+        author = metadata.get("author")
+
+        # Try to parse creation date
+        published_at = None
+        if metadata.get("creationDate"):
+            try:
+                # PDF date format: D:YYYYMMDDHHmmSS
+                date_str = metadata["creationDate"]
+                if date_str.startswith("D:"):
+                    date_str = date_str[2:16]  # Extract YYYYMMDDHHmmSS
+                    published_at = datetime.strptime(date_str, "%Y%m%d%H%M%S")
+            except (ValueError, IndexError):
+                pass
 
         return [
             RawItem(
@@ -128,34 +118,34 @@ class PDFConnector(BaseConnector):
             Tuple of (success, message)
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                # Use HEAD request first to check content type
-                response = await client.head(
-                    str(config.url),
-                    headers={"User-Agent": "NewsAggregator/1.0"},
-                    follow_redirects=True,
-                )
-
-                content_type = response.headers.get("content-type", "").lower()
-
-                if "pdf" in content_type:
-                    return True, "Valid PDF URL"
-
-                # Some servers don't report content-type correctly for HEAD
-                # Try to fetch first bytes and check magic number
-                response = await client.get(
-                    str(config.url),
-                    headers={
-                        "User-Agent": "NewsAggregator/1.0",
-                        "Range": "bytes=0-4",
-                    },
-                    follow_redirects=True,
-                )
+            client = get_http_client(timeout=10.0)
+            # Use HEAD request first to check content type
+            response = await client.head(
+                str(config.url),
+                headers={"User-Agent": "NewsAggregator/1.0"},
+                follow_redirects=True,
+            )
+
+            content_type = response.headers.get("content-type", "").lower()
+
+            if "pdf" in content_type:
+                return True, "Valid PDF URL"
+
+            # Some servers don't report content-type correctly for HEAD
+            # Try to fetch first bytes and check magic number
+            response = await client.get(
+                str(config.url),
+                headers={
+                    "User-Agent": "NewsAggregator/1.0",
+                    "Range": "bytes=0-4",
+                },
+                follow_redirects=True,
+            )
 
-                if response.content.startswith(b"%PDF"):
-                    return True, "Valid PDF URL"
+            if response.content.startswith(b"%PDF"):
+                return True, "Valid PDF URL"
 
-                return False, f"Not a PDF file (content-type: {content_type})"
+            return False, f"Not a PDF file (content-type: {content_type})"
 
         except httpx.TimeoutException:
             return False, "Connection timeout"
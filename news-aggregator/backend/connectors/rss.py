@@ -7,11 +7,14 @@ from datetime import datetime
 from time import mktime
 from urllib.parse import parse_qs, urljoin, urlparse
 
-import feedparser
 import httpx
 from pydantic import BaseModel, Field, HttpUrl
 
+from services.http_clients import get_http_client
+from services.parse_pool import parse_feed
+
 from .base import BaseConnector, RawItem
+from .feed_cache import fetch_feed_text
 from .registry import ConnectorRegistry
 
 logger = logging.getLogger(__name__)
@@ -61,6 +64,7 @@ class RSSConnector(BaseConnector):
     display_name = "RSS Feed"
     description = "Subscribe to any RSS or Atom feed"
     config_schema = RSSConfig
+    uses_known_entries = True
 
     async def fetch(self, config: RSSConfig) -> list[RawItem]:
         """Fetch items from RSS feed.
@@ -80,17 +84,17 @@ class RSSConnector(BaseConnector):
             except ImportError:
                 logger.warning("ArticleExtractor not available, disabling link following")
 
-        # Use legacy SSL context for sites with certificate/TLS issues
-        ssl_context = create_legacy_ssl_context() if not config.verify_ssl else True
-        async with httpx.AsyncClient(timeout=30.0, verify=ssl_context) as client:
-            response = await client.get(
-                str(config.url),
-                headers={"User-Agent": "NewsAggregator/1.0"},
-                follow_redirects=True,
-            )
-            response.raise_for_status()
-
-        feed = feedparser.parse(response.text)
+        # Legacy TLS profile for sites with certificate/TLS issues
+        client = get_http_client(verify_ssl=config.verify_ssl, timeout=30.0)
+        # Raises FeedNotModifiedError if unchanged since the last fetch
+        feed_text = await fetch_feed_text(
+            client,
+            str(config.url),
+            self.feed_validators,
+            headers={"User-Agent": "NewsAggregator/1.0"},
+        )
+
+        feed = await parse_feed(feed_text)
         items = []
 
         for entry in feed.entries:
@@ -144,11 +148,15 @@ class RSSConnector(BaseConnector):
             if hasattr(entry, "tags"):
                 tags = [t.term for t in entry.tags if hasattr(t, "term")]
 
+            # Already stored entries are dropped by the pipeline: skip enrichment
+            external_id = entry.get("id", link)
+            known = self.is_known_entry(external_id)
+
             # Try to fetch full article content if link following is enabled
             content = rss_content
             article_fetched = False
             article_source_domain = None
-            if article_extractor and link:
+            if article_extractor and link and not known:
                 try:
                     article = await article_extractor.fetch_article(link)
                     if article and article.content:
@@ -163,7 +171,7 @@ class RSSConnector(BaseConnector):
 
             # Enrich Eurostat items with SDMX metadata
             is_eurostat = "eurostat" in str(config.url).lower()
-            if is_eurostat and not article_fetched:
+            if is_eurostat and not article_fetched and not known:
                 try:
                     from services.eurostat_metadata import get_eurostat_service
 
@@ -200,7 +208,7 @@ class RSSConnector(BaseConnector):
 
             items.append(
                 RawItem(
-                    external_id=entry.get("id", link),
+                    external_id=external_id,
                     title=entry.get("title", "Untitled"),
                     content=content,
                     url=link,
@@ -210,6 +218,8 @@ class RSSConnector(BaseConnector):
                 )
             )
 
+        if self.known_entries is not None and self.known_entries.hits:
+            logger.debug(f"Skipped enrichment for {self.known_entries.hits} known entries")
         return items
 
     async def validate(self, config: RSSConfig) -> tuple[bool, str]:
@@ -222,16 +232,15 @@ class RSSConnector(BaseConnector):
             Tuple of (success, message)
         """
         try:
-            ssl_context = create_legacy_ssl_context() if not config.verify_ssl else True
-            async with httpx.AsyncClient(timeout=10.0, verify=ssl_context) as client:
-                response = await client.get(
-                    str(config.url),
-                    headers={"User-Agent": "NewsAggregator/1.0"},
-                    follow_redirects=True,
-                )
-                response.raise_for_status()
+            client = get_http_client(verify_ssl=config.verify_ssl, timeout=10.0)
+            response = await client.get(
+                str(config.url),
+                headers={"User-Agent": "NewsAggregator/1.0"},
+                follow_redirects=True,
+            )
+            response.raise_for_status()
 
-            feed = feedparser.parse(response.text)
+            feed = await parse_feed(response.text)
 
             # Check if it's a valid feed
             if feed.bozo and not feed.entries:
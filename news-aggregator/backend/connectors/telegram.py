@@ -13,6 +13,8 @@ import httpx
 from bs4 import BeautifulSoup
 from pydantic import BaseModel, Field, field_validator
 
+from services.http_clients import get_http_client
+
 from .base import BaseConnector, RawItem
 from .registry import ConnectorRegistry
 
@@ -61,6 +63,7 @@ class TelegramConnector(BaseConnector):
     display_name = "Telegram"
     description = "Monitor public Telegram channels"
     config_schema = TelegramConfig
+    uses_known_entries = True
 
     # User agent for requests
     USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -90,59 +93,64 @@ class TelegramConnector(BaseConnector):
             "Accept-Language": "de-DE,de;q=0.9,en;q=0.8",
         }
 
-        async with httpx.AsyncClient(timeout=30.0, headers=headers) as client:
-            response = await client.get(url, follow_redirects=True)
-            response.raise_for_status()
+        client = get_http_client(timeout=30.0, headers=headers)
+        response = await client.get(url, follow_redirects=True)
+        response.raise_for_status()
 
-            # Check if channel exists
-            if "tgme_page_icon_error" in response.text:
-                logger.warning(f"Telegram channel not found: {config.channel}")
-                return []
+        # Check if channel exists
+        if "tgme_page_icon_error" in response.text:
+            logger.warning(f"Telegram channel not found: {config.channel}")
+            return []
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            items = []
+        soup = BeautifulSoup(response.text, "html.parser")
+        items = []
 
-            # Find all message widgets
-            messages = soup.select(".tgme_widget_message_wrap")
+        # Find all message widgets
+        messages = soup.select(".tgme_widget_message_wrap")
 
-            for msg in messages[:config.max_posts]:
-                try:
-                    item = self._parse_message(msg, config)
-                    if item:
-                        # Try to fetch full article content if link following is enabled
-                        if article_extractor and item.content:
-                            urls = article_extractor.extract_urls_from_text(item.content)
-                            # Filter out internal Telegram links
-                            external_urls = [
-                                u for u in urls
-                                if not any(domain in u.lower() for domain in [
-                                    "t.me", "telegram.org", "telegram.me",
-                                ])
-                            ]
-                            for ext_url in external_urls[:1]:  # Only follow first external link
-                                try:
-                                    article = await article_extractor.fetch_article(ext_url)
-                                    if article and article.content:
-                                        item = RawItem(
-                                            external_id=item.external_id,
-                                            title=item.title,
-                                            content=f"Nachricht: {item.content}\n\n--- Verlinkter Artikel von {article.source_domain} ---\n\n{article.content}",
-                                            url=item.url,
-                                            author=item.author,
-                                            published_at=item.published_at,
-                                            metadata={**item.metadata, "article_extracted": True},
-                                        )
-                                        logger.debug(f"Fetched article from {ext_url}: {len(article.content)} chars")
-                                        break
-                                except Exception as e:
-                                    logger.warning(f"Failed to fetch article from {ext_url}: {e}")
-                        items.append(item)
-                except Exception as e:
-                    logger.warning(f"Error parsing Telegram message: {e}")
-                    continue
-
-            logger.info(f"Fetched {len(items)} posts from Telegram @{config.channel}")
-            return items
+        for msg in messages[:config.max_posts]:
+            try:
+                item = self._parse_message(msg, config)
+                if item:
+                    # Try to fetch full article content if link following is enabled
+                    # (not for messages already stored, the pipeline drops those)
+                    if (
+                        article_extractor
+                        and item.content
+                        and not self.is_known_entry(item.external_id)
+                    ):
+                        urls = article_extractor.extract_urls_from_text(item.content)
+                        # Filter out internal Telegram links
+                        external_urls = [
+                            u for u in urls
+                            if not any(domain in u.lower() for domain in [
+                                "t.me", "telegram.org", "telegram.me",
+                            ])
+                        ]
+                        for ext_url in external_urls[:1]:  # Only follow first external link
+                            try:
+                                article = await article_extractor.fetch_article(ext_url)
+                                if article and article.content:
+                                    item = RawItem(
+                                        external_id=item.external_id,
+                                        title=item.title,
+                                        content=f"Nachricht: {item.content}\n\n--- Verlinkter Artikel von {article.source_domain} ---\n\n{article.content}",
+                                        url=item.url,
+                                        author=item.author,
+                                        published_at=item.published_at,
+                                        metadata={**item.metadata, "article_extracted": True},
+                                    )
+                                    logger.debug(f"Fetched article from {ext_url}: {len(article.content)} chars")
+                                    break
+                            except Exception as e:
+                                logger.warning(f"Failed to fetch article from {ext_url}: {e}")
+                    items.append(item)
+            except Exception as e:
+                logger.warning(f"Error parsing Telegram message: {e}")
+                continue
+
+        logger.info(f"Fetched {len(items)} posts from Telegram @{config.channel}")
+        return items
 
     def _parse_message(self, msg_wrap, config: TelegramConfig) -> RawItem | None:
         """Parse a single Telegram message widget.
@@ -277,34 +285,34 @@ class TelegramConnector(BaseConnector):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=15.0, headers=headers) as client:
-                response = await client.get(url, follow_redirects=True)
+            client = get_http_client(timeout=15.0, headers=headers)
+            response = await client.get(url, follow_redirects=True)
 
-                if response.status_code == 404:
-                    return False, f"Channel not found: @{config.channel}"
+            if response.status_code == 404:
+                return False, f"Channel not found: @{config.channel}"
 
-                if response.status_code != 200:
-                    return False, f"HTTP error {response.status_code}"
+            if response.status_code != 200:
+                return False, f"HTTP error {response.status_code}"
 
-                # Check for error page
-                if "tgme_page_icon_error" in response.text:
-                    return False, f"Channel not found or private: @{config.channel}"
+            # Check for error page
+            if "tgme_page_icon_error" in response.text:
+                return False, f"Channel not found or private: @{config.channel}"
 
-                # Parse to get channel info
-                soup = BeautifulSoup(response.text, "html.parser")
+            # Parse to get channel info
+            soup = BeautifulSoup(response.text, "html.parser")
 
-                # Get channel title
-                title_elem = soup.select_one(".tgme_channel_info_header_title")
-                channel_title = title_elem.get_text(strip=True) if title_elem else config.channel
+            # Get channel title
+            title_elem = soup.select_one(".tgme_channel_info_header_title")
+            channel_title = title_elem.get_text(strip=True) if title_elem else config.channel
 
-                # Get subscriber count
-                counter_elem = soup.select_one(".tgme_channel_info_counter .counter_value")
-                subscribers = counter_elem.get_text(strip=True) if counter_elem else "unknown"
+            # Get subscriber count
+            counter_elem = soup.select_one(".tgme_channel_info_counter .counter_value")
+            subscribers = counter_elem.get_text(strip=True) if counter_elem else "unknown"
 
-                # Count visible messages
-                messages = soup.select(".tgme_widget_message_wrap")
+            # Count visible messages
+            messages = soup.select(".tgme_widget_message_wrap")
 
-                return True, f"Channel '{channel_title}' ({subscribers} subscribers), {len(messages)} recent posts visible"
+            return True, f"Channel '{channel_title}' ({subscribers} subscribers), {len(messages)} recent posts visible"
 
         except httpx.TimeoutException:
             return False, "Connection timeout"
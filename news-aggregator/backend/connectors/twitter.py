@@ -3,10 +3,11 @@
 from datetime import datetime
 from time import mktime
 
-import feedparser
-import httpx
 from pydantic import BaseModel, Field, field_validator
 
+from services.http_clients import get_http_client
+from services.parse_pool import parse_feed
+
 from .base import BaseConnector, RawItem
 from .registry import ConnectorRegistry
 
@@ -65,15 +66,15 @@ class TwitterConnector(BaseConnector):
         """
         rss_url = self._get_rss_url(config)
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                rss_url,
-                headers={"User-Agent": "NewsAggregator/1.0"},
-                follow_redirects=True,
-            )
-            response.raise_for_status()
+        client = get_http_client(timeout=30.0)
+        response = await client.get(
+            rss_url,
+            headers={"User-Agent": "NewsAggregator/1.0"},
+            follow_redirects=True,
+        )
+        response.raise_for_status()
 
-        feed = feedparser.parse(response.text)
+        feed = await parse_feed(response.text)
         items = []
 
         for entry in feed.entries:
@@ -143,23 +144,23 @@ class TwitterConnector(BaseConnector):
                 test_config = config.model_copy(update={"nitter_instance": instance})
                 rss_url = self._get_rss_url(test_config)
 
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    response = await client.get(
-                        rss_url,
-                        headers={"User-Agent": "NewsAggregator/1.0"},
-                        follow_redirects=True,
-                    )
-
-                    if response.status_code == 404:
-                        return False, f"Account not found: @{config.username}"
-
-                    if response.status_code == 200:
-                        feed = feedparser.parse(response.text)
-                        if feed.entries:
-                            msg = f"Found {len(feed.entries)} tweets"
-                            if instance != config.nitter_instance:
-                                msg += f" (using {instance})"
-                            return True, msg
+                client = get_http_client(timeout=10.0)
+                response = await client.get(
+                    rss_url,
+                    headers={"User-Agent": "NewsAggregator/1.0"},
+                    follow_redirects=True,
+                )
+
+                if response.status_code == 404:
+                    return False, f"Account not found: @{config.username}"
+
+                if response.status_code == 200:
+                    feed = await parse_feed(response.text)
+                    if feed.entries:
+                        msg = f"Found {len(feed.entries)} tweets"
+                        if instance != config.nitter_instance:
+                            msg += f" (using {instance})"
+                        return True, msg
 
             except Exception as e:
                 last_error = str(e)
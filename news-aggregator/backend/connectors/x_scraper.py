@@ -15,6 +15,7 @@ from pydantic import BaseModel, Field
 from .base import BaseConnector, RawItem
 from .registry import ConnectorRegistry
 from services.browser_pool import browser_pool
+from services.resource_blocking import block_resources
 
 logger = logging.getLogger(__name__)
 
@@ -165,6 +166,7 @@ class XScraperConnector(BaseConnector):
         locale = random.choice(self.LOCALES)
 
         items = []
+        metrics = None
 
         # Use shared browser pool instead of creating new Playwright instance
         async with browser_pool.get_browser() as browser:
@@ -181,6 +183,8 @@ class XScraperConnector(BaseConnector):
                     context_args["proxy"] = {"server": proxy_server}
 
                 context = await browser.new_context(**context_args)
+                # Skip images/video/fonts and trackers, count bytes and load time
+                metrics = await block_resources(context, self.connector_type)
 
                 # Load and inject saved cookies for authentication
                 cookies = self._load_cookies()
@@ -199,7 +203,7 @@ class XScraperConnector(BaseConnector):
                 auth_status = "authenticated" if cookies else "unauthenticated"
                 logger.info(f"Fetching X.com profile: {url} ({auth_status})" + (f" via proxy" if proxy_server else ""))
 
-                await page.goto(url, wait_until="domcontentloaded", timeout=45000)
+                await metrics.goto(page, url, wait_until="domcontentloaded", timeout=45000)
 
                 # Wait for tweets to load (may need to wait for JS to render)
                 try:
@@ -230,6 +234,8 @@ class XScraperConnector(BaseConnector):
                 logger.error(f"Error scraping @{config.username}: {e}")
                 raise
             finally:
+                if metrics:
+                    await metrics.finish()
                 # Close context (browser is closed by pool)
                 try:
                     await context.close()
@@ -502,21 +508,18 @@ Verlinkter Artikel von {article.source_domain}:
             # Get page HTML after JS execution
             html = await page.content()
 
-            # Use BeautifulSoup for parsing
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, "lxml")
+            # Article check and extraction (trafilatura works better with
+            # full HTML) run in the parse pool
+            from services.parse_pool import extract_article
+            extracted = await extract_article(html, url)
 
-            # Check if it's likely an article
-            is_article = article_extractor.is_likely_news_article(soup, url)
+            is_article = extracted["is_article"]
             if not is_article:
                 logger.debug(f"URL {url} does not appear to be a news article (Playwright)")
                 return None
 
-            # Extract title
-            title = article_extractor._extract_title(soup)
-
-            # Extract content using trafilatura (works better with full HTML)
-            content = article_extractor._extract_content(soup, html)
+            title = extracted["title"]
+            content = extracted["content"]
 
             if not content or len(content) < 100:
                 logger.debug(f"Insufficient content from {url}: {len(content) if content else 0} chars")
@@ -672,24 +675,20 @@ Verlinkter Artikel von {article.source_domain}:
             Tuple of (success, message)
         """
         try:
-            async with browser_pool.get_browser() as browser:
-                context = await browser.new_context(
-                    user_agent=random.choice(self.USER_AGENTS),
-                )
-                try:
-                    page = await context.new_page()
-                    stealth = Stealth()
-                    await stealth.apply_stealth_async(page)
-
-                    url = f"https://x.com/{config.username}"
-                    response = await page.goto(url, timeout=15000)
-
-                    if response and response.status == 200:
-                        return True, f"Profile @{config.username} found"
-                    else:
-                        return False, f"Profile @{config.username} not found (HTTP {response.status if response else 'error'})"
-                finally:
-                    await context.close()
+            async with browser_pool.new_context(
+                user_agent=random.choice(self.USER_AGENTS),
+            ) as context:
+                page = await context.new_page()
+                stealth = Stealth()
+                await stealth.apply_stealth_async(page)
+
+                url = f"https://x.com/{config.username}"
+                response = await page.goto(url, timeout=15000)
+
+                if response and response.status == 200:
+                    return True, f"Profile @{config.username} found"
+                else:
+                    return False, f"Profile @{config.username} not found (HTTP {response.status if response else 'error'})"
 
         except Exception as e:
             return False, f"Validation error: {str(e)}"
@@ -59,6 +59,9 @@ def _release_leader() -> None:
 async def run_migrations() -> None:
     """Run database migrations for existing databases."""
     from database import engine
+    from migrations.add_pipeline_columns import COLUMNS as PIPELINE_COLUMNS
+    from migrations.add_pipeline_columns import INDEXES as PIPELINE_INDEXES
+    from models import SEARCH_VECTOR_SQL
     from sqlalchemy import inspect, text
 
     async with engine.begin() as conn:
@@ -85,6 +88,12 @@ async def run_migrations() -> None:
             ("is_manually_reviewed", "ALTER TABLE items ADD COLUMN is_manually_reviewed BOOLEAN DEFAULT FALSE"),
             ("reviewed_at", "ALTER TABLE items ADD COLUMN reviewed_at TIMESTAMP"),
             ("assigned_aks", "ALTER TABLE items ADD COLUMN assigned_aks JSON DEFAULT '[]'"),
+            ("url_normalized", "ALTER TABLE items ADD COLUMN url_normalized VARCHAR(2000)"),
+            # Rewrites the table once (computes the vector for every existing item)
+            ("search_vector",
+             f"ALTER TABLE items ADD COLUMN search_vector TSVECTOR "
+             f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"),
+            *PIPELINE_COLUMNS,
         ]
 
         for column_name, sql in migrations:
@@ -92,6 +101,32 @@ async def run_migrations() -> None:
                 await conn.execute(text(sql))
                 logging.info(f"Migration: Added '{column_name}' column to items table")
 
+        # Add missing channel columns
+        def get_channel_columns(sync_conn):
+            inspector = inspect(sync_conn)
+            return [col["name"] for col in inspector.get_columns("channels")]
+
+        channel_columns = await conn.run_sync(get_channel_columns)
+        channel_migrations = [
+            ("feed_cache", "ALTER TABLE channels ADD COLUMN feed_cache JSONB DEFAULT '{}'"),
+            ("next_fetch_at", "ALTER TABLE channels ADD COLUMN next_fetch_at TIMESTAMP"),
+            ("fetch_stats", "ALTER TABLE channels ADD COLUMN fetch_stats JSONB DEFAULT '{}'"),
+        ]
+
+        for column_name, sql in channel_migrations:
+            if column_name not in channel_columns:
+                await conn.execute(text(sql))
+                logging.info(f"Migration: Added '{column_name}' column to channels table")
+
+        # Backfill due times from the static intervals
+        if "next_fetch_at" not in channel_columns:
+            await conn.execute(text("""
+                UPDATE channels
+                SET next_fetch_at = last_fetch_at + fetch_interval_minutes * INTERVAL '1 minute'
+                WHERE last_fetch_at IS NOT NULL
+            """))
+            logging.info("Migration: Backfilled channels.next_fetch_at")
+
         # Migrate assigned_ak from metadata to column for existing items
         if "assigned_ak" not in columns:
             await conn.execute(text("""
@@ -112,6 +147,13 @@ async def run_migrations() -> None:
             """))
             logging.info("Migration: assigned_ak values converted to assigned_aks arrays")
 
+        # Backfill normalized URLs used for cross-channel URL dedup
+        if "url_normalized" not in columns:
+            from migrations.add_url_normalized import backfill_url_normalized
+
+            updated = await backfill_url_normalized(conn)
+            logging.info(f"Migration: Backfilled url_normalized for {updated} items")
+
         # Migrate priority values: critical→high, high→medium, medium→low, low→none
         # Check if any items still have old priority values ('critical' only exists in old system)
         result = await conn.execute(text(
@@ -151,7 +193,7 @@ async def run_migrations() -> None:
                 # Clear pre_filter metadata so classifier worker will reprocess them
                 await conn.execute(text("""
                     UPDATE items
-                    SET metadata = metadata #- '{pre_filter}'
+                    SET metadata = metadata #- '{pre_filter}', classified_at = NULL
                     WHERE (summary IS NULL OR summary = '')
                       AND metadata #>> '{pre_filter}' IS NOT NULL
                 """))
@@ -183,6 +225,23 @@ async def run_migrations() -> None:
             ))
             logging.info("Migration: items.metadata converted to JSONB")
 
+        # One-time backfill of the work-queue columns from the metadata flags,
+        # committed per batch; re-runs until it has completed once
+        result = await conn.execute(text(
+            "SELECT value FROM settings WHERE key = 'pipeline_columns_backfill_done'"
+        ))
+        if not result.scalar():
+            from migrations.add_pipeline_columns import backfill_pipeline_columns
+
+            updated = await backfill_pipeline_columns(conn)
+            await conn.execute(text("""
+                INSERT INTO settings (key, value, description)
+                VALUES ('pipeline_columns_backfill_done', '"true"',
+                        'One-time copy of the metadata work-queue flags into item columns')
+                ON CONFLICT (key) DO UPDATE SET value = '"true"'
+            """))
+            logging.info(f"Migration: Backfilled work-queue columns for {updated} items")
+
         # Enable pg_trgm extension for trigram indexes
         await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
 
@@ -210,6 +269,16 @@ async def run_migrations() -> None:
             ("ix_items_metadata_gin",
              "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_metadata_gin "
              "ON items USING GIN (metadata jsonb_path_ops)"),
+            ("ix_channels_next_fetch_at",
+             "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_channels_next_fetch_at "
+             "ON channels (next_fetch_at) WHERE enabled = true"),
+            ("ix_items_url_normalized",
+             "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_url_normalized "
+             "ON items USING HASH (url_normalized)"),
+            ("ix_items_search_vector",
+             "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_search_vector "
+             "ON items USING GIN (search_vector)"),
+            *PIPELINE_INDEXES,
         ]
 
         for name, sql in indexes:
@@ -219,6 +288,23 @@ async def run_migrations() -> None:
                 # Index may already exist or be building concurrently
                 logging.warning(f"Index {name}: {e}")
 
+        # One-time fill of the stats rollup (table and triggers come from
+        # init_db) with the items that existed before it
+        result = await conn.execute(text(
+            "SELECT value FROM settings WHERE key = 'stats_rollup_backfill_done'"
+        ))
+        if not result.scalar():
+            from services.stats_rollup import reconcile_stats_rollup
+
+            counts = await reconcile_stats_rollup()
+            await conn.execute(text("""
+                INSERT INTO settings (key, value, description)
+                VALUES ('stats_rollup_backfill_done', '"true"',
+                        'One-time fill of item_stats_rollup from existing items')
+                ON CONFLICT (key) DO UPDATE SET value = '"true"'
+            """))
+            logging.info(f"Migration: Filled stats rollup ({counts['corrected']} buckets)")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -239,6 +325,20 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     if is_leader:
         await run_migrations()
 
+    # All processes listen for cross-process events (commands, new items, cache invalidation)
+    if settings.event_bus_enabled:
+        from services.event_bus import (
+            EVENT_CONFIG_CHANGED,
+            EVENT_RULES_CHANGED,
+            start_event_bus,
+        )
+        from services.rule_engine import on_rules_changed
+        from services.worker_status import invalidate_poll_interval
+
+        bus = await start_event_bus()
+        bus.subscribe(EVENT_RULES_CHANGED, on_rules_changed)
+        bus.subscribe(EVENT_CONFIG_CHANGED, invalidate_poll_interval)
+
     # Only the leader runs background workers
     if is_leader:
         from services.worker_status import write_state
@@ -257,6 +357,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
                 batch_size=10,
                 idle_sleep=30.0,
                 backlog_batch_size=50,
+                concurrency=settings.llm_worker_concurrency,
             )
             logging.info("LLM worker enabled and started")
         else:
@@ -284,19 +385,36 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             await stop_classifier_worker()
         if settings.llm_worker_enabled:
             await stop_worker()
+        from services.processor import close_llm_providers
+        await close_llm_providers()
         await proxy_manager.stop_background_search()
 
         from services.browser_pool import browser_pool
         await browser_pool.shutdown()
 
+        from services.http_clients import close_http_clients
+        await close_http_clients()
+
+        from services.parse_pool import shutdown_parse_pool
+        shutdown_parse_pool()
+
         # Mark all workers as stopped in DB
         from services.worker_status import write_state
         for name in ("scheduler", "llm", "classifier"):
             await write_state(name, running=False)
 
+        from services.event_bus import stop_event_bus
+        await stop_event_bus()
+
         _release_leader()
         logging.info("Leader shutdown complete")
     else:
+        from services.http_clients import close_http_clients
+        await close_http_clients()
+        from services.parse_pool import shutdown_parse_pool
+        shutdown_parse_pool()
+        from services.event_bus import stop_event_bus
+        await stop_event_bus()
         logging.info(f"Worker {os.getpid()} shutdown complete")
 
 
@@ -0,0 +1,125 @@
+"""Add work-queue columns to items table.
+
+This migration promotes the classifier/LLM worker flags from items.metadata
+to typed columns (classified_at, retry_priority, duplicate_checked_at,
+indexed_at), backfills them from the metadata keys, drops the old keys and
+creates the partial indexes the workers poll.
+
+Run with: python migrations/add_pipeline_columns.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from database import engine
+
+BATCH_SIZE = 5000
+
+COLUMNS = [
+    ("classified_at", "ALTER TABLE items ADD COLUMN classified_at TIMESTAMP"),
+    ("retry_priority", "ALTER TABLE items ADD COLUMN retry_priority VARCHAR(20)"),
+    ("duplicate_checked_at", "ALTER TABLE items ADD COLUMN duplicate_checked_at TIMESTAMP"),
+    ("indexed_at", "ALTER TABLE items ADD COLUMN indexed_at TIMESTAMP"),
+]
+
+INDEXES = [
+    ("ix_items_unclassified",
+     "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_unclassified "
+     "ON items (fetched_at DESC) WHERE classified_at IS NULL"),
+    ("ix_items_unchecked_duplicates",
+     "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_unchecked_duplicates "
+     "ON items (fetched_at DESC) WHERE duplicate_checked_at IS NULL AND similar_to_id IS NULL"),
+    ("ix_items_unindexed",
+     "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_unindexed "
+     "ON items (fetched_at DESC) WHERE indexed_at IS NULL"),
+    ("ix_items_llm_backlog",
+     "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_items_llm_backlog "
+     "ON items (retry_priority, fetched_at DESC) "
+     "WHERE needs_llm_processing = true AND classified_at IS NOT NULL"),
+]
+
+# Columns already set are kept (COALESCE), so re-running never undoes work
+# done through the columns after the old keys were dropped.
+_BACKFILL_SQL = text("""
+    UPDATE items SET
+        classified_at = COALESCE(classified_at, CASE
+            WHEN metadata #>> '{pre_filter}' IS NOT NULL
+            THEN COALESCE((metadata #>> '{pre_filter,classified_at}')::timestamp, fetched_at)
+        END),
+        retry_priority = COALESCE(retry_priority, metadata #>> '{retry_priority}'),
+        duplicate_checked_at = COALESCE(duplicate_checked_at, CASE
+            WHEN metadata #>> '{duplicate_checked}' IS NOT NULL
+            THEN COALESCE((metadata #>> '{duplicate_checked_at}')::timestamp, fetched_at)
+        END),
+        indexed_at = COALESCE(indexed_at, CASE
+            WHEN metadata #>> '{vectordb_indexed}' IS NOT NULL
+            THEN COALESCE((metadata #>> '{vectordb_indexed_at}')::timestamp, fetched_at)
+        END),
+        metadata = metadata - 'retry_priority' - 'duplicate_checked' - 'duplicate_checked_at'
+                            - 'vectordb_indexed' - 'vectordb_indexed_at'
+    WHERE id > :low AND id <= :high
+      AND metadata ?| array['pre_filter', 'retry_priority', 'duplicate_checked', 'vectordb_indexed']
+""")
+
+
+async def backfill_pipeline_columns(conn, batch_size: int = BATCH_SIZE) -> int:
+    """Copy the metadata work-queue flags into the columns.
+
+    Walks the table in id ranges so each batch is a short indexed range
+    update; with an AUTOCOMMIT connection every batch commits on its own.
+    Requires items.metadata to be JSONB. Returns the number of rows updated.
+    """
+    max_id = (await conn.execute(text("SELECT max(id) FROM items"))).scalar() or 0
+
+    updated = 0
+    for low in range(0, max_id, batch_size):
+        result = await conn.execute(_BACKFILL_SQL, {"low": low, "high": low + batch_size})
+        updated += result.rowcount
+    return updated
+
+
+async def migrate():
+    """Add the work-queue columns, backfill them and index them."""
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+        for column_name, sql in COLUMNS:
+            result = await conn.execute(text(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_name = 'items' AND column_name = :name"
+            ), {"name": column_name})
+            if result.fetchone():
+                print(f"Column '{column_name}' already exists, skipping")
+            else:
+                await conn.execute(text(sql))
+                print(f"Successfully added '{column_name}' column to items table")
+
+        updated = await backfill_pipeline_columns(conn)
+        print(f"Backfilled work-queue columns for {updated} items")
+
+        for name, sql in INDEXES:
+            await conn.execute(text(sql))
+            print(f"Successfully created partial index '{name}'")
+
+
+async def rollback():
+    """Remove the work-queue columns (the metadata keys are not restored)."""
+    async with engine.begin() as conn:
+        for name, _ in INDEXES:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        for column_name, _ in COLUMNS:
+            await conn.execute(text(f"ALTER TABLE items DROP COLUMN IF EXISTS {column_name}"))
+        print("Successfully dropped work-queue columns")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--rollback":
+        asyncio.run(rollback())
+    else:
+        asyncio.run(migrate())
@@ -0,0 +1,54 @@
+"""Add the item_stats_rollup table and its triggers on items.
+
+The table holds item counts per (day, channel, priority, read/starred/
+archived) for the /stats endpoints. Triggers on items keep it up to date;
+this migration creates both and fills the table from the existing items.
+
+Run with: python migrations/add_stats_rollup.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from database import engine
+from models import ItemStatsRollup
+from services.stats_rollup import reconcile_stats_rollup
+
+TRIGGERS = ["items_stats_rollup_insert", "items_stats_rollup_update", "items_stats_rollup_delete"]
+
+
+async def migrate():
+    """Create the rollup table with its triggers, then fill it."""
+    async with engine.begin() as conn:
+        # Fires the after_create DDL (function and triggers) when created
+        await conn.run_sync(ItemStatsRollup.__table__.create, checkfirst=True)
+        print("Table 'item_stats_rollup' ready")
+
+    counts = await reconcile_stats_rollup()
+    print(
+        f"Filled item_stats_rollup: {counts['corrected']} buckets "
+        f"in {counts['ranges']} day ranges"
+    )
+
+
+async def rollback():
+    """Drop the triggers, function and rollup table."""
+    async with engine.begin() as conn:
+        for trigger in TRIGGERS:
+            await conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger} ON items"))
+        await conn.execute(text("DROP FUNCTION IF EXISTS item_stats_rollup_apply()"))
+        await conn.execute(text("DROP TABLE IF EXISTS item_stats_rollup"))
+        print("Successfully dropped item_stats_rollup")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--rollback":
+        asyncio.run(rollback())
+    else:
+        asyncio.run(migrate())
@@ -0,0 +1,102 @@
+"""Add url_normalized column to items table.
+
+This migration adds the canonical URL used for cross-channel URL duplicate
+detection, backfills it for existing items and creates a hash index on it.
+
+Run with: python migrations/add_url_normalized.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import bindparam, text
+
+from database import engine
+
+BATCH_SIZE = 1000
+
+
+async def backfill_url_normalized(conn, batch_size: int = BATCH_SIZE) -> int:
+    """Fill url_normalized for items that don't have it yet.
+
+    Walks the table in id order (keyset) so each batch is a short indexed
+    range scan. Returns the number of rows updated.
+    """
+    from services.pipeline import _normalize_url
+
+    update_stmt = text(
+        "UPDATE items SET url_normalized = :url_normalized WHERE id = :item_id"
+    ).bindparams(bindparam("url_normalized"), bindparam("item_id"))
+
+    last_id = 0
+    updated = 0
+    while True:
+        result = await conn.execute(
+            text(
+                "SELECT id, url FROM items "
+                "WHERE id > :last_id AND url_normalized IS NULL "
+                "ORDER BY id LIMIT :batch_size"
+            ),
+            {"last_id": last_id, "batch_size": batch_size},
+        )
+        rows = result.all()
+        if not rows:
+            break
+
+        params = [
+            {"item_id": item_id, "url_normalized": _normalize_url(url)[:2000]}
+            for item_id, url in rows
+            if url
+        ]
+        if params:
+            await conn.execute(update_stmt, params)
+            updated += len(params)
+        last_id = rows[-1][0]
+
+    return updated
+
+
+async def migrate():
+    """Add url_normalized column, backfill it and index it."""
+    async with engine.begin() as conn:
+        # Check if column already exists
+        result = await conn.execute(text("""
+            SELECT column_name FROM information_schema.columns
+            WHERE table_name = 'items' AND column_name = 'url_normalized'
+        """))
+
+        if result.fetchone():
+            print("Column 'url_normalized' already exists, backfilling missing values")
+        else:
+            await conn.execute(text(
+                "ALTER TABLE items ADD COLUMN url_normalized VARCHAR(2000)"
+            ))
+            print("Successfully added 'url_normalized' column to items table")
+
+        updated = await backfill_url_normalized(conn)
+        print(f"Backfilled 'url_normalized' for {updated} items")
+
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_items_url_normalized "
+            "ON items USING HASH (url_normalized)"
+        ))
+        print("Successfully created hash index on 'url_normalized' column")
+
+
+async def rollback():
+    """Remove url_normalized column."""
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP INDEX IF EXISTS ix_items_url_normalized"))
+        await conn.execute(text("ALTER TABLE items DROP COLUMN IF EXISTS url_normalized"))
+        print("Successfully dropped 'url_normalized' column")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--rollback":
+        asyncio.run(rollback())
+    else:
+        asyncio.run(migrate())
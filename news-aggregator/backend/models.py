@@ -1,11 +1,27 @@
 """SQLAlchemy database models."""
 
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import ARRAY, JSON, JSONB, UUID
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    Computed,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSON, JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import uuid
 
@@ -41,6 +57,15 @@ class Priority(str, Enum):
     NONE = "none"  # Not relevant
 
 
+class RetryPriority(str, Enum):
+    """LLM backlog order, set from the classifier's relevance confidence."""
+
+    HIGH = "high"  # conf >= 0.5, likely relevant
+    EDGE_CASE = "edge_case"  # 0.25 <= conf < 0.5, uncertain
+    LOW = "low"  # conf < 0.25, certainly irrelevant (not sent to the LLM)
+    UNKNOWN = "unknown"  # Not classified yet
+
+
 class RuleType(str, Enum):
     """Rule matching types."""
 
@@ -109,6 +134,13 @@ class Channel(Base):
     fetch_interval_minutes: Mapped[int] = mapped_column(default=30)
     last_fetch_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Conditional GET validators (etag, last_modified, body_hash, url) and
+    # counters (requests, not_modified, unchanged) for feed connectors
+    feed_cache: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
+    # Adaptive scheduling (services.fetch_schedule): when the channel is due
+    # (NULL = immediately) and new-items history / effective interval
+    next_fetch_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    fetch_stats: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now(), onupdate=func.now()
@@ -121,6 +153,11 @@ class Channel(Base):
     __table_args__ = (
         Index("ix_channels_source_id", "source_id"),
         Index("ix_channels_connector_type", "connector_type"),
+        Index(
+            "ix_channels_next_fetch_at",
+            "next_fetch_at",
+            postgresql_where=(enabled == True),  # noqa: E712
+        ),
         Index(
             "ix_channels_unique_identifier",
             "source_id",
@@ -181,6 +218,16 @@ class Channel(Base):
         return self.enabled and self.source.enabled
 
 
+# Full-text search document of an item: title (A) over summary (B) over
+# content (C, first 100k characters), German stemming and stop words
+SEARCH_CONFIG = "german"
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(summary, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', left(coalesce(content, ''), 100000)), 'C')"
+)
+
+
 class Item(Base):
     """A fetched news item."""
 
@@ -194,6 +241,8 @@ class Item(Base):
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     detailed_analysis: Mapped[str | None] = mapped_column(Text, nullable=True)
     url: Mapped[str] = mapped_column(String(2000))
+    # Canonical URL (tracking params/www/fragment stripped) for cross-channel dedup
+    url_normalized: Mapped[str | None] = mapped_column(String(2000), nullable=True)
     author: Mapped[str | None] = mapped_column(String(255), nullable=True)
     published_at: Mapped[datetime] = mapped_column(DateTime)
     fetched_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
@@ -211,10 +260,21 @@ class Item(Base):
     metadata_: Mapped[dict[str, Any]] = mapped_column("metadata", JSONB, default=dict)
     # LLM processing status - True if item needs (re)processing due to GPU unavailability
     needs_llm_processing: Mapped[bool] = mapped_column(default=False, index=True)
+    # Work-queue state, each polled by a background worker through a partial index:
+    # NULL timestamps mean the step is still pending
+    classified_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    retry_priority: Mapped[RetryPriority | None] = mapped_column(String(20), nullable=True)
+    duplicate_checked_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # In the vector store
+    indexed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     # Semantic duplicate grouping - points to the "primary" item this is a duplicate of
     similar_to_id: Mapped[int | None] = mapped_column(
         ForeignKey("items.id", ondelete="SET NULL"), nullable=True, index=True
     )
+    # Generated by PostgreSQL on insert/update. Not mapped (see __mapper_args__),
+    # so the ORM never loads it or fetches it back after inserts; use it in
+    # queries as Item.search_vector.
+    search_vector = Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True))
 
     # Relationships
     channel: Mapped["Channel"] = relationship(back_populates="items")
@@ -236,7 +296,27 @@ class Item(Base):
         Index("ix_items_published_at", "published_at"),
         Index("ix_items_priority", "priority"),
         Index("ix_items_is_read", "is_read"),
+        Index("ix_items_url_normalized", "url_normalized", postgresql_using="hash"),
+        Index("ix_items_search_vector", "search_vector", postgresql_using="gin"),
+        # Work queues (classifier worker, LLM worker backlog)
+        Index(
+            "ix_items_unclassified", text("fetched_at DESC"),
+            postgresql_where=text("classified_at IS NULL"),
+        ),
+        Index(
+            "ix_items_unchecked_duplicates", text("fetched_at DESC"),
+            postgresql_where=text("duplicate_checked_at IS NULL AND similar_to_id IS NULL"),
+        ),
+        Index(
+            "ix_items_unindexed", text("fetched_at DESC"),
+            postgresql_where=text("indexed_at IS NULL"),
+        ),
+        Index(
+            "ix_items_llm_backlog", "retry_priority", text("fetched_at DESC"),
+            postgresql_where=text("needs_llm_processing = true AND classified_at IS NOT NULL"),
+        ),
     )
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
 
     @property
     def source(self) -> "Source":
@@ -320,6 +400,114 @@ class ItemEvent(Base):
     )
 
 
+class WorkClaim(Base):
+    """Lease on an item for one work queue, held by one worker process.
+
+    Lets classifier/LLM worker processes on several hosts share the queues;
+    see services/work_claims.py.
+    """
+
+    __tablename__ = "work_claims"
+
+    queue: Mapped[str] = mapped_column(String(20), primary_key=True)
+    item_id: Mapped[int] = mapped_column(
+        ForeignKey("items.id", ondelete="CASCADE"), primary_key=True
+    )
+    worker_id: Mapped[str] = mapped_column(String(255), index=True)
+    lease_until: Mapped[datetime] = mapped_column(DateTime)
+
+
+class ItemStatsRollup(Base):
+    """Item counts per fetch day, channel, priority and read/starred/archived flags.
+
+    Kept up to date by statement-level triggers on items (STATS_ROLLUP_DDL),
+    so every writer - pipeline, item endpoints, workers, purge - maintains
+    it; services/stats_rollup.py reconciles it with items nightly. The
+    /stats endpoints sum these rows instead of scanning items.
+    """
+
+    __tablename__ = "item_stats_rollup"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)  # items.fetched_at::date (UTC)
+    channel_id: Mapped[int] = mapped_column(
+        ForeignKey("channels.id", ondelete="CASCADE"), primary_key=True
+    )
+    priority: Mapped[Priority] = mapped_column(String(20), primary_key=True)
+    is_read: Mapped[bool] = mapped_column(primary_key=True)
+    is_starred: Mapped[bool] = mapped_column(primary_key=True)
+    is_archived: Mapped[bool] = mapped_column(primary_key=True)
+    item_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    __table_args__ = (
+        Index("ix_item_stats_rollup_channel_id", "channel_id"),
+    )
+
+
+STATS_ROLLUP_KEY = "day, channel_id, priority, is_read, is_starred, is_archived"
+# Rollup key of an items row
+STATS_ROLLUP_ITEM_KEY = (
+    "fetched_at::date AS day, channel_id, priority, is_read, is_starred, is_archived"
+)
+
+# One function for the three triggers; each sees the statement's rows as
+# transition tables, so a bulk update touches each rollup row once.
+STATS_ROLLUP_DDL = [
+    f"""
+    CREATE OR REPLACE FUNCTION item_stats_rollup_apply() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO item_stats_rollup AS r ({STATS_ROLLUP_KEY}, item_count)
+            SELECT {STATS_ROLLUP_ITEM_KEY}, count(*) FROM new_rows
+            GROUP BY 1, 2, 3, 4, 5, 6 ORDER BY 1, 2, 3, 4, 5, 6
+            ON CONFLICT ({STATS_ROLLUP_KEY})
+            DO UPDATE SET item_count = r.item_count + EXCLUDED.item_count;
+        ELSIF TG_OP = 'UPDATE' THEN
+            -- Rows whose key columns did not change cancel out
+            INSERT INTO item_stats_rollup AS r ({STATS_ROLLUP_KEY}, item_count)
+            SELECT {STATS_ROLLUP_KEY}, sum(n) FROM (
+                SELECT {STATS_ROLLUP_ITEM_KEY}, -1 AS n FROM old_rows
+                UNION ALL
+                SELECT {STATS_ROLLUP_ITEM_KEY}, 1 AS n FROM new_rows
+            ) changes
+            GROUP BY 1, 2, 3, 4, 5, 6 HAVING sum(n) <> 0 ORDER BY 1, 2, 3, 4, 5, 6
+            ON CONFLICT ({STATS_ROLLUP_KEY})
+            DO UPDATE SET item_count = r.item_count + EXCLUDED.item_count;
+        ELSE
+            -- Update only: on channel deletion the rollup rows cascade away first
+            UPDATE item_stats_rollup r SET item_count = r.item_count - d.n
+            FROM (
+                SELECT {STATS_ROLLUP_ITEM_KEY}, count(*) AS n FROM old_rows
+                GROUP BY 1, 2, 3, 4, 5, 6
+            ) d
+            WHERE r.day = d.day AND r.channel_id = d.channel_id AND r.priority = d.priority
+              AND r.is_read = d.is_read AND r.is_starred = d.is_starred
+              AND r.is_archived = d.is_archived;
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+    "DROP TRIGGER IF EXISTS items_stats_rollup_insert ON items",
+    "CREATE TRIGGER items_stats_rollup_insert AFTER INSERT ON items "
+    "REFERENCING NEW TABLE AS new_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION item_stats_rollup_apply()",
+    "DROP TRIGGER IF EXISTS items_stats_rollup_update ON items",
+    "CREATE TRIGGER items_stats_rollup_update AFTER UPDATE ON items "
+    "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION item_stats_rollup_apply()",
+    "DROP TRIGGER IF EXISTS items_stats_rollup_delete ON items",
+    "CREATE TRIGGER items_stats_rollup_delete AFTER DELETE ON items "
+    "REFERENCING OLD TABLE AS old_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION item_stats_rollup_apply()",
+]
+
+# Installed whenever create_all creates the rollup table (after items)
+ItemStatsRollup.__table__.add_is_dependent_on(Item.__table__)
+for _statement in STATS_ROLLUP_DDL:
+    event.listen(ItemStatsRollup.__table__, "after_create", DDL(_statement))
+
+
 class Setting(Base):
     """Application settings stored in database."""
 
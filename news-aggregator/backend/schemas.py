@@ -52,6 +52,9 @@ class ChannelResponse(ChannelBase, BaseSchema):
     source_id: int
     source_identifier: str | None
     last_fetch_at: datetime | None
+    next_fetch_at: datetime | None = None
+    # Adaptive scheduling: interval_minutes (effective), avg_new_items, history
+    fetch_stats: dict[str, Any] | None = None
     last_error: str | None
     created_at: datetime
     updated_at: datetime
@@ -166,6 +169,8 @@ class ItemResponse(ItemBase, BaseSchema):
     # Duplicate grouping
     similar_to_id: int | None = None  # ID of primary item if this is a duplicate
     duplicates: list[DuplicateBrief] = Field(default_factory=list)  # Child duplicates if this is primary
+    # Excerpt around the search terms (list_items with search), matches in <mark>
+    search_snippet: str | None = None
 
 
 class ItemUpdate(BaseModel):
@@ -192,6 +197,7 @@ class ItemListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = None  # Set in cursor pagination mode while more pages exist
 
 
 class BulkArchiveRequest(BaseModel):
@@ -344,6 +350,10 @@ class ChannelStats(BaseModel):
     unread_count: int
     last_fetch_at: datetime | None
     last_error: str | None
+    feed_requests: int = 0
+    feed_not_modified: int = 0
+    feed_unchanged: int = 0
+    feed_cache_hit_rate: float | None = None
 
 
 # === Validation schemas ===
@@ -0,0 +1,152 @@
+"""CPU benchmark for the parse pool: parse throughput per core.
+
+Generates synthetic documents (RSS feed, news article page, HTML listing
+page, PDF report), times each parser on a single core in this process, then
+pushes the same documents through ParsePool with 1..N worker processes and
+reports documents per second overall and per worker. No network or
+database is involved.
+
+Run inside the backend container:
+    python scripts/benchmark_parsing.py [--docs 200] [--workers 1 2 4]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.parse_pool import (  # noqa: E402
+    ParsePool,
+    _extract_article,
+    _extract_html_items,
+    _extract_pdf,
+    _parse_feed,
+)
+
+WORDS = [
+    "landtag", "kita", "pflege", "haushalt", "kürzung", "sozialhilfe", "wohnungslosigkeit",
+    "migration", "eingliederungshilfe", "jugendhilfe", "bürgergeld", "ehrenamt",
+    "wohlfahrt", "armut", "rente", "gesundheit", "schule", "integration", "förderung",
+]
+
+LISTING_SELECTORS = {"item": "li.news", "title": "a", "link": None, "content": "p", "date": "time"}
+
+
+def sentence(rng: random.Random, words: int = 15) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def make_feed(rng: random.Random, entries: int = 50) -> str:
+    items = "".join(
+        f"<item><title>{sentence(rng, 8)}</title><link>https://example.com/{i}</link>"
+        f"<description>{' '.join(sentence(rng) for _ in range(5))}</description>"
+        f"<pubDate>Mon, 06 Sep 2021 16:45:00 +0000</pubDate></item>"
+        for i in range(entries)
+    )
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>Bench</title>'
+        f"{items}</channel></rss>"
+    )
+
+
+def make_article(rng: random.Random) -> str:
+    # ~30 KB: navigation and teaser boilerplate around a 30-paragraph article
+    nav = "".join(f'<li><a href="/r/{i}">{sentence(rng, 4)}</a></li>' for i in range(150))
+    body = "".join(f"<p>{' '.join(sentence(rng) for _ in range(4))}</p>" for _ in range(30))
+    return (
+        '<html><head><meta property="og:type" content="article">'
+        '<meta property="og:title" content="Bench">'
+        '<meta property="article:published_time" content="2024-01-01"></head>'
+        f"<body><nav><ul>{nav}</ul></nav><article><h1>Bench</h1>{body}</article>"
+        f"<footer>{sentence(rng)}</footer></body></html>"
+    )
+
+
+def make_listing(rng: random.Random, entries: int = 100) -> str:
+    items = "".join(
+        f'<li class="news"><a href="/n/{i}">{sentence(rng, 8)}</a>'
+        f"<p>{sentence(rng)}</p><time>01.02.2024</time></li>"
+        for i in range(entries)
+    )
+    return f"<html><body><ul>{items}</ul></body></html>"
+
+
+def make_pdf(rng: random.Random, pages: int = 20) -> bytes:
+    import pymupdf
+
+    doc = pymupdf.open()
+    for _ in range(pages):
+        page = doc.new_page()
+        text = " ".join(sentence(rng) for _ in range(40))
+        page.insert_textbox(page.rect + (50, 50, -50, -50), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def bench_inline(label: str, func, args: tuple, docs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(docs):
+        func(*args)
+    per_doc_ms = (time.perf_counter() - start) / docs * 1000
+    print(f"  {label:<14} {per_doc_ms:8.2f} ms/doc  {1000 / per_doc_ms:8.1f} docs/s")
+    return per_doc_ms
+
+
+async def bench_pool(workers: int, jobs: list[tuple], docs: int) -> None:
+    pool = ParsePool(workers=workers, max_pending=workers * 4, timeout=120)
+    # Start the workers (and import the parsers) before timing
+    await asyncio.gather(*(pool.run(func, *args) for func, args in jobs for _ in range(workers)))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(pool.run(func, *args) for func, args in jobs for _ in range(docs)))
+    elapsed = time.perf_counter() - start
+    pool.shutdown()
+
+    rate = len(jobs) * docs / elapsed
+    print(f"  {workers} worker(s)    {rate:8.1f} docs/s  {rate / workers:8.1f} docs/s per worker")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=200, help="Documents per type")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, os.cpu_count() or 1])
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    rng = random.Random(42)
+    feed = make_feed(rng)
+    article = make_article(rng)
+    listing = make_listing(rng)
+    pdf = make_pdf(rng)
+    print(
+        f"Documents: feed {len(feed) // 1024} KB, article {len(article) // 1024} KB, "
+        f"listing {len(listing) // 1024} KB, PDF {len(pdf) // 1024} KB"
+    )
+
+    jobs = [
+        ("feedparser", _parse_feed, (feed,)),
+        ("article", _extract_article, (article, "https://example.com/a", True, ())),
+        ("html listing", _extract_html_items, (listing, LISTING_SELECTORS)),
+        ("pdf", _extract_pdf, (pdf,)),
+    ]
+
+    print(f"Single core, in process ({args.docs} docs each)")
+    total_ms = sum(bench_inline(label, func, fargs, args.docs) for label, func, fargs in jobs)
+    print(
+        f"  {'mix':<14} {total_ms / len(jobs):8.2f} ms/doc  "
+        f"{1000 * len(jobs) / total_ms:8.1f} docs/s"
+    )
+
+    print(f"Parse pool, mixed documents (cores: {os.cpu_count()})")
+    for workers in sorted(set(args.workers)):
+        asyncio.run(bench_pool(workers, [(func, fargs) for _, func, fargs in jobs], args.docs))
+
+
+if __name__ == "__main__":
+    main()
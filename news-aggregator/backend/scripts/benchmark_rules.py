@@ -0,0 +1,116 @@
+"""Micro-benchmark for rule matching: per-rule loop vs. compiled RuleEngine.
+
+Generates synthetic keyword/regex rules (80% keyword, 20% regex, 3 keywords
+per keyword rule) and matches them against German news-sized texts.
+
+Run inside the backend container:
+    python scripts/benchmark_rules.py [--counts 10 100 1000] [--items 200]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import RuleType  # noqa: E402
+from services.rule_engine import CompiledRule, compile_rules  # noqa: E402
+
+WORDS = [
+    "landtag", "kita", "pflege", "haushalt", "kürzung", "sozialhilfe", "wohnungslosigkeit",
+    "migration", "eingliederungshilfe", "jugendhilfe", "bürgergeld", "ehrenamt",
+    "wohlfahrt", "armut", "rente", "gesundheit", "schule", "integration", "förderung",
+    "regierung", "ministerium", "kommune", "gesetz", "reform", "verband", "träger",
+]
+
+
+def make_rules(count: int, rng: random.Random) -> list[CompiledRule]:
+    rules = []
+    for i in range(count):
+        if i % 5 == 4:
+            rule_type = RuleType.REGEX
+            pattern = rf"{rng.choice(WORDS)}\w*\s+\w+\s+{rng.choice(WORDS)}{i}"
+        else:
+            rule_type = RuleType.KEYWORD
+            pattern = ", ".join(f"{rng.choice(WORDS)}{rng.randint(0, count)}" for _ in range(3))
+        rules.append(CompiledRule(
+            id=i, name=f"rule-{i}", rule_type=rule_type, pattern=pattern,
+            priority_boost=5, target_priority=None, order=i,
+        ))
+    return rules
+
+
+def make_texts(count: int, rng: random.Random, max_suffix: int) -> list[str]:
+    texts = []
+    for _ in range(count):
+        words = [
+            f"{rng.choice(WORDS)}{rng.randint(0, max_suffix)}" if rng.random() < 0.05
+            else rng.choice(WORDS)
+            for _ in range(400)  # ~3-4 KB, a typical extracted article
+        ]
+        texts.append(" ".join(words))
+    return texts
+
+
+def match_legacy(rules: list[CompiledRule], text: str) -> list[int]:
+    """Previous Pipeline._match_rule behaviour, one rule at a time."""
+    text = text.lower()
+    hits = []
+    for rule in rules:
+        if rule.rule_type == RuleType.KEYWORD:
+            keywords = [k.strip().lower() for k in rule.pattern.split(",")]
+            if any(kw in text for kw in keywords):
+                hits.append(rule.id)
+        elif rule.rule_type == RuleType.REGEX:
+            if re.compile(rule.pattern, re.IGNORECASE).search(text):
+                hits.append(rule.id)
+    return hits
+
+
+def bench(label: str, func, texts: list[str]) -> float:
+    start = time.perf_counter()
+    for text in texts:
+        func(text)
+    per_item_us = (time.perf_counter() - start) / len(texts) * 1e6
+    print(f"  {label:<10} {per_item_us:10.1f} µs/item")
+    return per_item_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--items", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    for count in args.counts:
+        rules = make_rules(count, rng)
+        texts = make_texts(args.items, rng, count)
+
+        start = time.perf_counter()
+        rule_set = compile_rules(rules)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        # Both implementations must agree
+        for text in texts:
+            assert [r.id for r in rule_set.match(text)] == match_legacy(rules, text)
+
+        print(f"{count} rules (compile: {compile_ms:.1f} ms, {args.items} items)")
+        legacy = bench("per-rule", lambda t: match_legacy(rules, t), texts)
+        compiled = bench("compiled", rule_set.match, texts)
+        print(f"  speedup    {legacy / compiled:10.1f}x")
+
+        # Keyword rules alone (regex rules cost the same either way)
+        keyword_rules = [r for r in rules if r.rule_type == RuleType.KEYWORD]
+        keyword_set = compile_rules(keyword_rules)
+        print(f"  keyword rules only ({len(keyword_rules)})")
+        legacy = bench("per-rule", lambda t: match_legacy(keyword_rules, t), texts)
+        compiled = bench("compiled", keyword_set.match, texts)
+        print(f"  speedup    {legacy / compiled:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Search benchmark: ILIKE on title/content vs. full-text search.
+
+Builds an unlogged scratch table (bench_search_items) with the same
+generated search_vector, GIN and trigram indexes as items, fills it with
+synthetic German news texts, then times the previous search
+(title ILIKE OR content ILIKE) against the current one (search_vector @@
+websearch_to_tsquery OR title ILIKE) and prints the plan of each. The
+scratch table is dropped afterwards unless --keep is given.
+
+Run inside the backend container:
+    python scripts/benchmark_search.py [--rows 500000] [--runs 5]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text  # noqa: E402
+
+from database import engine  # noqa: E402
+from models import SEARCH_CONFIG, SEARCH_VECTOR_SQL  # noqa: E402
+
+TABLE = "bench_search_items"
+
+WORDS = [
+    "landtag", "kita", "pflege", "haushalt", "kürzung", "sozialhilfe", "wohnungslosigkeit",
+    "migration", "eingliederungshilfe", "jugendhilfe", "bürgergeld", "ehrenamt",
+    "wohlfahrt", "armut", "rente", "gesundheit", "schule", "integration", "förderung",
+    "regierung", "ministerium", "kommune", "gesetz", "reform", "verband", "träger",
+]
+
+# Search terms: common word, rare word, stemmed form, phrase
+TERMS = ["pflege", "kitagebühren", "kürzungen", "\"sozialhilfe reform\""]
+
+
+def random_words(count: int) -> str:
+    """SQL expression producing `count` random words from WORDS."""
+    words = ", ".join(f"'{w}'" for w in WORDS)
+    return (
+        f"(SELECT string_agg((ARRAY[{words}])[1 + floor(random() * {len(WORDS)})::int], ' ') "
+        f"FROM generate_series(1, {count} + (g * 0)))"
+    )
+
+
+async def build_table(conn, rows: int) -> None:
+    print(f"Building {TABLE} with {rows} rows...")
+    start = time.perf_counter()
+    await conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+    await conn.execute(text(
+        f"CREATE UNLOGGED TABLE {TABLE} ("
+        "id serial PRIMARY KEY, title varchar(500), summary text, content text, "
+        f"search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED)"
+    ))
+    # 1 in 1000 items is about Kitagebühren, so there is a selective term
+    await conn.execute(text(
+        f"INSERT INTO {TABLE} (title, summary, content) "
+        f"SELECT CASE WHEN g % 1000 = 0 THEN 'Kitagebühren steigen' ELSE {random_words(8)} END, "
+        f"{random_words(40)}, {random_words(400)} "
+        f"FROM generate_series(1, :rows) g"
+    ), {"rows": rows})
+    await conn.execute(text(f"CREATE INDEX ON {TABLE} USING GIN (search_vector)"))
+    await conn.execute(text(f"CREATE INDEX ON {TABLE} USING GIN (title gin_trgm_ops)"))
+    await conn.execute(text(f"ANALYZE {TABLE}"))
+    print(f"  done in {time.perf_counter() - start:.0f}s")
+
+
+def queries(term: str) -> dict[str, tuple[str, dict]]:
+    substring = {"pattern": f"%{term.strip(chr(34))}%"}
+    return {
+        "ilike": (
+            f"SELECT id FROM {TABLE} WHERE title ILIKE :pattern OR content ILIKE :pattern "
+            "ORDER BY id DESC LIMIT 50",
+            substring,
+        ),
+        "fulltext": (
+            f"SELECT id FROM {TABLE} "
+            f"WHERE search_vector @@ websearch_to_tsquery('{SEARCH_CONFIG}', :term) "
+            "OR title ILIKE :pattern "
+            "ORDER BY ts_rank_cd(search_vector, "
+            f"websearch_to_tsquery('{SEARCH_CONFIG}', :term), 32) DESC "
+            "LIMIT 50",
+            {**substring, "term": term},
+        ),
+    }
+
+
+async def time_query(conn, sql: str, params: dict, runs: int) -> tuple[float, int]:
+    timings = []
+    count = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        count = len((await conn.execute(text(sql), params)).all())
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), count
+
+
+async def plan_summary(conn, sql: str, params: dict) -> str:
+    rows = (await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), params)).all()
+    scans = [r[0].strip(" ->") for r in rows if "Scan" in r[0]]
+    return scans[0] if scans else rows[0][0]
+
+
+async def run(args) -> None:
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        if not args.reuse:
+            await build_table(conn, args.rows)
+
+        print(f"Median of {args.runs} runs, LIMIT 50")
+        for term in TERMS:
+            print(f"  {term}")
+            for name, (sql, params) in queries(term).items():
+                ms, count = await time_query(conn, sql, params, args.runs)
+                plan = await plan_summary(conn, sql, params)
+                print(f"    {name:<9} {ms:9.1f} ms  {count:3d} rows  {plan}")
+
+        if not args.keep:
+            await conn.execute(text(f"DROP TABLE {TABLE}"))
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500_000, help="Synthetic items")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per query")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch table")
+    parser.add_argument("--reuse", action="store_true", help="Reuse a kept scratch table")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
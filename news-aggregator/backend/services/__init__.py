@@ -1,31 +1,35 @@
-"""Services package."""
+"""Services package.
 
-from services.pipeline import Pipeline, RawItem, process_items
-from services.processor import ItemProcessor, create_processor_from_settings
-from services.scheduler import (
-    fetch_all_channels,
-    fetch_channel,
-    fetch_due_channels,
-    get_job_status,
-    start_scheduler,
-    stop_scheduler,
-    trigger_channel_fetch,
-)
+The names below are imported on first access, so importing a single
+service module (e.g. services.parse_pool in the parse worker processes)
+does not pull in the pipeline, scheduler, models and database.
+"""
 
-__all__ = [
+import importlib
+
+_EXPORTS = {
     # Pipeline
-    "Pipeline",
-    "RawItem",
-    "process_items",
+    "Pipeline": "services.pipeline",
+    "RawItem": "services.pipeline",
+    "process_items": "services.pipeline",
     # Processor (LLM-based)
-    "ItemProcessor",
-    "create_processor_from_settings",
+    "ItemProcessor": "services.processor",
+    "create_processor_from_settings": "services.processor",
     # Scheduler
-    "fetch_all_channels",
-    "fetch_channel",
-    "fetch_due_channels",
-    "get_job_status",
-    "start_scheduler",
-    "stop_scheduler",
-    "trigger_channel_fetch",
-]
+    "fetch_all_channels": "services.scheduler",
+    "fetch_channel": "services.scheduler",
+    "fetch_due_channels": "services.scheduler",
+    "get_job_status": "services.scheduler",
+    "start_scheduler": "services.scheduler",
+    "stop_scheduler": "services.scheduler",
+    "trigger_channel_fetch": "services.scheduler",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'services' has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
@@ -0,0 +1,361 @@
+"""Persistent cache for extracted articles.
+
+The same article URL reaches ArticleExtractor.fetch_article() through Google
+Alerts, RSS, Mastodon, Bluesky, X and the refetch endpoints, and every call
+used to download and extract it again, including the Wayback Machine and
+Playwright fallbacks. This cache stores the extraction result in a SQLite
+file so a story linked from five feeds is extracted once:
+
+- Keyed on the SHA-256 of the normalized URL (services.pipeline._normalize_url,
+  the form used for URL duplicate detection)
+- Negative results (not an article, too little content, 404) are cached
+  with a shorter TTL; transient failures (timeouts, 5xx, 429) are not cached
+- Entries expire after ARTICLE_CACHE_TTL_HOURS
+- The store is bounded to ARTICLE_CACHE_MAX_MB; least recently used entries
+  are evicted first
+
+Concurrent requests for the same URL within a process share one extraction.
+The SQLite file (WAL mode) is shared by all gunicorn workers. A broken or
+locked cache file never fails an extraction, it only turns into a miss.
+"""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from config import settings
+
+if TYPE_CHECKING:
+    from services.article_extractor import ArticleContent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_FILE = Path(__file__).parent.parent / "data" / "article_cache.db"
+
+# Check the store size after this many writes
+EVICT_EVERY = 50
+# Evict down to this fraction of the size limit
+EVICT_TARGET = 0.9
+
+_SCHEMA = """
+PRAGMA auto_vacuum = INCREMENTAL;
+CREATE TABLE IF NOT EXISTS article_cache (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    title TEXT,
+    content TEXT NOT NULL DEFAULT '',
+    source_domain TEXT NOT NULL DEFAULT '',
+    is_article INTEGER NOT NULL DEFAULT 0,
+    negative INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ix_article_cache_last_access ON article_cache (last_access);
+CREATE INDEX IF NOT EXISTS ix_article_cache_expires_at ON article_cache (expires_at);
+"""
+
+# Result of an extraction: (article or None, whether the result may be cached)
+ExtractResult = tuple["ArticleContent | None", bool]
+
+
+def cache_key(url: str) -> str:
+    """Cache key for an article URL (hash of the normalized URL)."""
+    from services.pipeline import _normalize_url
+
+    return hashlib.sha256(_normalize_url(url).encode("utf-8")).hexdigest()
+
+
+class ArticleCache:
+    """SQLite-backed extraction cache with TTLs and a size-bounded LRU."""
+
+    def __init__(
+        self,
+        path: Path | str,
+        max_mb: float | None = None,
+        ttl_hours: float | None = None,
+        negative_ttl_hours: float | None = None,
+    ):
+        """
+        Args:
+            path: SQLite file (created with its directory if missing)
+            max_mb: Size limit for stored articles in megabytes
+            ttl_hours: Lifetime of extracted articles
+            negative_ttl_hours: Lifetime of negative results
+        """
+        self.path = Path(path)
+        self.max_bytes = int((max_mb or settings.article_cache_max_mb) * 1024 * 1024)
+        self.ttl = (ttl_hours or settings.article_cache_ttl_hours) * 3600
+        self.negative_ttl = (negative_ttl_hours or settings.article_cache_negative_ttl_hours) * 3600
+        self._conn: sqlite3.Connection | None = None
+        # sqlite3 connections are not safe for concurrent use from threads
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._stats = {
+            "hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "shared_inflight": 0,
+            "stored": 0,
+            "stored_negative": 0,
+            "not_cached": 0,
+            "evicted": 0,
+            "errors": 0,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path, timeout=5.0, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    # --- Blocking operations (run in a thread) ---
+
+    def _get(self, key: str) -> tuple[bool, "ArticleContent | None"]:
+        from services.article_extractor import ArticleContent
+
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT url, title, content, source_domain, is_article, negative "
+                "FROM article_cache WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return False, None
+            conn.execute(
+                "UPDATE article_cache SET last_access = ?, hits = hits + 1 WHERE key = ?",
+                (now, key),
+            )
+
+        url, title, content, source_domain, is_article, negative = row
+        if negative:
+            return True, None
+        return True, ArticleContent(
+            url=url,
+            title=title,
+            content=content,
+            is_article=bool(is_article),
+            source_domain=source_domain,
+        )
+
+    def _put(self, key: str, url: str, article: "ArticleContent | None") -> None:
+        now = time.time()
+        if article is None:
+            values = (key, url, None, "", "", 0, 1, len(url), now, now + self.negative_ttl, now)
+        else:
+            size = (
+                len(url)
+                + len((article.title or "").encode("utf-8"))
+                + len(article.content.encode("utf-8"))
+            )
+            values = (
+                key, article.url, article.title, article.content, article.source_domain,
+                int(article.is_article), 0, size, now, now + self.ttl, now,
+            )
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO article_cache "
+                "(key, url, title, content, source_domain, is_article, negative, size, "
+                "created_at, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                values,
+            )
+            self._writes += 1
+            if self._writes >= EVICT_EVERY:
+                self._writes = 0
+                self._evict_locked()
+
+    def _evict_locked(self) -> int:
+        """Drop expired entries, then least recently used ones over the size limit."""
+        conn = self._connect()
+        removed = conn.execute(
+            "DELETE FROM article_cache WHERE expires_at <= ?", (time.time(),)
+        ).rowcount
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM article_cache").fetchone()[0]
+        if total > self.max_bytes:
+            # Keep the most recently used entries up to the target size
+            removed += conn.execute(
+                "DELETE FROM article_cache WHERE key IN ("
+                "  SELECT key FROM ("
+                "    SELECT key, SUM(size) OVER (ORDER BY last_access DESC, key) AS kept"
+                "    FROM article_cache"
+                "  ) WHERE kept > ?"
+                ")",
+                (int(self.max_bytes * EVICT_TARGET),),
+            ).rowcount
+        if removed:
+            conn.execute("PRAGMA incremental_vacuum")
+            self._stats["evicted"] += removed
+            logger.debug(f"Article cache: evicted {removed} entries")
+        return removed
+
+    def _evict(self) -> int:
+        with self._lock:
+            return self._evict_locked()
+
+    def _store_stats(self) -> dict:
+        now = time.time()
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT COUNT(*), "
+                "COALESCE(SUM(negative), 0), "
+                "COALESCE(SUM(CASE WHEN expires_at <= ? THEN 1 ELSE 0 END), 0), "
+                "COALESCE(SUM(size), 0) "
+                "FROM article_cache",
+                (now,),
+            ).fetchone()
+        entries, negative, expired, size = row
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "negative_entries": negative,
+            "expired_entries": expired,
+            "size_mb": round(size / 1024 / 1024, 2),
+            "max_mb": round(self.max_bytes / 1024 / 1024, 2),
+            "file_mb": (
+                round(self.path.stat().st_size / 1024 / 1024, 2) if self.path.exists() else 0.0
+            ),
+        }
+
+    def _clear(self) -> int:
+        with self._lock:
+            conn = self._connect()
+            removed = conn.execute("DELETE FROM article_cache").rowcount
+            conn.execute("PRAGMA incremental_vacuum")
+            return removed
+
+    # --- Async API ---
+
+    async def get(self, url: str) -> tuple[bool, "ArticleContent | None"]:
+        """Look up a URL.
+
+        Returns:
+            (found, article): article is None for a cached negative result
+        """
+        try:
+            found, article = await asyncio.to_thread(self._get, cache_key(url))
+        except (sqlite3.Error, OSError) as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Article cache lookup failed: {e}")
+            return False, None
+
+        if not found:
+            self._stats["misses"] += 1
+        elif article is None:
+            self._stats["negative_hits"] += 1
+        else:
+            self._stats["hits"] += 1
+        return found, article
+
+    async def put(self, url: str, article: "ArticleContent | None") -> None:
+        """Store an extraction result (None = negative result)."""
+        try:
+            await asyncio.to_thread(self._put, cache_key(url), url, article)
+        except (sqlite3.Error, OSError) as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Article cache write failed: {e}")
+            return
+        self._stats["stored" if article is not None else "stored_negative"] += 1
+
+    async def get_or_extract(
+        self,
+        url: str,
+        extract: Callable[[str], Awaitable[ExtractResult]],
+    ) -> "ArticleContent | None":
+        """Return the cached result for url, or extract and cache it.
+
+        Args:
+            url: Resolved article URL
+            extract: Coroutine function returning (article, cacheable);
+                results with cacheable=False (transient errors) are not stored
+        """
+        found, article = await self.get(url)
+        if found:
+            return article
+
+        key = cache_key(url)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._stats["shared_inflight"] += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            article, cacheable = await extract(url)
+            if cacheable:
+                await self.put(url, article)
+            else:
+                self._stats["not_cached"] += 1
+            future.set_result(article)
+            return article
+        except BaseException as e:
+            future.set_exception(e)
+            # Waiters re-raise it; don't warn about it being unretrieved
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def evict(self) -> int:
+        """Run expiry and LRU eviction now. Returns the number of removed entries."""
+        return await asyncio.to_thread(self._evict)
+
+    async def clear(self) -> int:
+        """Remove all entries. Returns the number of removed entries."""
+        return await asyncio.to_thread(self._clear)
+
+    async def get_store_stats(self) -> dict:
+        """Entry counts and size of the (shared) cache file."""
+        return await asyncio.to_thread(self._store_stats)
+
+    def get_stats(self) -> dict:
+        """Hit/miss counters of this process."""
+        lookups = self._stats["hits"] + self._stats["negative_hits"] + self._stats["misses"]
+        hits = self._stats["hits"] + self._stats["negative_hits"]
+        return {
+            **self._stats,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_cache: ArticleCache | None = None
+
+
+def get_article_cache() -> ArticleCache:
+    """Get the process-wide article cache."""
+    global _cache
+    if _cache is None:
+        _cache = ArticleCache(settings.article_cache_path or DEFAULT_CACHE_FILE)
+    return _cache
+
+
+def reset_article_cache() -> None:
+    """Close the cache; the next get_article_cache() reopens it from settings."""
+    global _cache
+    if _cache is not None:
+        _cache.close()
+        _cache = None
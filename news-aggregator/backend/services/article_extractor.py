@@ -12,6 +12,11 @@ from urllib.parse import urlparse, parse_qs, urljoin
 import httpx
 from bs4 import BeautifulSoup
 
+from config import settings
+from services.article_cache import get_article_cache
+from services.http_clients import get_http_client
+from services.parse_pool import extract_article
+
 logger = logging.getLogger(__name__)
 
 # Known news domains (German focus)
@@ -210,24 +215,30 @@ class ArticleExtractor:
             Final URL after following redirects
         """
         try:
-            async with httpx.AsyncClient(
-                timeout=10.0,
+            client = get_http_client(timeout=10.0)
+            response = await client.head(
+                url,
+                headers={
+                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                },
                 follow_redirects=True,
-            ) as client:
-                response = await client.head(
-                    url,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    },
-                )
-                return str(response.url)
+            )
+            return str(response.url)
         except Exception as e:
             logger.debug(f"Could not resolve redirects for {url}: {e}")
             return url
 
-    async def fetch_article(self, url: str) -> ArticleContent | None:
+    async def fetch_article(self, url: str, use_cache: bool = True) -> ArticleContent | None:
         """Fetch and extract article content from URL.
 
+        Results (including negative ones) are kept in the persistent article
+        cache (services.article_cache), so a URL linked from several feeds is
+        only downloaded and extracted once.
+
+        Args:
+            url: Article URL (t.co and Google redirect URLs are resolved)
+            use_cache: Set to False to bypass the cache
+
         Returns None if:
         - URL cannot be fetched
         - Content doesn't look like a news article
@@ -251,67 +262,83 @@ class ArticleExtractor:
             # Clean up URL - remove common tracking parameters
             url = self._clean_url(url)
 
+            if not use_cache or not settings.article_cache_enabled:
+                article, _ = await self._extract_article(url)
+                return article
+
+            return await get_article_cache().get_or_extract(url, self._extract_article)
+
+        except Exception as e:
+            logger.warning(f"Failed to fetch article from {url}: {e}")
+            return None
+
+    async def _extract_article(self, url: str) -> tuple[ArticleContent | None, bool]:
+        """Download and extract an article (uncached).
+
+        Returns:
+            (article or None, cacheable): cacheable is False for transient
+            failures (timeouts, 429, 5xx, connection errors) that are worth
+            retrying on the next sighting of the URL, including failures of
+            the Wayback Machine and Playwright fallbacks
+        """
+        try:
             parsed = urlparse(url)
             domain = parsed.netloc.lower().replace("www.", "")
 
             # Check if this is a known news domain (for Wayback fallback)
             is_news_domain = any(d in domain for d in NEWS_DOMAINS)
 
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                verify=True,
-            ) as client:
-                # Try Googlebot headers first for better paywall bypass
-                response = await client.get(url, headers=self.GOOGLEBOT_HEADERS)
-                response.raise_for_status()
+            client = get_http_client(timeout=self.timeout)
+            # Try Googlebot headers first for better paywall bypass
+            response = await client.get(url, headers=self.GOOGLEBOT_HEADERS, follow_redirects=True)
+            response.raise_for_status()
 
             html = response.text
-            soup = BeautifulSoup(html, "lxml")
+            # Article check and extraction run in the parse pool
+            extracted = await extract_article(html, url)
+            is_article = extracted["is_article"]
+            looks_like_spa = extracted["looks_like_spa"]
 
-            # Check if it's likely an article
-            is_article = self.is_likely_news_article(soup, url)
+            # Stays True unless a fallback below failed transiently
+            cacheable = True
 
             if not is_article:
                 # SPA pages may not have article indicators in unrendered HTML
                 # Try Playwright before giving up
-                if len(html) > 5000 and _looks_like_spa(html):
+                if looks_like_spa:
                     logger.info(f"Not detected as article but SPA markers found for {domain}, trying Playwright...")
-                    rendered_article = await _fetch_with_playwright(url, domain)
+                    rendered_article, cacheable = await _fetch_with_playwright(url, domain)
                     if rendered_article:
                         logger.info(f"Playwright rescued non-article SPA page for {domain}: {len(rendered_article.content)} chars")
-                        return rendered_article
+                        return rendered_article, True
                 logger.debug(f"URL {url} does not appear to be a news article")
-                return None
-
-            # Extract title
-            title = self._extract_title(soup)
+                return None, cacheable
 
-            # Extract content
-            content = self._extract_content(soup, html)
+            title = extracted["title"]
+            content = extracted["content"]
 
             # If content is too short and it's a news domain, try Wayback Machine
             if (not content or len(content) < 100) and is_news_domain:
                 logger.info(f"Insufficient content from {domain}, trying Wayback Machine...")
-                wayback_content = await self._try_wayback_machine(url)
+                wayback_content, cacheable = await self._try_wayback_machine(url)
                 if wayback_content and len(wayback_content.content) > len(content or ""):
                     logger.info(f"Got better content from Wayback Machine: {len(wayback_content.content)} chars")
-                    return wayback_content
+                    return wayback_content, True
 
             # Playwright fallback for JS-rendered pages (SPAs like Angular, React, Vue)
             # Check before the <100 early return so we can rescue 0-149 char content
-            if (not content or len(content) < 150) and len(html) > 5000:
-                if _looks_like_spa(html):
-                    original_len = len(content) if content else 0
-                    logger.info(f"Short content ({original_len} chars) with SPA markers detected for {domain}, trying Playwright...")
-                    rendered_article = await _fetch_with_playwright(url, domain)
-                    if rendered_article and len(rendered_article.content) > original_len:
-                        logger.info(f"Playwright fallback succeeded for {domain}: {len(rendered_article.content)} chars (was {original_len})")
-                        return rendered_article
+            if (not content or len(content) < 150) and looks_like_spa:
+                original_len = len(content) if content else 0
+                logger.info(f"Short content ({original_len} chars) with SPA markers detected for {domain}, trying Playwright...")
+                rendered_article, rendered_cacheable = await _fetch_with_playwright(url, domain)
+                cacheable = cacheable and rendered_cacheable
+                if rendered_article and len(rendered_article.content) > original_len:
+                    logger.info(f"Playwright fallback succeeded for {domain}: {len(rendered_article.content)} chars (was {original_len})")
+                    return rendered_article, True
 
             if not content or len(content) < 100:
                 logger.debug(f"Insufficient content extracted from {url}: {len(content) if content else 0} chars")
-                return None
+                return None, cacheable
 
             logger.info(f"Extracted article from {domain}: {len(content)} chars")
 
@@ -321,17 +348,18 @@ class ArticleExtractor:
                 content=content,
                 is_article=is_article,
                 source_domain=domain,
-            )
+            ), True
 
         except httpx.TimeoutException:
             logger.warning(f"Timeout fetching article from {url}")
-            return None
+            return None, False
         except httpx.HTTPStatusError as e:
-            logger.warning(f"HTTP error fetching {url}: {e.response.status_code}")
-            return None
+            status = e.response.status_code
+            logger.warning(f"HTTP error fetching {url}: {status}")
+            return None, _is_permanent_status(status)
         except Exception as e:
             logger.warning(f"Failed to fetch article from {url}: {e}")
-            return None
+            return None, False
 
     def _extract_title(self, soup: BeautifulSoup) -> str | None:
         """Extract article title from HTML."""
@@ -439,7 +467,7 @@ class ArticleExtractor:
 
         return ""
 
-    async def _try_wayback_machine(self, url: str) -> ArticleContent | None:
+    async def _try_wayback_machine(self, url: str) -> tuple[ArticleContent | None, bool]:
         """Try to fetch article from Wayback Machine (archive.org).
 
         Useful for hard paywalls where even Googlebot headers don't help.
@@ -450,16 +478,17 @@ class ArticleExtractor:
             url: Original article URL
 
         Returns:
-            ArticleContent if successful, None otherwise
+            (article or None, cacheable): cacheable is False if the archive
+            could not be reached (timeouts, 429, 5xx, connection errors)
         """
         try:
             # Query Wayback Machine availability API
             api_url = f"https://archive.org/wayback/available?url={url}"
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(api_url)
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client(timeout=10.0)
+            response = await client.get(api_url)
+            response.raise_for_status()
+            data = response.json()
 
             # Check if there's an archived snapshot
             snapshots = data.get("archived_snapshots", {})
@@ -467,37 +496,36 @@ class ArticleExtractor:
 
             if not closest.get("available"):
                 logger.debug(f"No Wayback Machine snapshot available for {url}")
-                return None
+                return None, True
 
             archive_url = closest.get("url")
             if not archive_url:
-                return None
+                return None, True
 
             logger.info(f"Found Wayback snapshot: {archive_url}")
 
             # Fetch the archived page
-            async with httpx.AsyncClient(
+            response = await client.get(
+                archive_url,
+                headers=self.BROWSER_HEADERS,
                 timeout=self.timeout,
                 follow_redirects=True,
-            ) as client:
-                response = await client.get(archive_url, headers=self.BROWSER_HEADERS)
-                response.raise_for_status()
-
-            html = response.text
-            soup = BeautifulSoup(html, "lxml")
-
-            # Remove Wayback Machine toolbar/overlay elements
-            for selector in ["#wm-ipp-base", "#wm-ipp", ".wb-autocomplete-suggestions"]:
-                for el in soup.select(selector):
-                    el.decompose()
-
-            # Extract content
-            title = self._extract_title(soup)
-            content = self._extract_content(soup, html)
+            )
+            response.raise_for_status()
+
+            # Extract content, without the Wayback Machine toolbar/overlay elements
+            extracted = await extract_article(
+                response.text,
+                url,
+                detect=False,
+                strip_selectors=("#wm-ipp-base", "#wm-ipp", ".wb-autocomplete-suggestions"),
+            )
+            title = extracted["title"]
+            content = extracted["content"]
 
             if not content or len(content) < 100:
                 logger.debug(f"Insufficient content from Wayback snapshot: {len(content) if content else 0} chars")
-                return None
+                return None, True
 
             parsed = urlparse(url)
             domain = parsed.netloc.lower().replace("www.", "")
@@ -508,14 +536,17 @@ class ArticleExtractor:
                 content=content,
                 is_article=True,
                 source_domain=domain,
-            )
+            ), True
 
         except httpx.TimeoutException:
             logger.debug(f"Timeout fetching from Wayback Machine for {url}")
-            return None
+            return None, False
+        except httpx.HTTPStatusError as e:
+            logger.debug(f"Wayback Machine returned {e.response.status_code} for {url}")
+            return None, _is_permanent_status(e.response.status_code)
         except Exception as e:
             logger.debug(f"Wayback Machine fallback failed for {url}: {e}")
-            return None
+            return None, False
 
 
 # SPA framework markers that indicate JS rendering is needed
@@ -538,69 +569,58 @@ def _looks_like_spa(html: str) -> bool:
     return any(marker.lower() in html_lower for marker in _SPA_MARKERS)
 
 
-async def _fetch_with_playwright(url: str, domain: str) -> ArticleContent | None:
+def _is_permanent_status(status: int) -> bool:
+    """Missing/forbidden pages stay that way; rate limits and server errors may not."""
+    return status < 500 and status not in (408, 429)
+
+
+async def _fetch_with_playwright(url: str, domain: str) -> tuple[ArticleContent | None, bool]:
     """Fetch article using Playwright browser for JS-rendered pages.
 
     Uses the shared browser pool to render the page and re-extract content
     with trafilatura.
+
+    Returns:
+        (article or None, cacheable): cacheable is False if rendering failed
+        (navigation timeouts, browser errors)
     """
     from services.browser_pool import browser_pool
+    from services.resource_blocking import block_resources
 
     try:
-        async with browser_pool.get_browser() as browser:
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                locale="de-DE",
-            )
+        async with browser_pool.new_context(
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            locale="de-DE",
+        ) as context:
+            # Only the DOM is needed: skip images/fonts/trackers (also
+            # gets "networkidle" sooner)
+            metrics = await block_resources(context, "article")
             try:
                 page = await context.new_page()
 
                 logger.debug(f"Playwright fallback: navigating to {url}")
-                await page.goto(url, wait_until="networkidle", timeout=15000)
+                await metrics.goto(page, url, wait_until="networkidle", timeout=15000)
 
                 html = await page.content()
             finally:
-                await context.close()
+                await metrics.finish()
 
-        # Re-extract with trafilatura on rendered HTML
-        try:
-            import trafilatura
-            content = trafilatura.extract(
-                html,
-                favor_precision=True,
-                include_comments=False,
-                include_tables=False,
-                include_formatting=False,
-                include_images=False,
-                no_fallback=False,
-            )
-        except Exception as e:
-            logger.debug(f"Playwright trafilatura extraction failed for {url}: {e}")
-            content = None
-
-        if not content or len(content) < 100:
-            # Try BeautifulSoup fallback on rendered HTML
-            soup = BeautifulSoup(html, "lxml")
-            extractor = ArticleExtractor()
-            content = extractor._extract_content_fallback(soup)
+        # Re-extract on rendered HTML (trafilatura, BeautifulSoup fallback)
+        extracted = await extract_article(html, url, detect=False)
+        content = extracted["content"]
 
         if not content or len(content) < 100:
             logger.debug(f"Playwright fallback: insufficient content from {url}: {len(content) if content else 0} chars")
-            return None
-
-        # Extract title from rendered page
-        soup = BeautifulSoup(html, "lxml")
-        extractor = ArticleExtractor()
-        title = extractor._extract_title(soup)
+            return None, True
 
         return ArticleContent(
             url=url,
-            title=title,
+            title=extracted["title"],
             content=content,
             is_article=True,
             source_domain=domain,
-        )
+        ), True
 
     except Exception as e:
         logger.warning(f"Playwright fallback failed for {url}: {e}")
-        return None
+        return None, False
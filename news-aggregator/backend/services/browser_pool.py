@@ -6,9 +6,21 @@ multiple node driver processes. Each driver process consumes significant
 resources, and without pooling they can accumulate and cause
 "Resource temporarily unavailable" (Errno 11) errors.
 
+Browsers are kept warm: a Chromium launched for one fetch is handed to the
+next caller instead of being closed, so a channel fetch no longer pays the
+cold start. Callers get isolated BrowserContexts (cookies, fingerprint and
+proxy are per context). A browser is recycled (closed, relaunched on
+demand) after BROWSER_MAX_USES checkouts, when its process tree exceeds
+BROWSER_MAX_RSS_MB, or after BROWSER_MAX_IDLE_SECONDS without use.
+
 Usage:
     from services.browser_pool import browser_pool
 
+    async with browser_pool.new_context(user_agent=..., proxy=...) as context:
+        page = await context.new_page()
+        # ... use page ...
+
+    # Or, to manage contexts yourself:
     async with browser_pool.get_browser() as browser:
         context = await browser.new_context(...)
         page = await context.new_page()
@@ -18,21 +30,125 @@ Usage:
 
 import asyncio
 import logging
+import os
 import time
+from collections import deque
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Optional
 
-from playwright.async_api import async_playwright, Browser, Playwright
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+
+from config import settings
+from services.resource_blocking import get_page_fetch_stats
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+]
+
+
+def _read_proc_stat(pid: int) -> tuple[str, int] | None:
+    """Return (command name, parent pid) of a process, or None if it is gone."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # comm is in parentheses and may contain spaces
+    comm = stat[stat.index("(") + 1:stat.rindex(")")]
+    ppid = int(stat[stat.rindex(")") + 2:].split()[1])
+    return comm, ppid
+
+
+def _process_table() -> dict[int, tuple[str, int]]:
+    """Snapshot of pid -> (command name, parent pid) from /proc (Linux only)."""
+    table = {}
+    try:
+        pids = [int(p) for p in os.listdir("/proc") if p.isdigit()]
+    except OSError:
+        return table
+    for pid in pids:
+        entry = _read_proc_stat(pid)
+        if entry is not None:
+            table[pid] = entry
+    return table
+
+
+# Process names of Chromium builds: chrome, chromium, chrome-headless-shell
+# and, in older Playwright releases, headless_shell
+CHROMIUM_PROCESS_NAMES = ("chrom", "headless_shell")
+
+
+def _is_chromium(comm: str) -> bool:
+    comm = comm.lower()
+    return any(name in comm for name in CHROMIUM_PROCESS_NAMES)
+
+
+def _chromium_roots(table: dict[int, tuple[str, int]]) -> set[int]:
+    """Chromium main processes (chrome processes whose parent is not chrome)."""
+    return {
+        pid for pid, (comm, ppid) in table.items()
+        if _is_chromium(comm) and not _is_chromium(table.get(ppid, ("", 0))[0])
+    }
+
+
+def _tree_rss_mb(root_pid: int, table: dict[int, tuple[str, int]] | None = None) -> float | None:
+    """Resident memory of a process and all its descendants, in MB.
+
+    Shared pages are counted once per process, so this overestimates a bit;
+    good enough for recycling decisions.
+    """
+    table = table if table is not None else _process_table()
+    if root_pid not in table:
+        return None
+    children: dict[int, list[int]] = {}
+    for pid, (_, ppid) in table.items():
+        children.setdefault(ppid, []).append(pid)
+
+    total_kb = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return round(total_kb / 1024, 1)
+
+
+@dataclass(eq=False)
+class PooledBrowser:
+    """A warm browser plus its bookkeeping."""
+
+    browser: Browser
+    generation: int
+    launch_seconds: float
+    pid: int | None = None
+    uses: int = 0
+    launched_at: float = 0.0
+    last_used: float = 0.0
+
+    def rss_mb(self, table: dict[int, tuple[str, int]] | None = None) -> float | None:
+        return _tree_rss_mb(self.pid, table) if self.pid else None
+
 
 class BrowserPool:
     """
     Singleton browser pool using a shared Playwright instance.
 
     Instead of each scraper creating its own Playwright driver (node process),
-    this pool maintains a single driver and creates/recycles browsers from it.
+    this pool maintains a single driver and up to max_browsers warm browsers.
+    A checked-out browser is used by one caller at a time; on return it goes
+    back to the idle list unless it is due for recycling.
 
     Restart logic uses a generation counter to prevent concurrent callers from
     triggering redundant restarts, and a cooldown to avoid restart storms.
@@ -41,9 +157,17 @@ class BrowserPool:
     RESTART_COOLDOWN = 30.0  # seconds between restart attempts
     MAX_RESTART_FAILURES = 3  # consecutive failures before giving up until cooldown
 
-    def __init__(self, max_browsers: int = 8, error_threshold: int = 10):
+    def __init__(
+        self,
+        max_browsers: int = 8,
+        error_threshold: int = 10,
+        max_uses: int = 50,
+        max_rss_mb: float = 1024.0,
+        max_idle_seconds: float = 600.0,
+    ):
         self._playwright: Optional[Playwright] = None
         self._lock = asyncio.Lock()
+        self._launch_lock = asyncio.Lock()
         self._semaphore = asyncio.Semaphore(max_browsers)
         self._initialized = False
         self._shutting_down = False
@@ -53,6 +177,16 @@ class BrowserPool:
         self._generation = 0  # incremented on each restart
         self._last_restart_attempt = 0.0
         self._consecutive_restart_failures = 0
+        self.max_browsers = max_browsers
+        self.max_uses = max_uses
+        self.max_rss_mb = max_rss_mb
+        self.max_idle_seconds = max_idle_seconds
+        self._idle: list[PooledBrowser] = []
+        self._in_use: list[PooledBrowser] = []
+        self._launches = 0
+        self._launch_times: deque[float] = deque(maxlen=20)
+        self._warm_checkouts = 0
+        self._recycled: dict[str, int] = {}
 
     async def _ensure_initialized(self) -> Playwright:
         """Ensure Playwright is initialized, creating it if needed."""
@@ -75,39 +209,120 @@ class BrowserPool:
             logger.info("Playwright instance ready (generation %d)", self._generation)
             return self._playwright
 
+    async def _launch(self, headless: bool, args: list[str] | None) -> PooledBrowser:
+        """Launch a browser and find its main process for memory accounting."""
+        playwright = await self._ensure_initialized()
+        generation = self._generation
+
+        # Launches are serialized so the new Chromium main process can be
+        # told apart from the ones that already exist
+        async with self._launch_lock:
+            table_before = _process_table()
+            roots_before = _chromium_roots(table_before)
+            start = time.monotonic()
+            browser = await asyncio.wait_for(
+                playwright.chromium.launch(
+                    headless=headless,
+                    args=args or DEFAULT_LAUNCH_ARGS,
+                ),
+                timeout=30.0,
+            )
+            launch_seconds = time.monotonic() - start
+            new_roots = _chromium_roots(_process_table()) - roots_before
+
+        self._launches += 1
+        self._launch_times.append(launch_seconds)
+        logger.info("Launched browser in %.2fs", launch_seconds)
+        if len(new_roots) != 1 and table_before:
+            logger.warning(
+                "Could not identify the browser process (%d candidates); "
+                "BROWSER_MAX_RSS_MB is not enforced for this browser",
+                len(new_roots),
+            )
+        now = time.monotonic()
+        return PooledBrowser(
+            browser=browser,
+            generation=generation,
+            launch_seconds=launch_seconds,
+            pid=new_roots.pop() if len(new_roots) == 1 else None,
+            launched_at=now,
+            last_used=now,
+        )
+
+    async def _close(self, pooled: PooledBrowser, reason: str) -> None:
+        """Close a pooled browser and record why."""
+        self._recycled[reason] = self._recycled.get(reason, 0) + 1
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            logger.debug("Error closing browser: %s", e)
+
+    def _recycle_reason(self, pooled: PooledBrowser) -> str | None:
+        """Why a returned browser should not be reused (None = keep it)."""
+        if self._shutting_down:
+            return "shutdown"
+        if pooled.generation != self._generation or not pooled.browser.is_connected():
+            return "disconnected"
+        if pooled.uses >= self.max_uses:
+            return "max_uses"
+        rss = pooled.rss_mb()
+        if rss is not None and rss > self.max_rss_mb:
+            logger.info("Recycling browser using %.0f MB (limit %.0f MB)", rss, self.max_rss_mb)
+            return "memory"
+        return None
+
+    async def _checkout(self, headless: bool, args: list[str] | None) -> PooledBrowser:
+        """Take a warm browser from the idle list or launch a new one."""
+        # Only default launches are pooled; custom ones are one-off browsers
+        if headless and args is None:
+            while self._idle:
+                pooled = self._idle.pop()
+                if pooled.generation == self._generation and pooled.browser.is_connected():
+                    self._warm_checkouts += 1
+                    return pooled
+                await self._close(pooled, "disconnected")
+            pooled = await self._launch(headless, args)
+        else:
+            pooled = await self._launch(headless, args)
+            pooled.uses = self.max_uses  # never returned to the idle list
+        return pooled
+
+    async def _checkin(self, pooled: PooledBrowser) -> None:
+        """Return a browser to the idle list or recycle it."""
+        pooled.uses += 1
+        pooled.last_used = time.monotonic()
+        reason = self._recycle_reason(pooled)
+        if reason is None:
+            self._idle.append(pooled)
+        else:
+            await self._close(pooled, reason)
+
     @asynccontextmanager
     async def get_browser(
         self,
         headless: bool = True,
         args: Optional[list[str]] = None,
     ):
+        """Check out a warm browser for exclusive use.
+
+        Contexts created on it must be closed by the caller (or use
+        new_context()). Non-default launch options get a one-off browser
+        that is closed afterwards.
+        """
         if self._shutting_down:
             raise RuntimeError("Browser pool is shutting down")
 
-        browser: Optional[Browser] = None
+        pooled: PooledBrowser | None = None
 
         async with self._semaphore:
             # Capture generation before we start so we can detect stale errors
             gen_before = self._generation
 
             try:
-                playwright = await self._ensure_initialized()
-
-                launch_args = args or [
-                    "--disable-blink-features=AutomationControlled",
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                ]
-
-                browser = await asyncio.wait_for(
-                    playwright.chromium.launch(
-                        headless=headless,
-                        args=launch_args,
-                    ),
-                    timeout=30.0,
-                )
+                pooled = await self._checkout(headless, args)
+                self._in_use.append(pooled)
 
-                yield browser
+                yield pooled.browser
 
                 # Success — reset error count
                 self._error_count = 0
@@ -122,11 +337,42 @@ class BrowserPool:
                 await self._handle_error(gen_before)
                 raise
             finally:
-                if browser:
-                    try:
-                        await browser.close()
-                    except Exception as e:
-                        logger.debug("Error closing browser: %s", e)
+                if pooled:
+                    self._in_use.remove(pooled)
+                    await self._checkin(pooled)
+
+    @asynccontextmanager
+    async def new_context(self, **context_args):
+        """Open an isolated BrowserContext on a pooled browser.
+
+        Keyword arguments go to Browser.new_context (user_agent, viewport,
+        locale, proxy, ...). The context is closed on exit; the browser
+        stays warm for the next caller.
+        """
+        async with self.get_browser() as browser:
+            context: BrowserContext = await browser.new_context(**context_args)
+            try:
+                yield context
+            finally:
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.debug("Error closing browser context: %s", e)
+
+    async def prune_idle(self) -> int:
+        """Close browsers idle for longer than max_idle_seconds.
+
+        Returns:
+            Number of browsers closed
+        """
+        now = time.monotonic()
+        stale = [p for p in self._idle if now - p.last_used > self.max_idle_seconds]
+        for pooled in stale:
+            self._idle.remove(pooled)
+            await self._close(pooled, "idle")
+        if stale:
+            logger.debug("Closed %d idle browsers", len(stale))
+        return len(stale)
 
     async def _handle_error(self, error_generation: int):
         """Handle browser error. Only trigger restart if still on the same generation."""
@@ -179,6 +425,11 @@ class BrowserPool:
                 self._error_count,
             )
 
+            # Browsers die with the driver; in-use ones are dropped on return
+            if self._idle:
+                self._recycled["restart"] = self._recycled.get("restart", 0) + len(self._idle)
+                self._idle.clear()
+
             # Stop existing driver
             if self._playwright:
                 try:
@@ -212,6 +463,10 @@ class BrowserPool:
         """Shutdown the browser pool and cleanup resources."""
         self._shutting_down = True
 
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            await self._close(pooled, "shutdown")
+
         async with self._lock:
             if self._playwright:
                 logger.info("Shutting down Playwright instance...")
@@ -229,14 +484,52 @@ class BrowserPool:
         return self._initialized
 
     async def health_check(self) -> dict:
+        table = _process_table()
+        now = time.monotonic()
+
+        def describe(pooled: PooledBrowser, state: str) -> dict:
+            return {
+                "state": state,
+                "pid": pooled.pid,
+                "uses": pooled.uses,
+                "age_seconds": round(now - pooled.launched_at),
+                "launch_seconds": round(pooled.launch_seconds, 2),
+                "rss_mb": pooled.rss_mb(table),
+            }
+
+        browsers = (
+            [describe(p, "in_use") for p in self._in_use]
+            + [describe(p, "idle") for p in self._idle]
+        )
+        launch_times = list(self._launch_times)
         return {
             "initialized": self._initialized,
             "shutting_down": self._shutting_down,
             "generation": self._generation,
             "error_count": self._error_count,
             "consecutive_restart_failures": self._consecutive_restart_failures,
+            "max_browsers": self.max_browsers,
+            "max_uses": self.max_uses,
+            "max_rss_mb": self.max_rss_mb,
+            "browsers_idle": len(self._idle),
+            "browsers_in_use": len(self._in_use),
+            "launches": self._launches,
+            "warm_checkouts": self._warm_checkouts,
+            "last_launch_seconds": round(launch_times[-1], 2) if launch_times else None,
+            "avg_launch_seconds": (
+                round(sum(launch_times) / len(launch_times), 2) if launch_times else None
+            ),
+            "total_rss_mb": round(sum(b["rss_mb"] or 0 for b in browsers), 1),
+            "recycled": dict(self._recycled),
+            "browsers": browsers,
+            "page_fetches": get_page_fetch_stats(),
         }
 
 
 # Singleton instance
-browser_pool = BrowserPool(max_browsers=4)
+browser_pool = BrowserPool(
+    max_browsers=settings.browser_pool_size,
+    max_uses=settings.browser_max_uses,
+    max_rss_mb=settings.browser_max_rss_mb,
+    max_idle_seconds=settings.browser_max_idle_seconds,
+)
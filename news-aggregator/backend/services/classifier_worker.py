@@ -2,8 +2,14 @@
 Classifier Background Worker.
 
 Continuously processes items through the embedding classifier:
-1. Items without pre_filter (never classified)
+1. Items without classified_at (never classified)
 2. Updates priority based on classifier confidence
+3. Items not yet checked for duplicates or indexed in the vector store
+
+Each queue is a NULL column backed by a partial index, so a poll reads only
+pending items whatever the size of the items table. Batches are claimed
+(services/work_claims.py), so worker processes on several hosts can share
+the queues.
 
 This ensures items fetched during classifier downtime get properly
 evaluated when the classifier comes back online.
@@ -12,14 +18,24 @@ evaluated when the classifier comes back online.
 import asyncio
 import logging
 from datetime import datetime
-from typing import Optional
 
 from sqlalchemy import func, select, update
 from sqlalchemy.orm import selectinload
 
 from database import async_session_maker
-from models import Channel, Item, Priority
-from services.pipeline import _strip_boilerplate
+from models import Channel, Item, Priority, RetryPriority
+from services.event_bus import EVENT_WORKER_COMMAND, get_event_bus
+from services.pipeline import _normalize_url, _strip_boilerplate
+from services.work_claims import (
+    QUEUE_CLASSIFY,
+    QUEUE_DEDUP,
+    QUEUE_INDEX,
+    claim_items,
+    make_worker_id,
+    release_all_claims,
+    release_claims,
+    renew_claims,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +50,7 @@ class ClassifierWorker:
     """
     Background worker for classifier processing.
 
-    Processes items that have never been classified (no pre_filter metadata)
+    Processes items that have never been classified (classified_at is NULL)
     and updates their priority based on classifier confidence.
     """
 
@@ -56,10 +72,14 @@ class ClassifierWorker:
         # Worker state
         self._running = False
         self._paused = False
-        self._task: Optional[asyncio.Task] = None
-        self._poll_task: Optional[asyncio.Task] = None
-        self._sync_task: Optional[asyncio.Task] = None
+        self._task: asyncio.Task | None = None
+        self._poll_task: asyncio.Task | None = None
+        self._sync_task: asyncio.Task | None = None
+        self._heartbeat_task: asyncio.Task | None = None
         self._classifier = None
+        self._worker_id = make_worker_id("classifier")
+        self._held_claims: tuple[str, list[int]] | None = None  # Batch being processed
+        self._last_command_at = datetime.utcnow()
 
         # Statistics (protected by _stats_lock for thread-safe updates)
         self._stats = {
@@ -77,6 +97,8 @@ class ClassifierWorker:
 
     async def start(self):
         """Start the worker background task."""
+        from services.worker_status import db_now, write_state
+
         if self._running:
             logger.warning("Classifier worker already running")
             return
@@ -84,11 +106,15 @@ class ClassifierWorker:
         self._running = True
         self._stats["started_at"] = datetime.utcnow().isoformat()
         self._stopped_due_to_errors = False  # Reset on start
+        # Only commands issued from now on (database clock, like their issue times)
+        self._last_command_at = await db_now()
+        bus = get_event_bus()
+        bus.subscribe(EVENT_WORKER_COMMAND, self._on_command_event)
         self._task = asyncio.create_task(self._run())
         self._poll_task = asyncio.create_task(self._poll_commands())
         self._sync_task = asyncio.create_task(self._sync_stats())
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
 
-        from services.worker_status import write_state
         await write_state("classifier", running=True)
         logger.info("Classifier worker started")
 
@@ -98,14 +124,23 @@ class ClassifierWorker:
             return
 
         self._running = False
-        for task in (self._task, self._poll_task, self._sync_task):
-            if task:
+        bus = get_event_bus()
+        bus.unsubscribe(EVENT_WORKER_COMMAND, self._on_command_event)
+        for task in (self._task, self._poll_task, self._sync_task, self._heartbeat_task):
+            if task and task is not asyncio.current_task():
                 task.cancel()
                 try:
                     await task
                 except asyncio.CancelledError:
                     pass
 
+        # Hand claimed items back to the other workers right away
+        try:
+            async with async_session_maker() as db:
+                await release_all_claims(db, self._worker_id)
+        except Exception as e:
+            logger.warning(f"Failed to release classifier claims: {e}")
+
         # Close HTTP client in classifier to prevent resource leak
         if self._classifier:
             await self._classifier.close()
@@ -224,21 +259,48 @@ class ClassifierWorker:
 
         logger.info("Classifier worker loop ended")
 
+    async def _apply_command(self, action: str, issued_at: datetime):
+        """Apply a pause/resume/stop command from the API."""
+        self._last_command_at = issued_at
+        if action == "pause":
+            await self.pause()
+        elif action == "resume":
+            await self.resume()
+        elif action == "stop":
+            await self.stop()
+
+    async def _on_command_event(self, event: dict):
+        """Apply a command received on the event bus."""
+        from services.worker_status import parse_command
+
+        if event.get("worker") != "classifier" or not self._running:
+            return
+        command = parse_command("classifier", event, self._last_command_at)
+        if command is not None:
+            await self._apply_command(*command)
+
     async def _poll_commands(self):
-        """Poll DB for commands (pause/resume/stop) from API workers."""
-        from services.worker_status import read_and_clear_command, get_poll_interval
+        """Poll DB for commands (pause/resume/stop) from API workers.
 
+        Commands normally arrive as events; the DB is only read while the
+        event bus is down and once after each (re)connect, for commands
+        sent while it was not listening.
+        """
+        from services.worker_status import get_poll_interval, read_new_command
+
+        bus = get_event_bus()
+        seen_generation = None
         while self._running:
             try:
                 interval = await get_poll_interval()
                 await asyncio.sleep(interval)
-                action = await read_and_clear_command("classifier")
-                if action == "pause":
-                    await self.pause()
-                elif action == "resume":
-                    await self.resume()
-                elif action == "stop":
-                    await self.stop()
+                generation = bus.generation if bus.connected else None
+                if generation is not None and generation == seen_generation:
+                    continue
+                command = await read_new_command("classifier", self._last_command_at)
+                seen_generation = generation
+                if command is not None:
+                    await self._apply_command(*command)
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -246,25 +308,54 @@ class ClassifierWorker:
                 await asyncio.sleep(10)
 
     async def _sync_stats(self):
-        """Periodically sync stats to DB for API workers to read."""
+        """Periodically sync stats to DB for API workers to read (when changed)."""
         from services.worker_status import write_stats, get_poll_interval
 
+        last_synced = None
         while self._running:
             try:
                 interval = await get_poll_interval()
                 await asyncio.sleep(interval)
                 async with self._stats_lock:
                     stats = self._stats.copy()
+                if stats == last_synced:
+                    continue
                 await write_stats("classifier", stats)
+                last_synced = stats
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.warning(f"Classifier stats sync error: {e}")
                 await asyncio.sleep(10)
 
+    async def _heartbeat(self):
+        """Renew the leases of the batch being processed."""
+        from config import settings
+
+        while self._running:
+            try:
+                await asyncio.sleep(settings.work_claim_lease_seconds / 3)
+                if self._held_claims:
+                    async with async_session_maker() as db:
+                        await renew_claims(db, *self._held_claims, self._worker_id)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"Classifier claim heartbeat error: {e}")
+
+    async def _release_claims(self, queue: str, item_ids: list[int]) -> None:
+        """Release claims after a batch, whether it succeeded or not."""
+        self._held_claims = None
+        try:
+            async with async_session_maker() as db:
+                await release_claims(db, queue, item_ids, self._worker_id)
+        except Exception as e:
+            # No longer renewed, so the claims expire after the lease
+            logger.warning(f"Failed to release {queue} claims: {e}")
+
     async def _process_unclassified_items(self) -> int:
         """
-        Process items without pre_filter classification.
+        Process items without classifier results (classified_at is NULL).
 
         Returns:
             Number of items processed
@@ -278,17 +369,35 @@ class ClassifierWorker:
             logger.debug(f"Cannot create classifier: {e}")
             return 0
 
-        # Phase 1: Query items without pre_filter (read-only, no lock needed)
+        # Phase 1: Claim a batch of unclassified items
+        async with async_session_maker() as db:
+            item_ids = await claim_items(
+                db,
+                QUEUE_CLASSIFY,
+                select(Item.id)
+                .where(Item.classified_at.is_(None))
+                .order_by(Item.fetched_at.desc())
+                .limit(self.batch_size),
+                self._worker_id,
+            )
+        if not item_ids:
+            return 0
+
+        self._held_claims = (QUEUE_CLASSIFY, item_ids)
+        try:
+            return await self._classify_items(classifier, item_ids)
+        finally:
+            await self._release_claims(QUEUE_CLASSIFY, item_ids)
+
+    async def _classify_items(self, classifier, item_ids: list[int]) -> int:
+        """Classify claimed items and store priority and queue state."""
+        # Load the claimed items (read-only, no lock needed)
         async with async_session_maker() as db:
-            from database import json_extract_path
             query = (
                 select(Item)
-                .where(
-                    json_extract_path(Item.metadata_, "pre_filter").is_(None),
-                )
+                .where(Item.id.in_(item_ids))
                 .options(selectinload(Item.channel).selectinload(Channel.source))
                 .order_by(Item.fetched_at.desc())
-                .limit(self.batch_size)
             )
 
             result = await db.execute(query)
@@ -314,23 +423,24 @@ class ClassifierWorker:
 
         logger.info(f"Classifying {len(items_to_classify)} unclassified items")
 
-        # Phase 2: Classify items (external HTTP calls, no lock needed)
+        # Phase 2: Classify items in one batched call (external HTTP, no lock needed)
         updates = []
         processed = 0
         priority_changed = 0
 
-        for item_data in items_to_classify:
-            if self._paused or not self._running:
-                break
+        if self._paused or not self._running:
+            return 0
 
-            try:
-                # Classify the item
-                result = await classifier.classify(
-                    title=item_data["title"],
-                    content=item_data["content"],
-                    source=item_data["source"],
-                )
+        try:
+            results = await classifier.classify_batch(items_to_classify)
+        except Exception as e:
+            logger.warning(f"Failed to classify batch of {len(items_to_classify)} items: {e}")
+            async with self._stats_lock:
+                self._stats["errors"] += 1
+            results = []
 
+        for item_data, result in zip(items_to_classify, results):
+            try:
                 confidence = result.get("relevance_confidence", 0.5)
                 old_priority = item_data["old_priority"]
 
@@ -338,6 +448,7 @@ class ClassifierWorker:
                 new_priority, new_score, skip_llm = self._determine_priority(confidence)
 
                 # Prepare updated metadata
+                classified_at = datetime.utcnow()
                 new_metadata = dict(item_data["old_metadata"])
                 new_metadata["pre_filter"] = {
                     "relevance_confidence": confidence,
@@ -345,16 +456,16 @@ class ClassifierWorker:
                     "ak_confidence": result.get("ak_confidence"),
                     "priority_suggestion": result.get("priority"),
                     "priority_confidence": result.get("priority_confidence"),
-                    "classified_at": datetime.utcnow().isoformat(),
+                    "classified_at": classified_at.isoformat(),
                 }
 
                 # Set retry priority for LLM worker
                 if confidence >= CONFIDENCE_HIGH:
-                    new_metadata["retry_priority"] = "high"
+                    retry_priority = RetryPriority.HIGH
                 elif confidence >= CONFIDENCE_EDGE:
-                    new_metadata["retry_priority"] = "edge_case"
+                    retry_priority = RetryPriority.EDGE_CASE
                 else:
-                    new_metadata["retry_priority"] = "low"
+                    retry_priority = RetryPriority.LOW
 
                 # Collect update
                 updates.append({
@@ -363,6 +474,8 @@ class ClassifierWorker:
                     "priority": new_priority.value,
                     "priority_score": new_score,
                     "metadata_": new_metadata,
+                    "classified_at": classified_at,
+                    "retry_priority": retry_priority.value,
                     "needs_llm_processing": not skip_llm,
                 })
 
@@ -395,6 +508,8 @@ class ClassifierWorker:
                                 priority=upd["priority"],
                                 priority_score=upd["priority_score"],
                                 metadata_=upd["metadata_"],
+                                classified_at=upd["classified_at"],
+                                retry_priority=upd["retry_priority"],
                                 needs_llm_processing=upd["needs_llm_processing"],
                             )
                         )
@@ -481,28 +596,46 @@ class ClassifierWorker:
             logger.debug(f"Cannot create classifier for duplicate check: {e}")
             return 0
 
-        # Find items without similar_to_id and without duplicate_checked flag
+        # Find items without similar_to_id that were never checked
         # Limit to recent items by default (configurable via DUPLICATE_CHECK_DAYS, 0 = no limit)
         import os
         check_days = int(os.environ.get("DUPLICATE_CHECK_DAYS", "7"))
 
         async with async_session_maker() as db:
-            from database import json_extract_path
-
             conditions = [
                 Item.similar_to_id.is_(None),
-                json_extract_path(Item.metadata_, "duplicate_checked").is_(None),
+                Item.duplicate_checked_at.is_(None),
             ]
 
             if check_days > 0:
                 cutoff = datetime.utcnow() - timedelta(days=check_days)
                 conditions.append(Item.fetched_at >= cutoff)
 
+            item_ids = await claim_items(
+                db,
+                QUEUE_DEDUP,
+                select(Item.id)
+                .where(*conditions)
+                .order_by(Item.fetched_at.desc())
+                .limit(self.batch_size),
+                self._worker_id,
+            )
+        if not item_ids:
+            return 0
+
+        self._held_claims = (QUEUE_DEDUP, item_ids)
+        try:
+            return await self._check_duplicates(classifier, item_ids)
+        finally:
+            await self._release_claims(QUEUE_DEDUP, item_ids)
+
+    async def _check_duplicates(self, classifier, item_ids: list[int]) -> int:
+        """Check claimed items for URL and semantic duplicates."""
+        async with async_session_maker() as db:
             query = (
                 select(Item)
-                .where(*conditions)
+                .where(Item.id.in_(item_ids))
                 .order_by(Item.fetched_at.desc())
-                .limit(self.batch_size)
             )
 
             result = await db.execute(query)
@@ -518,11 +651,26 @@ class ClassifierWorker:
                     "id": item.id,
                     "title": item.title,
                     "url": item.url,
+                    "url_normalized": item.url_normalized or (
+                        _normalize_url(item.url) if item.url else None
+                    ),
                     "channel_id": item.channel_id,
                     "content": item.content or "",
                     "old_metadata": dict(item.metadata_) if item.metadata_ else {},
                 })
 
+            # URL matches for the whole batch in one indexed lookup
+            url_rows: dict[str, list[tuple[int, int]]] = {}
+            urls = {d["url_normalized"] for d in items_to_check if d["url_normalized"]}
+            if urls:
+                result = await db.execute(
+                    select(Item.url_normalized, Item.id, Item.channel_id)
+                    .where(Item.url_normalized.in_(urls))
+                    .order_by(Item.id)
+                )
+                for url, other_id, other_channel in result.all():
+                    url_rows.setdefault(url, []).append((other_id, other_channel))
+
         logger.info(f"Checking {len(items_to_check)} items for duplicates")
 
         # Check each item for duplicates
@@ -537,30 +685,27 @@ class ClassifierWorker:
             try:
                 # Prepare updated metadata
                 new_metadata = dict(item_data["old_metadata"])
-                new_metadata["duplicate_checked"] = True
-                new_metadata["duplicate_checked_at"] = datetime.utcnow().isoformat()
 
                 similar_to_id = None
                 duplicates = []
 
                 # 1. URL-based duplicate check (exact same article from different channel)
-                if item_data.get("url"):
-                    async with async_session_maker() as url_db:
-                        url_match = await url_db.scalar(
-                            select(Item.id).where(
-                                Item.url == item_data["url"],
-                                Item.id < item_data["id"],
-                                Item.channel_id != item_data["channel_id"],
-                            ).order_by(Item.id).limit(1)
-                        )
-                        if url_match:
-                            similar_to_id = url_match
-                            new_metadata["duplicate_method"] = "url_match"
-                            duplicates_found += 1
-                            logger.info(
-                                f"URL duplicate: '{item_data['title'][:40]}...' "
-                                f"same URL as item {similar_to_id}"
-                            )
+                url_match = next(
+                    (
+                        other_id
+                        for other_id, other_channel in url_rows.get(item_data["url_normalized"], [])
+                        if other_id < item_data["id"] and other_channel != item_data["channel_id"]
+                    ),
+                    None,
+                )
+                if url_match:
+                    similar_to_id = url_match
+                    new_metadata["duplicate_method"] = "url_match"
+                    duplicates_found += 1
+                    logger.info(
+                        f"URL duplicate: '{item_data['title'][:40]}...' "
+                        f"same URL as item {similar_to_id}"
+                    )
 
                 # 2. Semantic duplicate check (same topic, different article)
                 if not similar_to_id:
@@ -601,6 +746,7 @@ class ClassifierWorker:
                     "id": item_data["id"],
                     "similar_to_id": similar_to_id,
                     "metadata_": new_metadata,
+                    "duplicate_checked_at": datetime.utcnow(),
                 })
                 checked += 1
 
@@ -643,6 +789,7 @@ class ClassifierWorker:
                             .values(
                                 similar_to_id=upd["similar_to_id"],
                                 metadata_=upd["metadata_"],
+                                duplicate_checked_at=upd["duplicate_checked_at"],
                             )
                         )
                     await db.commit()
@@ -677,19 +824,34 @@ class ClassifierWorker:
             logger.debug(f"Cannot create classifier for indexing: {e}")
             return 0
 
-        # Find items without vectordb_indexed flag
+        # Claim items not yet in the vector store
         async with async_session_maker() as db:
-            from database import json_extract_path
-            from sqlalchemy.orm import selectinload
+            item_ids = await claim_items(
+                db,
+                QUEUE_INDEX,
+                select(Item.id)
+                .where(Item.indexed_at.is_(None))
+                .order_by(Item.fetched_at.desc())
+                .limit(self.batch_size),
+                self._worker_id,
+            )
+        if not item_ids:
+            return 0
 
+        self._held_claims = (QUEUE_INDEX, item_ids)
+        try:
+            return await self._index_items(classifier, item_ids)
+        finally:
+            await self._release_claims(QUEUE_INDEX, item_ids)
+
+    async def _index_items(self, classifier, claimed_ids: list[int]) -> int:
+        """Add claimed items to the vector store and mark them indexed."""
+        async with async_session_maker() as db:
             query = (
                 select(Item)
-                .where(
-                    json_extract_path(Item.metadata_, "vectordb_indexed").is_(None),
-                )
+                .where(Item.id.in_(claimed_ids))
                 .options(selectinload(Item.channel).selectinload(Channel.source))
                 .order_by(Item.fetched_at.desc())
-                .limit(self.batch_size)
             )
 
             result = await db.execute(query)
@@ -733,24 +895,14 @@ class ClassifierWorker:
         if item_ids:
             try:
                 async with async_session_maker() as db:
-                    for item_id in item_ids:
-                        # Get current metadata
-                        result = await db.execute(
-                            select(Item.metadata_).where(Item.id == item_id)
-                        )
-                        current_meta = result.scalar() or {}
-                        new_meta = dict(current_meta)
-                        new_meta["vectordb_indexed"] = True
-                        new_meta["vectordb_indexed_at"] = datetime.utcnow().isoformat()
-
-                        await db.execute(
-                            update(Item)
-                            .where(Item.id == item_id)
-                            .values(metadata_=new_meta)
-                        )
+                    await db.execute(
+                        update(Item)
+                        .where(Item.id.in_(item_ids))
+                        .values(indexed_at=datetime.utcnow())
+                    )
                     await db.commit()
             except Exception as e:
-                logger.error(f"Failed to update vectordb_indexed flags: {e}")
+                logger.error(f"Failed to update indexed_at: {e}")
                 raise
 
         async with self._stats_lock:
@@ -765,7 +917,7 @@ class ClassifierWorker:
         """Daily check: compare DB indexed count with ChromaDB item count.
 
         Logs an error if the counts are significantly out of sync,
-        and resets vectordb_indexed flags for items missing from ChromaDB.
+        and resets indexed_at for items missing from ChromaDB.
         """
         try:
             classifier = await self._get_classifier()
@@ -782,11 +934,8 @@ class ClassifierWorker:
 
             # Get DB indexed count
             async with async_session_maker() as db:
-                from database import json_extract_path
                 db_count = await db.scalar(
-                    select(func.count()).select_from(Item).where(
-                        json_extract_path(Item.metadata_, "vectordb_indexed").isnot(None),
-                    )
+                    select(func.count()).select_from(Item).where(Item.indexed_at.isnot(None))
                 )
 
             diff = (db_count or 0) - chromadb_count
@@ -795,7 +944,7 @@ class ClassifierWorker:
                     f"VECTORDB SYNC CHECK: DB says {db_count} items indexed, "
                     f"ChromaDB has {chromadb_count} items. "
                     f"Difference: {diff} items. "
-                    f"Run /sync-duplicate-store or reset vectordb_indexed flags."
+                    f"Run /sync-duplicate-store or reset items.indexed_at."
                 )
             elif diff > 0:
                 logger.warning(
@@ -811,10 +960,10 @@ class ClassifierWorker:
 
 
 # Global worker instance
-_worker: Optional[ClassifierWorker] = None
+_worker: ClassifierWorker | None = None
 
 
-def get_classifier_worker() -> Optional[ClassifierWorker]:
+def get_classifier_worker() -> ClassifierWorker | None:
     """Get the global classifier worker instance."""
     return _worker
 
@@ -858,12 +1007,9 @@ async def stop_classifier_worker():
 
 async def get_unclassified_count() -> int:
     """Get count of items without classifier results."""
-    from database import json_extract_path
     async with async_session_maker() as db:
         result = await db.execute(
-            select(func.count(Item.id)).where(
-                json_extract_path(Item.metadata_, "pre_filter").is_(None)
-            )
+            select(func.count(Item.id)).where(Item.classified_at.is_(None))
         )
         return result.scalar() or 0
 
@@ -872,13 +1018,12 @@ async def get_unchecked_duplicates_count() -> int:
     """Get count of items that haven't been checked for duplicates."""
     import os
     from datetime import timedelta
-    from database import json_extract_path
 
     check_days = int(os.environ.get("DUPLICATE_CHECK_DAYS", "7"))
 
     conditions = [
         Item.similar_to_id.is_(None),
-        json_extract_path(Item.metadata_, "duplicate_checked").is_(None),
+        Item.duplicate_checked_at.is_(None),
     ]
 
     if check_days > 0:
@@ -13,7 +13,7 @@ import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 from typing import Optional
 
-import httpx
+from services.http_clients import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -48,9 +48,9 @@ class EurostatMetadata:
         """Fetch all dataset metadata from SDMX API."""
         logger.info("Fetching Eurostat SDMX metadata...")
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(self.SDMX_URL)
-            response.raise_for_status()
+        client = get_http_client(timeout=self.timeout)
+        response = await client.get(self.SDMX_URL)
+        response.raise_for_status()
 
         root = ET.fromstring(response.text)
         metadata = {}
@@ -147,9 +147,9 @@ class EurostatMetadata:
         try:
             import trafilatura
 
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(url)
-                response.raise_for_status()
+            client = get_http_client(timeout=30.0)
+            response = await client.get(url, follow_redirects=True)
+            response.raise_for_status()
 
             # Extract content using trafilatura
             content = trafilatura.extract(response.text)
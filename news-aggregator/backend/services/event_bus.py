@@ -0,0 +1,246 @@
+"""PostgreSQL LISTEN/NOTIFY event bus between backend processes.
+
+Every process (leader and API-only, on any host sharing the database) holds
+one dedicated asyncpg connection that LISTENs on a single channel. Events
+are small JSON payloads {"type": ..., ...} sent with pg_notify() through
+the regular connection pool, and are delivered to all listening processes,
+including the sender, once the sending transaction commits.
+
+Event types:
+- worker_command: pause/resume/stop for a worker (see worker_status)
+- items_created: new item ids that need LLM processing (from Pipeline)
+- rules_changed: drop compiled rule caches
+- config_changed: a runtime setting changed (key, or None for all)
+
+NOTIFY is fire-and-forget: events sent while a process is reconnecting
+are lost to it. Callers therefore keep their DB-backed fallback (command
+key, LLM backlog query, cache TTL) and only skip it while `connected` has
+stayed true; `generation` tells them whether the listener reconnected.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "news_events"
+
+EVENT_WORKER_COMMAND = "worker_command"
+EVENT_ITEMS_CREATED = "items_created"
+EVENT_RULES_CHANGED = "rules_changed"
+EVENT_CONFIG_CHANGED = "config_changed"
+
+# NOTIFY payloads must stay below 8000 bytes; ids are split over several events
+MAX_IDS_PER_EVENT = 500
+
+_NOTIFY = text("SELECT pg_notify(:channel, :payload)")
+
+Handler = Callable[[dict], Awaitable[None] | None]
+
+
+def _listener_dsn() -> str:
+    """Plain asyncpg DSN of the application database."""
+    from database import engine
+    return engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+class EventBus:
+    """Process-wide LISTEN connection plus handler registry."""
+
+    def __init__(self, keepalive: float = 60.0):
+        self.keepalive = keepalive
+        self._handlers: dict[str, list[Handler]] = {}
+        self._task: asyncio.Task | None = None
+        self._conn = None
+        self._connected = False
+        self._pending: set[asyncio.Task] = set()
+        # Incremented on every (re)connect
+        self.generation = 0
+        self.received = 0
+
+    @property
+    def started(self) -> bool:
+        return self._task is not None
+
+    @property
+    def connected(self) -> bool:
+        """True while the listener connection is up."""
+        return self._connected
+
+    def subscribe(self, event_type: str, handler: Handler) -> None:
+        """Call `handler(event)` for every event of this type (sync or async)."""
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type: str, handler: Handler) -> None:
+        handlers = self._handlers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    async def start(self) -> None:
+        """Start listening (reconnects in the background until stopped)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop listening and close the listener connection."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        for pending in list(self._pending):
+            pending.cancel()
+
+    async def publish(
+        self, event_type: str, session: AsyncSession | None = None, **data: Any
+    ) -> bool:
+        """Send an event to all processes. Returns False if not sent.
+
+        With `session` the event is part of that session's transaction: it is
+        delivered when the caller commits (so listeners see the rows it is
+        about) and dropped on rollback. Otherwise it is sent right away.
+
+        Nothing is sent while the bus is not started in this process (tests,
+        scripts, EVENT_BUS_ENABLED=false); callers then use their fallback.
+        """
+        if not self.started:
+            return False
+        params = {
+            "channel": CHANNEL,
+            "payload": json.dumps({"type": event_type, **data}, default=str),
+        }
+        try:
+            if session is not None:
+                # Savepoint: a failed NOTIFY must not abort the caller's transaction
+                async with session.begin_nested():
+                    await session.execute(_NOTIFY, params)
+            else:
+                from database import engine
+                async with engine.connect() as conn:
+                    await conn.execute(_NOTIFY, params)
+                    await conn.commit()
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to publish {event_type} event: {e}")
+            return False
+
+    async def publish_ids(
+        self,
+        event_type: str,
+        ids: Iterable[int],
+        session: AsyncSession | None = None,
+        **data: Any,
+    ) -> bool:
+        """Publish `ids` in chunks small enough for a NOTIFY payload."""
+        ids = list(ids)
+        for start in range(0, len(ids), MAX_IDS_PER_EVENT):
+            chunk = ids[start:start + MAX_IDS_PER_EVENT]
+            if not await self.publish(event_type, session=session, ids=chunk, **data):
+                return False
+        return True
+
+    def publish_soon(self, event_type: str, **data: Any) -> None:
+        """Publish from synchronous code without waiting for it."""
+        if not self.started:
+            return
+        self._track(asyncio.get_running_loop().create_task(self.publish(event_type, **data)))
+
+    async def _listen(self) -> None:
+        backoff = 1.0
+        while True:
+            conn = None
+            try:
+                import asyncpg
+
+                conn = await asyncpg.connect(_listener_dsn())
+                lost = asyncio.Event()
+                conn.add_termination_listener(lambda _conn: lost.set())
+                await conn.add_listener(CHANNEL, self._on_notify)
+                self._conn = conn
+                self._connected = True
+                self.generation += 1
+                backoff = 1.0
+                logger.info(f"Event bus listening on '{CHANNEL}'")
+
+                while not lost.is_set():
+                    try:
+                        await asyncio.wait_for(lost.wait(), timeout=self.keepalive)
+                    except TimeoutError:
+                        # Detect half-open connections the server never closed
+                        await asyncio.wait_for(conn.execute("SELECT 1"), timeout=10)
+                logger.warning("Event bus connection lost, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Event bus connection failed: {e}")
+            finally:
+                self._connected = False
+                self._conn = None
+                if conn is not None and not conn.is_closed():
+                    try:
+                        await asyncio.shield(conn.close(timeout=5))
+                    except Exception:
+                        pass
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 60.0)
+
+    def _on_notify(self, _conn, _pid: int, _channel: str, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+            event_type = event["type"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring malformed event: {payload[:200]}")
+            return
+
+        self.received += 1
+        for handler in list(self._handlers.get(event_type, [])):
+            try:
+                result = handler(event)
+                if inspect.isawaitable(result):
+                    self._track(asyncio.ensure_future(result))
+            except Exception as e:
+                logger.warning(f"Event handler for {event_type} failed: {e}")
+
+    def _track(self, task: asyncio.Future) -> None:
+        self._pending.add(task)
+        task.add_done_callback(self._done)
+
+    def _done(self, task: asyncio.Future) -> None:
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Event task failed: {task.exception()}")
+
+
+_bus: EventBus | None = None
+
+
+def get_event_bus() -> EventBus:
+    """Get the process-wide event bus (handlers can subscribe before start)."""
+    global _bus
+    if _bus is None:
+        from config import settings
+        _bus = EventBus(keepalive=settings.event_bus_keepalive_seconds)
+    return _bus
+
+
+async def start_event_bus() -> EventBus:
+    """Start listening in this process."""
+    bus = get_event_bus()
+    await bus.start()
+    return bus
+
+
+async def stop_event_bus() -> None:
+    """Stop listening in this process."""
+    if _bus is not None:
+        await _bus.stop()
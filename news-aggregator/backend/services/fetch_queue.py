@@ -0,0 +1,290 @@
+"""Priority fetch queue with per-connector-type worker pools.
+
+fetch_due_channels() only dispatches: it queues the channels that are due
+and returns. Each connector type has its own pool of long-running worker
+tasks (SOURCE_TYPE_LIMITS, capped by available proxies for scrapers), so a
+slow x_scraper fetch only occupies an x_scraper worker and never delays RSS
+channels or the next dispatch. There is no global fetch lock.
+
+Within a connector type, channels are fetched in priority order:
+
+- Manual triggers first
+- Then by how long the channel has been due (never fetched = most stale).
+  Channels of stakeholder sources count as STAKEHOLDER_HEAD_START_MINUTES
+  more overdue. A head start instead of a strict tier keeps regular
+  channels from starving behind a steady stream of stakeholder channels.
+
+A channel is queued at most once: dispatching it again while it waits or
+runs is a no-op. Workers run on the leader only (started lazily on first
+use, stopped with the scheduler).
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from models import Channel
+
+logger = logging.getLogger(__name__)
+
+# Stakeholder channels are treated as this much longer overdue
+STAKEHOLDER_HEAD_START_MINUTES = 30
+# Wait times kept per connector type for the percentiles
+WAIT_SAMPLES = 500
+# How often workers above a (proxy-capped) limit check it again
+LIMIT_RECHECK_SECONDS = 10
+
+_EPOCH = datetime(1970, 1, 1)
+_URGENT = float("-inf")
+
+
+@dataclass
+class FetchJob:
+    """A queued channel fetch."""
+
+    channel_id: int
+    connector_type: str
+    label: str
+    priority: float
+    training_mode: bool = False
+    enqueued_at: float = field(default_factory=time.monotonic)
+    started_at: float | None = None
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+def fetch_priority(channel: Channel) -> float:
+    """Sort key of a channel (lower = fetched first).
+
+    Seconds since the epoch at which the channel became due, minus the
+    stakeholder head start. Requires channel.source to be loaded.
+    """
+    due = channel.next_fetch_at or channel.last_fetch_at
+    key = (due - _EPOCH).total_seconds() if due else 0.0
+    if channel.source is not None and channel.source.is_stakeholder:
+        key -= STAKEHOLDER_HEAD_START_MINUTES * 60
+    return key
+
+
+class _TypePool:
+    """Queue, workers and counters of one connector type."""
+
+    def __init__(self, connector_type: str):
+        self.connector_type = connector_type
+        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self.workers: list[asyncio.Task] = []
+        self.running = 0
+        self.counters = {"enqueued": 0, "fetched": 0, "errors": 0, "timeouts": 0}
+        self.waits: deque[float] = deque(maxlen=WAIT_SAMPLES)
+        self.fetch_seconds = 0.0
+
+
+class FetchQueue:
+    """Channel fetch queue with one worker pool per connector type."""
+
+    def __init__(self):
+        self._pools: dict[str, _TypePool] = {}
+        self._jobs: dict[int, FetchJob] = {}
+        self._seq = itertools.count()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_pool(self, connector_type: str) -> _TypePool:
+        """Pool of a connector type, starting its workers on first use."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Workers of a previous event loop are gone
+            self.stop()
+            self._loop = loop
+
+        pool = self._pools.get(connector_type)
+        if pool is None:
+            from services.scheduler import SOURCE_TYPE_LIMITS
+
+            pool = self._pools[connector_type] = _TypePool(connector_type)
+            pool.workers = [
+                asyncio.create_task(
+                    self._worker(pool, index), name=f"fetch-{connector_type}-{index}"
+                )
+                for index in range(SOURCE_TYPE_LIMITS.get(connector_type, 3))
+            ]
+            logger.info(f"Started {len(pool.workers)} fetch workers for {connector_type}")
+        return pool
+
+    def enqueue(self, channel: Channel, training_mode: bool = False, urgent: bool = False) -> bool:
+        """Queue a channel fetch.
+
+        Args:
+            channel: Channel with its source loaded
+            training_mode: Fetch with filters disabled
+            urgent: Fetch before all other queued channels of its type
+
+        Returns:
+            True if queued, False if the channel was already queued or running
+        """
+        connector_type = (
+            channel.connector_type.value
+            if hasattr(channel.connector_type, "value")
+            else channel.connector_type
+        )
+        pool = self._get_pool(connector_type)
+        job = self._jobs.get(channel.id)
+        if job is not None:
+            if urgent and job.started_at is None and job.priority != _URGENT:
+                # Re-queue with the new priority; the old entry is skipped
+                job.priority = _URGENT
+                pool.queue.put_nowait((job.priority, next(self._seq), job))
+            return False
+
+        job = FetchJob(
+            channel_id=channel.id,
+            connector_type=connector_type,
+            label=f"{channel.source.name}/{connector_type}" if channel.source else connector_type,
+            priority=_URGENT if urgent else fetch_priority(channel),
+            training_mode=training_mode,
+        )
+        self._jobs[channel.id] = job
+        pool.counters["enqueued"] += 1
+        pool.queue.put_nowait((job.priority, next(self._seq), job))
+        return True
+
+    def is_queued(self, channel_id: int) -> bool:
+        """Whether a channel is waiting or being fetched."""
+        return channel_id in self._jobs
+
+    async def join(self) -> None:
+        """Wait until all currently queued fetches have finished."""
+        jobs = list(self._jobs.values())
+        await asyncio.gather(*(job.done.wait() for job in jobs))
+
+    async def _worker(self, pool: _TypePool, index: int) -> None:
+        """Fetch queued channels of one connector type, one at a time."""
+        from services.scheduler import get_effective_limit
+
+        while True:
+            if index >= get_effective_limit(pool.connector_type):
+                # Fewer proxies than workers: this worker sits out
+                await asyncio.sleep(LIMIT_RECHECK_SECONDS)
+                continue
+
+            _, _, job = await pool.queue.get()
+            if job.started_at is not None or self._jobs.get(job.channel_id) is not job:
+                # Stale entry of a re-prioritized job
+                continue
+            await self._run(pool, job)
+
+    async def _run(self, pool: _TypePool, job: FetchJob) -> None:
+        """Fetch one channel and record the outcome."""
+        from services import scheduler as scheduler_module
+
+        job.started_at = time.monotonic()
+        pool.waits.append(job.started_at - job.enqueued_at)
+        pool.running += 1
+        timeout = scheduler_module.CHANNEL_FETCH_TIMEOUTS.get(
+            pool.connector_type, scheduler_module.DEFAULT_FETCH_TIMEOUT
+        )
+        try:
+            await asyncio.wait_for(
+                scheduler_module.fetch_channel(job.channel_id, training_mode=job.training_mode),
+                timeout=timeout,
+            )
+            pool.counters["fetched"] += 1
+        except TimeoutError:
+            logger.error(f"Channel {job.channel_id} ({job.label}) timed out after {timeout}s")
+            pool.counters["timeouts"] += 1
+            pool.counters["errors"] += 1
+            await self._defer(job.channel_id)
+        except Exception as e:
+            logger.error(f"Error fetching channel {job.channel_id} ({job.label}): {e}")
+            pool.counters["errors"] += 1
+        finally:
+            pool.running -= 1
+            pool.fetch_seconds += time.monotonic() - job.started_at
+            self._jobs.pop(job.channel_id, None)
+            job.done.set()
+
+    async def _defer(self, channel_id: int) -> None:
+        """Schedule the retry of a timed-out channel.
+
+        fetch_channel() was cancelled before it could record the error, and
+        without a new next_fetch_at the channel would be dispatched again on
+        the next tick.
+        """
+        from services import scheduler as scheduler_module
+        from services.fetch_schedule import record_error
+
+        try:
+            async with scheduler_module.async_session_maker() as db:
+                channel = await db.get(Channel, channel_id)
+                if channel is not None:
+                    record_error(channel)
+                    await db.commit()
+        except Exception as e:
+            logger.warning(f"Could not reschedule timed-out channel {channel_id}: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Queue depth, wait times and outcomes per connector type."""
+        from services.scheduler import get_effective_limit
+
+        now = time.monotonic()
+        types = {}
+        for name, pool in sorted(self._pools.items()):
+            waiting = [
+                j for j in self._jobs.values()
+                if j.connector_type == name and j.started_at is None
+            ]
+            waits = sorted(pool.waits)
+            fetches = pool.counters["fetched"] + pool.counters["errors"]
+            types[name] = {
+                "workers": len(pool.workers),
+                "limit": get_effective_limit(name),
+                "queued": len(waiting),
+                "running": pool.running,
+                "oldest_wait_seconds": round(
+                    max((now - j.enqueued_at for j in waiting), default=0.0), 1
+                ),
+                **pool.counters,
+                "avg_wait_seconds": round(sum(waits) / len(waits), 1) if waits else None,
+                "p95_wait_seconds": round(waits[int(len(waits) * 0.95)], 1) if waits else None,
+                "max_wait_seconds": round(waits[-1], 1) if waits else None,
+                "avg_fetch_seconds": round(pool.fetch_seconds / fetches, 1) if fetches else None,
+            }
+        return {
+            "queued": sum(t["queued"] for t in types.values()),
+            "running": sum(t["running"] for t in types.values()),
+            "stakeholder_head_start_minutes": STAKEHOLDER_HEAD_START_MINUTES,
+            "types": types,
+        }
+
+    def stop(self) -> None:
+        """Cancel all workers and drop queued fetches."""
+        for pool in self._pools.values():
+            for task in pool.workers:
+                task.cancel()
+        self._pools.clear()
+        for job in self._jobs.values():
+            job.done.set()
+        self._jobs.clear()
+        self._loop = None
+
+
+_queue: FetchQueue | None = None
+
+
+def get_fetch_queue() -> FetchQueue:
+    """Get the process-wide fetch queue."""
+    global _queue
+    if _queue is None:
+        _queue = FetchQueue()
+    return _queue
+
+
+def stop_fetch_queue() -> None:
+    """Stop the fetch workers (called when the scheduler stops)."""
+    global _queue
+    if _queue is not None:
+        _queue.stop()
+        _queue = None
@@ -0,0 +1,117 @@
+"""Adaptive per-channel fetch intervals.
+
+A channel's fetch_interval_minutes is the configured baseline. After every
+fetch the scheduler records how many new items it produced and adapts the
+effective interval:
+
+- Quiet channels (no new items) back off, up to ADAPTIVE_FETCH_MAX_FACTOR
+  times the baseline (capped at ADAPTIVE_FETCH_MAX_MINUTES)
+- Busy channels are fetched more often, so each fetch yields about
+  ADAPTIVE_FETCH_TARGET_ITEMS new items, down to ADAPTIVE_FETCH_MIN_FACTOR
+  times the baseline (but never below ADAPTIVE_FETCH_MIN_MINUTES)
+
+The rate is an exponentially weighted average of new items per fetch, and
+the interval changes by at most MAX_STEP per fetch so one burst doesn't
+swing it. State lives in channels.fetch_stats; the resulting due time is
+stored in the indexed channels.next_fetch_at, which fetch_due_channels()
+queries directly.
+"""
+
+import math
+from datetime import datetime, timedelta
+from typing import Any
+
+from config import settings
+from models import Channel
+
+# New-items counts kept per channel (for display)
+HISTORY_SIZE = 10
+# Weight of the latest fetch in the average
+EWMA_ALPHA = 0.3
+# Max factor by which the interval grows or shrinks per fetch
+MAX_STEP = 1.5
+# Average below this counts as "no new items"
+QUIET_THRESHOLD = 0.1
+
+
+def interval_bounds(base: int) -> tuple[int, int]:
+    """Allowed effective interval range for a configured interval (minutes)."""
+    lower = max(
+        settings.adaptive_fetch_min_minutes, math.ceil(base * settings.adaptive_fetch_min_factor)
+    )
+    upper = min(settings.adaptive_fetch_max_minutes, int(base * settings.adaptive_fetch_max_factor))
+    # The configured interval itself is always allowed
+    return min(lower, base), max(upper, base)
+
+
+def effective_interval(channel: Channel) -> int:
+    """Current fetch interval of a channel in minutes."""
+    if not settings.adaptive_fetch_enabled:
+        return channel.fetch_interval_minutes
+    return (channel.fetch_stats or {}).get("interval_minutes") or channel.fetch_interval_minutes
+
+
+def next_interval(base: int, current: int, avg_new_items: float) -> int:
+    """Interval after a fetch, given the average new items per fetch."""
+    if avg_new_items < QUIET_THRESHOLD:
+        target = current * MAX_STEP
+    else:
+        # avg_new_items / current = items per minute
+        target = current * settings.adaptive_fetch_target_items / avg_new_items
+    target = min(max(target, current / MAX_STEP), current * MAX_STEP)
+    lower, upper = interval_bounds(base)
+    return round(min(max(target, lower), upper))
+
+
+def record_fetch(channel: Channel, new_items: int, now: datetime | None = None) -> None:
+    """Record a successful fetch and schedule the next one.
+
+    Args:
+        channel: Channel (attached to a session, caller commits)
+        new_items: Items stored by this fetch (0 for unchanged feeds)
+        now: Fetch time (default: utcnow)
+    """
+    now = now or datetime.utcnow()
+    stats: dict[str, Any] = dict(channel.fetch_stats or {})
+    avg = stats.get("avg_new_items")
+    avg = float(new_items) if avg is None else EWMA_ALPHA * new_items + (1 - EWMA_ALPHA) * avg
+
+    base = channel.fetch_interval_minutes
+    if settings.adaptive_fetch_enabled:
+        interval = next_interval(base, stats.get("interval_minutes") or base, avg)
+    else:
+        interval = base
+
+    channel.fetch_stats = {
+        **stats,
+        "history": (list(stats.get("history") or []) + [new_items])[-HISTORY_SIZE:],
+        "avg_new_items": round(avg, 3),
+        "interval_minutes": interval,
+        "fetches": stats.get("fetches", 0) + 1,
+    }
+    channel.last_fetch_at = now
+    channel.next_fetch_at = now + timedelta(minutes=interval)
+
+
+def record_error(channel: Channel, now: datetime | None = None) -> None:
+    """Schedule the retry after a failed fetch.
+
+    Retries after the shorter of the configured and the effective interval,
+    instead of on every scheduler tick.
+    """
+    now = now or datetime.utcnow()
+    retry = min(channel.fetch_interval_minutes, effective_interval(channel))
+    channel.next_fetch_at = now + timedelta(minutes=retry)
+
+
+def reset_interval(channel: Channel) -> None:
+    """Restart adaptation from the configured interval (after it was changed)."""
+    stats = dict(channel.fetch_stats or {})
+    stats["interval_minutes"] = channel.fetch_interval_minutes
+    channel.fetch_stats = stats
+    if channel.last_fetch_at is not None:
+        channel.next_fetch_at = channel.last_fetch_at + timedelta(
+            minutes=channel.fetch_interval_minutes
+        )
+    else:
+        channel.next_fetch_at = None
@@ -0,0 +1,353 @@
+"""Shared outbound HTTP clients for connectors and article extraction.
+
+Connectors used to build a throwaway httpx.AsyncClient per fetch, so every
+followed link paid a fresh DNS lookup and TCP/TLS handshake and nothing
+limited how hard a single site was hit. This module keeps one long-lived
+client per (TLS profile, proxy) combination:
+
+- "default": normal certificate verification
+- "legacy": connectors.rss.create_legacy_ssl_context() for sites with
+  broken certificates or outdated TLS (RSS channels with verify_ssl=False)
+
+All requests to the same host share a semaphore (max in-flight requests)
+and a token bucket (sustained requests per second plus a burst), no matter
+which client they go through.
+
+Usage:
+    from services.http_clients import get_http_client
+
+    client = get_http_client(verify_ssl=config.verify_ssl, timeout=30.0)
+    response = await client.get(url, headers=headers)
+
+Clients are bound to the event loop they were created on; if the registry
+is used from a different loop, it starts over with fresh clients.
+
+The shared clients never store cookies: they serve every connector and
+domain, so a session or consent cookie from one request would be sent on
+unrelated ones (and would defeat the cookie-less paywall bypass fetches).
+"""
+
+import asyncio
+import http.cookiejar
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
+import httpx
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+TLS_DEFAULT = "default"
+TLS_LEGACY = "legacy"
+
+# Hosts listed in the admin stats (by request count)
+STATS_MAX_HOSTS = 50
+
+
+class _RejectCookies(http.cookiejar.DefaultCookiePolicy):
+    """Cookie policy that never stores or returns cookies."""
+
+    def set_ok(self, cookie, request) -> bool:
+        return False
+
+    def return_ok(self, cookie, request) -> bool:
+        return False
+
+
+class HostLimiter:
+    """Concurrency limit plus token bucket for one host."""
+
+    def __init__(self, concurrency: int, rate: float, burst: int):
+        """
+        Args:
+            concurrency: Max in-flight requests to the host
+            rate: Sustained requests per second (0 = unlimited)
+            burst: Requests allowed back-to-back before rate limiting kicks in
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._bucket_lock = asyncio.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.wait_seconds = 0.0
+
+    async def _take_token(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._bucket_lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                delay = (1 - self._tokens) / self.rate
+                # Holding the lock keeps waiters in FIFO order
+                await asyncio.sleep(delay)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            self._tokens -= 1
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for a free slot and a token, then hold the slot."""
+        start = time.monotonic()
+        async with self._semaphore:
+            await self._take_token()
+            self.wait_seconds += time.monotonic() - start
+            self.requests += 1
+            self.in_flight += 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+
+class PooledHttpClient:
+    """Thin wrapper routing requests through a shared client and host limits.
+
+    Mirrors the httpx.AsyncClient request methods used by the connectors
+    (request/get/head/post), so call sites only swap how they get a client.
+    Default headers and timeout apply to every request made through it.
+    """
+
+    def __init__(
+        self,
+        registry: "HttpClientRegistry",
+        tls: str,
+        proxy: str | None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ):
+        self._registry = registry
+        self.tls = tls
+        self.proxy = proxy
+        self.headers = headers or {}
+        self.timeout = timeout
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        if self.headers:
+            kwargs["headers"] = {**self.headers, **(kwargs.get("headers") or {})}
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+        return await self._registry.request(method, url, tls=self.tls, proxy=self.proxy, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def head(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("HEAD", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+
+class HttpClientRegistry:
+    """Process-wide registry of pooled httpx clients and per-host limiters."""
+
+    def __init__(
+        self,
+        max_connections: int | None = None,
+        max_keepalive: int | None = None,
+        keepalive_expiry: float | None = None,
+        per_host_concurrency: int | None = None,
+        per_host_rate: float | None = None,
+        per_host_burst: int | None = None,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections or settings.http_max_connections,
+            max_keepalive_connections=max_keepalive or settings.http_max_keepalive,
+            keepalive_expiry=keepalive_expiry or settings.http_keepalive_expiry,
+        )
+        self.per_host_concurrency = per_host_concurrency or settings.http_per_host_concurrency
+        self.per_host_rate = (
+            per_host_rate if per_host_rate is not None else settings.http_per_host_rate
+        )
+        self.per_host_burst = per_host_burst or settings.http_per_host_burst
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._clients: dict[tuple[str, str | None], httpx.AsyncClient] = {}
+        self._hosts: dict[str, HostLimiter] = {}
+        self._client_stats: dict[tuple[str, str | None], dict[str, int]] = {}
+
+    def _check_loop(self) -> None:
+        """Start over when used from a different event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._loop is not None:
+                logger.debug("HTTP client registry used from a new event loop, resetting")
+            self._loop = loop
+            self._clients = {}
+            self._hosts = {}
+
+    def _create_client(self, tls: str, proxy: str | None) -> httpx.AsyncClient:
+        if tls == TLS_LEGACY:
+            from connectors.rss import create_legacy_ssl_context
+            verify = create_legacy_ssl_context()
+        else:
+            verify = True
+        return httpx.AsyncClient(
+            timeout=30.0,
+            limits=self.limits,
+            verify=verify,
+            proxy=proxy,
+            cookies=http.cookiejar.CookieJar(policy=_RejectCookies()),
+        )
+
+    def get_client(self, tls: str = TLS_DEFAULT, proxy: str | None = None) -> httpx.AsyncClient:
+        """Get or create the shared client for a TLS profile and proxy."""
+        self._check_loop()
+        key = (tls, proxy)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = self._create_client(tls, proxy)
+            self._clients[key] = client
+            stats = self._client_stats.setdefault(key, {
+                "requests": 0,
+                "new_connections": 0,
+                "errors": 0,
+                "clients_created": 0,
+            })
+            stats["clients_created"] += 1
+        return client
+
+    def host_limiter(self, url: str) -> HostLimiter:
+        """Get the limiter shared by all requests to url's host."""
+        self._check_loop()
+        host = (urlparse(url).hostname or "").lower()
+        limiter = self._hosts.get(host)
+        if limiter is None:
+            limiter = HostLimiter(
+                self.per_host_concurrency, self.per_host_rate, self.per_host_burst
+            )
+            self._hosts[host] = limiter
+        return limiter
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        tls: str = TLS_DEFAULT,
+        proxy: str | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a request through the shared client, respecting host limits.
+
+        Keyword arguments are passed to httpx.AsyncClient.request (headers,
+        timeout, follow_redirects, ...).
+        """
+        client = self.get_client(tls, proxy)
+        stats = self._client_stats[(tls, proxy)]
+
+        async def trace(event_name: str, info: dict) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                stats["new_connections"] += 1
+
+        extensions = {**kwargs.pop("extensions", {}), "trace": trace}
+        async with self.host_limiter(url).slot():
+            stats["requests"] += 1
+            try:
+                return await client.request(method, url, extensions=extensions, **kwargs)
+            except httpx.HTTPError:
+                stats["errors"] += 1
+                raise
+
+    def client(
+        self,
+        verify_ssl: bool = True,
+        proxy: str | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> PooledHttpClient:
+        """Get a request wrapper for a TLS profile and proxy."""
+        tls = TLS_DEFAULT if verify_ssl else TLS_LEGACY
+        return PooledHttpClient(self, tls, proxy, headers=headers, timeout=timeout)
+
+    def get_stats(self) -> dict:
+        """Connection reuse per client and politeness stats per host."""
+        clients = []
+        for (tls, proxy), stats in self._client_stats.items():
+            requests = stats["requests"]
+            reused = max(0, requests - stats["new_connections"])
+            client = self._clients.get((tls, proxy))
+            clients.append({
+                "tls": tls,
+                "proxy": proxy,
+                **stats,
+                "reused_connections": reused,
+                "reuse_rate": round(reused / requests, 4) if requests else 0.0,
+                "open": client is not None and not client.is_closed,
+            })
+
+        hosts = sorted(self._hosts.items(), key=lambda kv: kv[1].requests, reverse=True)
+        return {
+            "limits": {
+                "max_connections": self.limits.max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "keepalive_expiry": self.limits.keepalive_expiry,
+                "per_host_concurrency": self.per_host_concurrency,
+                "per_host_rate": self.per_host_rate,
+                "per_host_burst": self.per_host_burst,
+            },
+            "clients": clients,
+            "hosts_tracked": len(self._hosts),
+            "hosts": [
+                {
+                    "host": host,
+                    "requests": limiter.requests,
+                    "in_flight": limiter.in_flight,
+                    "wait_seconds": round(limiter.wait_seconds, 2),
+                }
+                for host, limiter in hosts[:STATS_MAX_HOSTS]
+            ],
+        }
+
+    async def close(self) -> None:
+        """Close all clients (recreated lazily on next use)."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing HTTP client: {e}")
+
+
+_registry: HttpClientRegistry | None = None
+
+
+def get_http_registry() -> HttpClientRegistry:
+    """Get the process-wide HTTP client registry."""
+    global _registry
+    if _registry is None:
+        _registry = HttpClientRegistry()
+    return _registry
+
+
+def get_http_client(
+    verify_ssl: bool = True,
+    proxy: str | None = None,
+    headers: dict[str, str] | None = None,
+    timeout: float | None = None,
+) -> PooledHttpClient:
+    """Get a shared HTTP client (see module docstring).
+
+    Args:
+        verify_ssl: False selects the legacy TLS profile (no verification)
+        proxy: Proxy URL, or None for a direct connection
+        headers: Default headers for requests made through this client
+        timeout: Default request timeout in seconds
+    """
+    return get_http_registry().client(
+        verify_ssl=verify_ssl, proxy=proxy, headers=headers, timeout=timeout
+    )
+
+
+async def close_http_clients() -> None:
+    """Close the shared clients (called on shutdown)."""
+    if _registry is not None:
+        await _registry.close()
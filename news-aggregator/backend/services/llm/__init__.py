@@ -24,7 +24,7 @@ Usage:
     print(response.text)
 """
 
-from .base import BaseLLMProvider, LLMResponse
+from .base import BaseLLMProvider, LLMResponse, LLMStreamChunk
 from .ollama import OllamaProvider
 from .openrouter import OpenRouterProvider
 from .service import LLMService
@@ -32,6 +32,7 @@ from .service import LLMService
 __all__ = [
     "BaseLLMProvider",
     "LLMResponse",
+    "LLMStreamChunk",
     "OllamaProvider",
     "OpenRouterProvider",
     "LLMService",
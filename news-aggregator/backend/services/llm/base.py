@@ -1,10 +1,23 @@
 """Base LLM provider interface."""
 
+import importlib.util
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
+import httpx
 from pydantic import BaseModel, Field
 
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=10,
+    max_keepalive_connections=5,
+    keepalive_expiry=60.0,
+)
+
 
 class LLMResponse(BaseModel):
     """Response from an LLM provider."""
@@ -17,17 +30,104 @@ class LLMResponse(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict, description="Provider-specific metadata")
 
 
+class LLMStreamChunk(BaseModel):
+    """One incremental piece of a streamed LLM response."""
+
+    text: str = Field(default="", description="Generated text in this chunk")
+    done: bool = Field(default=False, description="True for the provider's final chunk")
+    metadata: dict[str, Any] = Field(
+        default_factory=dict, description="Provider stats (final chunk)"
+    )
+
+
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers.
 
     Each provider must implement:
     - complete(): Generate text completion
     - is_available(): Check if provider is accessible
+
+    Generation requests go through one long-lived pooled client per provider
+    (created lazily by _get_client()), so keep-alive connections are reused
+    across items instead of paying a new TCP/TLS handshake per call.
     """
 
     # Provider metadata (override in subclass)
     provider_name: str = "base"
 
+    # Pool configuration (set by subclass __init__ via _init_pool)
+    timeout: int = 60
+    limits: httpx.Limits = DEFAULT_POOL_LIMITS
+    http2: bool = False
+
+    def _init_pool(self, limits: httpx.Limits | None, http2: bool) -> None:
+        """Set up pool configuration and connection counters."""
+        self.limits = limits or DEFAULT_POOL_LIMITS
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self._client: httpx.AsyncClient | None = None
+        self._pool_stats = {
+            "requests": 0,
+            "new_connections": 0,
+            "clients_created": 0,
+        }
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+            )
+            self._pool_stats["clients_created"] += 1
+        return self._client
+
+    async def _trace(self, event_name: str, info: dict) -> None:
+        """httpcore trace hook: counts connections actually opened."""
+        if event_name == "connection.connect_tcp.complete":
+            self._pool_stats["new_connections"] += 1
+
+    async def _post(self, url: str, **kwargs) -> httpx.Response:
+        """POST through the pooled client, recording connection reuse."""
+        self._pool_stats["requests"] += 1
+        client = self._get_client()
+        return await client.post(url, extensions={"trace": self._trace}, **kwargs)
+
+    @asynccontextmanager
+    async def _stream_post(self, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """Streaming POST through the pooled client, recording connection reuse.
+
+        Leaving the context before the body is consumed closes the
+        connection, which makes the server abort generation.
+        """
+        self._pool_stats["requests"] += 1
+        client = self._get_client()
+        async with client.stream(
+            "POST", url, extensions={"trace": self._trace}, **kwargs
+        ) as response:
+            yield response
+
+    def get_pool_stats(self) -> dict:
+        """Get connection reuse statistics for the pooled client."""
+        requests = self._pool_stats["requests"]
+        new_connections = self._pool_stats["new_connections"]
+        reused = max(0, requests - new_connections)
+        return {
+            **self._pool_stats,
+            "reused_connections": reused,
+            "reuse_rate": round(reused / requests, 4) if requests else 0.0,
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "open": self._client is not None and not self._client.is_closed,
+        }
+
+    async def close(self) -> None:
+        """Close the pooled client (recreated lazily on next use)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     @abstractmethod
     async def complete(
         self,
@@ -68,6 +168,32 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def chat_stream(
+        self,
+        messages: list[dict],
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Stream a completion from a full messages list.
+
+        Providers without native streaming yield the whole chat() response
+        as a single final chunk.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            LLMStreamChunk pieces; the last one has done=True
+        """
+        response = await self.chat(messages, temperature=temperature, max_tokens=max_tokens)
+        yield LLMStreamChunk(
+            text=response.text,
+            done=True,
+            metadata={"model": response.model, "eval_count": response.completion_tokens},
+        )
+
     @abstractmethod
     async def is_available(self) -> bool:
         """Check if the provider is accessible.
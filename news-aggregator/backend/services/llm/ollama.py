@@ -1,10 +1,12 @@
 """Ollama LLM provider for local model inference."""
 
+import json
 import logging
+from collections.abc import AsyncIterator
 
 import httpx
 
-from .base import BaseLLMProvider, LLMResponse
+from .base import BaseLLMProvider, LLMResponse, LLMStreamChunk
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +29,8 @@ class OllamaProvider(BaseLLMProvider):
         base_url: str = "http://localhost:11434",
         model: str = "llama3.2",
         timeout: int = 120,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
     ):
         """Initialize Ollama provider.
 
@@ -34,10 +38,13 @@ class OllamaProvider(BaseLLMProvider):
             base_url: Ollama API base URL
             model: Model name to use
             timeout: Request timeout in seconds
+            limits: Connection pool limits for the pooled client
+            http2: Use HTTP/2 if the h2 package is installed
         """
         self.base_url = base_url.rstrip("/")
         self.model = model
         self.timeout = timeout
+        self._init_pool(limits, http2)
 
     async def complete(
         self,
@@ -75,13 +82,9 @@ class OllamaProvider(BaseLLMProvider):
         if max_tokens:
             payload["options"]["num_predict"] = max_tokens
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/api/chat",
-                json=payload,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._post(f"{self.base_url}/api/chat", json=payload)
+        response.raise_for_status()
+        data = response.json()
 
         content = data["message"]["content"]
         # qwen3 models may use thinking mode where response is in 'thinking' field
@@ -132,13 +135,9 @@ class OllamaProvider(BaseLLMProvider):
         if max_tokens:
             payload["options"]["num_predict"] = max_tokens
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/api/chat",
-                json=payload,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._post(f"{self.base_url}/api/chat", json=payload)
+        response.raise_for_status()
+        data = response.json()
 
         content = data["message"]["content"]
         if not content and data["message"].get("thinking"):
@@ -158,6 +157,63 @@ class OllamaProvider(BaseLLMProvider):
             },
         )
 
+    async def chat_stream(
+        self,
+        messages: list[dict],
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Stream a completion token by token (Ollama NDJSON stream).
+
+        Closing the generator early closes the HTTP response, which makes
+        Ollama stop generating.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            LLMStreamChunk per streamed message part; the last has done=True
+        """
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "stream": True,
+            "think": False,
+            "options": {
+                "temperature": temperature,
+            },
+        }
+
+        if max_tokens:
+            payload["options"]["num_predict"] = max_tokens
+
+        async with self._stream_post(f"{self.base_url}/api/chat", json=payload) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                if data.get("error"):
+                    raise RuntimeError(f"Ollama stream error: {data['error']}")
+
+                message = data.get("message") or {}
+                if data.get("done"):
+                    yield LLMStreamChunk(
+                        text=message.get("content", ""),
+                        done=True,
+                        metadata={
+                            "model": data.get("model", self.model),
+                            "eval_count": data.get("eval_count"),
+                            "prompt_eval_count": data.get("prompt_eval_count"),
+                            "total_duration": data.get("total_duration"),
+                            "load_duration": data.get("load_duration"),
+                        },
+                    )
+                    return
+                yield LLMStreamChunk(text=message.get("content", ""))
+
     async def is_available(self) -> bool:
         """Check if Ollama is accessible.
 
@@ -37,6 +37,8 @@ class OpenRouterProvider(BaseLLMProvider):
         timeout: int = 60,
         site_url: str | None = None,
         site_name: str | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
     ):
         """Initialize OpenRouter provider.
 
@@ -46,12 +48,15 @@ class OpenRouterProvider(BaseLLMProvider):
             timeout: Request timeout in seconds
             site_url: Optional site URL for rankings
             site_name: Optional site name for rankings
+            limits: Connection pool limits for the pooled client
+            http2: Use HTTP/2 if the h2 package is installed
         """
         self.api_key = api_key
         self.model = model
         self.timeout = timeout
         self.site_url = site_url
         self.site_name = site_name
+        self._init_pool(limits, http2)
 
     async def complete(
         self,
@@ -96,14 +101,9 @@ class OpenRouterProvider(BaseLLMProvider):
         if max_tokens:
             payload["max_tokens"] = max_tokens
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                OPENROUTER_API_URL,
-                headers=headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._post(OPENROUTER_API_URL, headers=headers, json=payload)
+        response.raise_for_status()
+        data = response.json()
 
         usage = data.get("usage", {})
 
@@ -144,14 +144,9 @@ class OpenRouterProvider(BaseLLMProvider):
         if max_tokens:
             payload["max_tokens"] = max_tokens
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                OPENROUTER_API_URL,
-                headers=headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._post(OPENROUTER_API_URL, headers=headers, json=payload)
+        response.raise_for_status()
+        data = response.json()
 
         usage = data.get("usage", {})
         return LLMResponse(
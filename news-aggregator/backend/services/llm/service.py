@@ -1,7 +1,9 @@
 """LLM service with fallback support."""
 
 import logging
-from typing import Sequence
+import time
+from contextlib import aclosing
+from typing import Callable, Sequence
 
 from .base import BaseLLMProvider, LLMResponse
 
@@ -121,6 +123,110 @@ class LLMService:
         error_summary = "; ".join(errors)
         raise RuntimeError(f"All LLM providers failed (chat): {error_summary}")
 
+    async def stream_chat(
+        self,
+        messages: list[dict],
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        stop_when: Callable[[str], bool] | None = None,
+    ) -> LLMResponse:
+        """Stream a chat completion using first available provider.
+
+        Tokens are accumulated as they arrive. stop_when is called with each
+        new text chunk; once it returns True the stream is closed early,
+        which aborts generation on the server.
+        Response metadata carries latency instrumentation:
+        ttft_ms (time to first token), tokens_per_sec, stopped_early.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            stop_when: Optional predicate fed each new text chunk
+
+        Returns:
+            LLMResponse from successful provider
+
+        Raises:
+            RuntimeError: If all providers fail
+        """
+        errors = []
+
+        for provider in self.providers:
+            try:
+                logger.debug(f"Trying provider (stream): {provider.provider_name}")
+                response = await self._stream_from(
+                    provider, messages, temperature, max_tokens, stop_when
+                )
+                logger.info(f"LLM stream response from {provider.provider_name}")
+                return response
+
+            except Exception as e:
+                error_msg = f"{provider.provider_name}: {str(e)}"
+                logger.warning(f"Provider stream failed: {error_msg}")
+                errors.append(error_msg)
+                continue
+
+        error_summary = "; ".join(errors)
+        raise RuntimeError(f"All LLM providers failed (stream): {error_summary}")
+
+    async def _stream_from(
+        self,
+        provider: BaseLLMProvider,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int | None,
+        stop_when: Callable[[str], bool] | None,
+    ) -> LLMResponse:
+        """Consume one provider's stream and build an instrumented response."""
+        start = time.monotonic()
+        first_token_at = None
+        parts: list[str] = []
+        chunks = 0
+        stopped_early = False
+        final: dict = {}
+
+        async with aclosing(
+            provider.chat_stream(messages, temperature=temperature, max_tokens=max_tokens)
+        ) as stream:
+            async for chunk in stream:
+                if chunk.text:
+                    if first_token_at is None:
+                        first_token_at = time.monotonic()
+                    parts.append(chunk.text)
+                    chunks += 1
+                if chunk.done:
+                    final = chunk.metadata
+                    break
+                if stop_when is not None and chunk.text and stop_when(chunk.text):
+                    stopped_early = True
+                    break
+
+        end = time.monotonic()
+        text = "".join(parts)
+        # Ollama streams one token per chunk; prefer its own count when the stream completed
+        completion_tokens = final.get("eval_count") or chunks
+        generation_time = end - (first_token_at or end)
+
+        return LLMResponse(
+            text=text,
+            model=final.get("model") or getattr(provider, "model", provider.provider_name),
+            tokens_used=completion_tokens,
+            prompt_tokens=final.get("prompt_eval_count"),
+            completion_tokens=completion_tokens,
+            metadata={
+                "provider": provider.provider_name,
+                "streamed": True,
+                "stopped_early": stopped_early,
+                "ttft_ms": int((first_token_at - start) * 1000) if first_token_at else None,
+                "tokens_per_sec": (
+                    round(completion_tokens / generation_time, 2)
+                    if completion_tokens and generation_time > 0 else None
+                ),
+                "duration_ms": int((end - start) * 1000),
+            },
+        )
+
     async def check_availability(self) -> dict[str, bool]:
         """Check availability of all providers.
 
@@ -142,3 +248,19 @@ class LLMService:
             if await provider.is_available():
                 return provider
         return None
+
+    def get_pool_stats(self) -> dict[str, dict]:
+        """Get connection pool statistics for all providers.
+
+        Returns:
+            Dict mapping provider names to pool stats
+        """
+        return {p.provider_name: p.get_pool_stats() for p in self.providers}
+
+    async def close(self) -> None:
+        """Close pooled HTTP clients of all providers."""
+        for provider in self.providers:
+            try:
+                await provider.close()
+            except Exception as e:
+                logger.warning(f"Error closing {provider.provider_name} client: {e}")
@@ -11,17 +11,33 @@ Fresh items always take priority over backlog processing.
 import asyncio
 import logging
 from datetime import datetime
-from typing import Optional
 
-from sqlalchemy import case, func, select
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from database import async_session_maker
-from models import Channel, Item, Priority
-from sqlalchemy import and_, or_
+from models import Channel, Item, Priority, RetryPriority
+from services.event_bus import (
+    EVENT_CONFIG_CHANGED,
+    EVENT_ITEMS_CREATED,
+    EVENT_WORKER_COMMAND,
+    get_event_bus,
+)
+from services.work_claims import (
+    QUEUE_LLM,
+    claim_items,
+    make_worker_id,
+    release_all_claims,
+    release_claims,
+    renew_claims,
+)
 
 logger = logging.getLogger(__name__)
 
+# Backlog order by retry_priority (None: classified without one, e.g. via the
+# admin classify endpoint); "low" items are never sent to the LLM
+BACKLOG_ORDER = (RetryPriority.HIGH, RetryPriority.EDGE_CASE, RetryPriority.UNKNOWN, None)
+
 
 class LLMWorker:
     """
@@ -37,6 +53,7 @@ class LLMWorker:
         batch_size: int = 10,
         idle_sleep: float = 30.0,
         backlog_batch_size: int = 50,
+        concurrency: int = 1,
     ):
         """
         Initialize the LLM worker.
@@ -45,10 +62,12 @@ class LLMWorker:
             batch_size: Items to process per batch from fresh queue
             idle_sleep: Seconds to sleep when no work available
             backlog_batch_size: Items to fetch from backlog per query
+            concurrency: Max items in flight against the LLM at once
         """
         self.batch_size = batch_size
         self.idle_sleep = idle_sleep
         self.backlog_batch_size = backlog_batch_size
+        self.concurrency = max(1, concurrency)
 
         # Fresh items queue (in-memory, highest priority)
         # Bounded to prevent memory surge if LLM processing is slow
@@ -57,10 +76,15 @@ class LLMWorker:
         # Worker state
         self._running = False
         self._paused = False
-        self._task: Optional[asyncio.Task] = None
-        self._poll_task: Optional[asyncio.Task] = None
-        self._sync_task: Optional[asyncio.Task] = None
+        self._task: asyncio.Task | None = None
+        self._poll_task: asyncio.Task | None = None
+        self._sync_task: asyncio.Task | None = None
+        self._heartbeat_task: asyncio.Task | None = None
         self._processor = None
+        self._processor_stale = False  # LLM settings changed; rebuild between batches
+        self._worker_id = make_worker_id("llm")
+        self._held_claims: list[int] = []  # Batch being processed
+        self._last_command_at = datetime.utcnow()
 
         # Statistics (protected by _stats_lock for thread-safe updates)
         self._stats = {
@@ -77,6 +101,8 @@ class LLMWorker:
 
     async def start(self):
         """Start the worker background task."""
+        from services.worker_status import db_now, write_state
+
         if self._running:
             logger.warning("LLM worker already running")
             return
@@ -84,11 +110,17 @@ class LLMWorker:
         self._running = True
         self._stats["started_at"] = datetime.utcnow().isoformat()
         self._stopped_due_to_errors = False  # Reset on start
+        # Only commands issued from now on (database clock, like their issue times)
+        self._last_command_at = await db_now()
+        bus = get_event_bus()
+        bus.subscribe(EVENT_WORKER_COMMAND, self._on_command_event)
+        bus.subscribe(EVENT_ITEMS_CREATED, self._on_items_created)
+        bus.subscribe(EVENT_CONFIG_CHANGED, self._on_config_changed)
         self._task = asyncio.create_task(self._run())
         self._poll_task = asyncio.create_task(self._poll_commands())
         self._sync_task = asyncio.create_task(self._sync_stats())
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
 
-        from services.worker_status import write_state
         await write_state("llm", running=True)
         logger.info("LLM worker started")
 
@@ -98,14 +130,27 @@ class LLMWorker:
             return
 
         self._running = False
-        for task in (self._task, self._poll_task, self._sync_task):
-            if task:
+        bus = get_event_bus()
+        bus.unsubscribe(EVENT_WORKER_COMMAND, self._on_command_event)
+        bus.unsubscribe(EVENT_ITEMS_CREATED, self._on_items_created)
+        bus.unsubscribe(EVENT_CONFIG_CHANGED, self._on_config_changed)
+        for task in (self._task, self._poll_task, self._sync_task, self._heartbeat_task):
+            if task and task is not asyncio.current_task():
                 task.cancel()
                 try:
                     await task
                 except asyncio.CancelledError:
                     pass
 
+        # Hand claimed items back to the other workers right away
+        try:
+            async with async_session_maker() as db:
+                await release_all_claims(db, self._worker_id)
+        except Exception as e:
+            logger.warning(f"Failed to release LLM claims: {e}")
+
+        await self._release_processor()
+
         from services.worker_status import write_state, write_stats
         await write_state("llm", running=False)
         async with self._stats_lock:
@@ -144,6 +189,18 @@ class LLMWorker:
             logger.warning(f"Fresh item queue full, item {item_id} will be processed via backlog")
             return False
 
+    async def _on_items_created(self, event: dict):
+        """Queue fresh items announced by a pipeline in any process."""
+        for item_id in event.get("ids", []):
+            if not await self.enqueue_fresh(item_id):
+                break
+
+    def _on_config_changed(self, event: dict):
+        """Rebuild the processor when LLM settings change (e.g. LLM disabled)."""
+        if event.get("key") in (None, "llm_enabled"):
+            # Not released here: a batch may be using it right now
+            self._processor_stale = True
+
     async def get_status(self) -> dict:
         """Get worker status and statistics."""
         async with self._stats_lock:
@@ -153,9 +210,17 @@ class LLMWorker:
             "paused": self._paused,
             "stopped_due_to_errors": self._stopped_due_to_errors,
             "fresh_queue_size": self._fresh_queue.qsize(),
+            "concurrency": self.concurrency,
             "stats": stats_copy,
+            "llm_connections": self._processor.llm.get_pool_stats() if self._processor else {},
         }
 
+    async def _release_processor(self):
+        """Drop the cached processor and close its pooled LLM connections."""
+        processor, self._processor = self._processor, None
+        if processor is not None:
+            await processor.llm.close()
+
     async def _get_processor(self):
         """Get or create the LLM processor, waking gpu1 if needed."""
         from services.gpu1_power import get_power_manager
@@ -170,13 +235,17 @@ class LLMWorker:
                 logger.info("gpu1 not available, attempting Wake-on-LAN...")
                 if await power_mgr.ensure_available():
                     logger.info("gpu1 woken and ready for LLM processing")
-                    # Clear cached processor since gpu1 was asleep
-                    self._processor = None
+                    # Clear cached processor since gpu1 was asleep (its connections are dead)
+                    await self._release_processor()
                 else:
                     logger.warning("Failed to wake gpu1, LLM processing unavailable")
-                    self._processor = None
+                    await self._release_processor()
                     return None
 
+        if self._processor_stale:
+            self._processor_stale = False
+            await self._release_processor()
+
         if self._processor is None:
             self._processor = await create_processor_from_settings()
         return self._processor
@@ -244,21 +313,48 @@ class LLMWorker:
 
         logger.info("LLM worker loop ended")
 
+    async def _apply_command(self, action: str, issued_at: datetime):
+        """Apply a pause/resume/stop command from the API."""
+        self._last_command_at = issued_at
+        if action == "pause":
+            await self.pause()
+        elif action == "resume":
+            await self.resume()
+        elif action == "stop":
+            await self.stop()
+
+    async def _on_command_event(self, event: dict):
+        """Apply a command received on the event bus."""
+        from services.worker_status import parse_command
+
+        if event.get("worker") != "llm" or not self._running:
+            return
+        command = parse_command("llm", event, self._last_command_at)
+        if command is not None:
+            await self._apply_command(*command)
+
     async def _poll_commands(self):
-        """Poll DB for commands (pause/resume/stop) from API workers."""
-        from services.worker_status import read_and_clear_command, get_poll_interval
+        """Poll DB for commands (pause/resume/stop) from API workers.
+
+        Commands normally arrive as events; the DB is only read while the
+        event bus is down and once after each (re)connect, for commands
+        sent while it was not listening.
+        """
+        from services.worker_status import get_poll_interval, read_new_command
 
+        bus = get_event_bus()
+        seen_generation = None
         while self._running:
             try:
                 interval = await get_poll_interval()
                 await asyncio.sleep(interval)
-                action = await read_and_clear_command("llm")
-                if action == "pause":
-                    await self.pause()
-                elif action == "resume":
-                    await self.resume()
-                elif action == "stop":
-                    await self.stop()
+                generation = bus.generation if bus.connected else None
+                if generation is not None and generation == seen_generation:
+                    continue
+                command = await read_new_command("llm", self._last_command_at)
+                seen_generation = generation
+                if command is not None:
+                    await self._apply_command(*command)
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -266,22 +362,57 @@ class LLMWorker:
                 await asyncio.sleep(10)
 
     async def _sync_stats(self):
-        """Periodically sync stats to DB for API workers to read."""
+        """Periodically sync stats to DB for API workers to read (when changed)."""
         from services.worker_status import write_stats, get_poll_interval
 
+        last_synced = None
         while self._running:
             try:
                 interval = await get_poll_interval()
                 await asyncio.sleep(interval)
                 async with self._stats_lock:
                     stats = {**self._stats, "fresh_queue_size": self._fresh_queue.qsize()}
+                if self._processor:
+                    stats["llm_connections"] = self._processor.llm.get_pool_stats()
+                if stats == last_synced:
+                    continue
                 await write_stats("llm", stats)
+                last_synced = stats
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.warning(f"LLM stats sync error: {e}")
                 await asyncio.sleep(10)
 
+    async def _heartbeat(self):
+        """Renew the leases of the batch being processed."""
+        from config import settings
+
+        while self._running:
+            try:
+                await asyncio.sleep(settings.work_claim_lease_seconds / 3)
+                if self._held_claims:
+                    async with async_session_maker() as db:
+                        await renew_claims(db, QUEUE_LLM, self._held_claims, self._worker_id)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"LLM claim heartbeat error: {e}")
+
+    async def _process_claimed(self, item_ids: list[int], processor, is_fresh: bool) -> int:
+        """Process claimed items, then release the claims whether it succeeded or not."""
+        self._held_claims = item_ids
+        try:
+            return await self._process_items(item_ids, processor, is_fresh=is_fresh)
+        finally:
+            self._held_claims = []
+            try:
+                async with async_session_maker() as db:
+                    await release_claims(db, QUEUE_LLM, item_ids, self._worker_id)
+            except Exception as e:
+                # No longer renewed, so the claims expire after the lease
+                logger.warning(f"Failed to release LLM claims: {e}")
+
     def _record_gpu1_activity(self):
         """Record LLM processing activity for gpu1 idle tracking."""
         from services.gpu1_power import get_power_manager
@@ -300,7 +431,7 @@ class LLMWorker:
 
         if await power_mgr.shutdown_if_idle():
             # Clear processor so we wake gpu1 again next time
-            self._processor = None
+            await self._release_processor()
             logger.info("gpu1 shutdown due to idle timeout, processor cleared")
 
     async def _process_fresh_items(self) -> int:
@@ -335,7 +466,20 @@ class LLMWorker:
                 logger.warning("LLM processor unavailable, re-enqueued fresh items")
                 return 0
 
-            processed = await self._process_items(item_ids, processor, is_fresh=True)
+            # Skip items another worker process has claimed or already processed
+            async with async_session_maker() as db:
+                item_ids = await claim_items(
+                    db,
+                    QUEUE_LLM,
+                    select(Item.id)
+                    .where(Item.id.in_(item_ids), Item.needs_llm_processing == True)  # noqa: E712
+                    .order_by(Item.id),
+                    self._worker_id,
+                )
+            if not item_ids:
+                return 0
+
+            processed = await self._process_claimed(item_ids, processor, is_fresh=True)
             async with self._stats_lock:
                 self._stats["fresh_processed"] += processed
 
@@ -376,35 +520,29 @@ class LLMWorker:
             return 0
 
         # Query backlog items ordered by priority
-        # Only process items that have been classified (have pre_filter metadata)
+        # Only process items that have been classified (classified_at is set)
         # This ensures classifier runs before LLM, avoiding wasted compute on irrelevant items
+        # One ix_items_llm_backlog range scan per priority ("low" is skipped as certainly
+        # irrelevant), claimed so that other worker processes take different items
+        item_ids: list[int] = []
         async with async_session_maker() as db:
-            from database import json_extract_path
-            retry_priority = json_extract_path(Item.metadata_, "retry_priority")
-            pre_filter = json_extract_path(Item.metadata_, "pre_filter")
-            priority_order = case(
-                (retry_priority == "high", 1),
-                (retry_priority == "edge_case", 2),
-                (retry_priority == "low", 3),
-                else_=4,
-            )
-
-            query = (
-                select(Item.id)
-                .where(
-                    # Must be classified first (pre_filter exists)
-                    pre_filter.is_not(None),
-                    # Must need LLM processing
-                    Item.needs_llm_processing == True,  # noqa: E712
-                    # Skip certainly irrelevant items
-                    or_(retry_priority != "low", retry_priority.is_(None)),
+            for retry_priority in BACKLOG_ORDER:
+                remaining = self.backlog_batch_size - len(item_ids)
+                if remaining <= 0:
+                    break
+                query = (
+                    select(Item.id)
+                    .where(
+                        Item.needs_llm_processing == True,  # noqa: E712
+                        Item.classified_at.isnot(None),
+                        Item.retry_priority == retry_priority
+                        if retry_priority is not None
+                        else Item.retry_priority.is_(None),
+                    )
+                    .order_by(Item.fetched_at.desc())
+                    .limit(remaining)
                 )
-                .order_by(priority_order, Item.fetched_at.desc())
-                .limit(self.backlog_batch_size)
-            )
-
-            result = await db.execute(query)
-            item_ids = [row[0] for row in result.fetchall()]
+                item_ids.extend(await claim_items(db, QUEUE_LLM, query, self._worker_id))
 
         if not item_ids:
             return 0
@@ -412,7 +550,7 @@ class LLMWorker:
         logger.info(f"Processing {len(item_ids)} backlog items")
 
         try:
-            processed = await self._process_items(item_ids, processor, is_fresh=False)
+            processed = await self._process_claimed(item_ids, processor, is_fresh=False)
             async with self._stats_lock:
                 self._stats["backlog_processed"] += processed
         except Exception as e:
@@ -432,13 +570,17 @@ class LLMWorker:
         """
         Process a batch of items through the LLM.
 
+        Up to `concurrency` items are analyzed at once so the LLM server can
+        serve them in parallel slots (OLLAMA_NUM_PARALLEL). Finished results
+        are written back in grouped commits of up to `concurrency` items.
+
         IMPORTANT: This method releases DB connections during LLM processing
         to avoid monopolizing connections for extended periods (10-60 sec per item).
 
         Pattern per item:
         1. Quick read (acquire + release connection)
         2. LLM processing (no connection held)
-        3. Quick write (acquire + release connection)
+        3. Grouped write (one connection + commit per group of results)
 
         Args:
             item_ids: List of item database IDs
@@ -448,205 +590,306 @@ class LLMWorker:
         Returns:
             Number of items successfully processed
         """
+        item_type = "fresh" if is_fresh else "backlog"
+        semaphore = asyncio.Semaphore(self.concurrency)
+        in_flight: set[asyncio.Task] = set()
+        ready: list[dict] = []
+        processed = 0
+        started = 0
+
+        async def analyze(item_id: int) -> dict | None:
+            try:
+                return await self._analyze_item(item_id, processor, is_fresh)
+            finally:
+                semaphore.release()
+
+        def collect_done():
+            for task in [t for t in in_flight if t.done()]:
+                in_flight.discard(task)
+                result = task.result()
+                if result is not None:
+                    ready.append(result)
+
+        try:
+            for item_id in item_ids:
+                await semaphore.acquire()
+
+                # Check for fresh items interrupting backlog
+                if not is_fresh and not self._fresh_queue.empty():
+                    semaphore.release()
+                    logger.info(f"Fresh items arrived, pausing backlog after {started} items")
+                    break
+
+                # Check if paused
+                if self._paused:
+                    semaphore.release()
+                    logger.info(f"Worker paused, stopping after {started} items")
+                    break
+
+                in_flight.add(asyncio.create_task(analyze(item_id)))
+                started += 1
+
+                collect_done()
+                if len(ready) >= self.concurrency:
+                    processed += await self._write_results(ready, item_type)
+                    ready = []
+
+            # Drain items still in flight (never abandon started LLM work)
+            if in_flight:
+                await asyncio.wait(in_flight)
+            collect_done()
+            if ready:
+                processed += await self._write_results(ready, item_type)
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+        return processed
+
+    async def _analyze_item(self, item_id: int, processor, is_fresh: bool) -> dict | None:
+        """
+        Read one item and run the LLM on it (phases 1 and 2).
+
+        Returns:
+            Result dict for _write_results, or None if skipped/failed
+        """
         import time
-        from sqlalchemy import update as sql_update
-        from services.item_events import record_event, EVENT_LLM_PROCESSED
 
-        processed = 0
         item_type = "fresh" if is_fresh else "backlog"
 
-        for item_id in item_ids:
-            # Check for fresh items interrupting backlog
-            if not is_fresh and not self._fresh_queue.empty():
-                logger.info(f"Fresh items arrived, pausing backlog after {processed} items")
-                break
+        try:
+            # Phase 1: Quick read - extract data we need for LLM
+            # Connection is released after this block
+            item_data = None
+            candidate_data = None  # For edge-case duplicate confirmation
+            async with async_session_maker() as db:
+                result = await db.execute(
+                    select(Item)
+                    .where(Item.id == item_id)
+                    .options(selectinload(Item.channel).selectinload(Channel.source))
+                )
+                item = result.scalar_one_or_none()
 
-            # Check if paused
-            if self._paused:
-                logger.info(f"Worker paused, stopping after {processed} items")
-                break
+                if not item:
+                    logger.warning(f"Item {item_id} not found")
+                    return None
 
-            try:
-                # Phase 1: Quick read - extract data we need for LLM
-                # Connection is released after this block
-                item_data = None
-                candidate_data = None  # For edge-case duplicate confirmation
-                async with async_session_maker() as db:
-                    result = await db.execute(
-                        select(Item)
-                        .where(Item.id == item_id)
-                        .options(selectinload(Item.channel).selectinload(Channel.source))
-                    )
-                    item = result.scalar_one_or_none()
-
-                    if not item:
-                        logger.warning(f"Item {item_id} not found")
-                        continue
-
-                    # Skip if already processed (race condition)
-                    if not is_fresh and not item.needs_llm_processing:
-                        continue
-
-                    # Extract all data needed for LLM processing
-                    source_name = item.channel.source.name if item.channel and item.channel.source else "Unbekannt"
-                    item_data = {
-                        "id": item.id,
-                        "title": item.title,
-                        "content": item.content,
-                        "url": item.url,
-                        "source_name": source_name,
-                        "priority_score": item.priority_score or 0,
-                        "metadata_": dict(item.metadata_) if item.metadata_ else {},
-                        "assigned_aks": item.assigned_aks or [],
-                    }
-
-                    # Check for edge-case duplicate candidate needing LLM confirmation
-                    dup_candidate = item_data["metadata_"].get("duplicate_candidate")
-                    if dup_candidate:
-                        candidate_id = dup_candidate.get("candidate_id")
-                        if candidate_id:
-                            cand_result = await db.execute(
-                                select(Item).where(Item.id == candidate_id)
+                # Skip if already processed (race condition)
+                if not is_fresh and not item.needs_llm_processing:
+                    return None
+
+                # Extract all data needed for LLM processing
+                source_name = (
+                    item.channel.source.name
+                    if item.channel and item.channel.source
+                    else "Unbekannt"
+                )
+                item_data = {
+                    "id": item.id,
+                    "title": item.title,
+                    "content": item.content,
+                    "url": item.url,
+                    "source_name": source_name,
+                    "priority_score": item.priority_score or 0,
+                    "metadata_": dict(item.metadata_) if item.metadata_ else {},
+                    "assigned_aks": item.assigned_aks or [],
+                }
+
+                # Check for edge-case duplicate candidate needing LLM confirmation
+                dup_candidate = item_data["metadata_"].get("duplicate_candidate")
+                if dup_candidate:
+                    candidate_id = dup_candidate.get("candidate_id")
+                    if candidate_id:
+                        cand_result = await db.execute(
+                            select(Item).where(Item.id == candidate_id)
+                        )
+                        cand_item = cand_result.scalar_one_or_none()
+                        if cand_item:
+                            candidate_data = {
+                                "id": cand_item.id,
+                                "title": cand_item.title,
+                                "content": cand_item.content,
+                            }
+                        else:
+                            logger.warning(
+                                f"Duplicate candidate {candidate_id} not found, "
+                                "skipping confirmation"
                             )
-                            cand_item = cand_result.scalar_one_or_none()
-                            if cand_item:
-                                candidate_data = {
-                                    "id": cand_item.id,
-                                    "title": cand_item.title,
-                                    "content": cand_item.content,
-                                }
-                            else:
-                                logger.warning(f"Duplicate candidate {candidate_id} not found, skipping confirmation")
-
-                # Phase 2: LLM processing - NO connection held
-                # This can take 10-60 seconds per item
-                start_time = time.time()
-
-                # 2a. Check for edge-case duplicate confirmation first
-                duplicate_confirmed = None
-                duplicate_reasoning = None
-                if candidate_data:
-                    dup_candidate = item_data["metadata_"].get("duplicate_candidate", {})
-                    logger.info(
-                        f"Confirming duplicate: '{item_data['title'][:40]}...' vs "
-                        f"'{candidate_data['title'][:40]}...' (score: {dup_candidate.get('similarity_score', 0):.3f})"
-                    )
-                    duplicate_confirmed, duplicate_reasoning = await processor.confirm_duplicate(
-                        item_data, candidate_data
-                    )
-                    logger.info(
-                        f"Duplicate confirmation: {duplicate_confirmed} - {duplicate_reasoning}"
-                    )
 
-                # 2b. Main item analysis (with conversation messages for topic extraction)
-                analysis, conversation_messages = await processor.analyze_from_data_with_messages(item_data)
+            # Phase 2: LLM processing - NO connection held
+            # This can take 10-60 seconds per item
+            start_time = time.time()
+
+            # 2a. Check for edge-case duplicate confirmation first
+            duplicate_confirmed = None
+            duplicate_reasoning = None
+            if candidate_data:
+                dup_candidate = item_data["metadata_"].get("duplicate_candidate", {})
+                logger.info(
+                    f"Confirming duplicate: '{item_data['title'][:40]}...' vs "
+                    f"'{candidate_data['title'][:40]}...' "
+                    f"(score: {dup_candidate.get('similarity_score', 0):.3f})"
+                )
+                duplicate_confirmed, duplicate_reasoning = await processor.confirm_duplicate(
+                    item_data, candidate_data
+                )
+                logger.info(
+                    f"Duplicate confirmation: {duplicate_confirmed} - {duplicate_reasoning}"
+                )
 
-                # 2c. Topic extraction via follow-up chat turn
-                topic = "Sonstiges"
-                topic_suggestion = None
-                if analysis.get("relevant") is not False:
-                    try:
-                        topic, topic_suggestion = await processor.extract_topics(conversation_messages)
-                        logger.debug(f"Extracted topic for item {item_id}: {topic}" +
-                                     (f" (suggestion: {topic_suggestion})" if topic_suggestion else ""))
-                    except Exception as topic_err:
-                        logger.warning(f"Topic extraction failed for item {item_id}: {topic_err}")
+            # 2b. Main item analysis (with conversation messages for topic extraction)
+            analysis, conversation_messages = await processor.analyze_from_data_with_messages(
+                item_data
+            )
+            llm_metrics = analysis.pop("llm_metrics", None)
 
-                elapsed = time.time() - start_time
-                async with self._stats_lock:
-                    self._stats["total_processing_time"] += elapsed
-                    self._stats["items_timed"] += 1
-
-                # Compute values to update
-                llm_priority = analysis.get("priority") or analysis.get("priority_suggestion")
-                if analysis.get("relevant") is False:
-                    llm_priority = None
-
-                if llm_priority == "high":
-                    new_priority = Priority.HIGH
-                    new_score = max(item_data["priority_score"], 90)
-                elif llm_priority == "medium":
-                    new_priority = Priority.MEDIUM
-                    new_score = max(item_data["priority_score"], 70)
-                elif llm_priority == "low":
-                    new_priority = Priority.LOW
-                    new_score = max(item_data["priority_score"], 40)
-                else:
-                    new_priority = Priority.NONE
-                    new_score = min(item_data["priority_score"] or 100, 20)
-
-                # Set assigned_aks: LLM takes precedence, classifier AK as fallback
-                llm_aks = analysis.get("assigned_aks", [])
-                assigned_aks = llm_aks
-                assigned_ak = llm_aks[0] if llm_aks else None
-                if not llm_aks and not item_data["assigned_aks"]:
-                    pre_filter = item_data["metadata_"].get("pre_filter", {})
-                    classifier_ak = pre_filter.get("ak_suggestion")
-                    if classifier_ak:
-                        assigned_aks = [classifier_ak]
-                        assigned_ak = classifier_ak
-                        logger.debug(f"Using classifier AK: {classifier_ak}")
-
-                # Prepare metadata update
-                new_metadata = dict(item_data["metadata_"])
-                new_metadata["llm_analysis"] = {
-                    "relevance_score": analysis.get("relevance_score", 0.5),
-                    "priority_suggestion": llm_priority,
-                    "assigned_aks": llm_aks,
-                    "assigned_ak": llm_aks[0] if llm_aks else None,
-                    "tags": analysis.get("tags", []),
-                    "topic": topic,
-                    "topic_suggestion": topic_suggestion,
-                    "reasoning": analysis.get("reasoning"),
-                    "processed_at": datetime.utcnow().isoformat(),
-                    "source": "llm_worker",
+            # 2c. Topic extraction via follow-up chat turn
+            topic = "Sonstiges"
+            topic_suggestion = None
+            if analysis.get("relevant") is not False:
+                try:
+                    topic, topic_suggestion = await processor.extract_topics(conversation_messages)
+                    logger.debug(f"Extracted topic for item {item_id}: {topic}" +
+                                 (f" (suggestion: {topic_suggestion})" if topic_suggestion else ""))
+                except Exception as topic_err:
+                    logger.warning(f"Topic extraction failed for item {item_id}: {topic_err}")
+
+            elapsed = time.time() - start_time
+            async with self._stats_lock:
+                self._stats["total_processing_time"] += elapsed
+                self._stats["items_timed"] += 1
+
+            # Compute values to update
+            llm_priority = analysis.get("priority") or analysis.get("priority_suggestion")
+            if analysis.get("relevant") is False:
+                llm_priority = None
+
+            if llm_priority == "high":
+                new_priority = Priority.HIGH
+                new_score = max(item_data["priority_score"], 90)
+            elif llm_priority == "medium":
+                new_priority = Priority.MEDIUM
+                new_score = max(item_data["priority_score"], 70)
+            elif llm_priority == "low":
+                new_priority = Priority.LOW
+                new_score = max(item_data["priority_score"], 40)
+            else:
+                new_priority = Priority.NONE
+                new_score = min(item_data["priority_score"] or 100, 20)
+
+            # Set assigned_aks: LLM takes precedence, classifier AK as fallback
+            llm_aks = analysis.get("assigned_aks", [])
+            assigned_aks = llm_aks
+            assigned_ak = llm_aks[0] if llm_aks else None
+            if not llm_aks and not item_data["assigned_aks"]:
+                pre_filter = item_data["metadata_"].get("pre_filter", {})
+                classifier_ak = pre_filter.get("ak_suggestion")
+                if classifier_ak:
+                    assigned_aks = [classifier_ak]
+                    assigned_ak = classifier_ak
+                    logger.debug(f"Using classifier AK: {classifier_ak}")
+
+            # Prepare metadata update
+            new_metadata = dict(item_data["metadata_"])
+            new_metadata["llm_analysis"] = {
+                "relevance_score": analysis.get("relevance_score", 0.5),
+                "priority_suggestion": llm_priority,
+                "assigned_aks": llm_aks,
+                "assigned_ak": llm_aks[0] if llm_aks else None,
+                "tags": analysis.get("tags", []),
+                "topic": topic,
+                "topic_suggestion": topic_suggestion,
+                "reasoning": analysis.get("reasoning"),
+                "processed_at": datetime.utcnow().isoformat(),
+                "source": "llm_worker",
+            }
+
+            # Record duplicate confirmation result in metadata
+            confirmed_similar_to_id = None
+            dup_candidate = item_data["metadata_"].get("duplicate_candidate", {})
+            if duplicate_confirmed is not None:
+                new_metadata["duplicate_confirmation"] = {
+                    "confirmed": duplicate_confirmed,
+                    "reasoning": duplicate_reasoning,
+                    "candidate_id": dup_candidate.get("candidate_id"),
+                    "similarity_score": dup_candidate.get("similarity_score"),
+                    "confirmed_at": datetime.utcnow().isoformat(),
                 }
+                # Clear the candidate since we've processed it
+                if "duplicate_candidate" in new_metadata:
+                    del new_metadata["duplicate_candidate"]
+
+                if duplicate_confirmed:
+                    confirmed_similar_to_id = dup_candidate.get("candidate_id")
+
+            update_values = {
+                "summary": analysis.get("summary"),
+                "detailed_analysis": analysis.get("detailed_analysis"),
+                "priority": new_priority,
+                "priority_score": new_score,
+                "assigned_aks": assigned_aks,
+                "assigned_ak": assigned_ak,
+                "metadata_": new_metadata,
+                "needs_llm_processing": False,
+            }
+
+            # Set similar_to_id if duplicate was confirmed by LLM
+            if confirmed_similar_to_id:
+                update_values["similar_to_id"] = confirmed_similar_to_id
+
+            # Remove None values to avoid overwriting with None
+            update_values = {
+                k: v for k, v in update_values.items()
+                if v is not None or k in ("assigned_ak", "needs_llm_processing")
+            }
+
+            return {
+                "item_id": item_id,
+                "title": item_data["title"],
+                "update_values": update_values,
+                "analysis": analysis,
+                "llm_priority": llm_priority,
+                "llm_aks": llm_aks,
+                "priority_input": (
+                    item_data["metadata_"].get("pre_filter", {}).get("priority_suggestion")
+                    or "unknown"
+                ),
+                "duplicate_confirmed": duplicate_confirmed,
+                "duplicate_reasoning": duplicate_reasoning,
+                "duplicate_candidate": dup_candidate,
+                "elapsed": elapsed,
+                "llm_metrics": llm_metrics,
+            }
 
-                # Record duplicate confirmation result in metadata
-                confirmed_similar_to_id = None
-                if duplicate_confirmed is not None:
-                    dup_candidate = item_data["metadata_"].get("duplicate_candidate", {})
-                    new_metadata["duplicate_confirmation"] = {
-                        "confirmed": duplicate_confirmed,
-                        "reasoning": duplicate_reasoning,
-                        "candidate_id": dup_candidate.get("candidate_id"),
-                        "similarity_score": dup_candidate.get("similarity_score"),
-                        "confirmed_at": datetime.utcnow().isoformat(),
-                    }
-                    # Clear the candidate since we've processed it
-                    if "duplicate_candidate" in new_metadata:
-                        del new_metadata["duplicate_candidate"]
-
-                    if duplicate_confirmed:
-                        confirmed_similar_to_id = dup_candidate.get("candidate_id")
-
-                # Phase 3: Quick write - update item in database
-                # Connection is released after this block
-                async with async_session_maker() as db:
-                    update_values = {
-                        "summary": analysis.get("summary"),
-                        "detailed_analysis": analysis.get("detailed_analysis"),
-                        "priority": new_priority,
-                        "priority_score": new_score,
-                        "assigned_aks": assigned_aks,
-                        "assigned_ak": assigned_ak,
-                        "metadata_": new_metadata,
-                        "needs_llm_processing": False,
-                    }
-
-                    # Set similar_to_id if duplicate was confirmed by LLM
-                    if confirmed_similar_to_id:
-                        update_values["similar_to_id"] = confirmed_similar_to_id
-
-                    # Remove None values to avoid overwriting with None
-                    update_values = {k: v for k, v in update_values.items() if v is not None or k in ("assigned_ak", "needs_llm_processing")}
+        except Exception as e:
+            logger.warning(f"Failed to process {item_type} item {item_id}: {e}")
+            async with self._stats_lock:
+                self._stats["errors"] += 1
+            return None
+
+    async def _write_results(self, results: list[dict], item_type: str) -> int:
+        """
+        Write a group of LLM results back in a single transaction (phase 3).
+
+        Args:
+            results: Result dicts from _analyze_item
+            item_type: "fresh" or "backlog" (for logging/events)
+
+        Returns:
+            Number of items written
+        """
+        from sqlalchemy import update as sql_update
+        from services.item_events import record_event, EVENT_LLM_PROCESSED, EVENT_DUPLICATE_DETECTED
 
+        try:
+            async with async_session_maker() as db:
+                for res in results:
+                    item_id = res["item_id"]
                     await db.execute(
                         sql_update(Item)
                         .where(Item.id == item_id)
-                        .values(**update_values)
+                        .values(**res["update_values"])
                     )
-                    await db.commit()
 
                     # Record LLM processing event
                     await record_event(
@@ -654,18 +897,21 @@ class LLMWorker:
                         item_id,
                         EVENT_LLM_PROCESSED,
                         data={
-                            "priority": llm_priority,
-                            "assigned_aks": llm_aks,
-                            "relevance_score": analysis.get("relevance_score"),
+                            "priority": res["llm_priority"],
+                            "assigned_aks": res["llm_aks"],
+                            "relevance_score": res["analysis"].get("relevance_score"),
                             "source": item_type,
                         },
                     )
 
                     # Record duplicate confirmation event if applicable
-                    if duplicate_confirmed is not None:
-                        from services.item_events import EVENT_DUPLICATE_DETECTED
-                        dup_candidate = item_data["metadata_"].get("duplicate_candidate", {})
-                        event_type = EVENT_DUPLICATE_DETECTED if duplicate_confirmed else "duplicate_rejected"
+                    if res["duplicate_confirmed"] is not None:
+                        dup_candidate = res["duplicate_candidate"]
+                        event_type = (
+                            EVENT_DUPLICATE_DETECTED
+                            if res["duplicate_confirmed"]
+                            else "duplicate_rejected"
+                        )
                         await record_event(
                             db,
                             item_id,
@@ -673,8 +919,8 @@ class LLMWorker:
                             data={
                                 "candidate_id": dup_candidate.get("candidate_id"),
                                 "similarity_score": dup_candidate.get("similarity_score"),
-                                "llm_confirmed": duplicate_confirmed,
-                                "reasoning": duplicate_reasoning,
+                                "llm_confirmed": res["duplicate_confirmed"],
+                                "reasoning": res["duplicate_reasoning"],
                             },
                         )
 
@@ -683,38 +929,48 @@ class LLMWorker:
                         from services.processing_logger import ProcessingLogger
 
                         plogger = ProcessingLogger(db)
-                        pre_filter = item_data["metadata_"].get("pre_filter", {})
-                        priority_input = pre_filter.get("priority_suggestion") or "unknown"
-
                         await plogger.log_llm_analysis(
                             item_id=item_id,
-                            analysis=analysis,
-                            priority_input=priority_input,
-                            priority_output=llm_priority,
-                            duration_ms=int(elapsed * 1000),
+                            analysis=res["analysis"],
+                            priority_input=res["priority_input"],
+                            priority_output=res["llm_priority"],
+                            duration_ms=int(res["elapsed"] * 1000),
+                            llm_metrics=res.get("llm_metrics"),
                         )
                     except Exception as log_err:
                         logger.warning(f"Failed to log LLM analysis for item {item_id}: {log_err}")
 
-                processed += 1
-                async with self._stats_lock:
-                    self._stats["last_processed_at"] = datetime.utcnow().isoformat()
+                await db.commit()
+        except Exception as e:
+            if len(results) > 1:
+                # Don't let one bad row discard the whole group
+                logger.warning(
+                    f"Grouped write of {len(results)} {item_type} results failed, "
+                    f"retrying singly: {e}"
+                )
+                written = 0
+                for res in results:
+                    written += await self._write_results([res], item_type)
+                return written
+            logger.warning(f"Failed to write {item_type} item {results[0]['item_id']}: {e}")
+            async with self._stats_lock:
+                self._stats["errors"] += 1
+            return 0
 
-                logger.info(f"LLM {item_type}: {item_data['title'][:40]}... -> {llm_priority}")
+        async with self._stats_lock:
+            self._stats["last_processed_at"] = datetime.utcnow().isoformat()
 
-            except Exception as e:
-                logger.warning(f"Failed to process {item_type} item {item_id}: {e}")
-                async with self._stats_lock:
-                    self._stats["errors"] += 1
+        for res in results:
+            logger.info(f"LLM {item_type}: {res['title'][:40]}... -> {res['llm_priority']}")
 
-        return processed
+        return len(results)
 
 
 # Global worker instance
-_worker: Optional[LLMWorker] = None
+_worker: LLMWorker | None = None
 
 
-def get_worker() -> Optional[LLMWorker]:
+def get_worker() -> LLMWorker | None:
     """Get the global worker instance."""
     return _worker
 
@@ -723,6 +979,7 @@ async def start_worker(
     batch_size: int = 10,
     idle_sleep: float = 30.0,
     backlog_batch_size: int = 50,
+    concurrency: int = 1,
 ) -> LLMWorker:
     """
     Start the global LLM worker.
@@ -731,6 +988,7 @@ async def start_worker(
         batch_size: Fresh items to process per batch
         idle_sleep: Seconds to sleep when idle
         backlog_batch_size: Backlog items to fetch per query
+        concurrency: Max items in flight against the LLM at once
 
     Returns:
         The started worker instance
@@ -745,6 +1003,7 @@ async def start_worker(
         batch_size=batch_size,
         idle_sleep=idle_sleep,
         backlog_batch_size=backlog_batch_size,
+        concurrency=concurrency,
     )
     await _worker.start()
     return _worker
@@ -759,6 +1018,28 @@ async def stop_worker():
         _worker = None
 
 
+async def notify_fresh_items(item_ids: list[int], db=None) -> None:
+    """
+    Hand fresh items to the LLM workers of all processes.
+
+    Announced as an items_created event so a worker in another process or
+    instance picks them up within milliseconds; the workers' claims make
+    sure only one of them processes each item. Without the event bus the
+    items go to this process's worker (or wait for the backlog).
+
+    Args:
+        item_ids: Database IDs of the new items
+        db: Session that created the items; the event is sent when it commits
+    """
+    if not item_ids:
+        return
+    bus = get_event_bus()
+    if bus.connected and await bus.publish_ids(EVENT_ITEMS_CREATED, item_ids, session=db):
+        return
+    for item_id in item_ids:
+        await enqueue_fresh_item(item_id)
+
+
 async def enqueue_fresh_item(item_id: int):
     """
     Enqueue a fresh item for immediate LLM processing.
@@ -0,0 +1,371 @@
+"""Process pool for CPU-bound parsing (feeds, HTML, articles, PDFs).
+
+feedparser, BeautifulSoup/lxml, trafilatura and PyMuPDF are pure CPU work.
+Run on the event loop, one slow document (a 2 MB feed, a 300-page PDF)
+stalls every other coroutine in the process, including API requests. This
+module runs them in a bounded ProcessPoolExecutor instead, so the loop only
+does I/O:
+
+    from services.parse_pool import parse_feed
+
+    feed = await parse_feed(feed_text)
+
+- PARSE_POOL_WORKERS worker processes (0 = run in a thread instead, for
+  development and tests), started lazily on first use via forkserver
+- At most PARSE_POOL_MAX_PENDING documents are queued per process; further
+  callers wait, which bounds the memory held by raw documents
+- Every task has a timeout (PARSE_TIMEOUT_SECONDS, longer for PDFs). On
+  timeout the workers are killed and the pool is restarted, since a stuck
+  parse would otherwise occupy a worker forever. Tasks that were running
+  next to it are retried once on the new pool.
+- Workers are replaced after PARSE_POOL_MAX_TASKS_PER_CHILD tasks, which
+  caps memory growth in long-running parser processes
+
+The worker functions below run inside the pool processes: they take and
+return plain, picklable data and must stay importable without the database
+or the app. They only import config and the parsing helpers of
+services.article_extractor; services/__init__.py loads its exports lazily,
+so importing this module does not pull in the pipeline, models or database.
+
+Benchmark: python scripts/benchmark_parsing.py
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# PDFs can be hundreds of pages
+PDF_TIMEOUT_FACTOR = 4
+
+
+class ParseTimeoutError(Exception):
+    """A parse task did not finish within its timeout."""
+
+
+# --- Worker functions (run in the pool processes) ---
+
+
+def _parse_feed(text: str):
+    """feedparser.parse() with a result that can be sent back to the caller."""
+    import feedparser
+
+    feed = feedparser.parse(text)
+    if feed.get("bozo_exception") is not None:
+        # SAX exceptions keep a reference to the (closed) input stream
+        exc = feed["bozo_exception"]
+        feed["bozo_exception"] = Exception(f"{type(exc).__name__}: {exc}")
+    return feed
+
+
+def _extract_article(
+    html: str,
+    url: str,
+    detect: bool = True,
+    strip_selectors: tuple[str, ...] = (),
+) -> dict:
+    """Article detection plus title and main-text extraction for one page.
+
+    Args:
+        html: Page HTML
+        url: Page URL (used by the article heuristics)
+        detect: Run the news-article heuristics; if they fail, title and
+            content are not extracted
+        strip_selectors: CSS selectors removed before extraction
+
+    Returns:
+        Dict with is_article, looks_like_spa, title and content
+    """
+    from bs4 import BeautifulSoup
+
+    from services.article_extractor import ArticleExtractor, _looks_like_spa
+
+    extractor = ArticleExtractor()
+    soup = BeautifulSoup(html, "lxml")
+    for selector in strip_selectors:
+        for el in soup.select(selector):
+            el.decompose()
+
+    result = {
+        "is_article": True,
+        "looks_like_spa": len(html) > 5000 and _looks_like_spa(html),
+        "title": None,
+        "content": "",
+    }
+    if detect and not extractor.is_likely_news_article(soup, url):
+        result["is_article"] = False
+        return result
+
+    result["title"] = extractor._extract_title(soup)
+    result["content"] = extractor._extract_content(soup, html)
+    return result
+
+
+def _extract_html_items(html: str, selectors: dict[str, str | None]) -> list[dict]:
+    """Select news items from a page with the HTML connector's CSS selectors.
+
+    Returns:
+        One dict per item with title, href, content and date_text
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "lxml")
+    items = []
+    for element in soup.select(selectors["item"]):
+        title_el = element.select_one(selectors["title"])
+        if not title_el:
+            continue
+        title = title_el.get_text(strip=True)
+        if not title:
+            continue
+
+        href = None
+        if selectors.get("link"):
+            link_el = element.select_one(selectors["link"])
+            if link_el:
+                href = link_el.get("href") or None
+        elif title_el.get("href"):
+            href = title_el["href"]
+        elif title_el.name == "a":
+            href = ""
+
+        content = ""
+        if selectors.get("content"):
+            content_el = element.select_one(selectors["content"])
+            if content_el:
+                content = content_el.get_text(strip=True)
+
+        date_text = None
+        if selectors.get("date"):
+            date_el = element.select_one(selectors["date"])
+            if date_el:
+                date_text = date_el.get_text(strip=True)
+
+        items.append({"title": title, "href": href, "content": content, "date_text": date_text})
+    return items
+
+
+def _count_html_items(html: str, selector: str) -> int:
+    """Number of elements matching a CSS selector."""
+    from bs4 import BeautifulSoup
+
+    return len(BeautifulSoup(html, "lxml").select(selector))
+
+
+def _extract_pdf(data: bytes) -> dict:
+    """Text and metadata of a PDF document.
+
+    Returns:
+        Dict with text, metadata and page_count
+    """
+    import pymupdf
+
+    doc = pymupdf.open(stream=data, filetype="pdf")
+    try:
+        return {
+            "text": "".join(page.get_text() for page in doc),
+            "metadata": dict(doc.metadata or {}),
+            "page_count": len(doc),
+        }
+    finally:
+        doc.close()
+
+
+# --- Pool ---
+
+
+class ParsePool:
+    """Bounded process pool with per-task timeouts."""
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_pending: int | None = None,
+        timeout: float | None = None,
+        max_tasks_per_child: int | None = None,
+    ):
+        """
+        Args:
+            workers: Worker processes (0 = run in a thread)
+            max_pending: Max queued plus running tasks per process
+            timeout: Default per-task timeout in seconds
+            max_tasks_per_child: Tasks before a worker process is replaced
+        """
+        self.workers = settings.parse_pool_workers if workers is None else workers
+        self.max_pending = max_pending or settings.parse_pool_max_pending
+        self.timeout = timeout or settings.parse_timeout_seconds
+        self.max_tasks_per_child = max_tasks_per_child or settings.parse_pool_max_tasks_per_child
+        self._executor: Executor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: asyncio.Semaphore | None = None
+        self._restarts = 0
+        self._stats: dict[str, dict[str, Any]] = {}
+
+    def _check_loop(self) -> asyncio.Semaphore:
+        """Semaphore for the running loop (recreated when the loop changes)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._pending is None:
+            self._loop = loop
+            self._pending = asyncio.Semaphore(max(1, self.max_pending))
+        return self._pending
+
+    def _get_executor(self) -> Executor | None:
+        """The process pool, or None in thread mode."""
+        if self.workers <= 0:
+            return None
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+                max_tasks_per_child=self.max_tasks_per_child,
+            )
+            logger.info(f"Parse pool started with {self.workers} worker processes")
+        return self._executor
+
+    def _restart(self, executor: Executor, reason: str) -> None:
+        """Kill the pool's workers; the next task starts a fresh pool."""
+        if self._executor is not executor:
+            return
+        self._executor = None
+        self._restarts += 1
+        logger.warning(f"Restarting parse pool ({reason})")
+        processes = list((getattr(executor, "_processes", None) or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            try:
+                process.kill()
+            except Exception:
+                pass
+
+    async def run(self, func: Callable, *args, timeout: float | None = None) -> Any:
+        """Run func(*args) in the pool.
+
+        Args:
+            func: Module-level function (picklable) taking picklable arguments
+            timeout: Seconds before ParseTimeoutError (default: pool timeout)
+
+        Raises:
+            ParseTimeoutError: The task did not finish in time
+            Any exception raised by func
+        """
+        timeout = timeout or self.timeout
+        name = func.__name__.lstrip("_")
+        stats = self._stats.setdefault(name, {
+            "tasks": 0, "errors": 0, "timeouts": 0, "seconds": 0.0, "max_seconds": 0.0,
+        })
+
+        async with self._check_loop():
+            start = time.monotonic()
+            stats["tasks"] += 1
+            try:
+                for attempt in range(2):
+                    executor = self._get_executor()
+                    future = asyncio.get_running_loop().run_in_executor(executor, func, *args)
+                    try:
+                        return await asyncio.wait_for(future, timeout)
+                    except TimeoutError:
+                        stats["timeouts"] += 1
+                        if executor is not None:
+                            self._restart(executor, f"{name} timed out after {timeout:.0f}s")
+                        raise ParseTimeoutError(f"{name} timed out after {timeout:.0f}s")
+                    except BrokenProcessPool:
+                        # Killed next to a timed-out task (or a worker crashed): retry once
+                        self._restart(executor, f"broken pool during {name}")
+                        if attempt:
+                            raise
+            except ParseTimeoutError:
+                raise
+            except Exception:
+                stats["errors"] += 1
+                raise
+            finally:
+                elapsed = time.monotonic() - start
+                stats["seconds"] += elapsed
+                stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+
+    def get_stats(self) -> dict:
+        """Per-task-type counts and timings of this process."""
+        return {
+            "workers": self.workers,
+            "mode": "process" if self.workers > 0 else "thread",
+            "running": self._executor is not None,
+            "max_pending": self.max_pending,
+            "timeout_seconds": self.timeout,
+            "restarts": self._restarts,
+            "tasks": {
+                name: {
+                    **s,
+                    "seconds": round(s["seconds"], 2),
+                    "max_seconds": round(s["max_seconds"], 2),
+                    "avg_ms": round(s["seconds"] / s["tasks"] * 1000, 1) if s["tasks"] else None,
+                }
+                for name, s in self._stats.items()
+            },
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (restarted lazily on next use)."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool: ParsePool | None = None
+
+
+def get_parse_pool() -> ParsePool:
+    """Get the process-wide parse pool."""
+    global _pool
+    if _pool is None:
+        _pool = ParsePool()
+    return _pool
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the parse pool's workers (called on shutdown)."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+# --- Async API ---
+
+
+async def parse_feed(text: str):
+    """Parse an RSS/Atom feed (feedparser result)."""
+    return await get_parse_pool().run(_parse_feed, text)
+
+
+async def extract_article(
+    html: str,
+    url: str,
+    detect: bool = True,
+    strip_selectors: tuple[str, ...] = (),
+) -> dict:
+    """Detect and extract an article from page HTML (see _extract_article)."""
+    return await get_parse_pool().run(_extract_article, html, url, detect, strip_selectors)
+
+
+async def extract_html_items(html: str, selectors: dict[str, str | None]) -> list[dict]:
+    """Select items from a page with CSS selectors (see _extract_html_items)."""
+    return await get_parse_pool().run(_extract_html_items, html, selectors)
+
+
+async def count_html_items(html: str, selector: str) -> int:
+    """Count elements matching a CSS selector."""
+    return await get_parse_pool().run(_count_html_items, html, selector)
+
+
+async def extract_pdf(data: bytes) -> dict:
+    """Extract text and metadata from a PDF (see _extract_pdf)."""
+    pool = get_parse_pool()
+    return await pool.run(_extract_pdf, data, timeout=pool.timeout * PDF_TIMEOUT_FACTOR)
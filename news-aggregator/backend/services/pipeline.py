@@ -11,11 +11,12 @@ from datetime import datetime, timedelta, UTC
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse, urlunparse, parse_qs, urlencode, unquote
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from models import Channel, Item, Priority, ProcessingStepType, Rule, RuleType
+from models import Channel, Item, Priority, ProcessingStepType, RetryPriority, Rule, RuleType
 from config import settings
+from services.rule_engine import CompiledRule, compile_rules, get_rule_engine
 
 if TYPE_CHECKING:
     from services.processor import ItemProcessor
@@ -135,6 +136,85 @@ class RawItem:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+# Max values per IN (...) list in the dedup pre-pass
+DEDUP_IN_CHUNK_SIZE = 500
+
+
+def _chunked(values: list, size: int = DEDUP_IN_CHUNK_SIZE):
+    """Yield successive chunks of values."""
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+@dataclass
+class DedupLookup:
+    """Duplicate lookups for one fetch batch, resolved up front by the pre-pass."""
+
+    external_ids: set[str] = field(default_factory=set)  # Already stored in this channel
+    content_hashes: set[str] = field(default_factory=set)  # Already stored anywhere
+    url_matches: dict[str, int] = field(default_factory=dict)  # Normalized URL -> oldest item in another channel
+    semantic: dict[str, list[dict]] = field(default_factory=dict)  # external_id -> candidates
+    existing_ids: set[int] = field(default_factory=set)  # Semantic candidates still in the DB
+
+    def is_duplicate(self, external_id: str, content_hash: str) -> bool:
+        """Check for an exact duplicate (same channel external_id or same content)."""
+        return external_id in self.external_ids or content_hash in self.content_hashes
+
+    def add(self, external_id: str, content_hash: str) -> None:
+        """Register an accepted item so later items in the batch dedup against it."""
+        self.external_ids.add(external_id)
+        self.content_hashes.add(content_hash)
+
+    def url_match(self, url: str) -> int | None:
+        """Look up a URL by its normalized form."""
+        return self.url_matches.get(_normalize_url(url))
+
+
+def normalize_raw_item(raw: RawItem) -> RawItem:
+    """Normalize content (strip HTML, fix encoding, etc.).
+
+    Module-level so the scheduler can build the exact text the pipeline will
+    store and index before the database phase starts.
+    """
+    # Normalize published_at to UTC naive datetime
+    # Database uses TIMESTAMP WITHOUT TIME ZONE, so we must strip tzinfo
+    published_at = raw.published_at
+    if published_at.tzinfo is not None:
+        # Convert to UTC first, then remove timezone info
+        published_at = published_at.astimezone(UTC).replace(tzinfo=None)
+
+    # Strip HTML tags from content
+    content = re.sub(r"<[^>]+>", "", raw.content)
+
+    # Remove control characters (except newline, tab, carriage return)
+    # This prevents issues with parsing, storing, and JSON serialization
+    content = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", content)
+
+    # Normalize whitespace
+    content = re.sub(r"\s+", " ", content).strip()
+
+    # Decode all HTML entities (numeric, hex, and named)
+    content = html_module.unescape(content)
+
+    # Strip HTML tags from title, remove control chars, normalize whitespace
+    title = re.sub(r"<[^>]+>", "", raw.title)
+    title = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", title)
+    title = re.sub(r"\s+", " ", title).strip()
+
+    # Decode all HTML entities in title
+    title = html_module.unescape(title)
+
+    return RawItem(
+        external_id=raw.external_id,
+        title=title,
+        content=content,
+        url=raw.url,
+        author=raw.author,
+        published_at=published_at,
+        metadata=raw.metadata,
+    )
+
+
 class Pipeline:
     """Processing pipeline for raw items."""
 
@@ -196,9 +276,10 @@ class Pipeline:
         # find each other via ChromaDB since neither is indexed yet)
         batch_titles: list[str] = []  # Cleaned titles for comparison
 
+        # 1-2. Skip old items and normalize content up front so the duplicate
+        # lookups for the whole batch can be resolved with set-based queries
+        candidates: list[tuple[RawItem, str]] = []
         for raw in raw_items:
-            # Create item-specific logger for this processing run
-            item_logger = self.processing_logger.new_item_run() if self.processing_logger else None
             # 1. Skip old items (older than MAX_AGE_DAYS) - disabled in training_mode
             # Normalize published_at to naive UTC for comparison
             pub_dt = raw.published_at
@@ -210,14 +291,16 @@ class Pipeline:
 
             # 2. Normalize content
             normalized = self._normalize_content(raw)
+            candidates.append((normalized, self._compute_hash(normalized.content)))
 
-            # 3. Check for duplicates
-            content_hash = self._compute_hash(normalized.content)
-            is_duplicate = await self._is_duplicate(
-                channel.id, normalized.external_id, content_hash
-            )
+        dedup = await self._prefetch_duplicates(candidates, channel)
+
+        for normalized, content_hash in candidates:
+            # Create item-specific logger for this processing run
+            item_logger = self.processing_logger.new_item_run() if self.processing_logger else None
 
-            if is_duplicate:
+            # 3. Check for duplicates
+            if dedup.is_duplicate(normalized.external_id, content_hash):
                 logger.debug(f"Skipping duplicate: {normalized.title[:50]}")
                 continue
 
@@ -228,89 +311,51 @@ class Pipeline:
             similarity_score = None
             duplicate_candidate = None  # For edge cases needing LLM review
             if not self.training_mode and normalized.url:
-                try:
+                url_match = dedup.url_match(normalized.url)
+                if url_match:
                     from services.item_events import record_event, EVENT_DUPLICATE_DETECTED
 
-                    # Exact URL match across all channels
-                    url_match = await self.db.scalar(
-                        select(Item.id).where(
-                            Item.url == normalized.url,
-                            Item.channel_id != channel.id,
-                        ).order_by(Item.id).limit(1)
+                    similar_to_id = url_match
+                    logger.info(
+                        f"URL duplicate: '{normalized.title[:40]}...' "
+                        f"same URL as item {similar_to_id}"
                     )
-
-                    # If no exact match, try normalized URL (strips tracking params, www, etc.)
-                    if not url_match:
-                        norm_url = _normalize_url(normalized.url)
-                        # Only check if normalization changed the URL
-                        if norm_url != normalized.url:
-                            url_match = await self.db.scalar(
-                                select(Item.id).where(
-                                    Item.url == norm_url,
-                                    Item.channel_id != channel.id,
-                                ).order_by(Item.id).limit(1)
-                            )
-
-                    if url_match:
-                        similar_to_id = url_match
-                        logger.info(
-                            f"URL duplicate: '{normalized.title[:40]}...' "
-                            f"same URL as item {similar_to_id}"
+                    try:
+                        await record_event(
+                            self.db,
+                            similar_to_id,
+                            EVENT_DUPLICATE_DETECTED,
+                            data={
+                                "duplicate_title": normalized.title,
+                                "duplicate_source": channel.source.name if channel.source else None,
+                                "duplicate_channel_id": channel.id,
+                                "duplicate_url": normalized.url,
+                                "method": "url_match",
+                            },
                         )
-                        try:
-                            await record_event(
-                                self.db,
-                                similar_to_id,
-                                EVENT_DUPLICATE_DETECTED,
-                                data={
-                                    "duplicate_title": normalized.title,
-                                    "duplicate_source": channel.source.name if channel.source else None,
-                                    "duplicate_channel_id": channel.id,
-                                    "duplicate_url": normalized.url,
-                                    "method": "url_match",
-                                },
-                            )
-                        except Exception as e:
-                            logger.warning(f"Failed to record URL duplicate event: {e}")
-                except Exception as e:
-                    logger.warning(f"URL duplicate check failed, continuing: {e}")
+                    except Exception as e:
+                        logger.warning(f"Failed to record URL duplicate event: {e}")
 
             # 3b. Check for semantic duplicates (cross-channel, different articles on same topic)
             # Instead of skipping, we store the duplicate with similar_to_id pointing to primary
             # For edge cases (similarity 0.60-0.75), mark for LLM review instead of auto-linking
             if not similar_to_id and self.relevance_filter and not self.training_mode:
                 try:
-                    # Strip boilerplate before embedding to avoid false positive similarity
-                    clean_title = _strip_boilerplate(normalized.title)
-                    clean_content = _strip_boilerplate(normalized.content)
-                    # Use lower threshold to catch "maybe duplicates" for LLM review
-                    duplicates = await self.relevance_filter.find_duplicates(
-                        title=clean_title,
-                        content=clean_content,
-                        threshold=DUPLICATE_THRESHOLD_MAYBE,  # 0.60 - catches edge cases
-                    )
+                    duplicates = dedup.semantic.get(normalized.external_id) or []
                     if duplicates:
                         best_match = duplicates[0]
                         match_score = best_match.get("score", 0)
                         match_id = int(best_match["id"])
 
                         # Verify the candidate item still exists (vector index may be out of sync)
-                        from sqlalchemy import select
                         from services.item_events import record_event, EVENT_DUPLICATE_DETECTED
-                        try:
-                            existing = await self.db.scalar(
-                                select(Item.id).where(Item.id == match_id)
+                        if match_id not in dedup.existing_ids:
+                            logger.warning(
+                                f"Skipping duplicate: item {match_id} no longer exists "
+                                "(vector index out of sync)"
                             )
-                            if not existing:
-                                logger.warning(
-                                    f"Skipping duplicate: item {match_id} no longer exists "
-                                    "(vector index out of sync)"
-                                )
-                                match_id = None
-                                match_score = None
-                        except Exception as e:
-                            logger.warning(f"Failed to verify candidate item: {e}")
                             match_id = None
+                            match_score = None
 
                         if match_id:
                             if match_score >= DUPLICATE_THRESHOLD_CONFIRMED:
@@ -392,6 +437,7 @@ class Pipeline:
                 title=normalized.title,
                 content=normalized.content,
                 url=normalized.url,
+                url_normalized=_normalize_url(normalized.url) if normalized.url else None,
                 author=normalized.author,
                 published_at=normalized.published_at,
                 content_hash=content_hash,
@@ -416,7 +462,7 @@ class Pipeline:
                 # Check for pre-computed results first (avoids SQLAlchemy async context issues)
                 if normalized.external_id in self.pre_filter_results:
                     cached = self.pre_filter_results[normalized.external_id]
-                    pre_filter_result = cached["result"]
+                    pre_filter_result = cached.get("result")
                 elif self.relevance_filter:
                     # Fallback: call classifier directly (may fail in async SQLAlchemy context)
                     try:
@@ -462,18 +508,19 @@ class Pipeline:
                 if pre_filter_result:
                     confidence = pre_filter_result.get("relevance_confidence", 0.5)
                     if confidence >= 0.5:
-                        item.metadata_["retry_priority"] = "high"
+                        item.retry_priority = RetryPriority.HIGH
                     elif confidence >= 0.25:
-                        item.metadata_["retry_priority"] = "edge_case"
+                        item.retry_priority = RetryPriority.EDGE_CASE
                     else:
-                        item.metadata_["retry_priority"] = "low"
+                        item.retry_priority = RetryPriority.LOW
                 else:
                     # No classifier result - treat as unknown (will be processed by classifier worker)
-                    item.metadata_["retry_priority"] = "unknown"
-                logger.info(f"Marked for LLM retry: {normalized.title[:40]} (priority: {item.metadata_.get('retry_priority')})")
+                    item.retry_priority = RetryPriority.UNKNOWN
+                logger.info(f"Marked for LLM retry: {normalized.title[:40]} (priority: {item.retry_priority.value})")
 
             # 7. Store pre-filter result in metadata if available
             if pre_filter_result:
+                item.classified_at = datetime.utcnow()
                 item.metadata_["pre_filter"] = {
                     "relevance_confidence": pre_filter_result.get("relevance_confidence"),
                     "ak_suggestion": pre_filter_result.get("ak"),
@@ -513,6 +560,7 @@ class Pipeline:
 
             # 8. Add to database
             self.db.add(item)
+            dedup.add(normalized.external_id, content_hash)
             # Store logger reference for post-flush logging
             item._processing_logger = item_logger
             # Store intra-batch duplicate reference (resolved to real ID after flush)
@@ -582,101 +630,225 @@ class Pipeline:
             # 9. Index items in vector store for semantic search (async, non-blocking)
             if self.relevance_filter and not self.training_mode:
                 indexed_ids = []
-                try:
-                    # Strip boilerplate before indexing to improve duplicate detection quality
-                    items_to_index = [
-                        {
-                            "id": str(item.id),
-                            "title": _strip_boilerplate(item.title),
-                            "content": _strip_boilerplate(item.content),
-                            "metadata": {
-                                "source": channel.source.name if channel.source else "",
-                                "priority": _get_priority_value(item.priority) if item.priority else None,
-                                "channel_id": str(channel.id),
-                            },
-                        }
-                        for item in new_items
-                    ]
-                    indexed = await self.relevance_filter.index_items_batch(items_to_index)
-                    if indexed > 0:
-                        logger.info(f"Indexed {indexed} items in vector store")
-                        # Track which items were indexed (batch indexing is all-or-nothing)
-                        indexed_ids = [item.id for item in new_items]
-                except Exception as e:
-                    logger.warning(f"Failed to index items in vector store: {e}")
 
-                # Update vectordb_indexed flag for successfully indexed items
+                def index_metadata(item: Item) -> dict:
+                    return {
+                        "source": channel.source.name if channel.source else "",
+                        "priority": _get_priority_value(item.priority) if item.priority else None,
+                        "channel_id": str(channel.id),
+                    }
+
+                # Items embedded by the scheduler's ingest call only need their
+                # new IDs confirmed; everything else is sent in full
+                to_confirm = {}
+                to_index = []
+                for item in new_items:
+                    handle = (self.pre_filter_results.get(item.external_id) or {}).get("index_handle")
+                    if handle:
+                        to_confirm[handle] = item
+                    else:
+                        to_index.append(item)
+
+                if to_confirm:
+                    try:
+                        confirmed, missing = await self.relevance_filter.confirm_index([
+                            {"handle": handle, "id": str(item.id), "metadata": index_metadata(item)}
+                            for handle, item in to_confirm.items()
+                        ])
+                        missing_set = set(missing)
+                        for handle, item in to_confirm.items():
+                            if handle in missing_set:
+                                to_index.append(item)  # Staged embedding expired
+                            else:
+                                indexed_ids.append(item.id)
+                        if confirmed > 0:
+                            logger.info(f"Confirmed {confirmed} staged items in vector store")
+                    except Exception as e:
+                        logger.warning(f"Failed to confirm staged items, re-indexing: {e}")
+                        to_index.extend(to_confirm.values())
+
+                if to_index:
+                    try:
+                        # Strip boilerplate before indexing to improve duplicate detection quality
+                        items_to_index = [
+                            {
+                                "id": str(item.id),
+                                "title": _strip_boilerplate(item.title),
+                                "content": _strip_boilerplate(item.content),
+                                "metadata": index_metadata(item),
+                            }
+                            for item in to_index
+                        ]
+                        indexed = await self.relevance_filter.index_items_batch(items_to_index)
+                        if indexed > 0:
+                            logger.info(f"Indexed {indexed} items in vector store")
+                            # Track which items were indexed (batch indexing is all-or-nothing)
+                            indexed_ids.extend(item.id for item in to_index)
+                    except Exception as e:
+                        logger.warning(f"Failed to index items in vector store: {e}")
+
+                # Mark successfully indexed items (others stay in the classifier worker's queue)
                 if indexed_ids:
                     try:
+                        indexed_at = datetime.utcnow()
                         for item in new_items:
                             if item.id in indexed_ids:
-                                item.metadata_ = item.metadata_ or {}
-                                item.metadata_["vectordb_indexed"] = True
-                                item.metadata_["vectordb_indexed_at"] = datetime.utcnow().isoformat()
+                                item.indexed_at = indexed_at
                         await self.db.commit()
                     except Exception as e:
-                        logger.warning(f"Failed to update vectordb_indexed flags: {e}")
+                        logger.warning(f"Failed to update indexed_at: {e}")
 
-            # 10. Enqueue fresh items to LLM worker for immediate processing
+            # 10. Announce fresh items to the LLM workers for immediate processing
             if not self.training_mode:
-                from services.llm_worker import enqueue_fresh_item
+                from services.llm_worker import notify_fresh_items
 
                 items_to_process = [
-                    item for item in new_items
+                    item.id for item in new_items
                     if item.needs_llm_processing
                 ]
-                for item in items_to_process:
-                    await enqueue_fresh_item(item.id)
+                await notify_fresh_items(items_to_process, db=self.db)
 
                 if items_to_process:
                     logger.info(f"Enqueued {len(items_to_process)} fresh items to LLM worker")
 
+        # 11. Release embeddings staged by the scheduler's ingest call for items
+        # that were not stored (duplicates, old items); they would never be confirmed
+        if self.relevance_filter and not self.training_mode and self.pre_filter_results:
+            stored = {item.external_id for item in new_items}
+            dropped = [
+                entry["index_handle"]
+                for external_id, entry in self.pre_filter_results.items()
+                if entry.get("index_handle") and external_id not in stored
+            ]
+            if dropped:
+                try:
+                    await self.relevance_filter.discard_index(dropped)
+                except Exception as e:
+                    # Staged entries expire on the classifier side anyway
+                    logger.debug(f"Failed to discard {len(dropped)} staged items: {e}")
+
         return new_items
 
     def _normalize_content(self, raw: RawItem) -> RawItem:
         """Normalize content (strip HTML, fix encoding, etc.)."""
-        # Normalize published_at to UTC naive datetime
-        # Database uses TIMESTAMP WITHOUT TIME ZONE, so we must strip tzinfo
-        published_at = raw.published_at
-        if published_at.tzinfo is not None:
-            # Convert to UTC first, then remove timezone info
-            published_at = published_at.astimezone(UTC).replace(tzinfo=None)
-
-        # Strip HTML tags from content
-        content = re.sub(r"<[^>]+>", "", raw.content)
-
-        # Remove control characters (except newline, tab, carriage return)
-        # This prevents issues with parsing, storing, and JSON serialization
-        content = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", content)
-
-        # Normalize whitespace
-        content = re.sub(r"\s+", " ", content).strip()
-
-        # Decode all HTML entities (numeric, hex, and named)
-        content = html_module.unescape(content)
-
-        # Strip HTML tags from title, remove control chars, normalize whitespace
-        title = re.sub(r"<[^>]+>", "", raw.title)
-        title = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", title)
-        title = re.sub(r"\s+", " ", title).strip()
-
-        # Decode all HTML entities in title
-        title = html_module.unescape(title)
-
-        return RawItem(
-            external_id=raw.external_id,
-            title=title,
-            content=content,
-            url=raw.url,
-            author=raw.author,
-            published_at=published_at,
-            metadata=raw.metadata,
-        )
+        return normalize_raw_item(raw)
 
     def _compute_hash(self, content: str) -> str:
         """Compute SHA-256 hash of content."""
         return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
+    async def _prefetch_duplicates(
+        self, candidates: list[tuple[RawItem, str]], channel: Channel
+    ) -> DedupLookup:
+        """Resolve all duplicate lookups for a batch up front.
+
+        Uses a few IN (...) queries (external_ids, content hashes, raw and
+        normalized URLs), one batched semantic duplicate search for items not
+        already searched by the scheduler's ingest call, and one existence
+        check for the semantic candidates. The per-item loop then only
+        consults the returned in-memory maps.
+
+        Args:
+            candidates: (normalized item, content hash) pairs
+            channel: Channel the items came from
+
+        Returns:
+            DedupLookup for the batch
+        """
+        dedup = DedupLookup()
+        if not candidates:
+            return dedup
+
+        # Exact duplicates: external_id within channel, content hash anywhere
+        external_ids = list({n.external_id for n, _ in candidates})
+        for chunk in _chunked(external_ids):
+            result = await self.db.execute(
+                select(Item.external_id).where(
+                    Item.channel_id == channel.id,
+                    Item.external_id.in_(chunk),
+                )
+            )
+            dedup.external_ids.update(result.scalars())
+
+        content_hashes = list({h for _, h in candidates})
+        for chunk in _chunked(content_hashes):
+            result = await self.db.execute(
+                select(Item.content_hash).where(Item.content_hash.in_(chunk))
+            )
+            dedup.content_hashes.update(result.scalars())
+
+        if self.training_mode:
+            return dedup
+
+        # URL duplicates across channels (indexed lookup on the normalized URL)
+        try:
+            urls = list({_normalize_url(n.url) for n, _ in candidates if n.url})
+            for chunk in _chunked(urls):
+                result = await self.db.execute(
+                    select(Item.url_normalized, func.min(Item.id))
+                    .where(Item.url_normalized.in_(chunk), Item.channel_id != channel.id)
+                    .group_by(Item.url_normalized)
+                )
+                dedup.url_matches.update({url: item_id for url, item_id in result.all()})
+        except Exception as e:
+            logger.warning(f"URL duplicate check failed, continuing: {e}")
+
+        if not self.relevance_filter:
+            return dedup
+
+        # Semantic duplicates: reuse ingest results, search the rest in one batch
+        to_search: list[RawItem] = []
+        for normalized, content_hash in candidates:
+            if dedup.is_duplicate(normalized.external_id, content_hash):
+                continue
+            if normalized.url and dedup.url_match(normalized.url):
+                continue
+            cached = self.pre_filter_results.get(normalized.external_id) or {}
+            if "duplicates" in cached:
+                # Already searched by the scheduler's combined ingest call
+                dedup.semantic[normalized.external_id] = [
+                    d for d in cached["duplicates"]
+                    if d.get("score", 0) >= DUPLICATE_THRESHOLD_MAYBE
+                ]
+            else:
+                to_search.append(normalized)
+
+        if to_search:
+            try:
+                # Strip boilerplate before embedding to avoid false positive similarity
+                # Use lower threshold to catch "maybe duplicates" for LLM review
+                results = await self.relevance_filter.find_duplicates_batch(
+                    [
+                        {
+                            "title": _strip_boilerplate(n.title),
+                            "content": _strip_boilerplate(n.content),
+                        }
+                        for n in to_search
+                    ],
+                    threshold=DUPLICATE_THRESHOLD_MAYBE,  # 0.60 - catches edge cases
+                )
+                for normalized, duplicates in zip(to_search, results):
+                    dedup.semantic[normalized.external_id] = duplicates
+            except Exception as e:
+                logger.warning(f"Semantic duplicate check failed, continuing: {e}")
+
+        # Verify best candidates still exist (vector index may be out of sync)
+        candidate_ids: set[int] = set()
+        for duplicates in dedup.semantic.values():
+            if duplicates:
+                try:
+                    candidate_ids.add(int(duplicates[0]["id"]))
+                except (KeyError, TypeError, ValueError):
+                    pass
+        try:
+            for chunk in _chunked(list(candidate_ids)):
+                result = await self.db.execute(select(Item.id).where(Item.id.in_(chunk)))
+                dedup.existing_ids.update(result.scalars())
+        except Exception as e:
+            logger.warning(f"Failed to verify candidate items: {e}")
+
+        return dedup
+
     async def _is_duplicate(
         self, channel_id: int, external_id: str, content_hash: str
     ) -> bool:
@@ -697,18 +869,16 @@ class Pipeline:
 
     async def _apply_rules(self, item: Item) -> None:
         """Apply matching rules and calculate priority score."""
-        # Get enabled rules
-        query = select(Rule).where(Rule.enabled == True).order_by(Rule.order)  # noqa: E712
-        result = await self.db.execute(query)
-        rules = result.scalars().all()
+        # Compiled enabled rules (cached, invalidated by the /rules endpoints)
+        rule_set = await get_rule_engine().get_rules(self.db)
+        matched_rules = set(rule_set.match(f"{item.title} {item.content}"))
 
         total_boost = 0
         target_priority = None
 
-        for rule in rules:
-            # Check non-semantic rules synchronously
+        for rule in rule_set.rules:
             if rule.rule_type != RuleType.SEMANTIC:
-                matched = self._match_rule(rule, item)
+                matched = rule in matched_rules
             else:
                 # Check semantic rules using LLM
                 matched = await self._match_semantic_rule(rule, item)
@@ -738,31 +908,13 @@ class Pipeline:
             item.priority = self._score_to_priority(item.priority_score)
 
     def _match_rule(self, rule: Rule, item: Item) -> bool:
-        """Check if rule matches item."""
-        text = f"{item.title} {item.content}".lower()
-
-        if rule.rule_type == RuleType.KEYWORD:
-            # Simple keyword matching (case-insensitive)
-            keywords = [k.strip().lower() for k in rule.pattern.split(",")]
-            return any(kw in text for kw in keywords)
+        """Check if a single keyword/regex rule matches item.
 
-        elif rule.rule_type == RuleType.REGEX:
-            # Regex matching
-            try:
-                pattern = re.compile(rule.pattern, re.IGNORECASE)
-                return bool(pattern.search(text))
-            except re.error:
-                logger.warning(f"Invalid regex in rule {rule.id}: {rule.pattern}")
-                return False
-
-        elif rule.rule_type == RuleType.SEMANTIC:
-            # LLM-based semantic matching (handled async separately)
-            # This is checked in _apply_rules_async
-            return False
-
-        return False
+        Semantic rules never match here (they are checked via the LLM).
+        """
+        return bool(compile_rules([rule]).match(f"{item.title} {item.content}"))
 
-    async def _match_semantic_rule(self, rule: Rule, item: Item) -> bool:
+    async def _match_semantic_rule(self, rule: Rule | CompiledRule, item: Item) -> bool:
         """Check if item matches a semantic rule using LLM.
 
         Args:
@@ -363,6 +363,7 @@ class ProcessingLogger:
         priority_output: Any,
         duration_ms: int | None = None,
         error_message: str | None = None,
+        llm_metrics: dict[str, Any] | None = None,
     ) -> ItemProcessingLog:
         """Log an LLM analysis step.
 
@@ -373,6 +374,8 @@ class ProcessingLogger:
             priority_output: Priority after LLM analysis
             duration_ms: Processing time in milliseconds
             error_message: Error message if analysis failed
+            llm_metrics: Streaming call metrics (provider, ttft_ms,
+                tokens_per_sec, stopped_early, completion_tokens)
 
         Returns:
             The created log entry
@@ -382,7 +385,7 @@ class ProcessingLogger:
             step_type=ProcessingStepType.LLM_ANALYSIS,
             item_id=item_id,
             model_name=settings.ollama_model,
-            model_provider="ollama",
+            model_provider=(llm_metrics or {}).get("provider") or "ollama",
             duration_ms=duration_ms,
             confidence_score=analysis.get("relevance_score"),
             priority_input=priority_input,
@@ -393,6 +396,7 @@ class ProcessingLogger:
             relevance_score=analysis.get("relevance_score"),
             success=error_message is None,
             error_message=error_message,
+            input_data={"llm_metrics": llm_metrics} if llm_metrics else None,
             output_data=analysis,
         )
 
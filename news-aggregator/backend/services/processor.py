@@ -88,16 +88,100 @@ PRIORITY_KEYWORDS = {
 }
 
 
+# Fields the analysis JSON must contain before a stream may be cut short
+ANALYSIS_REQUIRED_FIELDS = frozenset({
+    "summary", "detailed_analysis", "argumentationskette", "relevant",
+    "relevance_score", "priority", "assigned_aks", "tags", "reasoning",
+})
+
+
+class AnalysisJsonScanner:
+    """Incremental scanner for a streamed analysis JSON object.
+
+    feed() is called with each streamed chunk and returns True as soon as
+    generation can stop: either the top-level object has closed, or every
+    required field has a complete value and the model moves on to an extra
+    key. json_text then holds the parseable object (closed if cut short).
+    """
+
+    def __init__(self, required_fields: frozenset[str] = ANALYSIS_REQUIRED_FIELDS):
+        self.required_fields = required_fields
+        self.json_text: str | None = None
+        self._buffer: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect_key = False
+        self._key: list[str] | None = None
+        self._current_key: str | None = None
+        self._closed_fields: set[str] = set()
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk; return True once the analysis JSON is complete."""
+        if self.json_text is not None:
+            return True
+
+        for char in chunk:
+            if self._depth == 0:
+                # Skip anything before the object (e.g. markdown fences)
+                if char == "{":
+                    self._depth = 1
+                    self._expect_key = True
+                    self._buffer.append(char)
+                continue
+
+            self._buffer.append(char)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._key is not None:
+                        self._current_key = "".join(self._key)
+                        self._key = None
+                elif self._key is not None:
+                    self._key.append(char)
+                continue
+
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect_key:
+                    self._key = []
+                    self._expect_key = False
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.json_text = "".join(self._buffer)
+                    return True
+            elif char == "," and self._depth == 1:
+                if self._current_key is not None:
+                    self._closed_fields.add(self._current_key)
+                if self.required_fields <= self._closed_fields:
+                    # Everything we need is closed; drop the comma and close the object
+                    self.json_text = "".join(self._buffer[:-1]) + "}"
+                    return True
+                self._expect_key = True
+
+        return False
+
+
 class ItemProcessor:
     """LLM-based processor for item summarization and analysis."""
 
-    def __init__(self, llm_service: LLMService):
+    def __init__(self, llm_service: LLMService, streaming: bool = False):
         """Initialize processor with LLM service.
 
         Args:
             llm_service: LLM service for text generation
+            streaming: Stream analysis responses and stop once the JSON is complete
         """
         self.llm = llm_service
+        self.streaming = streaming
 
     async def confirm_duplicate(
         self,
@@ -234,12 +318,7 @@ Datum: {date_str}"""
 
         try:
             # Use system prompt for base models (Option B approach)
-            response = await self.llm.complete(
-                prompt,
-                system=ANALYSIS_SYSTEM_PROMPT,
-                temperature=0.1,
-                max_tokens=6000,  # Sufficient headroom for full JSON response
-            )
+            response = await self._complete_analysis(prompt)
             return self._parse_analysis_response(response)
 
         except Exception as e:
@@ -270,12 +349,7 @@ Quelle: {source_name}
 Datum: {date_str}"""
 
         try:
-            response = await self.llm.complete(
-                prompt,
-                system=ANALYSIS_SYSTEM_PROMPT,
-                temperature=0.1,
-                max_tokens=6000,
-            )
+            response = await self._complete_analysis(prompt)
             return self._parse_analysis_response(response)
 
         except Exception as e:
@@ -308,13 +382,15 @@ Datum: {date_str}"""
         ]
 
         try:
-            response = await self.llm.complete(
-                prompt,
-                system=ANALYSIS_SYSTEM_PROMPT,
-                temperature=0.1,
-                max_tokens=6000,
-            )
+            response = await self._complete_analysis(prompt)
             analysis = self._parse_analysis_response(response)
+            if response.metadata.get("streamed"):
+                # Latency instrumentation for ProcessingLogger (popped by the LLM worker)
+                analysis["llm_metrics"] = {
+                    key: response.metadata.get(key)
+                    for key in ("provider", "ttft_ms", "tokens_per_sec", "stopped_early")
+                }
+                analysis["llm_metrics"]["completion_tokens"] = response.completion_tokens
             # Build full conversation for follow-up
             conversation = messages + [{"role": "assistant", "content": response.text}]
             return analysis, conversation
@@ -323,6 +399,34 @@ Datum: {date_str}"""
             logger.error(f"Analysis from data (with messages) failed: {e}")
             return self._default_analysis(), messages
 
+    async def _complete_analysis(self, prompt: str) -> LLMResponse:
+        """Run the analysis prompt.
+
+        In streaming mode generation is stopped as soon as the analysis JSON
+        is complete, and the response text is the (closed) JSON object.
+        """
+        if not self.streaming:
+            return await self.llm.complete(
+                prompt,
+                system=ANALYSIS_SYSTEM_PROMPT,
+                temperature=0.1,
+                max_tokens=6000,  # Sufficient headroom for full JSON response
+            )
+
+        scanner = AnalysisJsonScanner()
+        response = await self.llm.stream_chat(
+            [
+                {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.1,
+            max_tokens=6000,
+            stop_when=scanner.feed,
+        )
+        if scanner.json_text is not None:
+            response = response.model_copy(update={"text": scanner.json_text})
+        return response
+
     async def check_semantic_rule(self, item: Item, rule: Rule) -> bool:
         """Check if item matches a semantic (LLM-based) rule.
 
@@ -582,12 +686,43 @@ async def is_llm_enabled() -> bool:
     return settings.llm_enabled
 
 
+# Providers shared by all processors so their pooled HTTP clients (and
+# keep-alive connections) survive across fetch runs and worker batches.
+# Keyed by provider name; replaced (and closed) when the config changes.
+_shared_providers: dict[str, tuple[tuple, Any]] = {}
+
+
+async def _get_shared_provider(name: str, config: tuple, factory):
+    """Return the cached provider for name, recreating it if config changed."""
+    cached = _shared_providers.get(name)
+    if cached is not None:
+        cached_config, provider = cached
+        if cached_config == config:
+            return provider
+        await provider.close()
+    provider = factory()
+    _shared_providers[name] = (config, provider)
+    return provider
+
+
+async def close_llm_providers() -> None:
+    """Close pooled HTTP clients of all shared LLM providers."""
+    for _, provider in list(_shared_providers.values()):
+        try:
+            await provider.close()
+        except Exception as e:
+            logger.warning(f"Error closing {provider.provider_name} client: {e}")
+    _shared_providers.clear()
+
+
 async def create_processor_from_settings() -> ItemProcessor | None:
     """Create processor instance from application settings.
 
     Returns:
         Configured ItemProcessor instance, or None if LLM is disabled
     """
+    import httpx
+
     from config import settings
     from .llm import OllamaProvider, OpenRouterProvider, LLMService
 
@@ -597,26 +732,55 @@ async def create_processor_from_settings() -> ItemProcessor | None:
         logging.getLogger(__name__).info("LLM processing disabled (env or runtime setting)")
         return None
 
+    limits = httpx.Limits(
+        max_connections=settings.llm_http_max_connections,
+        max_keepalive_connections=settings.llm_http_max_keepalive,
+        keepalive_expiry=settings.llm_http_keepalive_expiry,
+    )
+    pool_config = (
+        settings.llm_http_max_connections,
+        settings.llm_http_max_keepalive,
+        settings.llm_http_keepalive_expiry,
+        settings.llm_http2,
+    )
+
     providers = []
 
     # Add Ollama as primary provider
     providers.append(
-        OllamaProvider(
-            base_url=settings.ollama_base_url,
-            model=settings.ollama_model,
-            timeout=settings.ollama_timeout,
+        await _get_shared_provider(
+            "ollama",
+            (settings.ollama_base_url, settings.ollama_model, settings.ollama_timeout, pool_config),
+            lambda: OllamaProvider(
+                base_url=settings.ollama_base_url,
+                model=settings.ollama_model,
+                timeout=settings.ollama_timeout,
+                limits=limits,
+                http2=settings.llm_http2,
+            ),
         )
     )
 
     # Add OpenRouter as fallback if configured
     if settings.openrouter_api_key:
         providers.append(
-            OpenRouterProvider(
-                api_key=settings.openrouter_api_key,
-                model=settings.openrouter_model,
-                timeout=settings.openrouter_timeout,
+            await _get_shared_provider(
+                "openrouter",
+                (
+                    settings.openrouter_api_key,
+                    settings.openrouter_model,
+                    settings.openrouter_timeout,
+                    pool_config,
+                ),
+                lambda: OpenRouterProvider(
+                    api_key=settings.openrouter_api_key,
+                    model=settings.openrouter_model,
+                    timeout=settings.openrouter_timeout,
+                    limits=limits,
+                    http2=settings.llm_http2,
+                ),
             )
         )
 
     llm_service = LLMService(providers)
-    return ItemProcessor(llm_service)
+    return ItemProcessor(llm_service, streaming=settings.llm_streaming)
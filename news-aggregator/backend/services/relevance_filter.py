@@ -21,6 +21,9 @@ class RelevanceFilter:
     Uses a singleton httpx.AsyncClient for connection pooling and efficiency.
     """
 
+    # Max items per /classify/batch request (keeps GPU memory and payload bounded)
+    CLASSIFY_BATCH_SIZE = 64
+
     def __init__(self, base_url: str, threshold: float = 0.75, timeout: int = 30):
         """
         Initialize the relevance filter.
@@ -79,6 +82,55 @@ class RelevanceFilter:
         response.raise_for_status()
         return response.json()
 
+    async def classify_batch(self, items: list[dict]) -> list[dict]:
+        """
+        Classify multiple articles using the /classify/batch endpoint.
+
+        Items are sent in chunks of CLASSIFY_BATCH_SIZE; each chunk is
+        embedded in a single forward pass on the classifier side.
+
+        Args:
+            items: List of dicts with keys: title, content, source (optional)
+
+        Returns:
+            List of classification dicts in the same order as items
+
+        Raises:
+            httpx.RequestError: If the classifier service is unavailable
+        """
+        client = await self._get_client()
+        results: list[dict] = []
+        for i in range(0, len(items), self.CLASSIFY_BATCH_SIZE):
+            chunk = items[i:i + self.CLASSIFY_BATCH_SIZE]
+            response = await client.post(
+                f"{self.base_url}/classify/batch",
+                json={
+                    "items": [
+                        {
+                            "title": item["title"],
+                            "content": item["content"],
+                            "source": item.get("source", ""),
+                        }
+                        for item in chunk
+                    ],
+                },
+                timeout=max(self.timeout, 60.0),
+            )
+            response.raise_for_status()
+            results.extend(response.json().get("results", []))
+        return results
+
+    def _decide(self, title: str, result: dict) -> bool:
+        """Return False if the classification is confidently irrelevant."""
+        # If clearly irrelevant (high confidence), skip LLM
+        if not result["relevant"] and result["relevance_confidence"] < (1 - self.threshold):
+            logger.info(
+                f"Pre-filtered as irrelevant: {title[:50]}... "
+                f"(confidence: {1 - result['relevance_confidence']:.1%})"
+            )
+            return False
+        return True
+
     async def should_process(
         self,
         title: str,
@@ -95,21 +147,151 @@ class RelevanceFilter:
         """
         try:
             result = await self.classify(title, content, source)
+            return self._decide(title, result), result
+
+        except httpx.RequestError as e:
+            # If classifier unavailable, process anyway (fail open)
+            logger.warning(f"Classifier unavailable, processing anyway: {e}")
+            return True, None
 
-            # If clearly irrelevant (high confidence), skip LLM
-            if not result["relevant"] and result["relevance_confidence"] < (1 - self.threshold):
-                logger.info(
-                    f"Pre-filtered as irrelevant: {title[:50]}... "
-                    f"(confidence: {1 - result['relevance_confidence']:.1%})"
-                )
-                return False, result
+    async def should_process_batch(
+        self,
+        items: list[dict],
+    ) -> list[tuple[bool, dict | None]]:
+        """
+        Batch variant of should_process.
+
+        Args:
+            items: List of dicts with keys: title, content, source (optional)
 
-            return True, result
+        Returns:
+            List of (should_process, classification or None) in input order.
+            Fails open (True, None) for every item if the classifier is unavailable.
+        """
+        if not items:
+            return []
 
+        try:
+            results = await self.classify_batch(items)
         except httpx.RequestError as e:
             # If classifier unavailable, process anyway (fail open)
             logger.warning(f"Classifier unavailable, processing anyway: {e}")
-            return True, None
+            return [(True, None)] * len(items)
+
+        return [
+            (self._decide(item["title"], result), result)
+            for item, result in zip(items, results)
+        ]
+
+    async def ingest_batch(
+        self,
+        items: list[dict],
+        threshold: float = 0.75,
+        n_results: int = 5,
+    ) -> list[dict]:
+        """
+        Classify, find duplicates and stage indexing via the /ingest endpoint.
+
+        Each item's text is sent and embedded once. The returned index_handle
+        is passed to confirm_index() after the item is committed.
+
+        Args:
+            items: List of dicts with keys: title, content, source (optional)
+            threshold: Duplicate similarity threshold
+            n_results: Max duplicate candidates per item
+
+        Returns:
+            List of dicts in input order with keys: should_process,
+            classification (or None), duplicates, index_handle
+
+        Raises:
+            httpx.RequestError / httpx.HTTPStatusError: If the call fails
+        """
+        client = await self._get_client()
+        results: list[dict] = []
+        for i in range(0, len(items), self.CLASSIFY_BATCH_SIZE):
+            chunk = items[i:i + self.CLASSIFY_BATCH_SIZE]
+            response = await client.post(
+                f"{self.base_url}/ingest",
+                json={
+                    "items": [
+                        {
+                            "title": item["title"],
+                            "content": item["content"],
+                            "source": item.get("source", ""),
+                        }
+                        for item in chunk
+                    ],
+                    "threshold": threshold,
+                    "n_results": n_results,
+                },
+                timeout=max(self.timeout, 60.0),
+            )
+            response.raise_for_status()
+            for item, result in zip(chunk, response.json().get("results", [])):
+                classification = result.get("classification")
+                results.append({
+                    "should_process": (
+                        self._decide(item["title"], classification) if classification else True
+                    ),
+                    "classification": classification,
+                    "duplicates": result.get("duplicates", []),
+                    "index_handle": result.get("index_handle"),
+                })
+        return results
+
+    async def confirm_index(self, items: list[dict]) -> tuple[int, list[str]]:
+        """
+        Index items staged by ingest_batch under their database IDs.
+
+        Args:
+            items: List of dicts with keys: handle, id, metadata (optional)
+
+        Returns:
+            Tuple of (indexed_count, missing_handles). Missing handles have
+            expired on the classifier side and must be indexed via
+            index_items_batch instead.
+
+        Raises:
+            httpx.RequestError / httpx.HTTPStatusError: If the call fails
+        """
+        if not items:
+            return 0, []
+
+        client = await self._get_client()
+        response = await client.post(
+            f"{self.base_url}/index/confirm",
+            json={"items": items},
+            timeout=60.0,
+        )
+        response.raise_for_status()
+        result = response.json()
+        return result.get("indexed", 0), result.get("missing_handles", [])
+
+    async def discard_index(self, handles: list[str]) -> int:
+        """
+        Drop items staged by ingest_batch that will not be confirmed.
+
+        Args:
+            handles: index_handle values from ingest_batch
+
+        Returns:
+            Number of staged items that were dropped
+
+        Raises:
+            httpx.RequestError / httpx.HTTPStatusError: If the call fails
+        """
+        if not handles:
+            return 0
+
+        client = await self._get_client()
+        response = await client.post(
+            f"{self.base_url}/index/discard",
+            json={"handles": handles},
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        return response.json().get("discarded", 0)
 
     async def is_available(self) -> bool:
         """Check if the classifier service is available."""
@@ -310,6 +492,46 @@ class RelevanceFilter:
             logger.warning(f"Duplicate search failed: {e}")
             return []
 
+    async def find_duplicates_batch(
+        self,
+        items: list[dict],
+        threshold: float = 0.75,
+    ) -> list[list[dict]]:
+        """
+        Find semantic duplicates for many items via /find-duplicates/batch.
+
+        Items are sent in chunks of CLASSIFY_BATCH_SIZE; each chunk is
+        embedded in one pass and searched with one vector-store query.
+
+        Args:
+            items: List of dicts with keys: title, content
+            threshold: Similarity threshold (default 0.75)
+
+        Returns:
+            One list of duplicate candidates per item, in the same order
+
+        Raises:
+            httpx.HTTPError: If the classifier service is unavailable
+        """
+        client = await self._get_client()
+        results: list[list[dict]] = []
+        for i in range(0, len(items), self.CLASSIFY_BATCH_SIZE):
+            chunk = items[i:i + self.CLASSIFY_BATCH_SIZE]
+            response = await client.post(
+                f"{self.base_url}/find-duplicates/batch",
+                json={
+                    "items": [
+                        {"title": item["title"], "content": item["content"]}
+                        for item in chunk
+                    ],
+                    "threshold": threshold,
+                },
+                timeout=max(self.timeout, 60.0),
+            )
+            response.raise_for_status()
+            results.extend(response.json().get("results", []))
+        return results
+
     async def get_all_indexed_ids(self) -> list[str]:
         """
         Get all item IDs currently indexed in the vector store.
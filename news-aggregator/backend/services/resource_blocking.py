@@ -0,0 +1,224 @@
+"""Request interception for Playwright scrapers.
+
+Scrapers only need the DOM (and the scripts that build it), but a full page
+load also pulls images, video, fonts and third-party trackers, all of it
+through our proxies. block_resources() installs a route handler on a
+BrowserContext that aborts:
+
+- requests of a blocked resource type (BROWSER_BLOCKED_RESOURCE_TYPES)
+- requests to known ad/analytics hosts (BLOCKED_HOSTS, suffix match)
+
+BROWSER_RESOURCE_ALLOWLIST exempts resources per connector: entries
+containing a dot are host suffixes, anything else is a resource type.
+
+The returned PageFetchMetrics counts requests, blocked requests, bytes
+received and page-load time for one fetch; finish() logs them and adds them
+to per-connector totals reported by the browser pool health check. Response
+sizes are looked up asynchronously after each request finishes, so finish()
+waits for the pending lookups and must be awaited before the context closes.
+
+Note: Playwright disables the HTTP cache for routed contexts.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Ad, analytics and tracking hosts (suffix match on the request host)
+BLOCKED_HOSTS = frozenset({
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "adnxs.com",
+    "criteo.com",
+    "criteo.net",
+    "taboola.com",
+    "outbrain.com",
+    "scorecardresearch.com",
+    "chartbeat.com",
+    "chartbeat.net",
+    "hotjar.com",
+    "facebook.net",
+    "ads-twitter.com",
+    "analytics.twitter.com",
+    "ioam.de",
+    "xiti.com",
+    "cxense.com",
+    "adsrvr.org",
+    "rubiconproject.com",
+    "pubmatic.com",
+    "yieldlab.net",
+    "smartadserver.com",
+})
+
+
+def _host_matches(host: str, suffixes: frozenset[str]) -> bool:
+    """True if host equals or is a subdomain of one of the suffixes."""
+    parts = host.split(".")
+    return any(".".join(parts[i:]) in suffixes for i in range(len(parts) - 1))
+
+
+@dataclass(frozen=True)
+class BlockingProfile:
+    """What one connector's browser contexts may load."""
+
+    blocked_types: frozenset[str]
+    blocked_hosts: frozenset[str] = BLOCKED_HOSTS
+    allowed_types: frozenset[str] = frozenset()
+    allowed_hosts: frozenset[str] = frozenset()
+
+    @classmethod
+    def for_connector(cls, connector: str) -> "BlockingProfile":
+        """Build the profile from settings (global block list plus the connector's allowlist)."""
+        allowlist = settings.browser_resource_allowlist.get(connector, [])
+        return cls(
+            blocked_types=frozenset(settings.browser_blocked_resource_types),
+            allowed_types=frozenset(a for a in allowlist if "." not in a),
+            allowed_hosts=frozenset(a.lower() for a in allowlist if "." in a),
+        )
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type == "document":
+            # Never block navigations (the page itself or its frames)
+            return False
+        host = (urlparse(url).hostname or "").lower()
+        if self.allowed_hosts and _host_matches(host, self.allowed_hosts):
+            return False
+        if resource_type in self.blocked_types and resource_type not in self.allowed_types:
+            return True
+        return _host_matches(host, self.blocked_hosts)
+
+
+@dataclass
+class PageFetchMetrics:
+    """Network totals and page-load time of one scraper fetch."""
+
+    connector: str
+    requests: int = 0
+    blocked: int = 0
+    bytes_received: int = 0
+    page_loads: int = 0
+    load_seconds: float = 0.0
+    _size_lookups: set[asyncio.Task] = field(default_factory=set, repr=False)
+
+    def on_request_finished(self, request) -> None:
+        """requestfinished handler: add the response size once it is known."""
+        task = asyncio.get_running_loop().create_task(self._add_size(request))
+        self._size_lookups.add(task)
+        task.add_done_callback(self._size_lookups.discard)
+
+    async def _add_size(self, request) -> None:
+        try:
+            sizes = await request.sizes()
+            self.bytes_received += sizes["responseBodySize"] + sizes["responseHeadersSize"]
+        except Exception:
+            # Page or context already closed
+            pass
+
+    async def goto(self, page, url: str, **kwargs):
+        """page.goto() with the time until the wait_until event recorded."""
+        start = time.monotonic()
+        try:
+            return await page.goto(url, **kwargs)
+        finally:
+            self.page_loads += 1
+            self.load_seconds += time.monotonic() - start
+
+    async def finish(self, timeout: float = 5.0) -> None:
+        """Log this fetch and add it to the per-connector totals.
+
+        Waits up to `timeout` seconds for response sizes still being looked
+        up; lookups that do not finish in time are not counted.
+        """
+        if self._size_lookups:
+            _, pending = await asyncio.wait(set(self._size_lookups), timeout=timeout)
+            for task in pending:
+                task.cancel()
+        totals = _totals.setdefault(self.connector, {
+            "fetches": 0,
+            "requests": 0,
+            "blocked": 0,
+            "bytes_received": 0,
+            "page_loads": 0,
+            "load_seconds": 0.0,
+        })
+        totals["fetches"] += 1
+        totals["requests"] += self.requests
+        totals["blocked"] += self.blocked
+        totals["bytes_received"] += self.bytes_received
+        totals["page_loads"] += self.page_loads
+        totals["load_seconds"] += self.load_seconds
+        logger.info(
+            f"{self.connector} fetch: {self.requests} requests ({self.blocked} blocked), "
+            f"{self.bytes_received / 1024:.0f} KB, "
+            f"{self.page_loads} page loads in {self.load_seconds:.1f}s"
+        )
+
+
+# Per-connector totals since process start
+_totals: dict[str, dict] = {}
+
+
+async def block_resources(context, connector: str) -> PageFetchMetrics:
+    """Install resource blocking and byte accounting on a BrowserContext.
+
+    Args:
+        context: Playwright BrowserContext (before pages are opened)
+        connector: Connector type, selects the allowlist
+
+    Returns:
+        Metrics for this fetch (await finish() before closing the context)
+    """
+    metrics = PageFetchMetrics(connector=connector)
+    context.on("requestfinished", metrics.on_request_finished)
+
+    if not settings.browser_block_resources:
+        def on_request(request) -> None:
+            metrics.requests += 1
+
+        context.on("request", on_request)
+        return metrics
+
+    profile = BlockingProfile.for_connector(connector)
+
+    async def handle_route(route) -> None:
+        request = route.request
+        metrics.requests += 1
+        if profile.should_block(request.resource_type, request.url):
+            metrics.blocked += 1
+            await route.abort("blockedbyclient")
+        else:
+            await route.continue_()
+
+    await context.route("**/*", handle_route)
+    return metrics
+
+
+def get_page_fetch_stats() -> dict[str, dict]:
+    """Per-connector totals with averages per fetch."""
+    stats = {}
+    for connector, totals in _totals.items():
+        fetches = totals["fetches"] or 1
+        stats[connector] = {
+            **totals,
+            "load_seconds": round(totals["load_seconds"], 1),
+            "avg_kb_per_fetch": round(totals["bytes_received"] / fetches / 1024, 1),
+            "avg_load_seconds": round(
+                totals["load_seconds"] / totals["page_loads"], 2
+            ) if totals["page_loads"] else None,
+            "blocked_ratio": round(
+                totals["blocked"] / totals["requests"], 3
+            ) if totals["requests"] else 0.0,
+        }
+    return stats
@@ -0,0 +1,204 @@
+"""Chunked retention purge.
+
+Items past their per-priority retention (housekeeping config) are deleted in
+bounded batches instead of one DELETE with every ID:
+
+    DELETE FROM items WHERE id IN (
+        SELECT id FROM items WHERE <retention condition>
+        ORDER BY fetched_at LIMIT :batch FOR UPDATE SKIP LOCKED
+    ) RETURNING id
+
+- Each batch is its own short transaction, including the cascades into
+  item_events, item_processing_logs and item_rule_matches, so the items
+  table is never locked for the whole purge
+- The returned IDs go to the vector indexes (classifier /delete) right away,
+  so memory is bounded by one batch
+- The purge pauses PURGE_BATCH_PAUSE_SECONDS between batches to leave room
+  for the pipeline and API requests
+- Progress is published with the worker stats ("purge"), so any worker can
+  report it (GET /admin/housekeeping/cleanup/status)
+
+SKIP LOCKED makes a concurrent purge in another process skip rows this one
+is deleting instead of waiting for them.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from database import async_session_maker
+from models import Item, Priority
+
+logger = logging.getLogger(__name__)
+
+# Priority levels and their housekeeping config keys, in purge order
+RETENTION_KEYS = [
+    (Priority.HIGH, "retention_days_high"),
+    (Priority.MEDIUM, "retention_days_medium"),
+    (Priority.LOW, "retention_days_low"),
+    (Priority.NONE, "retention_days_none"),
+]
+# Seconds between progress updates written to the DB
+PROGRESS_INTERVAL = 2.0
+
+# One purge per process at a time
+_purge_lock = asyncio.Lock()
+
+
+def retention_conditions(priority: Priority, config: dict, now: datetime) -> list:
+    """WHERE conditions selecting the expired items of one priority."""
+    cutoff = now - timedelta(days=config.get(dict(RETENTION_KEYS)[priority], 30))
+    conditions = [
+        Item.priority == priority,
+        Item.fetched_at < cutoff,
+    ]
+    if config.get("exclude_starred", True):
+        conditions.append(Item.is_starred == False)  # noqa: E712
+    return conditions
+
+
+def delete_batch_statement(conditions: list, batch_size: int):
+    """DELETE ... RETURNING id for up to batch_size of the oldest matching items."""
+    batch = (
+        select(Item.id)
+        .where(*conditions)
+        .order_by(Item.fetched_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    return (
+        delete(Item)
+        .where(Item.id.in_(batch.scalar_subquery()))
+        .returning(Item.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def count_expired(db: AsyncSession, conditions: list) -> int:
+    """Number of items matching retention conditions."""
+    return await db.scalar(select(func.count(Item.id)).where(*conditions)) or 0
+
+
+async def _publish(status: dict[str, Any]) -> None:
+    """Write purge progress to the worker stats."""
+    from services.worker_status import write_stats
+
+    await write_stats("purge", status)
+
+
+async def _delete_vectors(relevance_filter, ids: list[int], status: dict[str, Any]) -> None:
+    """Remove one batch of deleted items from the vector indexes."""
+    deleted_search, deleted_dup = await relevance_filter.delete_items([str(i) for i in ids])
+    status["vector_deleted"] += max(deleted_search, deleted_dup)
+
+
+async def purge_items(
+    config: dict,
+    trigger: str = "manual",
+    batch_size: int | None = None,
+    pause: float | None = None,
+) -> dict[str, Any]:
+    """Delete items past their retention period in batches.
+
+    Args:
+        config: Housekeeping configuration (retention days, exclude_starred)
+        trigger: "manual" or "scheduled" (reported in the progress)
+        batch_size: Items per batch (default: PURGE_BATCH_SIZE)
+        pause: Seconds between batches (default: PURGE_BATCH_PAUSE_SECONDS)
+
+    Returns:
+        Final status with deleted, by_priority, batches and vector_deleted
+    """
+    from services.relevance_filter import create_relevance_filter
+
+    batch_size = batch_size or settings.purge_batch_size
+    pause = settings.purge_batch_pause_seconds if pause is None else pause
+
+    async with _purge_lock:
+        now = datetime.utcnow()
+        start = time.monotonic()
+        plan = [
+            (priority, retention_conditions(priority, config, now))
+            for priority, _ in RETENTION_KEYS
+        ]
+
+        async with async_session_maker() as db:
+            total = sum([await count_expired(db, conditions) for _, conditions in plan])
+
+        status: dict[str, Any] = {
+            "running": True,
+            "trigger": trigger,
+            "started_at": now.isoformat(),
+            "finished_at": None,
+            "total": total,
+            "deleted": 0,
+            "by_priority": {},
+            "batches": 0,
+            "vector_deleted": 0,
+            "current_priority": None,
+            "error": None,
+        }
+        await _publish(status)
+        logger.info(f"Retention purge ({trigger}) started: {total} items, batches of {batch_size}")
+
+        try:
+            relevance_filter = await create_relevance_filter() if total else None
+        except Exception as e:
+            logger.warning(f"Vector index cleanup unavailable: {e}")
+            relevance_filter = None
+
+        last_publish = time.monotonic()
+        try:
+            for priority, conditions in plan:
+                status["current_priority"] = priority.value
+                while True:
+                    async with async_session_maker() as db:
+                        result = await db.execute(delete_batch_statement(conditions, batch_size))
+                        ids = [row[0] for row in result]
+                        await db.commit()
+                    if not ids:
+                        break
+
+                    status["batches"] += 1
+                    status["deleted"] += len(ids)
+                    by_priority = status["by_priority"]
+                    by_priority[priority.value] = by_priority.get(priority.value, 0) + len(ids)
+                    if relevance_filter is not None:
+                        await _delete_vectors(relevance_filter, ids, status)
+
+                    if time.monotonic() - last_publish >= PROGRESS_INTERVAL:
+                        await _publish(status)
+                        last_publish = time.monotonic()
+                    if len(ids) < batch_size:
+                        break
+                    await asyncio.sleep(pause)
+        except Exception as e:
+            status["error"] = str(e)
+            logger.error(f"Retention purge failed after {status['deleted']} items: {e}")
+            raise
+        finally:
+            status["running"] = False
+            status["current_priority"] = None
+            status["finished_at"] = datetime.utcnow().isoformat()
+            status["seconds"] = round(time.monotonic() - start, 1)
+            await _publish(status)
+
+        logger.info(
+            f"Retention purge ({trigger}) completed: deleted {status['deleted']} items "
+            f"in {status['batches']} batches ({status['by_priority']}), "
+            f"{status['vector_deleted']} removed from vector indexes"
+        )
+        return status
+
+
+async def get_purge_status() -> dict[str, Any]:
+    """Progress of the running (or last) purge, from any worker."""
+    from services.worker_status import read_stats
+
+    return await read_stats("purge")
@@ -0,0 +1,241 @@
+"""Compiled rule engine for keyword/regex priority rules.
+
+Enabled rules are loaded once and compiled:
+- All keyword rules go into a single trie of their (lower-cased) keywords.
+  The trie is rendered as one regular expression so the scan runs in the C
+  regex engine. Each search reports the longest keyword starting at a
+  position and the next search resumes one character later; each keyword
+  knows which shorter keywords are its prefixes. One pass over the text
+  therefore yields every keyword hit, including overlapping ones ("kita"
+  inside "kitas", "tag" inside "landtag").
+- Regex rules are pre-compiled once (invalid patterns are dropped with a warning).
+
+The compiled set is cached per process. The /rules endpoints call
+invalidate_rules() after every change, which also notifies the other
+processes over the event bus; without it they pick changes up after
+RULE_CACHE_TTL seconds.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Priority, Rule, RuleType
+
+logger = logging.getLogger(__name__)
+
+# Max age of the cached rule set before it is reloaded (covers changes made
+# through another worker process)
+RULE_CACHE_TTL = 30.0
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """Detached snapshot of a Rule row (safe to share across sessions)."""
+
+    id: int | None
+    name: str
+    rule_type: RuleType
+    pattern: str
+    priority_boost: int
+    target_priority: Priority | None
+    order: int
+
+    @classmethod
+    def from_rule(cls, rule: Rule) -> "CompiledRule":
+        return cls(
+            id=rule.id,
+            name=rule.name,
+            rule_type=rule.rule_type,
+            pattern=rule.pattern,
+            priority_boost=rule.priority_boost or 0,
+            target_priority=rule.target_priority,
+            order=rule.order or 0,
+        )
+
+
+def _trie_regex(node: dict) -> str:
+    """Render a character trie as a regex matching the longest keyword."""
+    terminal = "" in node
+    branches = [re.escape(ch) + _trie_regex(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if terminal:
+        # Greedy optional: prefer the longer keyword, fall back to this one
+        return "(?:" + body + ")?"
+    return body
+
+
+class KeywordMatcher:
+    """Trie over all keywords, scanned in a single pass."""
+
+    def __init__(self, keywords: dict[str, set[int]]):
+        """
+        Args:
+            keywords: Lower-cased keyword -> indexes of the rules that use it
+        """
+        self._rules_by_keyword: dict[str, frozenset[int]] = {}
+        self._regex: re.Pattern | None = None
+        if not keywords:
+            return
+
+        trie: dict = {}
+        for keyword in keywords:
+            node = trie
+            for ch in keyword:
+                node = node.setdefault(ch, {})
+            node[""] = True
+
+        # Every prefix of a keyword that is itself a keyword also occurs
+        # wherever the longer keyword occurs
+        for keyword in keywords:
+            hits: set[int] = set()
+            for end in range(1, len(keyword) + 1):
+                hits |= keywords.get(keyword[:end], set())
+            self._rules_by_keyword[keyword] = frozenset(hits)
+
+        self._regex = re.compile(_trie_regex(trie))
+
+    def match(self, text: str) -> set[int]:
+        """Return the indexes of all rules with a keyword in text (lower-cased)."""
+        if self._regex is None:
+            return set()
+        hits: set[int] = set()
+        seen: set[str] = set()
+        pos = 0
+        while (m := self._regex.search(text, pos)) is not None:
+            keyword = m.group()
+            if keyword not in seen:
+                seen.add(keyword)
+                hits |= self._rules_by_keyword[keyword]
+            # Resume inside the match to catch overlapping keywords
+            pos = m.start() + 1
+        return hits
+
+
+@dataclass
+class CompiledRuleSet:
+    """Enabled rules in evaluation order plus their compiled matchers."""
+
+    rules: list[CompiledRule]
+    keyword_matcher: KeywordMatcher
+    regexes: list[tuple[int, re.Pattern]] = field(default_factory=list)
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    def match(self, text: str) -> list[CompiledRule]:
+        """Return all keyword/regex rules matching text, in rule order.
+
+        Semantic rules are never returned; they need the LLM and are
+        checked separately by the caller.
+        """
+        text = text.lower()
+        hits = self.keyword_matcher.match(text)
+        for index, pattern in self.regexes:
+            if pattern.search(text):
+                hits.add(index)
+        return [self.rules[i] for i in sorted(hits)]
+
+    @property
+    def semantic_rules(self) -> list[CompiledRule]:
+        return [r for r in self.rules if r.rule_type == RuleType.SEMANTIC]
+
+
+def compile_rules(rules: list[Rule] | list[CompiledRule]) -> CompiledRuleSet:
+    """Compile rules (already in evaluation order) into a CompiledRuleSet."""
+    compiled = [r if isinstance(r, CompiledRule) else CompiledRule.from_rule(r) for r in rules]
+
+    keywords: dict[str, set[int]] = {}
+    regexes: list[tuple[int, re.Pattern]] = []
+    for index, rule in enumerate(compiled):
+        if rule.rule_type == RuleType.KEYWORD:
+            for keyword in rule.pattern.split(","):
+                keyword = keyword.strip().lower()
+                if keyword:
+                    keywords.setdefault(keyword, set()).add(index)
+        elif rule.rule_type == RuleType.REGEX:
+            try:
+                regexes.append((index, re.compile(rule.pattern, re.IGNORECASE)))
+            except re.error:
+                logger.warning(f"Invalid regex in rule {rule.id}: {rule.pattern}")
+
+    return CompiledRuleSet(
+        rules=compiled,
+        keyword_matcher=KeywordMatcher(keywords),
+        regexes=regexes,
+    )
+
+
+class RuleEngine:
+    """Per-process cache of the compiled enabled rule set."""
+
+    def __init__(self, ttl: float = RULE_CACHE_TTL):
+        self.ttl = ttl
+        self._rule_set: CompiledRuleSet | None = None
+        self._lock = asyncio.Lock()
+        self._generation = 0
+        self.loads = 0
+
+    def invalidate(self) -> None:
+        """Drop the cached rule set (next get_rules() reloads it)."""
+        self._generation += 1
+        self._rule_set = None
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._rule_set is not None
+            and time.monotonic() - self._rule_set.loaded_at < self.ttl
+        )
+
+    async def get_rules(self, db: AsyncSession) -> CompiledRuleSet:
+        """Return the compiled enabled rules, loading them if needed."""
+        if self._is_fresh():
+            return self._rule_set
+
+        async with self._lock:
+            if self._is_fresh():
+                return self._rule_set
+
+            generation = self._generation
+            query = select(Rule).where(Rule.enabled == True).order_by(Rule.order)  # noqa: E712
+            result = await db.execute(query)
+            rule_set = compile_rules(list(result.scalars().all()))
+            if generation == self._generation:
+                # Don't cache a set that was invalidated while loading
+                self._rule_set = rule_set
+            self.loads += 1
+            logger.debug(f"Compiled {len(rule_set.rules)} enabled rules")
+            return rule_set
+
+
+_engine: RuleEngine | None = None
+
+
+def get_rule_engine() -> RuleEngine:
+    """Get the process-wide rule engine."""
+    global _engine
+    if _engine is None:
+        _engine = RuleEngine()
+    return _engine
+
+
+def invalidate_rules() -> None:
+    """Signal that rules changed (called by the /rules endpoints).
+
+    Drops this process's cache and sends a rules_changed event so the other
+    processes drop theirs instead of waiting for the TTL.
+    """
+    from services.event_bus import EVENT_RULES_CHANGED, get_event_bus
+
+    get_rule_engine().invalidate()
+    get_event_bus().publish_soon(EVENT_RULES_CHANGED)
+
+
+def on_rules_changed(event: dict) -> None:
+    """rules_changed event handler."""
+    get_rule_engine().invalidate()
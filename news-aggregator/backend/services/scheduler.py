@@ -4,15 +4,22 @@ import asyncio
 import logging
 from collections import defaultdict
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import or_, select
+from sqlalchemy.orm import contains_eager, selectinload
 
 from config import settings
 from database import async_session_maker
 from models import Channel, Source
+from services.fetch_queue import get_fetch_queue, stop_fetch_queue
+from services.fetch_schedule import record_error, record_fetch
+from services.stats_rollup import reconcile_stats_rollup
+
+if TYPE_CHECKING:
+    from connectors import FeedValidators
 
 logger = logging.getLogger(__name__)
 
@@ -84,9 +91,6 @@ def get_effective_limit(source_type: str) -> int:
 
     return base_limit
 
-# Lock to prevent overlapping fetches (replaces boolean flag to avoid race conditions)
-_fetch_lock = asyncio.Lock()
-
 scheduler = AsyncIOScheduler()
 
 
@@ -172,6 +176,23 @@ async def fetch_all_channels(training_mode: bool = False) -> dict:
     }
 
 
+def _updated_feed_cache(
+    feed_cache: dict, validators: "FeedValidators", hit: str | None = None
+) -> dict:
+    """Merge fresh validators and request counters into a channel's feed_cache.
+
+    Args:
+        feed_cache: Current channels.feed_cache value
+        validators: Validators after the fetch
+        hit: "not_modified" / "unchanged" when the fetch was short-circuited
+    """
+    updated = {**feed_cache, **validators.to_dict()}
+    updated["requests"] = feed_cache.get("requests", 0) + 1
+    for key in ("not_modified", "unchanged"):
+        updated[key] = feed_cache.get(key, 0) + (1 if hit == key else 0)
+    return updated
+
+
 async def fetch_channel(channel_id: int, training_mode: bool = False) -> int:
     """Fetch items from a single channel.
 
@@ -185,7 +206,8 @@ async def fetch_channel(channel_id: int, training_mode: bool = False) -> int:
     Returns:
         Number of new items fetched.
     """
-    from connectors import ConnectorRegistry
+    from connectors import ConnectorRegistry, FeedNotModifiedError, FeedValidators, KnownEntries
+    from models import Item
     from services.pipeline import Pipeline
     from services.processor import ItemProcessor, create_processor_from_settings
     from services.relevance_filter import create_relevance_filter
@@ -238,26 +260,55 @@ async def fetch_channel(channel_id: int, training_mode: bool = False) -> int:
         connector_type = channel.connector_type
         channel_config = dict(channel.config)
         source_name = channel.source.name
+        feed_cache = dict(channel.feed_cache or {})
+
+        # Stored external_ids, so the connector only enriches unseen entries
+        # and the pre-filter only sends those to the classifier
+        known_entries = None
+        connector_class = ConnectorRegistry.get(connector_type)
+        uses_known_entries = connector_class is not None and connector_class.uses_known_entries
+        if uses_known_entries or (relevance_filter and not training_mode):
+            result = await db.execute(
+                select(Item.external_id).where(Item.channel_id == channel_id)
+            )
+            known_entries = KnownEntries(result.scalars())
 
     # Phase 2: Network I/O - fetch items (runs in parallel with other channels)
+    # Training fetches want every entry of the feed, so no conditional GET (and
+    # no FeedNotModifiedError short-circuit); the stored validators stay as they are
+    feed_validators = FeedValidators() if training_mode else FeedValidators.from_dict(feed_cache)
     try:
-        connector_class = ConnectorRegistry.get(connector_type)
         if connector_class is None:
             raise ValueError(f"Unknown connector type: {connector_type}")
 
         connector = connector_class()
+        connector.feed_validators = None if training_mode else feed_validators
+        connector.known_entries = known_entries if uses_known_entries else None
         config_dict = {"url": channel_config.get("url", ""), **channel_config}
         config_model = connector_class.config_schema(**config_dict)
         raw_items = await connector.fetch(config_model)
 
         logger.info(f"Connector returned {len(raw_items)} raw items from channel {channel_id}")
 
+    except FeedNotModifiedError as e:
+        # Unchanged feed: skip parsing results, pre-filter and pipeline entirely
+        async with async_session_maker() as db:
+            channel = await db.get(Channel, channel_id)
+            if channel:
+                channel.feed_cache = _updated_feed_cache(feed_cache, feed_validators, e.reason)
+                record_fetch(channel, 0)
+                channel.last_error = None
+                await db.commit()
+        logger.info(f"Channel {channel_id} feed {e.reason}, skipping")
+        return 0
+
     except Exception as e:
         # Phase 2 error: Update channel error status
         async with async_session_maker() as db:
             channel = await db.get(Channel, channel_id)
             if channel:
                 channel.last_error = str(e)
+                record_error(channel)
                 await db.commit()
         logger.error(f"Error fetching channel {channel_id}: {e}")
         raise
@@ -265,23 +316,60 @@ async def fetch_channel(channel_id: int, training_mode: bool = False) -> int:
     # Phase 2.5: Pre-filter items BEFORE entering database session
     # This avoids async context conflicts between httpx and SQLAlchemy
     pre_filter_results: dict[str, dict] = {}
-    if relevance_filter and not training_mode and raw_items:
-        logger.debug(f"Pre-filtering {len(raw_items)} items for channel {channel_id}")
-        for raw_item in raw_items:
+    # Entries already stored are dropped by the pipeline; don't embed them again
+    unseen_items = [
+        raw_item for raw_item in raw_items
+        if known_entries is None or raw_item.external_id not in known_entries
+    ]
+    if relevance_filter and not training_mode and unseen_items:
+        from services.pipeline import (
+            DUPLICATE_THRESHOLD_MAYBE,
+            _strip_boilerplate,
+            normalize_raw_item,
+        )
+
+        logger.debug(f"Pre-filtering {len(unseen_items)} items for channel {channel_id}")
+        # Combined ingest: classification, duplicate candidates and staged index
+        # embeddings in one call, on the same cleaned text the pipeline indexes
+        ingest_items = []
+        for raw_item in unseen_items:
+            normalized = normalize_raw_item(raw_item)
+            ingest_items.append({
+                "title": _strip_boilerplate(normalized.title),
+                "content": _strip_boilerplate(normalized.content),
+                "source": source_name,
+            })
+        try:
+            ingested = await relevance_filter.ingest_batch(
+                ingest_items, threshold=DUPLICATE_THRESHOLD_MAYBE
+            )
+            for raw_item, ingest in zip(unseen_items, ingested):
+                entry = {
+                    "duplicates": ingest["duplicates"],
+                    "index_handle": ingest["index_handle"],
+                }
+                if ingest["classification"]:
+                    entry["should_process"] = ingest["should_process"]
+                    entry["result"] = ingest["classification"]
+                pre_filter_results[raw_item.external_id] = entry
+        except Exception as e:
+            # Older classifier without /ingest, or transient failure:
+            # fall back to batch classification only
+            logger.warning(f"Ingest call failed for channel {channel_id}, classifying only: {e}")
             try:
-                should_process, result = await relevance_filter.should_process(
-                    title=raw_item.title,
-                    content=raw_item.content,
-                    source=source_name,
-                )
-                if result:
-                    pre_filter_results[raw_item.external_id] = {
-                        "should_process": should_process,
-                        "result": result,
-                    }
+                decisions = await relevance_filter.should_process_batch([
+                    {"title": raw_item.title, "content": raw_item.content, "source": source_name}
+                    for raw_item in unseen_items
+                ])
+                for raw_item, (should_process, result) in zip(unseen_items, decisions):
+                    if result:
+                        pre_filter_results[raw_item.external_id] = {
+                            "should_process": should_process,
+                            "result": result,
+                        }
             except Exception as e:
-                logger.warning(f"Pre-filter failed for item '{raw_item.title[:40]}': {e}")
-        logger.debug(f"Pre-filtered {len(pre_filter_results)}/{len(raw_items)} items")
+                logger.warning(f"Batch pre-filter failed for channel {channel_id}: {e}")
+        logger.debug(f"Pre-filtered {len(pre_filter_results)}/{len(unseen_items)} items")
 
     # Phase 3: Database writes - process and store items
     # Note: No global lock needed - PostgreSQL MVCC handles concurrent writes
@@ -306,8 +394,11 @@ async def fetch_channel(channel_id: int, training_mode: bool = False) -> int:
             )
             new_items = await pipeline.process(raw_items, channel)
 
-            channel.last_fetch_at = datetime.utcnow()
+            record_fetch(channel, len(new_items))
             channel.last_error = None
+            if feed_validators.url:
+                # Persist validators only once the items are stored
+                channel.feed_cache = _updated_feed_cache(feed_cache, feed_validators)
             await db.commit()
 
             logger.info(f"Fetched {len(new_items)} new items from channel {channel_id}{mode_str}")
@@ -321,6 +412,7 @@ async def fetch_channel(channel_id: int, training_mode: bool = False) -> int:
                 channel = await db.get(Channel, channel_id)
                 if channel:
                     channel.last_error = str(e)
+                    record_error(channel)
                     await db.commit()
             except Exception as store_err:
                 # Don't let error storage failure mask original error
@@ -390,100 +482,55 @@ async def _fetch_source_type_group(
 
 
 async def fetch_due_channels() -> dict:
-    """Fetch channels that are past their individual fetch interval.
-
-    Fetches channels in parallel, grouped by source type. Each source type
-    has its own concurrency limit to prevent overwhelming external services.
-
-    Checks every enabled channel and fetches those where:
-    now - last_fetch_at > fetch_interval_minutes
+    """Queue channels that are past their individual fetch interval.
 
+    Due channels are found with one query on the indexed next_fetch_at
+    column (NULL = never fetched), which fetch_channel() sets after every
+    fetch from the channel's adaptive interval (services.fetch_schedule).
     Also checks that the parent source is enabled.
 
+    The channels are handed to the fetch queue (services.fetch_queue),
+    whose per-connector-type workers fetch them in priority order. This
+    returns without waiting for the fetches, so a slow connector type never
+    delays the next dispatch or the other types.
+
     Returns:
-        Dict with fetch statistics.
+        Dict with due and newly queued channel counts.
     """
-    # Use lock to prevent overlapping fetches (atomic test-and-acquire)
-    if _fetch_lock.locked():
-        logger.debug("Fetch already in progress, skipping")
-        return {"skipped": True, "reason": "fetch_in_progress"}
-
-    async with _fetch_lock:
-        now = datetime.utcnow()
+    now = datetime.utcnow()
+    queue = get_fetch_queue()
 
-        async with async_session_maker() as db:
-            # Find enabled channels where parent source is also enabled
-            query = (
-                select(Channel)
-                .join(Source)
-                .options(selectinload(Channel.source))
-                .where(
-                    Channel.enabled == True,  # noqa: E712
-                    Source.enabled == True,  # noqa: E712
-                )
-            )
-            result = await db.execute(query)
-            all_channels = result.scalars().all()
-
-            # Filter in Python for clearer logic
-            due_channels = []
-            for channel in all_channels:
-                if channel.last_fetch_at is None:
-                    due_channels.append(channel)
-                else:
-                    due_time = channel.last_fetch_at + timedelta(minutes=channel.fetch_interval_minutes)
-                    if due_time < now:
-                        due_channels.append(channel)
-
-            if not due_channels:
-                return {"due_channels": 0, "fetched": 0, "errors": 0}
-
-            # Group channels by source type
-            by_type: dict[str, list[Channel]] = defaultdict(list)
-            for channel in due_channels:
-                by_type[channel.connector_type].append(channel)
-
-            logger.info(
-                f"Found {len(due_channels)} channels due for fetching "
-                f"across {len(by_type)} source types: "
-                f"{', '.join(f'{k}({len(v)})' for k, v in by_type.items())}"
+    async with async_session_maker() as db:
+        # Due enabled channels whose parent source is also enabled
+        query = (
+            select(Channel)
+            .join(Source)
+            .options(contains_eager(Channel.source))
+            .where(
+                Channel.enabled == True,  # noqa: E712
+                Source.enabled == True,  # noqa: E712
+                or_(Channel.next_fetch_at.is_(None), Channel.next_fetch_at <= now),
             )
+        )
+        result = await db.execute(query)
+        due_channels = result.scalars().all()
 
-            # Create semaphores per source type (dynamic limits for proxy-using connectors)
-            semaphores = {
-                source_type: asyncio.Semaphore(get_effective_limit(source_type))
-                for source_type in by_type.keys()
-            }
+        queued: dict[str, int] = defaultdict(int)
+        for channel in due_channels:
+            if queue.enqueue(channel):
+                queued[channel.connector_type] += 1
 
-            # Fetch all source types in parallel
-            tasks = [
-                _fetch_source_type_group(source_type, channels, semaphores[source_type])
-                for source_type, channels in by_type.items()
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Collect results
-            total_fetched = 0
-            total_errors = 0
-            for source_type, result in zip(by_type.keys(), results):
-                if isinstance(result, Exception):
-                    logger.error(f"Error in source type group {source_type}: {result}")
-                    total_errors += len(by_type[source_type])
-                else:
-                    fetched, errors = result
-                    total_fetched += fetched
-                    total_errors += errors
-                    if fetched > 0 or errors > 0:
-                        logger.info(f"  {source_type}: {fetched} fetched, {errors} errors")
-
-        if total_fetched > 0 or total_errors > 0:
-            logger.info(f"Parallel fetch complete: {total_fetched} channels, {total_errors} errors")
-
-        return {
-            "due_channels": len(due_channels),
-            "fetched": total_fetched,
-            "errors": total_errors,
-        }
+    if queued:
+        logger.info(
+            f"Queued {sum(queued.values())} of {len(due_channels)} due channels: "
+            f"{', '.join(f'{k}({v})' for k, v in queued.items())}"
+        )
+
+    return {
+        "due_channels": len(due_channels),
+        "queued": sum(queued.values()),
+        "already_queued": len(due_channels) - sum(queued.values()),
+    }
 
 
 async def retry_llm_processing(batch_size: int = 10) -> dict:
@@ -523,9 +570,7 @@ async def retry_llm_processing(batch_size: int = 10) -> dict:
         # Query items needing LLM processing, ordered by priority
         # Priority order: high > unknown > edge_case > low
         # "low" items are certainly irrelevant (confidence < 0.25)
-        from database import json_extract_path
-
-        retry_priority = json_extract_path(Item.metadata_, "retry_priority")
+        retry_priority = Item.retry_priority
         priority_order = case(
             (retry_priority == "high", 1),
             (retry_priority == "unknown", 2),
@@ -620,102 +665,32 @@ async def cleanup_old_items() -> dict:
     """Remove items based on per-priority retention settings.
 
     Uses housekeeping configuration from database with different retention
-    periods per priority level.
+    periods per priority level. Items are deleted in batches with their
+    vector index entries (services.retention).
 
     Returns:
         Dict with deletion statistics.
     """
-    from sqlalchemy import delete, and_
-
-    from models import Item, Priority, Setting
+    from api.admin import get_housekeeping_config
+    from services.retention import purge_items
 
     logger.info("Starting cleanup of old items")
 
     async with async_session_maker() as db:
-        # Load housekeeping config from database
-        from api.admin import DEFAULT_HOUSEKEEPING_CONFIG
-
-        result = await db.execute(
-            select(Setting).where(Setting.key == "housekeeping")
-        )
-        setting = result.scalar_one_or_none()
-
-        if setting and setting.value:
-            config = dict(DEFAULT_HOUSEKEEPING_CONFIG)
-            config.update(setting.value)
-        else:
-            config = dict(DEFAULT_HOUSEKEEPING_CONFIG)
-
-        # Check if autopurge is enabled
-        if not config.get("autopurge_enabled", False):
-            logger.info("Autopurge disabled, skipping cleanup")
-            return {"deleted": 0, "skipped": True, "reason": "autopurge_disabled"}
-
-        exclude_starred = config.get("exclude_starred", True)
-        now = datetime.utcnow()
-        total_deleted = 0
-        by_priority: dict[str, int] = {}
-
-        # Collect all item IDs to delete across priorities
-        all_ids_to_delete: list[int] = []
-
-        # Delete per-priority with different retention periods
-        for priority, days_key in [
-            (Priority.HIGH, "retention_days_high"),
-            (Priority.MEDIUM, "retention_days_medium"),
-            (Priority.LOW, "retention_days_low"),
-            (Priority.NONE, "retention_days_none"),
-        ]:
-            retention_days = config.get(days_key, 30)
-            cutoff = now - timedelta(days=retention_days)
-
-            # Build conditions
-            conditions = [
-                Item.priority == priority,
-                Item.fetched_at < cutoff,
-            ]
-            if exclude_starred:
-                conditions.append(Item.is_starred == False)  # noqa: E712
-
-            # First collect the IDs
-            id_result = await db.execute(select(Item.id).where(and_(*conditions)))
-            ids_to_delete = [row[0] for row in id_result.fetchall()]
-
-            if ids_to_delete:
-                all_ids_to_delete.extend(ids_to_delete)
-                stmt = delete(Item).where(Item.id.in_(ids_to_delete))
-                await db.execute(stmt)
-                count = len(ids_to_delete)
-                by_priority[priority.value] = count
-                total_deleted += count
-                logger.info(
-                    f"Deleted {count} {priority.value} priority items "
-                    f"older than {retention_days} days"
-                )
+        config = await get_housekeeping_config(db)
 
-        # Clean up vector indexes
-        if all_ids_to_delete:
-            try:
-                from services.relevance_filter import create_relevance_filter
-                relevance_filter = await create_relevance_filter()
-                if relevance_filter:
-                    str_ids = [str(id) for id in all_ids_to_delete]
-                    deleted_search, deleted_dup = await relevance_filter.delete_items(str_ids)
-                    logger.info(
-                        f"Vector index cleanup: {deleted_search} from search, "
-                        f"{deleted_dup} from duplicate index"
-                    )
-            except Exception as e:
-                logger.warning(f"Failed to clean up vector indexes: {e}")
-
-        await db.commit()
+    # Check if autopurge is enabled
+    if not config.get("autopurge_enabled", False):
+        logger.info("Autopurge disabled, skipping cleanup")
+        return {"deleted": 0, "skipped": True, "reason": "autopurge_disabled"}
 
-        logger.info(f"Cleanup completed: deleted {total_deleted} items ({by_priority})")
-        return {
-            "deleted": total_deleted,
-            "by_priority": by_priority,
-            "skipped": False,
-        }
+    result = await purge_items(config, trigger="scheduled")
+    return {
+        "deleted": result["deleted"],
+        "by_priority": result["by_priority"],
+        "batches": result["batches"],
+        "skipped": False,
+    }
 
 
 async def cleanup_old_events() -> int:
@@ -745,19 +720,36 @@ async def cleanup_old_events() -> int:
 
 
 async def _sync_scheduler_stats() -> None:
-    """Sync scheduler job list to DB so non-leader workers can read it."""
+    """Sync scheduler job list and leader-side fetch stats to DB.
+
+    The fetch stats cover the fetch queue, HTTP clients, browsers, article
+    cache and parse pool.
+    """
+    from services.article_cache import get_article_cache
+    from services.browser_pool import browser_pool
+    from services.http_clients import get_http_registry
+    from services.parse_pool import get_parse_pool
     from services.worker_status import write_stats
     jobs = get_job_status()
     # Exclude the sync job itself from the list
     jobs = [j for j in jobs if j["id"] != "sync_scheduler_stats"]
-    await write_stats("scheduler", {"jobs": jobs})
+    await write_stats("scheduler", {
+        "jobs": jobs,
+        "fetch_queue": get_fetch_queue().get_stats(),
+        "http_clients": get_http_registry().get_stats(),
+        "browser_pool": await browser_pool.health_check(),
+        "article_cache": get_article_cache().get_stats(),
+        "parse_pool": get_parse_pool().get_stats(),
+    })
 
 
 def start_scheduler() -> None:
     """Start the background scheduler."""
+    from services.browser_pool import browser_pool
     from services.proxy_manager import proxy_manager
 
-    # Smart fetch job - checks every minute for channels that are due
+    # Dispatch job - queues channels that are due every minute (fetched by
+    # the per-connector-type workers of services.fetch_queue)
     scheduler.add_job(
         fetch_due_channels,
         trigger=IntervalTrigger(minutes=1),
@@ -788,6 +780,17 @@ def start_scheduler() -> None:
         replace_existing=True,
     )
 
+    # Reconcile the stats rollup with items (daily at 3:30 AM, after the purges)
+    scheduler.add_job(
+        reconcile_stats_rollup,
+        trigger="cron",
+        hour=3,
+        minute=30,
+        id="reconcile_stats_rollup",
+        name="Reconcile stats rollup",
+        replace_existing=True,
+    )
+
     # Proxy refresh job (every 30 minutes)
     scheduler.add_job(
         proxy_manager.refresh_proxy_list,
@@ -797,6 +800,15 @@ def start_scheduler() -> None:
         replace_existing=True,
     )
 
+    # Close warm browsers nobody used for a while (every minute)
+    scheduler.add_job(
+        browser_pool.prune_idle,
+        trigger=IntervalTrigger(minutes=1),
+        id="prune_idle_browsers",
+        name="Close idle browsers",
+        replace_existing=True,
+    )
+
     # NOTE: LLM retry processing is now handled by the LLM worker (llm_worker.py)
     # which runs continuously and processes items with priority ordering.
     # The old 5-minute interval job has been removed for efficiency.
@@ -827,6 +839,7 @@ def start_scheduler() -> None:
 def stop_scheduler() -> None:
     """Stop the background scheduler."""
     scheduler.shutdown(wait=False)
+    stop_fetch_queue()
     logger.info("Scheduler stopped")
 
     # Write state to DB (fire-and-forget via event loop)
@@ -853,13 +866,11 @@ def get_job_status() -> list[dict]:
 
 
 async def trigger_channel_fetch(channel_id: int) -> None:
-    """Manually trigger a fetch for a specific channel."""
-    scheduler.add_job(
-        fetch_channel,
-        args=[channel_id],
-        id=f"manual_fetch_channel_{channel_id}",
-        replace_existing=True,
-    )
+    """Manually trigger a fetch for a specific channel (ahead of the queue)."""
+    async with async_session_maker() as db:
+        channel = await db.get(Channel, channel_id, options=[selectinload(Channel.source)])
+        if channel is not None:
+            get_fetch_queue().enqueue(channel, urgent=True)
 
 
 # Legacy aliases for backward compatibility during transition
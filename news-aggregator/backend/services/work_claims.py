@@ -0,0 +1,143 @@
+"""DB-backed claims on work-queue items for multiple worker processes.
+
+The classifier and LLM workers find pending items through their work-queue
+columns (see Item.classified_at etc.). To let several worker processes,
+possibly on different hosts, drain the same queue, a worker claims a batch
+before processing it:
+
+1. SELECT the pending item ids with FOR UPDATE OF items SKIP LOCKED, leaving
+   out items with a live claim in the same queue. Rows another worker is
+   claiming right now are skipped instead of waited on.
+2. INSERT a work_claims row (queue, item_id) per id with a lease, in the same
+   transaction, then commit. The row locks are only held for this step.
+   Only ids whose row was inserted (or whose expired claim was taken over)
+   count as claimed; the select can still return items another worker
+   claimed just before, and those are left to it.
+3. Process the items, renewing their leases (heartbeat) while the batch
+   runs, and delete the claims when done.
+
+A worker that dies leaves its claims behind; they stop counting once their
+lease has passed, and the next claim takes the item over. Lease times come
+from the database clock, so hosts with skewed clocks agree on them.
+"""
+
+import logging
+import os
+import socket
+from collections.abc import Iterable
+from datetime import timedelta
+
+from sqlalchemy import Select, delete, exists, func, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Item, WorkClaim
+
+logger = logging.getLogger(__name__)
+
+# Queue names
+QUEUE_CLASSIFY = "classify"
+QUEUE_DEDUP = "dedup"
+QUEUE_INDEX = "index"
+QUEUE_LLM = "llm"
+
+# Naive UTC timestamp from the database clock (columns are TIMESTAMP)
+_db_now = func.timezone("utc", func.now())
+
+
+def make_worker_id(name: str) -> str:
+    """Identity of a worker in this process, unique across hosts."""
+    return f"{socket.gethostname()}:{os.getpid()}:{name}"
+
+
+def _lease_seconds() -> int:
+    from config import settings
+    return settings.work_claim_lease_seconds
+
+
+def _unclaimed(queue: str):
+    """Condition: the item has no live claim in this queue."""
+    return ~exists().where(
+        WorkClaim.queue == queue,
+        WorkClaim.item_id == Item.id,
+        WorkClaim.lease_until > _db_now,
+    )
+
+
+async def claim_items(db: AsyncSession, queue: str, query: Select, worker_id: str) -> list[int]:
+    """Claim the items selected by `query` and commit.
+
+    `query` selects Item.id with the queue's conditions, order and limit.
+    Returns the claimed ids in query order; items claimed or being claimed
+    by other workers are left out.
+    """
+    query = query.where(_unclaimed(queue)).with_for_update(of=Item, skip_locked=True)
+    result = await db.execute(query)
+    item_ids = [row[0] for row in result.fetchall()]
+    if not item_ids:
+        await db.rollback()
+        return []
+
+    lease_until = _db_now + timedelta(seconds=_lease_seconds())
+    stmt = insert(WorkClaim).values([
+        {"queue": queue, "item_id": item_id, "worker_id": worker_id, "lease_until": lease_until}
+        for item_id in item_ids
+    ])
+    # Expired claims of dead workers are taken over. A live claim is kept:
+    # another worker may have committed it after this statement's snapshot,
+    # when the row lock was already gone and SKIP LOCKED returned the item.
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[WorkClaim.queue, WorkClaim.item_id],
+        set_={"worker_id": stmt.excluded.worker_id, "lease_until": stmt.excluded.lease_until},
+        where=WorkClaim.lease_until <= _db_now,
+    ).returning(WorkClaim.item_id)
+    claimed = {row[0] for row in (await db.execute(stmt)).fetchall()}
+    await db.commit()
+    return [item_id for item_id in item_ids if item_id in claimed]
+
+
+async def release_claims(
+    db: AsyncSession, queue: str, item_ids: Iterable[int], worker_id: str
+) -> None:
+    """Drop this worker's claims on the items and commit."""
+    item_ids = list(item_ids)
+    if not item_ids:
+        return
+    await db.execute(
+        delete(WorkClaim).where(
+            WorkClaim.queue == queue,
+            WorkClaim.item_id.in_(item_ids),
+            WorkClaim.worker_id == worker_id,
+        )
+    )
+    await db.commit()
+
+
+async def release_all_claims(db: AsyncSession, worker_id: str) -> None:
+    """Drop every claim of this worker (on stop) and commit."""
+    await db.execute(delete(WorkClaim).where(WorkClaim.worker_id == worker_id))
+    await db.commit()
+
+
+async def renew_claims(
+    db: AsyncSession, queue: str, item_ids: Iterable[int], worker_id: str
+) -> int:
+    """Extend this worker's leases on the items (heartbeat) and commit.
+
+    Returns the number of claims renewed; claims that a failed release left
+    behind are not renewed and simply expire.
+    """
+    item_ids = list(item_ids)
+    if not item_ids:
+        return 0
+    result = await db.execute(
+        update(WorkClaim)
+        .where(
+            WorkClaim.queue == queue,
+            WorkClaim.item_id.in_(item_ids),
+            WorkClaim.worker_id == worker_id,
+        )
+        .values(lease_until=_db_now + timedelta(seconds=_lease_seconds()))
+    )
+    await db.commit()
+    return result.rowcount
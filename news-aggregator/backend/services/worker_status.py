@@ -1,8 +1,20 @@
 """DB-backed worker status for multi-worker (gunicorn) support.
 
 Stores worker state, stats, and commands in the PostgreSQL settings table
-so all gunicorn workers can read correct status. Only the leader process
-runs background tasks; all processes serve API requests.
+so all gunicorn workers can read correct status. In each backend instance
+only the leader process runs background tasks; all processes serve API
+requests. Several instances may run classifier/LLM workers against the same
+database (see services/work_claims.py), so a command is not consumed by the
+first worker that reads it: every worker process applies it once.
+
+Commands are also sent as worker_command events on the event bus (see
+services/event_bus.py), so workers apply them right away; while the bus is
+connected they skip the command poll, and they stop re-reading the poll
+interval until a config_changed event says it changed.
+
+Command issue times and the times they are compared with come from the
+database clock (db_now), never from the API or worker host, so clock skew
+between hosts cannot drop a new command or re-apply an old one.
 
 Keys: worker:{name}:state, worker:{name}:stats, worker:{name}:command
 """
@@ -11,7 +23,7 @@ import json
 import logging
 from datetime import datetime, timedelta
 
-from sqlalchemy import select, text
+from sqlalchemy import func, select, text
 
 from database import async_session_maker
 from models import Setting
@@ -21,21 +33,55 @@ logger = logging.getLogger(__name__)
 # Command timeout: discard commands older than this
 COMMAND_TIMEOUT_SECONDS = 60
 
+POLL_INTERVAL_KEY = "worker_status_poll_interval"
+
+# (event bus generation, interval) while the bus is connected
+_poll_interval_cache: tuple[int, int] | None = None
+
+_DB_NOW = select(func.timezone("utc", func.now()))
+
 
 def _key(name: str, suffix: str) -> str:
     return f"worker:{name}:{suffix}"
 
 
+async def db_now() -> datetime:
+    """Current UTC time of the database server (naive, like utcnow())."""
+    try:
+        async with async_session_maker() as db:
+            return await db.scalar(_DB_NOW)
+    except Exception as e:
+        logger.warning(f"Failed to read database time, using local clock: {e}")
+        return datetime.utcnow()
+
+
 async def get_poll_interval() -> int:
     """Get the poll interval, checking DB override first, then env default.
 
     The DB setting 'worker_status_poll_interval' overrides the env var.
     This allows changing the interval on the fly via the settings API.
+    While the event bus stays connected the value is cached; changes arrive
+    as config_changed events (see invalidate_poll_interval).
     """
+    global _poll_interval_cache
+    from services.event_bus import get_event_bus
+
+    bus = get_event_bus()
+    generation = bus.generation if bus.connected else None
+    if _poll_interval_cache is not None and _poll_interval_cache[0] == generation:
+        return _poll_interval_cache[1]
+
+    interval = await _read_poll_interval()
+    if generation is not None:
+        _poll_interval_cache = (generation, interval)
+    return interval
+
+
+async def _read_poll_interval() -> int:
     try:
         async with async_session_maker() as db:
             result = await db.scalar(
-                select(Setting.value).where(Setting.key == "worker_status_poll_interval")
+                select(Setting.value).where(Setting.key == POLL_INTERVAL_KEY)
             )
             if result is not None:
                 val = result if isinstance(result, int) else int(result)
@@ -48,6 +94,13 @@ async def get_poll_interval() -> int:
     return settings.worker_status_poll_interval
 
 
+def invalidate_poll_interval(event: dict | None = None) -> None:
+    """Drop the cached poll interval (config_changed event handler)."""
+    global _poll_interval_cache
+    if event is None or event.get("key") in (None, POLL_INTERVAL_KEY):
+        _poll_interval_cache = None
+
+
 async def write_state(name: str, *, running: bool, paused: bool = False,
                       stopped_due_to_errors: bool = False) -> None:
     """Write worker state to DB. Called by leader on state changes."""
@@ -81,39 +134,51 @@ async def read_stats(name: str) -> dict:
 
 
 async def write_command(name: str, action: str) -> None:
-    """Write a command for the worker. Called by API endpoints."""
+    """Write a command for the worker and announce it. Called by API endpoints."""
+    from services.event_bus import EVENT_WORKER_COMMAND, get_event_bus
+
     value = {
         "action": action,
-        "issued_at": datetime.utcnow().isoformat(),
+        "issued_at": (await db_now()).isoformat(),
     }
     await _upsert(_key(name, "command"), value, f"Pending command for {name}")
+    await get_event_bus().publish(EVENT_WORKER_COMMAND, worker=name, **value)
 
 
-async def read_and_clear_command(name: str) -> str | None:
-    """Read and clear pending command. Called by leader poll loop.
+async def read_new_command(name: str, after: datetime) -> tuple[str, datetime] | None:
+    """Read the pending command if it was issued after `after`.
 
-    Returns the action string, or None if no command or command is stale.
+    Called by each worker process's poll loop, which passes the issue time of
+    the last command it applied (or its database start time). Returns
+    (action, issued_at), or None if there is no newer command or it is stale.
     """
-    key = _key(name, "command")
-    value = await _read(key)
+    value = await _read(_key(name, "command"))
     if value is None:
         return None
+    return parse_command(name, value, after, now=await db_now())
+
 
-    # Clear the command
-    await _delete(key)
+def parse_command(
+    name: str, value: dict, after: datetime, now: datetime | None = None
+) -> tuple[str, datetime] | None:
+    """(action, issued_at) of a command value or event, if newer than `after`.
+
+    With `now` (database time), commands older than COMMAND_TIMEOUT_SECONDS
+    are ignored; events are delivered live and are not checked.
+    """
+    try:
+        issued = datetime.fromisoformat(value["issued_at"])
+    except (KeyError, ValueError, TypeError):
+        return None
+    if issued <= after:
+        return None
 
-    # Check staleness
-    issued_at = value.get("issued_at")
-    if issued_at:
-        try:
-            issued = datetime.fromisoformat(issued_at)
-            if datetime.utcnow() - issued > timedelta(seconds=COMMAND_TIMEOUT_SECONDS):
-                logger.warning(f"Discarding stale command for {name}: {value.get('action')}")
-                return None
-        except (ValueError, TypeError):
-            pass
+    if now is not None and now - issued > timedelta(seconds=COMMAND_TIMEOUT_SECONDS):
+        # Left in place until the next command, so keep this quiet
+        logger.debug(f"Ignoring stale command for {name}: {value.get('action')}")
+        return None
 
-    return value.get("action")
+    return value.get("action"), issued
 
 
 async def _upsert(key: str, value: dict, description: str = "") -> None:
@@ -146,16 +211,3 @@ async def _read(key: str) -> dict | None:
         logger.warning(f"Failed to read setting {key}: {e}")
         return None
 
-
-async def _delete(key: str) -> None:
-    """Delete a setting."""
-    try:
-        async with async_session_maker() as db:
-            existing = await db.scalar(
-                select(Setting).where(Setting.key == key)
-            )
-            if existing:
-                await db.delete(existing)
-                await db.commit()
-    except Exception as e:
-        logger.warning(f"Failed to delete setting {key}: {e}")
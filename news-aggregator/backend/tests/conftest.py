@@ -33,6 +33,32 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_caches(tmp_path, monkeypatch) -> Generator[None, None, None]:
+    """Clear per-process caches so tests don't see each other's data."""
+    from api.items import invalidate_item_counts
+    from config import settings
+    from services.article_cache import reset_article_cache
+    from services.fetch_queue import stop_fetch_queue
+    from services.parse_pool import shutdown_parse_pool
+    from services.rule_engine import invalidate_rules
+    from services.worker_status import invalidate_poll_interval
+
+    invalidate_item_counts()
+    invalidate_rules()
+    invalidate_poll_interval()
+    # Fresh article cache file per test (never the one in data/)
+    monkeypatch.setattr(settings, "article_cache_path", str(tmp_path / "article_cache.db"))
+    reset_article_cache()
+    # Parse in a thread instead of starting worker processes
+    monkeypatch.setattr(settings, "parse_pool_workers", 0)
+    shutdown_parse_pool()
+    yield
+    reset_article_cache()
+    shutdown_parse_pool()
+    stop_fetch_queue()
+
+
 @pytest_asyncio.fixture
 async def db_engine():
     """Create a test database engine."""
@@ -0,0 +1,137 @@
+"""Tests for the persistent article extraction cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.article_cache import ArticleCache, get_article_cache
+from services.article_extractor import ArticleContent, ArticleExtractor
+
+
+def _article(url: str, content: str = "Inhalt " * 50) -> ArticleContent:
+    return ArticleContent(
+        url=url,
+        title="Titel",
+        content=content,
+        is_article=True,
+        source_domain="example.com",
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ArticleCache(tmp_path / "cache.db", max_mb=1, ttl_hours=1, negative_ttl_hours=1)
+    yield cache
+    cache.close()
+
+
+class TestArticleCache:
+    """Tests for lookups, negative results, expiry and eviction."""
+
+    @pytest.mark.asyncio
+    async def test_roundtrip_by_normalized_url(self, cache):
+        """Tracking parameters, www and trailing slashes map to the same entry."""
+        await cache.put("https://www.example.com/story/", _article("https://www.example.com/story/"))
+
+        found, article = await cache.get("https://example.com/story?utm_source=x")
+        assert found
+        assert article.title == "Titel"
+        assert article.is_article is True
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_negative_and_transient_results(self, cache):
+        """Negative results are served from the cache, transient failures are retried."""
+        negative = AsyncMock(return_value=(None, True))
+        assert await cache.get_or_extract("https://example.com/a", negative) is None
+        assert await cache.get_or_extract("https://example.com/a", negative) is None
+        assert negative.await_count == 1
+
+        transient = AsyncMock(return_value=(None, False))
+        await cache.get_or_extract("https://example.com/b", transient)
+        await cache.get_or_extract("https://example.com/b", transient)
+        assert transient.await_count == 2
+
+        stats = cache.get_stats()
+        assert stats["negative_hits"] == 1
+        assert stats["not_cached"] == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_miss(self, cache):
+        """Entries past their TTL are not returned and are removed on eviction."""
+        await cache.put("https://example.com/old", _article("https://example.com/old"))
+        cache.ttl = -1
+        await cache.put("https://example.com/older", _article("https://example.com/older"))
+
+        found, _ = await cache.get("https://example.com/older")
+        assert not found
+        assert await cache.evict() == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, cache):
+        """Over the size limit, least recently used entries are evicted first."""
+        content = "x" * 300_000
+        for i in range(4):
+            url = f"https://example.com/{i}"
+            await cache.put(url, _article(url, content))
+        # Touch the oldest entry so it survives
+        assert (await cache.get("https://example.com/0"))[0]
+
+        # 1.2 MB stored, evicted down to 90% of 1 MB
+        assert await cache.evict() == 1
+        assert (await cache.get("https://example.com/0"))[0]
+        assert not (await cache.get("https://example.com/1"))[0]
+        assert (await cache.get("https://example.com/2"))[0]
+        store = await cache.get_store_stats()
+        assert store["entries"] == 3
+        assert store["size_mb"] <= 0.9
+
+
+class TestFetchArticleCached:
+    """Tests for ArticleExtractor.fetch_article() with the cache."""
+
+    HTML = '''<html><head>
+        <meta property="og:title" content="Test Article" />
+        <meta property="og:type" content="article" />
+    </head><body><article><p>''' + "Der Artikeltext ist lang genug. " * 10 + '''</p></article>
+    </body></html>'''
+
+    @pytest.mark.asyncio
+    async def test_same_article_extracted_once(self):
+        """Sequential and concurrent fetches of one story download it once."""
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return MagicMock(text=self.HTML, raise_for_status=MagicMock())
+
+        with patch("services.article_extractor.get_http_client") as mock_client:
+            mock_client.return_value.get = AsyncMock(side_effect=slow_get)
+            extractor = ArticleExtractor()
+
+            results = await asyncio.gather(
+                extractor.fetch_article("https://example.com/story?utm_source=rss"),
+                extractor.fetch_article("https://www.example.com/story"),
+            )
+            again = await extractor.fetch_article(
+                "https://www.google.com/url?rct=j&url=https://example.com/story/"
+            )
+
+        assert mock_client.return_value.get.await_count == 1
+        assert all(r.title == "Test Article" for r in results)
+        assert again.content == results[0].content
+        stats = get_article_cache().get_stats()
+        assert stats["shared_inflight"] == 1
+        assert stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bypass_cache(self):
+        """use_cache=False always downloads."""
+        with patch("services.article_extractor.get_http_client") as mock_client:
+            mock_client.return_value.get = AsyncMock(
+                return_value=MagicMock(text=self.HTML, raise_for_status=MagicMock())
+            )
+            extractor = ArticleExtractor()
+            await extractor.fetch_article("https://example.com/story")
+            await extractor.fetch_article("https://example.com/story", use_cache=False)
+
+        assert mock_client.return_value.get.await_count == 2
@@ -299,14 +299,12 @@ class TestResolveRedirect:
     @pytest.mark.asyncio
     async def test_resolve_tco_link(self, extractor):
         """Should resolve t.co redirects."""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("services.article_extractor.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.url = "https://example.com/final-url"
 
             mock_client_instance = AsyncMock()
             mock_client_instance.head = AsyncMock(return_value=mock_response)
-            mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-            mock_client_instance.__aexit__ = AsyncMock(return_value=None)
             mock_client.return_value = mock_client_instance
 
             result = await extractor.resolve_redirect("https://t.co/abc123")
@@ -315,11 +313,9 @@ class TestResolveRedirect:
     @pytest.mark.asyncio
     async def test_resolve_redirect_error_returns_original(self, extractor):
         """Should return original URL on error."""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("services.article_extractor.get_http_client") as mock_client:
             mock_client_instance = AsyncMock()
             mock_client_instance.head = AsyncMock(side_effect=Exception("Network error"))
-            mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-            mock_client_instance.__aexit__ = AsyncMock(return_value=None)
             mock_client.return_value = mock_client_instance
 
             result = await extractor.resolve_redirect("https://t.co/abc123")
@@ -343,7 +339,7 @@ class TestFetchArticle:
             </article>
         </body></html>'''
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("services.article_extractor.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.text = html
             mock_response.url = "https://example.com/article"
@@ -351,8 +347,6 @@ class TestFetchArticle:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.get = AsyncMock(return_value=mock_response)
-            mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-            mock_client_instance.__aexit__ = AsyncMock(return_value=None)
             mock_client.return_value = mock_client_instance
 
             result = await extractor.fetch_article("https://example.com/article")
@@ -367,11 +361,9 @@ class TestFetchArticle:
         """Should return None on timeout."""
         import httpx
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("services.article_extractor.get_http_client") as mock_client:
             mock_client_instance = AsyncMock()
             mock_client_instance.get = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
-            mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-            mock_client_instance.__aexit__ = AsyncMock(return_value=None)
             mock_client.return_value = mock_client_instance
 
             result = await extractor.fetch_article("https://slow-site.com/article")
@@ -382,15 +374,13 @@ class TestFetchArticle:
         """Should return None on HTTP error."""
         import httpx
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("services.article_extractor.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 404
             error = httpx.HTTPStatusError("Not found", request=MagicMock(), response=mock_response)
 
             mock_client_instance = AsyncMock()
             mock_client_instance.get = AsyncMock(side_effect=error)
-            mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-            mock_client_instance.__aexit__ = AsyncMock(return_value=None)
             mock_client.return_value = mock_client_instance
 
             result = await extractor.fetch_article("https://example.com/missing")
@@ -401,7 +391,7 @@ class TestFetchArticle:
         """Should return None for non-news pages."""
         html = "<html><body><p>Just a simple page.</p></body></html>"
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("services.article_extractor.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.text = html
             mock_response.url = "https://random-blog.com/page"
@@ -409,13 +399,50 @@ class TestFetchArticle:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.get = AsyncMock(return_value=mock_response)
-            mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-            mock_client_instance.__aexit__ = AsyncMock(return_value=None)
             mock_client.return_value = mock_client_instance
 
             result = await extractor.fetch_article("https://random-blog.com/page")
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_failed_fallback_is_not_cached(self, extractor):
+        """A transient Playwright or Wayback failure makes the result uncacheable."""
+        # SPA markers only count on pages of some size
+        spa_html = "<html><body><div ng-app='news'>{{ article.text }}</div>%s</body></html>" % (
+            "<script>var x = 1;</script>" * 250
+        )
+        short_html = (
+            '<html><head><meta property="og:type" content="article" /></head>'
+            "<body><article><p>Teaser</p></article></body></html>"
+        )
+
+        def client_for(html):
+            mock_response = MagicMock()
+            mock_response.text = html
+            mock_response.raise_for_status = MagicMock()
+            mock_client_instance = AsyncMock()
+            mock_client_instance.get = AsyncMock(return_value=mock_response)
+            return mock_client_instance
+
+        get_client = "services.article_extractor.get_http_client"
+        playwright = "services.article_extractor._fetch_with_playwright"
+        spa_url = "https://random-blog.com/app"
+
+        with patch(get_client, return_value=client_for(spa_html)), \
+                patch(playwright, AsyncMock(return_value=(None, False))):
+            assert await extractor._extract_article(spa_url) == (None, False)
+
+        wayback_failed = AsyncMock(return_value=(None, False))
+        with patch(get_client, return_value=client_for(short_html)), \
+                patch.object(extractor, "_try_wayback_machine", wayback_failed):
+            result = await extractor._extract_article("https://www.spiegel.de/artikel")
+            assert result == (None, False)
+
+        # The same pages are cached as "no article" once the fallbacks answer
+        with patch(get_client, return_value=client_for(spa_html)), \
+                patch(playwright, AsyncMock(return_value=(None, True))):
+            assert await extractor._extract_article(spa_url) == (None, True)
+
     @pytest.mark.asyncio
     async def test_fetch_resolves_google_redirect(self, extractor):
         """Should resolve Google redirect URLs."""
@@ -428,7 +455,7 @@ class TestFetchArticle:
             </article>
         </body></html>'''
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("services.article_extractor.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.text = html
             mock_response.url = "https://news-site.com/article"
@@ -436,8 +463,6 @@ class TestFetchArticle:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.get = AsyncMock(return_value=mock_response)
-            mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-            mock_client_instance.__aexit__ = AsyncMock(return_value=None)
             mock_client.return_value = mock_client_instance
 
             # Google redirect URL
@@ -0,0 +1,187 @@
+"""Tests for the warm browser pool and scraper resource blocking."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from config import settings
+from services.browser_pool import BrowserPool, PooledBrowser, _chromium_roots
+from services.resource_blocking import BlockingProfile, block_resources, get_page_fetch_stats
+
+
+def _fake_browser() -> MagicMock:
+    browser = MagicMock()
+    browser.is_connected.return_value = True
+    browser.close = AsyncMock()
+    browser.new_context = AsyncMock(return_value=MagicMock(close=AsyncMock()))
+    return browser
+
+
+@pytest.fixture
+def pool():
+    """Pool whose Playwright driver launches fake browsers."""
+    pool = BrowserPool(max_browsers=2, max_uses=3, max_rss_mb=500, max_idle_seconds=60)
+    playwright = MagicMock()
+    playwright.chromium.launch = AsyncMock(side_effect=lambda **kwargs: _fake_browser())
+    pool._ensure_initialized = AsyncMock(return_value=playwright)
+    pool.launch = playwright.chromium.launch
+    return pool
+
+
+class TestBrowserPool:
+    """Tests for browser reuse and recycling."""
+
+    @pytest.mark.asyncio
+    async def test_browser_reused_between_checkouts(self, pool):
+        """A returned browser is handed to the next caller instead of relaunching."""
+        async with pool.get_browser() as first:
+            pass
+        async with pool.get_browser() as second:
+            pass
+
+        assert first is second
+        assert pool.launch.await_count == 1
+        first.close.assert_not_awaited()
+        health = await pool.health_check()
+        assert health["launches"] == 1
+        assert health["warm_checkouts"] == 1
+        assert health["browsers_idle"] == 1
+        assert health["last_launch_seconds"] is not None
+
+    @pytest.mark.asyncio
+    async def test_recycled_after_max_uses(self, pool):
+        """After max_uses checkouts the browser is closed and relaunched."""
+        browsers = []
+        for _ in range(4):
+            async with pool.get_browser() as browser:
+                browsers.append(browser)
+
+        assert pool.launch.await_count == 2
+        browsers[0].close.assert_awaited_once()
+        assert browsers[3] is not browsers[0]
+        assert (await pool.health_check())["recycled"] == {"max_uses": 1}
+
+    @pytest.mark.asyncio
+    async def test_recycled_over_memory_limit(self, pool):
+        """A browser whose process tree exceeds max_rss_mb is not reused."""
+        with patch.object(PooledBrowser, "rss_mb", return_value=800.0):
+            async with pool.get_browser() as browser:
+                pass
+
+        browser.close.assert_awaited_once()
+        assert pool._recycled == {"memory": 1}
+        assert pool._idle == []
+
+    @pytest.mark.asyncio
+    async def test_new_context_is_closed(self, pool):
+        """new_context() passes the fingerprint through and closes the context."""
+        async with pool.new_context(locale="de-DE", proxy={"server": "http://p:1"}) as context:
+            pass
+
+        browser = pool._idle[0].browser
+        browser.new_context.assert_awaited_once_with(locale="de-DE", proxy={"server": "http://p:1"})
+        context.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_prune_idle(self, pool):
+        """Browsers idle longer than max_idle_seconds are closed."""
+        async with pool.get_browser() as browser:
+            pass
+        pool._idle[0].last_used -= 120
+
+        assert await pool.prune_idle() == 1
+        browser.close.assert_awaited_once()
+        assert pool._recycled == {"idle": 1}
+
+    def test_chromium_roots(self):
+        """Main processes are found for new and old headless shell builds."""
+        table = {
+            1: ("python", 0),
+            10: ("chrome-headless-shell", 1),
+            11: ("chrome-headless-shell", 10),
+            20: ("headless_shell", 1),
+            21: ("headless_shell", 20),
+            30: ("chromium", 1),
+            40: ("node", 1),
+        }
+        assert _chromium_roots(table) == {10, 20, 30}
+
+    @pytest.mark.asyncio
+    async def test_launch_finds_browser_pid(self, pool, caplog):
+        """The new main process becomes the browser's pid; no match logs a warning."""
+        tables = [{1: ("python", 0)}, {1: ("python", 0), 20: ("headless_shell", 1)}]
+        snapshot = MagicMock(side_effect=lambda: tables.pop(0) if len(tables) > 1 else tables[0])
+        with patch("services.browser_pool._process_table", snapshot):
+            async with pool.get_browser():
+                pass
+        assert pool._idle[0].pid == 20
+        assert "BROWSER_MAX_RSS_MB" not in caplog.text
+
+        with patch("services.browser_pool._process_table", return_value={1: ("python", 0)}):
+            pooled = await pool._launch(headless=True, args=None)
+        assert pooled.pid is None
+        assert "BROWSER_MAX_RSS_MB is not enforced" in caplog.text
+
+
+class TestResourceBlocking:
+    """Tests for route interception on scraper contexts."""
+
+    def test_blocking_profile(self):
+        """Heavy resource types and tracker hosts are blocked; documents and allowlist pass."""
+        allowlist = {"x_scraper": ["font", "cdn.example"]}
+        with patch.object(settings, "browser_resource_allowlist", allowlist):
+            profile = BlockingProfile.for_connector("x_scraper")
+
+        assert profile.should_block("image", "https://pbs.twimg.com/a.jpg")
+        assert profile.should_block("script", "https://www.googletagmanager.com/gtm.js")
+        assert not profile.should_block("script", "https://abs.twimg.com/main.js")
+        assert not profile.should_block("document", "https://ad.doubleclick.net/frame")
+        # Allowlisted type and host
+        assert not profile.should_block("font", "https://x.com/font.woff2")
+        assert not profile.should_block("image", "https://img.cdn.example/a.png")
+
+    @pytest.mark.asyncio
+    async def test_route_handler_counts_blocked_requests(self):
+        """The installed route aborts blocked requests and counts them per fetch."""
+        context = MagicMock()
+        context.route = AsyncMock()
+        metrics = await block_resources(context, "article")
+        handler = context.route.await_args.args[1]
+
+        for resource_type, url in [
+            ("image", "https://example.com/a.jpg"),
+            ("script", "https://example.com/app.js"),
+        ]:
+            route = MagicMock(abort=AsyncMock(), continue_=AsyncMock())
+            route.request.resource_type = resource_type
+            route.request.url = url
+            await handler(route)
+
+        assert metrics.requests == 2
+        assert metrics.blocked == 1
+
+        metrics.bytes_received = 2048
+        await metrics.finish()
+        stats = get_page_fetch_stats()["article"]
+        assert stats["fetches"] >= 1
+        assert stats["blocked"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_finish_waits_for_response_sizes(self):
+        """Sizes still being looked up when the fetch ends are counted."""
+        context = MagicMock()
+        context.route = AsyncMock()
+        metrics = await block_resources(context, "article")
+        event, handler = context.on.call_args.args
+        assert event == "requestfinished"
+
+        async def slow_sizes():
+            await asyncio.sleep(0.01)
+            return {"responseBodySize": 1000, "responseHeadersSize": 24}
+
+        for _ in range(2):
+            handler(MagicMock(sizes=slow_sizes))
+        await metrics.finish()
+
+        assert metrics.bytes_received == 2048
@@ -231,34 +231,73 @@ class TestProcessUnclassifiedItems:
         mock_db_write.commit = AsyncMock()
 
         mock_classifier = MagicMock()
-        mock_classifier.classify = AsyncMock(return_value={
+        mock_classifier.classify_batch = AsyncMock(return_value=[{
             "relevance_confidence": 0.7,
             "ak": "Test AK",
             "ak_confidence": 0.8,
             "priority": "medium",
             "priority_confidence": 0.6,
-        })
+        }])
 
         call_count = [0]
 
         async def mock_context_manager(*args, **kwargs):
             call_count[0] += 1
-            if call_count[0] == 1:
+            if call_count[0] <= 2:  # Claim, then load
                 return mock_db_read
             return mock_db_write
 
-        with patch.object(worker, "_get_classifier", return_value=mock_classifier):
+        with patch.object(worker, "_get_classifier", return_value=mock_classifier), \
+                patch("services.classifier_worker.claim_items", AsyncMock(return_value=[1])):
             with patch("services.classifier_worker.async_session_maker") as mock_session:
                 mock_cm = AsyncMock()
                 mock_cm.__aenter__ = mock_context_manager
                 mock_cm.__aexit__ = AsyncMock(return_value=None)
                 mock_session.return_value = mock_cm
-                with patch("services.classifier_worker.db_write_lock"):
-                    with patch("services.item_events.record_event", new_callable=AsyncMock):
-                        result = await worker._process_unclassified_items()
+                with patch("services.item_events.record_event", new_callable=AsyncMock):
+                    result = await worker._process_unclassified_items()
 
         assert result == 1
         assert worker._stats["processed"] == 1
+        # All items go to the classifier in a single batched call
+        mock_classifier.classify_batch.assert_awaited_once()
+        assert len(mock_classifier.classify_batch.call_args.args[0]) == 1
+        # Queue state goes to the indexed columns, not to metadata
+        params = mock_db_write.execute.await_args_list[0].args[0].compile().params
+        assert params["retry_priority"] == "high"
+        assert params["classified_at"] is not None
+        assert "retry_priority" not in params["metadata"]
+
+    @pytest.mark.asyncio
+    async def test_process_batch_failure_counts_error(self, worker):
+        """A failed batch call should count one error and process nothing."""
+        worker._running = True
+
+        mock_item = MagicMock()
+        mock_item.id = 1
+        mock_item.title = "Test Article"
+        mock_item.content = "Test content"
+        mock_item.channel = None
+        mock_item.priority = Priority.NONE
+        mock_item.metadata_ = {}
+
+        mock_db = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [mock_item]
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        mock_classifier = MagicMock()
+        mock_classifier.classify_batch = AsyncMock(side_effect=Exception("boom"))
+
+        with patch.object(worker, "_get_classifier", return_value=mock_classifier), \
+                patch("services.classifier_worker.claim_items", AsyncMock(return_value=[1])):
+            with patch("services.classifier_worker.async_session_maker") as mock_session:
+                mock_session.return_value.__aenter__ = AsyncMock(return_value=mock_db)
+                mock_session.return_value.__aexit__ = AsyncMock(return_value=None)
+                result = await worker._process_unclassified_items()
+
+        assert result == 0
+        assert worker._stats["errors"] == 1
 
 
 class TestModuleFunctions:
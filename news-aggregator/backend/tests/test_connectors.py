@@ -17,6 +17,8 @@ from connectors import (
     InstagramConnector,
     TelegramConnector,
     LinkedInConnector,
+    FeedNotModifiedError,
+    FeedValidators,
 )
 from connectors.rss import RSSConfig
 from connectors.html import HTMLConfig
@@ -306,12 +308,12 @@ class TestRSSConnectorFetch:
         connector = RSSConnector()
         config = RSSConfig(url="https://example.com/feed.xml")
 
-        with patch("connectors.rss.httpx.AsyncClient") as mock_client:
+        with patch("connectors.rss.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.text = rss_feed_content
             mock_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -323,6 +325,67 @@ class TestRSSConnectorFetch:
         assert items[0].external_id == "article1"
 
 
+    @staticmethod
+    def _response(status_code: int, body: str = "", headers: dict | None = None) -> MagicMock:
+        response = MagicMock()
+        response.status_code = status_code
+        response.text = body
+        response.content = body.encode()
+        response.headers = headers or {}
+        response.raise_for_status = MagicMock()
+        return response
+
+    @pytest.mark.asyncio
+    async def test_fetch_sends_validators_and_stops_on_304(self):
+        """Stored validators are sent; a 304 short-circuits the fetch."""
+        connector = RSSConnector()
+        connector.feed_validators = FeedValidators(
+            url="https://example.com/feed.xml",
+            etag='"v1"',
+            last_modified="Mon, 01 Jan 2024 12:00:00 GMT",
+        )
+        config = RSSConfig(url="https://example.com/feed.xml", follow_links=False)
+
+        with patch("connectors.rss.get_http_client") as mock_client:
+            get = AsyncMock(return_value=self._response(304))
+            mock_client.return_value.get = get
+
+            with pytest.raises(FeedNotModifiedError) as exc:
+                await connector.fetch(config)
+
+        assert exc.value.reason == "not_modified"
+        headers = get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Mon, 01 Jan 2024 12:00:00 GMT"
+
+    @pytest.mark.asyncio
+    async def test_fetch_identical_body_is_unchanged(self, rss_feed_content):
+        """A byte-identical feed body is reported as unchanged after the first fetch."""
+        connector = RSSConnector()
+        connector.feed_validators = FeedValidators()
+        config = RSSConfig(url="https://example.com/feed.xml", follow_links=False)
+
+        with patch("connectors.rss.get_http_client") as mock_client:
+            mock_client.return_value.get = AsyncMock(
+                return_value=self._response(200, rss_feed_content, {"etag": '"v2"'})
+            )
+
+            items = await connector.fetch(config)
+            assert len(items) == 1
+            assert connector.feed_validators.etag == '"v2"'
+            assert connector.feed_validators.body_hash
+
+            with pytest.raises(FeedNotModifiedError) as exc:
+                await connector.fetch(config)
+
+        assert exc.value.reason == "unchanged"
+
+    def test_validators_ignored_for_other_url(self):
+        """Validators stored for another feed URL are not sent."""
+        validators = FeedValidators(url="https://old.example.com/feed", etag='"v1"')
+        assert validators.request_headers("https://new.example.com/feed") == {}
+
+
 class TestRSSConnectorValidate:
     """Tests for RSS connector validation."""
 
@@ -340,12 +403,12 @@ class TestRSSConnectorValidate:
             </channel>
         </rss>"""
 
-        with patch("connectors.rss.httpx.AsyncClient") as mock_client:
+        with patch("connectors.rss.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.text = rss_content
             mock_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -360,12 +423,12 @@ class TestRSSConnectorValidate:
         connector = RSSConnector()
         config = RSSConfig(url="https://example.com/feed.xml")
 
-        with patch("connectors.rss.httpx.AsyncClient") as mock_client:
+        with patch("connectors.rss.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.text = "not xml"
             mock_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -434,13 +497,13 @@ class TestInstagramConnectorFetch:
         connector = InstagramConnector()
         config = InstagramConfig(username="testuser")
 
-        with patch("connectors.instagram.httpx.AsyncClient") as mock_client:
+        with patch("connectors.instagram.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.text = picuki_html_content
             mock_response.status_code = 200
             mock_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -461,13 +524,13 @@ class TestInstagramConnectorFetch:
 
         empty_html = """<!DOCTYPE html><html><body><div class="box-photos"></div></body></html>"""
 
-        with patch("connectors.instagram.httpx.AsyncClient") as mock_client:
+        with patch("connectors.instagram.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.text = empty_html
             mock_response.status_code = 200
             mock_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -492,12 +555,12 @@ class TestInstagramConnectorValidate:
             </div>
         </body></html>"""
 
-        with patch("connectors.instagram.httpx.AsyncClient") as mock_client:
+        with patch("connectors.instagram.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.text = profile_html
             mock_response.status_code = 200
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -518,12 +581,12 @@ class TestInstagramConnectorValidate:
             <p>This page doesn't exist</p>
         </body></html>"""
 
-        with patch("connectors.instagram.httpx.AsyncClient") as mock_client:
+        with patch("connectors.instagram.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.text = not_found_html
             mock_response.status_code = 200
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -543,12 +606,12 @@ class TestInstagramConnectorValidate:
             <p>This account is private</p>
         </body></html>"""
 
-        with patch("connectors.instagram.httpx.AsyncClient") as mock_client:
+        with patch("connectors.instagram.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.text = private_html
             mock_response.status_code = 200
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -632,13 +695,13 @@ class TestTelegramConnectorFetch:
         connector = TelegramConnector()
         config = TelegramConfig(channel="testchannel")
 
-        with patch("connectors.telegram.httpx.AsyncClient") as mock_client:
+        with patch("connectors.telegram.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.text = telegram_channel_html
             mock_response.status_code = 200
             mock_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -657,13 +720,13 @@ class TestTelegramConnectorFetch:
         connector = TelegramConnector()
         config = TelegramConfig(channel="testchannel", include_forwards=False)
 
-        with patch("connectors.telegram.httpx.AsyncClient") as mock_client:
+        with patch("connectors.telegram.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.text = telegram_channel_html
             mock_response.status_code = 200
             mock_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -686,13 +749,13 @@ class TestTelegramConnectorFetch:
             <p>Channel not found</p>
         </body></html>"""
 
-        with patch("connectors.telegram.httpx.AsyncClient") as mock_client:
+        with patch("connectors.telegram.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.text = error_html
             mock_response.status_code = 200
             mock_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -725,12 +788,12 @@ class TestTelegramConnectorValidate:
             </div>
         </body></html>"""
 
-        with patch("connectors.telegram.httpx.AsyncClient") as mock_client:
+        with patch("connectors.telegram.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.text = channel_html
             mock_response.status_code = 200
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -751,12 +814,12 @@ class TestTelegramConnectorValidate:
             <div class="tgme_page_icon_error"></div>
         </body></html>"""
 
-        with patch("connectors.telegram.httpx.AsyncClient") as mock_client:
+        with patch("connectors.telegram.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.text = error_html
             mock_response.status_code = 200
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -764,3 +827,45 @@ class TestTelegramConnectorValidate:
 
         assert valid is False
         assert "not found" in message.lower() or "private" in message.lower()
+
+
+class TestKnownEntries:
+    """Tests for the per-channel known entry set."""
+
+    def test_membership(self):
+        """Stored external_ids are found, others are not."""
+        from connectors import KnownEntries
+
+        known = KnownEntries(["a", "b", "https://example.com/1", ""])
+        assert len(known) == 3
+        assert "b" in known
+        assert "https://example.com/1" in known
+        assert "c" not in known
+        assert None not in known
+
+    @pytest.mark.asyncio
+    async def test_rss_skips_article_fetch_for_known_entries(self):
+        """Link following only runs for entries not stored yet."""
+        from connectors import KnownEntries
+
+        feed = """<?xml version="1.0"?>
+        <rss version="2.0"><channel><title>Feed</title>
+            <item><title>Old</title><link>https://example.com/old</link><guid>old</guid></item>
+            <item><title>New</title><link>https://example.com/new</link><guid>new</guid></item>
+        </channel></rss>"""
+        connector = RSSConnector()
+        connector.known_entries = KnownEntries(["old"])
+        config = RSSConfig(url="https://example.com/feed.xml")
+
+        fetch_article = AsyncMock(return_value=None)
+        with patch("connectors.rss.get_http_client") as mock_client, \
+             patch("services.article_extractor.ArticleExtractor.fetch_article", fetch_article):
+            response = MagicMock()
+            response.text = feed
+            mock_client.return_value.get = AsyncMock(return_value=response)
+
+            items = await connector.fetch(config)
+
+        assert [i.external_id for i in items] == ["old", "new"]
+        fetch_article.assert_awaited_once_with("https://example.com/new")
+        assert connector.known_entries.hits == 1
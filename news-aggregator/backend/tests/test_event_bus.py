@@ -0,0 +1,192 @@
+"""Tests for the LISTEN/NOTIFY event bus and its publishers/subscribers."""
+
+import json
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.event_bus import (
+    EVENT_ITEMS_CREATED,
+    EVENT_WORKER_COMMAND,
+    MAX_IDS_PER_EVENT,
+    EventBus,
+)
+from services.llm_worker import LLMWorker, notify_fresh_items
+
+
+def _notify(bus: EventBus, event: dict) -> None:
+    bus._on_notify(None, 1, "news_events", json.dumps(event))
+
+
+def _started_bus() -> EventBus:
+    bus = EventBus()
+    bus._task = MagicMock()  # Pretend the listener runs
+    bus._connected = True
+    bus.generation = 1
+    return bus
+
+
+class TestDispatch:
+    """Tests for delivering notifications to handlers."""
+
+    def test_handlers_get_their_event_type(self):
+        bus = EventBus()
+        commands, created = [], []
+        bus.subscribe(EVENT_WORKER_COMMAND, commands.append)
+        bus.subscribe(EVENT_ITEMS_CREATED, created.append)
+
+        _notify(bus, {"type": EVENT_ITEMS_CREATED, "ids": [1, 2]})
+
+        assert created == [{"type": EVENT_ITEMS_CREATED, "ids": [1, 2]}]
+        assert commands == []
+        assert bus.received == 1
+
+    def test_unsubscribed_handler_is_not_called(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(EVENT_ITEMS_CREATED, received.append)
+        bus.unsubscribe(EVENT_ITEMS_CREATED, received.append)
+
+        _notify(bus, {"type": EVENT_ITEMS_CREATED, "ids": [1]})
+
+        assert received == []
+
+    def test_malformed_payload_is_ignored(self):
+        bus = EventBus()
+        bus._on_notify(None, 1, "news_events", "not json")
+        _notify(bus, {"ids": [1]})
+        assert bus.received == 0
+
+
+class TestPublish:
+    """Tests for sending events."""
+
+    @pytest.mark.asyncio
+    async def test_not_sent_before_start(self):
+        """Without a listener in this process callers use their fallback."""
+        assert await EventBus().publish(EVENT_ITEMS_CREATED, ids=[1]) is False
+
+    @pytest.mark.asyncio
+    async def test_ids_are_chunked(self):
+        bus = _started_bus()
+        ids = list(range(MAX_IDS_PER_EVENT * 2 + 1))
+
+        with patch.object(bus, "publish", AsyncMock(return_value=True)) as publish:
+            assert await bus.publish_ids(EVENT_ITEMS_CREATED, ids)
+
+        chunks = [c.kwargs["ids"] for c in publish.await_args_list]
+        assert [len(c) for c in chunks] == [MAX_IDS_PER_EVENT, MAX_IDS_PER_EVENT, 1]
+        assert sum(chunks, []) == ids
+
+    @pytest.mark.asyncio
+    async def test_session_publish_uses_savepoint(self):
+        """Sent with the caller's transaction; a failure can't abort it."""
+        bus = _started_bus()
+        session = MagicMock()
+        session.execute = AsyncMock()
+
+        assert await bus.publish(EVENT_ITEMS_CREATED, session=session, ids=[7])
+
+        session.begin_nested.assert_called_once()
+        params = session.execute.await_args.args[1]
+        assert json.loads(params["payload"]) == {"type": EVENT_ITEMS_CREATED, "ids": [7]}
+
+
+class TestFreshItems:
+    """Tests for handing new items to LLM workers."""
+
+    @pytest.mark.asyncio
+    async def test_published_when_connected(self):
+        bus = _started_bus()
+        with patch("services.llm_worker.get_event_bus", return_value=bus), \
+             patch.object(bus, "publish_ids", AsyncMock(return_value=True)) as publish_ids, \
+             patch("services.llm_worker.enqueue_fresh_item", AsyncMock()) as enqueue:
+            await notify_fresh_items([1, 2], db="session")
+
+        publish_ids.assert_awaited_once_with(EVENT_ITEMS_CREATED, [1, 2], session="session")
+        enqueue.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_local_fallback_without_bus(self):
+        with patch("services.llm_worker.get_event_bus", return_value=EventBus()), \
+             patch("services.llm_worker.enqueue_fresh_item", AsyncMock()) as enqueue:
+            await notify_fresh_items([1, 2])
+
+        assert [c.args[0] for c in enqueue.await_args_list] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_worker_queues_announced_items(self):
+        worker = LLMWorker()
+        await worker._on_items_created({"type": EVENT_ITEMS_CREATED, "ids": [5, 6]})
+        assert worker._fresh_queue.qsize() == 2
+
+
+class TestWorkerCommands:
+    """Tests for commands received as events."""
+
+    @pytest.mark.asyncio
+    async def test_newer_command_is_applied_once(self):
+        worker = LLMWorker()
+        worker._running = True
+        issued = datetime.utcnow()
+        event = {"type": EVENT_WORKER_COMMAND, "worker": "llm",
+                 "action": "pause", "issued_at": issued.isoformat()}
+
+        with patch.object(worker, "pause", AsyncMock()) as pause:
+            await worker._on_command_event(event)
+            # Also read back by the poll after a reconnect
+            await worker._on_command_event(event)
+
+        pause.assert_awaited_once()
+        assert worker._last_command_at == issued
+
+    @pytest.mark.asyncio
+    async def test_other_workers_commands_are_ignored(self):
+        worker = LLMWorker()
+        worker._running = True
+        issued_at = (datetime.utcnow() + timedelta(seconds=1)).isoformat()
+        event = {"type": EVENT_WORKER_COMMAND, "worker": "classifier",
+                 "action": "pause", "issued_at": issued_at}
+
+        with patch.object(worker, "pause", AsyncMock()) as pause:
+            await worker._on_command_event(event)
+
+        pause.assert_not_awaited()
+
+
+class TestPollInterval:
+    """The poll interval is only re-read when the bus can't announce changes."""
+
+    @pytest.mark.asyncio
+    async def test_cached_while_connected(self):
+        from services.worker_status import get_poll_interval, invalidate_poll_interval
+
+        bus = _started_bus()
+        read = AsyncMock(return_value=15)
+        with patch("services.event_bus.get_event_bus", return_value=bus), \
+             patch("services.worker_status._read_poll_interval", read):
+            assert await get_poll_interval() == 15
+            assert await get_poll_interval() == 15
+            assert read.await_count == 1
+
+            invalidate_poll_interval({"key": "worker_status_poll_interval"})
+            await get_poll_interval()
+            assert read.await_count == 2
+
+            # Reconnected: events may have been missed
+            bus.generation += 1
+            await get_poll_interval()
+            assert read.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_read_every_time_without_bus(self):
+        from services.worker_status import get_poll_interval
+
+        read = AsyncMock(return_value=10)
+        with patch("services.event_bus.get_event_bus", return_value=EventBus()), \
+             patch("services.worker_status._read_poll_interval", read):
+            await get_poll_interval()
+            await get_poll_interval()
+
+        assert read.await_count == 2
@@ -0,0 +1,135 @@
+"""Tests for the priority fetch queue."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from models import Channel, ConnectorType, Source
+from services.fetch_queue import FetchQueue, fetch_priority
+
+
+def _channel(
+    channel_id: int,
+    connector_type: str = ConnectorType.RSS,
+    due_minutes_ago: int | None = 10,
+    stakeholder: bool = False,
+) -> Channel:
+    now = datetime.utcnow()
+    return Channel(
+        id=channel_id,
+        name=f"Channel {channel_id}",
+        connector_type=connector_type,
+        config={},
+        next_fetch_at=None if due_minutes_ago is None else now - timedelta(minutes=due_minutes_ago),
+        source=Source(name=f"Source {channel_id}", is_stakeholder=stakeholder),
+    )
+
+
+@pytest.fixture
+def queue():
+    queue = FetchQueue()
+    yield queue
+    queue.stop()
+
+
+class TestPriority:
+    """Tests for the order in which queued channels are fetched."""
+
+    def test_stakeholder_head_start(self):
+        """Stakeholder channels count as 30 minutes more overdue; never fetched comes first."""
+        regular = _channel(1, due_minutes_ago=20)
+        stakeholder = _channel(2, due_minutes_ago=5, stakeholder=True)
+        regular_older = _channel(3, due_minutes_ago=60)
+        never = _channel(4, due_minutes_ago=None)
+
+        ordered = sorted([regular, stakeholder, regular_older, never], key=fetch_priority)
+        assert [c.id for c in ordered] == [4, 3, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_fetched_in_priority_order(self, queue):
+        """With one free worker, queued channels run most stale first; urgent ones jump ahead."""
+        order = []
+
+        async def fetch(channel_id, training_mode=False):
+            order.append(channel_id)
+            return 0
+
+        with patch("services.scheduler.fetch_channel", fetch), \
+             patch.dict("services.scheduler.SOURCE_TYPE_LIMITS", {"rss": 1}):
+            queue.enqueue(_channel(1, due_minutes_ago=5))
+            queue.enqueue(_channel(2, due_minutes_ago=50))
+            queue.enqueue(_channel(3, due_minutes_ago=20))
+            queue.enqueue(_channel(1), urgent=True)
+            await queue.join()
+
+        assert order == [1, 2, 3]
+
+
+class TestWorkerPools:
+    """Tests for per-connector-type workers, deduplication and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_slow_type_does_not_block_others(self, queue):
+        """A stuck scraper fetch does not delay RSS channels."""
+        release = asyncio.Event()
+        done = []
+
+        async def fetch(channel_id, training_mode=False):
+            if channel_id == 1:
+                await release.wait()
+            done.append(channel_id)
+            return 0
+
+        with patch("services.scheduler.fetch_channel", fetch):
+            queue.enqueue(_channel(1, connector_type=ConnectorType.X_SCRAPER))
+            queue.enqueue(_channel(2))
+            queue.enqueue(_channel(3))
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert done == [2, 3]
+            assert queue.is_queued(1)
+
+            release.set()
+            await queue.join()
+
+        assert done == [2, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_dedup_and_stats(self, queue):
+        """A queued channel is not queued twice; outcomes and waits are counted per type."""
+        async def fetch(channel_id, training_mode=False):
+            if channel_id == 2:
+                raise RuntimeError("boom")
+            return 0
+
+        with patch("services.scheduler.fetch_channel", fetch):
+            assert queue.enqueue(_channel(1))
+            assert not queue.enqueue(_channel(1))
+            assert queue.enqueue(_channel(2))
+            assert queue.get_stats()["queued"] == 2
+            await queue.join()
+
+        stats = queue.get_stats()
+        rss = stats["types"]["rss"]
+        assert stats["queued"] == 0
+        assert (rss["enqueued"], rss["fetched"], rss["errors"]) == (2, 1, 1)
+        assert rss["workers"] == 10
+        assert rss["max_wait_seconds"] is not None
+
+    @pytest.mark.asyncio
+    async def test_timeout_counts_and_frees_worker(self, queue):
+        """A fetch over its type's timeout is counted and the channel leaves the queue."""
+        async def fetch(channel_id, training_mode=False):
+            await asyncio.sleep(10)
+
+        with patch("services.scheduler.fetch_channel", fetch), \
+             patch.dict("services.scheduler.CHANNEL_FETCH_TIMEOUTS", {"rss": 0.05}), \
+             patch.object(FetchQueue, "_defer") as defer:
+            queue.enqueue(_channel(1))
+            await queue.join()
+
+        assert queue.get_stats()["types"]["rss"]["timeouts"] == 1
+        assert not queue.is_queued(1)
+        defer.assert_called_once_with(1)
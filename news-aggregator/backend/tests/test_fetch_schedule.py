@@ -0,0 +1,96 @@
+"""Tests for adaptive per-channel fetch intervals."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from config import settings
+from models import Channel, ConnectorType
+from services.fetch_schedule import record_error, record_fetch, reset_interval
+
+
+def _channel(interval: int = 60) -> Channel:
+    return Channel(
+        name="Test",
+        connector_type=ConnectorType.RSS,
+        config={},
+        fetch_interval_minutes=interval,
+        fetch_stats={},
+    )
+
+
+@pytest.fixture
+def adaptive(monkeypatch):
+    monkeypatch.setattr(settings, "adaptive_fetch_enabled", True)
+    monkeypatch.setattr(settings, "adaptive_fetch_target_items", 2.0)
+    monkeypatch.setattr(settings, "adaptive_fetch_min_factor", 0.25)
+    monkeypatch.setattr(settings, "adaptive_fetch_max_factor", 8.0)
+    monkeypatch.setattr(settings, "adaptive_fetch_min_minutes", 5)
+    monkeypatch.setattr(settings, "adaptive_fetch_max_minutes", 720)
+
+
+class TestRecordFetch:
+    """Tests for adapting the interval after each fetch."""
+
+    def test_quiet_channel_backs_off_to_bound(self, adaptive):
+        """Fetches without new items widen the interval step by step up to the max factor."""
+        channel = _channel(60)
+        now = datetime(2024, 1, 1, 12, 0)
+
+        record_fetch(channel, 0, now)
+        assert channel.fetch_stats["interval_minutes"] == 90
+        assert channel.next_fetch_at == now + timedelta(minutes=90)
+        assert channel.last_fetch_at == now
+
+        for _ in range(20):
+            record_fetch(channel, 0, now)
+        assert channel.fetch_stats["interval_minutes"] == 480
+        assert channel.fetch_stats["history"] == [0] * 10
+        assert channel.fetch_stats["fetches"] == 21
+
+    def test_busy_channel_tightens_with_step_limit(self, adaptive):
+        """Many new items shorten the interval by at most MAX_STEP per fetch."""
+        channel = _channel(60)
+
+        record_fetch(channel, 20)
+        assert channel.fetch_stats["interval_minutes"] == 40
+
+        for _ in range(10):
+            record_fetch(channel, 20)
+        # 60 * 0.25
+        assert channel.fetch_stats["interval_minutes"] == 15
+
+    def test_disabled_keeps_configured_interval(self, adaptive, monkeypatch):
+        """With adaptive fetching off, the configured interval is used."""
+        monkeypatch.setattr(settings, "adaptive_fetch_enabled", False)
+        channel = _channel(60)
+        now = datetime(2024, 1, 1, 12, 0)
+
+        record_fetch(channel, 0, now)
+        assert channel.fetch_stats["interval_minutes"] == 60
+        assert channel.next_fetch_at == now + timedelta(minutes=60)
+
+
+class TestScheduleChanges:
+    """Tests for errors and configuration changes."""
+
+    def test_error_retries_after_shorter_interval(self, adaptive):
+        """A failed fetch is retried after min(configured, effective) interval."""
+        channel = _channel(60)
+        channel.fetch_stats = {"interval_minutes": 240}
+        now = datetime(2024, 1, 1, 12, 0)
+
+        record_error(channel, now)
+        assert channel.next_fetch_at == now + timedelta(minutes=60)
+
+    def test_reset_interval(self, adaptive):
+        """Changing the configured interval restarts adaptation from it."""
+        channel = _channel(60)
+        channel.fetch_stats = {"interval_minutes": 240, "avg_new_items": 0.0}
+        channel.last_fetch_at = datetime(2024, 1, 1, 12, 0)
+        channel.fetch_interval_minutes = 30
+
+        reset_interval(channel)
+        assert channel.fetch_stats["interval_minutes"] == 30
+        assert channel.fetch_stats["avg_new_items"] == 0.0
+        assert channel.next_fetch_at == datetime(2024, 1, 1, 12, 30)
@@ -0,0 +1,120 @@
+"""Tests for the shared outbound HTTP client registry."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from services.http_clients import TLS_DEFAULT, TLS_LEGACY, HttpClientRegistry
+
+
+def _registry(handler, **kwargs) -> HttpClientRegistry:
+    """Registry whose clients answer through an httpx.MockTransport."""
+    registry = HttpClientRegistry(**kwargs)
+    registry._create_client = lambda tls, proxy: httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+    return registry
+
+
+class TestHttpClientRegistry:
+    """Tests for client sharing and per-host limits."""
+
+    @pytest.mark.asyncio
+    async def test_clients_shared_per_tls_profile(self):
+        """One client per (TLS profile, proxy); the legacy profile gets its own."""
+        registry = HttpClientRegistry()
+        default = registry.get_client(TLS_DEFAULT)
+        assert registry.get_client(TLS_DEFAULT) is default
+        assert registry.get_client(TLS_LEGACY) is not default
+        assert registry.client(verify_ssl=False).tls == TLS_LEGACY
+        await registry.close()
+        assert registry.get_client(TLS_DEFAULT) is not default
+        await registry.close()
+
+    @pytest.mark.asyncio
+    async def test_default_headers_and_stats(self):
+        """Wrapper headers are merged into each request; requests are counted per host."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(dict(request.headers))
+            return httpx.Response(200, text="ok")
+
+        registry = _registry(handler)
+        client = registry.client(headers={"User-Agent": "Test/1.0", "X-A": "1"})
+        await client.get("https://a.example/1", headers={"X-A": "2"})
+        await client.get("https://a.example/2")
+        await registry.client().get("https://b.example/")
+
+        assert seen[0]["user-agent"] == "Test/1.0"
+        assert seen[0]["x-a"] == "2"
+        stats = registry.get_stats()
+        assert stats["clients"][0]["requests"] == 3
+        assert [(h["host"], h["requests"]) for h in stats["hosts"]] == [
+            ("a.example", 2),
+            ("b.example", 1),
+        ]
+        await registry.close()
+
+    @pytest.mark.asyncio
+    async def test_shared_client_keeps_no_cookies(self):
+        """Cookies set by one site are never sent on later requests."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("cookie"))
+            return httpx.Response(200, headers={"Set-Cookie": "session=abc; Path=/"})
+
+        registry = HttpClientRegistry()
+        client = registry.get_client(TLS_DEFAULT)
+        # Real client configuration, answered by a mock transport
+        client._transport = httpx.MockTransport(handler)
+        await registry.client().get("https://a.example/login")
+        await registry.client().get("https://a.example/article")
+        await registry.client().get("https://b.example/")
+
+        assert seen == [None, None, None]
+        assert len(client.cookies) == 0
+        await registry.close()
+
+    @pytest.mark.asyncio
+    async def test_per_host_concurrency_limit(self):
+        """No more than per_host_concurrency requests to one host are in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200)
+
+        registry = _registry(handler, per_host_concurrency=2, per_host_rate=0)
+        client = registry.client()
+        await asyncio.gather(*(client.get(f"https://a.example/{i}") for i in range(6)))
+        assert peak == 2
+        await registry.close()
+
+    @pytest.mark.asyncio
+    async def test_per_host_rate_limit(self):
+        """After the burst, requests to a host are spaced by the token bucket."""
+        registry = _registry(
+            lambda request: httpx.Response(200),
+            per_host_concurrency=10,
+            per_host_rate=20.0,
+            per_host_burst=1,
+        )
+        client = registry.client()
+
+        start = time.monotonic()
+        await asyncio.gather(*(client.get("https://a.example/") for _ in range(3)))
+        assert time.monotonic() - start >= 0.09
+        # Other hosts have their own bucket
+        start = time.monotonic()
+        await client.get("https://b.example/")
+        assert time.monotonic() - start < 0.05
+        await registry.close()
@@ -2,6 +2,7 @@
 
 from datetime import datetime, timedelta
 from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from httpx import AsyncClient
@@ -197,6 +198,43 @@ class TestListItems:
         assert response.status_code == 200
         assert len(response.json()["items"]) >= 1
 
+    @pytest.mark.asyncio
+    async def test_list_items_search_ranked_with_snippet(
+        self, client: AsyncClient, db_session: AsyncSession, channel_in_db: Channel
+    ):
+        """Full-text search stems German words, ranks title matches first, highlights snippets."""
+        db_session.add_all([
+            Item(
+                channel_id=channel_in_db.id,
+                external_id="fts-content",
+                title="Haushalt der Stadt beschlossen",
+                content="Der Haushalt sieht höhere Kitagebühren für alle Familien vor.",
+                url="https://test.com/fts-content",
+                published_at=datetime.utcnow(),
+                content_hash="fts-content",
+                priority=Priority.MEDIUM,
+            ),
+            Item(
+                channel_id=channel_in_db.id,
+                external_id="fts-title",
+                title="Kitagebühren steigen",
+                content="Die Beiträge für Kindertagesstätten werden erhöht.",
+                url="https://test.com/fts-title",
+                published_at=datetime.utcnow() - timedelta(days=1),
+                content_hash="fts-title",
+                priority=Priority.MEDIUM,
+            ),
+        ])
+        await db_session.flush()
+
+        response = await client.get(
+            "/api/items", params={"search": "Kitagebühr", "sort_by": "relevance"}
+        )
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert [i["external_id"] for i in items] == ["fts-title", "fts-content"]
+        assert "<mark>Kitagebühren</mark>" in items[1]["search_snippet"]
+
     @pytest.mark.asyncio
     async def test_list_items_sort_by_date(
         self, client: AsyncClient, multiple_items_in_db: list[Item]
@@ -228,6 +266,74 @@ class TestListItems:
             priorities = [priority_order.get(item["priority"], 5) for item in items]
             assert priorities == sorted(priorities)
 
+    @pytest.mark.asyncio
+    async def test_list_items_cursor_pagination(
+        self, client: AsyncClient, db_session: AsyncSession, channel_in_db: Channel
+    ):
+        """Cursor mode walks all items by (published_at, id) without offsets."""
+        published = datetime.utcnow()
+        for i in range(25):
+            db_session.add(Item(
+                channel_id=channel_in_db.id,
+                external_id=f"cursor-test-{i}",
+                title=f"Cursor Test {i}",
+                content="Content",
+                url=f"https://test.com/cursor/{i}",
+                # Pairs share a timestamp so the id tiebreaker matters
+                published_at=published - timedelta(hours=i // 2),
+                content_hash=f"cursorhash{i}",
+                priority=Priority.MEDIUM,
+            ))
+        await db_session.flush()
+
+        seen: list[int] = []
+        params: dict[str, Any] = {"pagination": "cursor", "page_size": 10, "relevant_only": False}
+        for _ in range(3):
+            response = await client.get("/api/items", params=params)
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] == 25
+            seen.extend(item["id"] for item in data["items"])
+            if data["next_cursor"] is None:
+                break
+            params = {**params, "cursor": data["next_cursor"]}
+
+        assert len(seen) == 25
+        assert len(set(seen)) == 25
+        assert data["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_list_items_cursor_by_priority(
+        self, client: AsyncClient, multiple_items_in_db: list[Item]
+    ):
+        """Cursor mode keeps priority order across pages."""
+        params: dict[str, Any] = {
+            "sort_by": "priority", "pagination": "cursor", "page_size": 1, "relevant_only": False,
+        }
+        priorities = []
+        while True:
+            data = (await client.get("/api/items", params=params)).json()
+            priorities.extend(item["priority"] for item in data["items"])
+            if not data["next_cursor"]:
+                break
+            params = {**params, "cursor": data["next_cursor"]}
+
+        priority_order = {"high": 1, "medium": 2, "low": 3, "none": 4}
+        ranks = [priority_order[p] for p in priorities]
+        assert ranks == sorted(ranks)
+        assert len(priorities) == len(multiple_items_in_db)
+
+    @pytest.mark.asyncio
+    async def test_list_items_cursor_rejected(self, client: AsyncClient):
+        """Malformed cursors and unsupported sorts are rejected."""
+        response = await client.get("/api/items", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+        response = await client.get(
+            "/api/items", params={"pagination": "cursor", "sort_by": "source"}
+        )
+        assert response.status_code == 400
+
     @pytest.mark.asyncio
     async def test_list_items_invalid_page_size(self, client: AsyncClient):
         """Invalid page_size is rejected."""
@@ -238,6 +344,52 @@ class TestListItems:
         assert response.status_code == 422
 
 
+class TestListItemsHelpers:
+    """Tests for cursor encoding and the count cache key."""
+
+    def test_cursor_round_trip(self):
+        """Cursors decode back to their sort key and id."""
+        from api.items import _decode_cursor, _encode_cursor
+
+        published = datetime(2025, 3, 1, 12, 30)
+        cursor = _encode_cursor("date", "desc", published, 42)
+        assert _decode_cursor(cursor, "date", "desc") == (published, 42)
+
+        cursor = _encode_cursor("priority", "asc", 2, 7)
+        assert _decode_cursor(cursor, "priority", "asc") == (2, 7)
+
+    def test_cursor_for_other_sort_rejected(self):
+        """A cursor can only be used with the sort it was issued for."""
+        from fastapi import HTTPException
+
+        from api.items import _decode_cursor, _encode_cursor
+
+        cursor = _encode_cursor("date", "desc", datetime(2025, 3, 1), 1)
+        with pytest.raises(HTTPException) as exc:
+            _decode_cursor(cursor, "date", "asc")
+        assert exc.value.status_code == 400
+
+    def test_search_uses_fulltext_index(self):
+        """Search compiles to a tsvector match (GIN) plus a title substring (trigram)."""
+        from sqlalchemy.dialects import postgresql
+
+        from api.items import _search_condition
+
+        sql = str(_search_condition(" kita ").compile(dialect=postgresql.dialect()))
+        assert "items.search_vector @@ websearch_to_tsquery('german'::regconfig" in sql
+        assert "items.title ILIKE" in sql
+        assert "items.content" not in sql
+
+    def test_count_cache_key_normalizes_filters(self):
+        """Equivalent filter sets share one count cache entry."""
+        from api.items import _count_cache_key
+
+        assert _count_cache_key(priority="high,medium", search=" Pflege ") == _count_cache_key(
+            search="pflege", priority="medium, high"
+        )
+        assert _count_cache_key(priority="high") != _count_cache_key(priority="medium")
+
+
 class TestGetItem:
     """Tests for GET /api/items/{id} endpoint."""
 
@@ -415,6 +567,27 @@ class TestMarkAsRead:
         get_response = await client.get(f"/api/items/{item_in_db.id}")
         assert get_response.json()["is_read"] is True
 
+    @pytest.mark.asyncio
+    async def test_counts_invalidated_after_commit(
+        self, client: AsyncClient, db_session: AsyncSession, item_in_db: Item
+    ):
+        """Cached totals are dropped only once the change is committed.
+
+        Dropped earlier, a concurrent list request could cache the old total
+        again before the commit.
+        """
+        in_transaction = []
+
+        with patch(
+            "api.items.invalidate_item_counts",
+            side_effect=lambda: in_transaction.append(db_session.in_transaction()),
+        ):
+            await client.post(f"/api/items/{item_in_db.id}/read")
+            await client.post(f"/api/items/{item_in_db.id}/archive")
+            await client.post("/api/items/mark-all-read", json={"ids": [item_in_db.id]})
+
+        assert in_transaction == [False, False, False]
+
     @pytest.mark.asyncio
     async def test_mark_as_read_not_found(self, client: AsyncClient):
         """Returns 404 for non-existent item."""
@@ -533,6 +706,38 @@ class TestRefetchItem:
 
         assert response.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_refetch_ignores_cached_negative_result(
+        self, db_session: AsyncSession, item_in_db: Item
+    ):
+        """A manual re-fetch downloads the article even if the cache says there is none."""
+        from api.items import _refetch_rss_item_task
+        from services.article_cache import get_article_cache
+
+        await db_session.commit()
+        await get_article_cache().put(item_in_db.url, None)
+        html = (
+            '<html><head><meta property="og:title" content="Test Article" />'
+            '<meta property="og:type" content="article" /></head><body><article><p>'
+            + "Der Artikeltext ist lang genug. " * 10
+            + "</p></article></body></html>"
+        )
+
+        with patch("api.items.async_session_maker") as mock_session_maker, \
+             patch("api.items._reprocess_items_task", AsyncMock()), \
+             patch("services.article_extractor.get_http_client") as mock_client:
+            mock_session_maker.return_value.__aenter__ = AsyncMock(return_value=db_session)
+            mock_session_maker.return_value.__aexit__ = AsyncMock(return_value=None)
+            mock_client.return_value.get = AsyncMock(
+                return_value=MagicMock(text=html, raise_for_status=MagicMock())
+            )
+            await _refetch_rss_item_task(item_in_db.id)
+
+        mock_client.return_value.get.assert_awaited_once()
+        await db_session.refresh(item_in_db)
+        assert "Der Artikeltext ist lang genug." in item_in_db.content
+        assert item_in_db.metadata_["article_extracted"] is True
+
     @pytest.mark.asyncio
     async def test_refetch_x_scraper_item(
         self, client: AsyncClient, db_session: AsyncSession, source_in_db: Source
@@ -7,6 +7,7 @@ from services.llm import (
     BaseLLMProvider,
     LLMResponse,
     LLMService,
+    LLMStreamChunk,
     OllamaProvider,
     OpenRouterProvider,
 )
@@ -77,9 +78,8 @@ class TestOllamaProvider:
         mock_response.raise_for_status = MagicMock()
 
         with patch("services.llm.ollama.httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.is_closed = False
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
             response = await provider.complete("Test prompt")
 
@@ -87,6 +87,80 @@ class TestOllamaProvider:
         assert response.model == "llama3.2"
         assert response.tokens_used == 50
 
+    @pytest.mark.asyncio
+    async def test_pooled_client_reused(self):
+        """Requests should share one long-lived client until closed."""
+        provider = OllamaProvider()
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"message": {"content": "ok"}}
+        mock_response.raise_for_status = MagicMock()
+
+        with patch("services.llm.ollama.httpx.AsyncClient") as mock_client:
+            mock_client.return_value.is_closed = False
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
+            mock_client.return_value.aclose = AsyncMock()
+
+            await provider.complete("First")
+            await provider.chat([{"role": "user", "content": "Second"}])
+            stats = provider.get_pool_stats()
+            await provider.close()
+
+        assert mock_client.call_count == 1
+        assert mock_client.return_value.post.await_count == 2
+        mock_client.return_value.aclose.assert_awaited_once()
+        assert stats["requests"] == 2
+        assert stats["clients_created"] == 1
+        assert stats["open"] is True
+        assert provider.get_pool_stats()["open"] is False
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_yields_chunks(self):
+        """chat_stream should yield message parts and a final chunk with stats."""
+        provider = OllamaProvider()
+        lines = [
+            '{"message": {"content": "{\\"a\\""}, "done": false}',
+            "",
+            '{"message": {"content": ": 1}"}, "done": false}',
+            '{"message": {"content": ""}, "done": true, "eval_count": 2, "prompt_eval_count": 7}',
+        ]
+
+        async def aiter_lines():
+            for line in lines:
+                yield line
+
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_response.aiter_lines = aiter_lines
+        stream_ctx = MagicMock()
+        stream_ctx.__aenter__ = AsyncMock(return_value=mock_response)
+        stream_ctx.__aexit__ = AsyncMock(return_value=None)
+
+        with patch("services.llm.ollama.httpx.AsyncClient") as mock_client:
+            mock_client.return_value.is_closed = False
+            mock_client.return_value.stream = MagicMock(return_value=stream_ctx)
+
+            chunks = [c async for c in provider.chat_stream([{"role": "user", "content": "x"}])]
+
+        payload = mock_client.return_value.stream.call_args.kwargs["json"]
+        assert payload["stream"] is True
+        assert "".join(c.text for c in chunks) == '{"a": 1}'
+        assert chunks[-1].done is True
+        assert chunks[-1].metadata["eval_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_pool_stats_count_new_connections(self):
+        """Trace hook should count opened connections, the rest are reuses."""
+        provider = OllamaProvider()
+        provider._pool_stats["requests"] = 4
+        await provider._trace("connection.connect_tcp.complete", {})
+        await provider._trace("connection.send_request_headers.complete", {})
+
+        stats = provider.get_pool_stats()
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 3
+        assert stats["reuse_rate"] == 0.75
+
     @pytest.mark.asyncio
     async def test_is_available_success(self):
         """is_available should return True when API responds."""
@@ -156,9 +230,8 @@ class TestOpenRouterProvider:
         mock_response.raise_for_status = MagicMock()
 
         with patch("services.llm.openrouter.httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.is_closed = False
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
             response = await provider.complete("Test prompt")
 
@@ -228,6 +301,58 @@ class TestLLMService:
         provider1.complete.assert_called_once()
         provider2.complete.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_stream_chat_stops_early(self):
+        """stream_chat should close the stream once stop_when fires and report metrics."""
+        closed = False
+
+        async def fake_stream(messages, temperature=0.7, max_tokens=None):
+            nonlocal closed
+            try:
+                for part in ["{", '"x"', ": 1", "}", " trailing", " chatter"]:
+                    yield LLMStreamChunk(text=part)
+            finally:
+                closed = True
+
+        provider = MagicMock(spec=BaseLLMProvider)
+        provider.provider_name = "test"
+        provider.model = "test-model"
+        provider.chat_stream = fake_stream
+
+        seen = []
+
+        def stop_when(chunk):
+            seen.append(chunk)
+            return chunk == "}"
+
+        service = LLMService([provider])
+        response = await service.stream_chat(
+            [{"role": "user", "content": "x"}], stop_when=stop_when
+        )
+
+        assert response.text == '{"x": 1}'
+        assert closed is True
+        assert seen == ["{", '"x"', ": 1", "}"]
+        assert response.completion_tokens == 4
+        assert response.metadata["stopped_early"] is True
+        assert response.metadata["ttft_ms"] is not None
+        assert response.metadata["provider"] == "test"
+
+    @pytest.mark.asyncio
+    async def test_stream_chat_falls_back_to_chat(self):
+        """Providers without native streaming should be served via chat()."""
+        provider = OpenRouterProvider(api_key="key")
+        provider.chat = AsyncMock(
+            return_value=LLMResponse(text="hello", model="m", completion_tokens=3)
+        )
+
+        service = LLMService([provider])
+        response = await service.stream_chat([{"role": "user", "content": "x"}])
+
+        assert response.text == "hello"
+        assert response.completion_tokens == 3
+        assert response.metadata["stopped_early"] is False
+
     @pytest.mark.asyncio
     async def test_raises_when_all_fail(self):
         """Service should raise when all providers fail."""
@@ -173,6 +173,28 @@ class TestLLMWorkerStatus:
         status = await worker.get_status()
         assert status["fresh_queue_size"] == 2
 
+    @pytest.mark.asyncio
+    async def test_get_status_llm_connections(self, worker):
+        """Should report pool stats of the cached processor's providers."""
+        assert (await worker.get_status())["llm_connections"] == {}
+
+        worker._processor = MagicMock()
+        worker._processor.llm.get_pool_stats.return_value = {"ollama": {"requests": 3}}
+        status = await worker.get_status()
+        assert status["llm_connections"] == {"ollama": {"requests": 3}}
+
+    @pytest.mark.asyncio
+    async def test_stop_closes_processor_connections(self, worker):
+        """Stopping should close pooled LLM connections and drop the processor."""
+        processor = MagicMock()
+        processor.llm.close = AsyncMock()
+        await worker.start()
+        worker._processor = processor
+        await worker.stop()
+
+        processor.llm.close.assert_awaited_once()
+        assert worker._processor is None
+
     @pytest.mark.asyncio
     async def test_get_status_stats_copy(self, worker):
         """Should return copy of stats."""
@@ -211,9 +233,11 @@ class TestLLMWorkerProcessFresh:
         for i in range(10):
             await worker.enqueue_fresh(i)
 
-        # Mock processor and _process_items
+        # Mock processor, claims and _process_items
         mock_processor = MagicMock()
-        with patch.object(worker, "_get_processor", return_value=mock_processor):
+        with patch.object(worker, "_get_processor", return_value=mock_processor), \
+                patch("services.llm_worker.claim_items", AsyncMock(return_value=[0, 1, 2, 3, 4])), \
+                patch("services.llm_worker.release_claims", AsyncMock()):
             with patch.object(worker, "_process_items", return_value=5) as mock_process:
                 result = await worker._process_fresh_items()
 
@@ -251,6 +275,50 @@ class TestLLMWorkerProcessBacklog:
 
         assert result == 3
 
+    @pytest.mark.asyncio
+    async def test_process_backlog_walks_retry_priorities_in_order(self, worker):
+        """Backlog fills from high, then edge_case, and stops at the batch size."""
+        from sqlalchemy.dialects import postgresql
+
+        mock_claim = AsyncMock(side_effect=[list(range(1, 7)), list(range(7, 11))])
+        mock_release = AsyncMock()
+
+        with patch.object(worker, "_get_processor", return_value=MagicMock()), \
+                patch("services.gpu1_power.get_power_manager", return_value=None), \
+                patch("services.llm_worker.async_session_maker"), \
+                patch("services.llm_worker.claim_items", mock_claim), \
+                patch("services.llm_worker.release_claims", mock_release):
+            with patch.object(worker, "_process_items", return_value=10) as mock_process:
+                await worker._process_backlog_items()
+
+        assert mock_claim.await_count == 2
+        assert mock_process.call_args.args[0] == list(range(1, 11))
+        second = str(mock_claim.await_args_list[1].args[2].compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        ))
+        assert "items.retry_priority = 'edge_case'" in second
+        assert "LIMIT 4" in second
+        # Claims are released once the batch is done
+        assert mock_release.await_args.args[2] == list(range(1, 11))
+
+    @pytest.mark.asyncio
+    async def test_process_backlog_releases_claims_on_error(self, worker):
+        """A failing batch still hands its items back to the other workers."""
+        mock_release = AsyncMock()
+
+        with patch.object(worker, "_get_processor", return_value=MagicMock()), \
+                patch("services.gpu1_power.get_power_manager", return_value=None), \
+                patch("services.llm_worker.async_session_maker"), \
+                patch("services.llm_worker.claim_items", AsyncMock(return_value=[1, 2])), \
+                patch("services.llm_worker.release_claims", mock_release):
+            with patch.object(worker, "_process_items", side_effect=RuntimeError("boom")):
+                result = await worker._process_backlog_items()
+
+        assert result == 0
+        assert worker._stats["errors"] == 1
+        assert worker._held_claims == []
+        mock_release.assert_awaited()
+
 
 class TestLLMWorkerProcessItems:
     """Tests for item processing logic."""
@@ -335,6 +403,90 @@ class TestLLMWorkerProcessItems:
         assert result == 0
 
 
+class TestLLMWorkerConcurrency:
+    """Tests for bounded concurrent processing and grouped writes."""
+
+    @staticmethod
+    def _result(item_id):
+        return {"item_id": item_id, "title": f"Item {item_id}", "llm_priority": "low"}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """No more than `concurrency` items should be analyzed at once."""
+        worker = LLMWorker(concurrency=3)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_analyze(item_id, processor, is_fresh):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return self._result(item_id)
+
+        write = AsyncMock(side_effect=lambda results, item_type: len(results))
+        with patch.object(worker, "_analyze_item", side_effect=fake_analyze):
+            with patch.object(worker, "_write_results", write):
+                result = await worker._process_items(list(range(10)), MagicMock(), is_fresh=True)
+
+        assert result == 10
+        assert max_in_flight == 3
+        # Results are committed in groups, not one transaction per item
+        assert write.await_count < 10
+        written = sorted(r["item_id"] for call in write.await_args_list for r in call.args[0])
+        assert written == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_fresh_items_preempt_backlog(self):
+        """Backlog stops launching items once fresh items arrive, but finishes in-flight ones."""
+        worker = LLMWorker(concurrency=2)
+        started = []
+
+        async def fake_analyze(item_id, processor, is_fresh):
+            started.append(item_id)
+            if item_id == 1:
+                await worker.enqueue_fresh(99)
+            await asyncio.sleep(0.01)
+            return self._result(item_id)
+
+        write = AsyncMock(side_effect=lambda results, item_type: len(results))
+        with patch.object(worker, "_analyze_item", side_effect=fake_analyze):
+            with patch.object(worker, "_write_results", write):
+                result = await worker._process_items(
+                    list(range(1, 10)), MagicMock(), is_fresh=False
+                )
+
+        assert started == [1, 2]
+        assert result == 2
+
+    @pytest.mark.asyncio
+    async def test_grouped_write_falls_back_to_single(self, worker):
+        """A failing group commit should be retried item by item."""
+        good_db = AsyncMock()
+        good_db.add = MagicMock()
+        bad_db = AsyncMock()
+        bad_db.add = MagicMock()
+        bad_db.commit = AsyncMock(side_effect=Exception("constraint violation"))
+        sessions = [bad_db, good_db, bad_db]
+
+        results = [
+            {**self._result(i), "update_values": {}, "analysis": {}, "llm_aks": [],
+             "priority_input": "unknown", "duplicate_confirmed": None,
+             "duplicate_candidate": {}, "elapsed": 1.0}
+            for i in (1, 2)
+        ]
+
+        with patch("services.llm_worker.async_session_maker") as mock_session:
+            mock_session.return_value.__aenter__ = AsyncMock(side_effect=sessions)
+            mock_session.return_value.__aexit__ = AsyncMock(return_value=None)
+            with patch("services.item_events.record_event", new_callable=AsyncMock):
+                written = await worker._write_results(results, "backlog")
+
+        assert written == 1
+        assert worker._stats["errors"] == 1
+
+
 class TestModuleFunctions:
     """Tests for module-level functions."""
 
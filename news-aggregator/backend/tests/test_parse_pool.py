@@ -0,0 +1,125 @@
+"""Tests for the parsing process pool."""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pymupdf
+import pytest
+
+from services.parse_pool import (
+    ParsePool,
+    ParseTimeoutError,
+    _extract_html_items,
+    _extract_pdf,
+    _parse_feed,
+)
+
+FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Landtag</title>
+<item><title>Haushalt beschlossen</title><link>https://example.com/a</link>
+<pubDate>Mon, 06 Sep 2021 16:45:00 +0000</pubDate></item>
+</channel></rss>"""
+
+
+@pytest.fixture
+def pool():
+    pool = ParsePool(workers=1, timeout=10)
+    yield pool
+    pool.shutdown()
+
+
+class TestParsePool:
+    """Tests for running parsers in worker processes."""
+
+    @pytest.mark.asyncio
+    async def test_feed_parsed_in_worker(self, pool):
+        """Feeds come back from the worker with entries and a picklable bozo_exception."""
+        feed = await pool.run(_parse_feed, FEED)
+        assert feed.feed.get("title") == "Landtag"
+        assert feed.entries[0].title == "Haushalt beschlossen"
+        assert feed.entries[0].published_parsed.tm_year == 2021
+
+        broken = await pool.run(_parse_feed, "<rss><channel><item>")
+        assert broken.bozo
+        assert str(broken.bozo_exception)
+
+        stats = pool.get_stats()
+        assert stats["mode"] == "process"
+        assert stats["tasks"]["parse_feed"]["tasks"] == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_restarts_pool(self, pool):
+        """A task over its timeout raises ParseTimeoutError and its worker is replaced."""
+        with pytest.raises(ParseTimeoutError):
+            await pool.run(time.sleep, 30, timeout=0.5)
+
+        assert pool.get_stats()["restarts"] == 1
+        assert pool.get_stats()["tasks"]["sleep"]["timeouts"] == 1
+        # The next task gets a fresh worker
+        feed = await pool.run(_parse_feed, FEED)
+        assert len(feed.entries) == 1
+
+    @pytest.mark.asyncio
+    async def test_thread_mode(self):
+        """workers=0 runs parsers in a thread."""
+        pool = ParsePool(workers=0)
+        feed = await pool.run(_parse_feed, FEED)
+        assert len(feed.entries) == 1
+        assert pool.get_stats()["mode"] == "thread"
+
+
+class TestWorkerFunctions:
+    """Tests for the parser functions that run in the workers."""
+
+    def test_extract_html_items(self):
+        """Items without a title are skipped; links come from link or title elements."""
+        html = """<ul>
+            <li class="n"><a class="t" href="/a">Erste</a><time>01.02.2024</time></li>
+            <li class="n"><span class="t"></span></li>
+            <li class="n"><span class="t">Zweite</span><p>Text</p></li>
+        </ul>"""
+        items = _extract_html_items(html, {
+            "item": "li.n", "title": ".t", "link": None, "content": "p", "date": "time",
+        })
+
+        assert [i["title"] for i in items] == ["Erste", "Zweite"]
+        assert items[0]["href"] == "/a"
+        assert items[0]["date_text"] == "01.02.2024"
+        assert items[1]["href"] is None
+        assert items[1]["content"] == "Text"
+
+    def test_extract_pdf(self):
+        """Text, page count and metadata are extracted from PDF bytes."""
+        doc = pymupdf.open()
+        doc.new_page().insert_text((72, 72), "Sozialbericht Hessen")
+        doc.set_metadata({"title": "Bericht"})
+        data = doc.tobytes()
+        doc.close()
+
+        parsed = _extract_pdf(data)
+        assert "Sozialbericht Hessen" in parsed["text"]
+        assert parsed["page_count"] == 1
+        assert parsed["metadata"]["title"] == "Bericht"
+
+    def test_workers_import_without_app(self):
+        """Worker processes load the parsers without the database, models or app."""
+        script = (
+            "import sys\n"
+            "from services.parse_pool import _extract_article\n"
+            "html = '<article><p>' + 'Text ' * 40 + '</p></article>'\n"
+            "assert _extract_article(html, 'https://www.hessenschau.de/a')['content']\n"
+            "loaded = {m.split('.')[0] for m in sys.modules}\n"
+            "assert not loaded & {'database', 'models', 'main', 'api'}, loaded\n"
+        )
+        env = {k: v for k, v in os.environ.items() if not k.startswith("DATABASE_")}
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).parent.parent,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
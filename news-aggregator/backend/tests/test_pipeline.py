@@ -1,12 +1,13 @@
 """Tests for the item processing pipeline."""
 
 from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models import Channel, ConnectorType, Item, Priority, Rule, RuleType, Source
-from services.pipeline import Pipeline, RawItem
+from services.pipeline import DedupLookup, Pipeline, RawItem, normalize_raw_item
 
 
 class TestRawItem:
@@ -40,6 +41,47 @@ class TestRawItem:
         assert item.metadata["likes"] == 100
 
 
+class TestNormalizeRawItem:
+    """Tests for the module-level normalization helper."""
+
+    def test_matches_pipeline_normalization(self):
+        """Scheduler and pipeline must produce identical text for ingest."""
+        raw = RawItem(
+            external_id="1",
+            title="<b>Titel</b> &amp; mehr",
+            content="<p>Text   mit\n\nLeerraum</p>",
+            url="https://example.com",
+        )
+        normalized = normalize_raw_item(raw)
+        assert normalized.title == "Titel & mehr"
+        assert normalized.content == "Text mit Leerraum"
+
+
+class TestDedupLookup:
+    """Tests for the in-memory dedup maps built by the pre-pass."""
+
+    def test_exact_duplicates_and_batch_registration(self):
+        """Accepted items should dedup later items of the same batch."""
+        dedup = DedupLookup(external_ids={"old-1"}, content_hashes={"hash-old"})
+        assert dedup.is_duplicate("old-1", "other")
+        assert dedup.is_duplicate("new-1", "hash-old")
+        assert not dedup.is_duplicate("new-1", "hash-new")
+
+        dedup.add("new-1", "hash-new")
+        assert dedup.is_duplicate("new-1", "x")
+        assert dedup.is_duplicate("new-2", "hash-new")
+
+    def test_url_match_uses_normalized_url(self):
+        """URL lookup should match tracked-param and www variants of a stored URL."""
+        dedup = DedupLookup(url_matches={
+            "https://example.com/a": 1,
+            "https://example.com/b": 2,
+        })
+        assert dedup.url_match("https://example.com/a?utm_source=x") == 1
+        assert dedup.url_match("https://www.example.com/b/?utm_source=feed") == 2
+        assert dedup.url_match("https://example.com/c") is None
+
+
 class TestPipeline:
     """Tests for Pipeline class."""
 
@@ -366,3 +408,130 @@ class TestPipeline:
 
         assert len(new_items) == 1
         assert new_items[0].external_id == "new-1"
+
+    @pytest.mark.asyncio
+    async def test_process_uses_ingest_results(self, db_session: AsyncSession):
+        """Pre-computed ingest results replace per-item duplicate search and indexing."""
+        source = Source(name="Test")
+        db_session.add(source)
+        await db_session.flush()
+
+        channel = Channel(
+            source_id=source.id,
+            connector_type=ConnectorType.RSS,
+            config={},
+        )
+        channel.source = source
+        db_session.add(channel)
+        await db_session.flush()
+
+        relevance_filter = MagicMock()
+        relevance_filter.find_duplicates_batch = AsyncMock(return_value=[])
+        relevance_filter.confirm_index = AsyncMock(return_value=(1, []))
+        relevance_filter.discard_index = AsyncMock(return_value=1)
+        relevance_filter.index_items_batch = AsyncMock(return_value=0)
+
+        raw_items = [
+            RawItem(
+                external_id="ingested-1",
+                title="Ingested Article",
+                content="Ingested content",
+                url="https://example.com/ingested",
+            ),
+            # Same content: dropped as a duplicate, its staged embedding released
+            RawItem(
+                external_id="ingested-2",
+                title="Ingested Article (repost)",
+                content="Ingested content",
+                url="https://example.com/ingested-repost",
+            ),
+        ]
+        pre_filter_results = {
+            "ingested-1": {
+                "should_process": True,
+                "result": {"relevant": True, "relevance_confidence": 0.8},
+                "duplicates": [],
+                "index_handle": "handle-1",
+            },
+            "ingested-2": {
+                "should_process": True,
+                "result": {"relevant": True, "relevance_confidence": 0.8},
+                "duplicates": [],
+                "index_handle": "handle-2",
+            },
+        }
+
+        pipeline = Pipeline(
+            db_session,
+            relevance_filter=relevance_filter,
+            pre_filter_results=pre_filter_results,
+        )
+        new_items = await pipeline.process(raw_items, channel)
+
+        assert len(new_items) == 1
+        relevance_filter.find_duplicates_batch.assert_not_awaited()
+        relevance_filter.index_items_batch.assert_not_awaited()
+        confirmed = relevance_filter.confirm_index.call_args.args[0]
+        assert confirmed[0]["handle"] == "handle-1"
+        assert confirmed[0]["id"] == str(new_items[0].id)
+        assert new_items[0].indexed_at is not None
+        relevance_filter.discard_index.assert_awaited_once_with(["handle-2"])
+
+    @pytest.mark.asyncio
+    async def test_process_batches_duplicate_lookups(self, db_session: AsyncSession):
+        """Duplicate lookups should be resolved once per batch, not per item."""
+        source = Source(name="Test")
+        db_session.add(source)
+        await db_session.flush()
+
+        channel = Channel(source_id=source.id, connector_type=ConnectorType.RSS, config={})
+        other = Channel(source_id=source.id, connector_type=ConnectorType.RSS, config={"x": 1})
+        channel.source = source
+        db_session.add_all([channel, other])
+        await db_session.flush()
+
+        existing = Item(
+            channel_id=other.id,
+            external_id="other-1",
+            title="Elsewhere",
+            content="Elsewhere content",
+            # Stored with tracking params: only the normalized column can match it
+            url="https://example.com/shared?utm_campaign=feed",
+            url_normalized="https://example.com/shared",
+            published_at=datetime.utcnow(),
+            content_hash="hash-elsewhere",
+        )
+        db_session.add(existing)
+        await db_session.flush()
+
+        relevance_filter = MagicMock()
+        relevance_filter.find_duplicates_batch = AsyncMock(
+            return_value=[[{"id": str(existing.id), "score": 0.9, "title": "Elsewhere"}], []]
+        )
+        relevance_filter.index_items_batch = AsyncMock(return_value=0)
+
+        raw_items = [
+            RawItem(external_id="url-dup", title="Shared", content="Shared body",
+                    url="https://www.example.com/shared?utm_source=x"),
+            RawItem(external_id="semantic-dup", title="Same story", content="Reworded",
+                    url="https://example.com/s1"),
+            RawItem(external_id="fresh", title="Fresh", content="Fresh body",
+                    url="https://example.com/s2"),
+            RawItem(external_id="fresh", title="Fresh again", content="Repeated id",
+                    url="https://example.com/s3"),
+        ]
+
+        pipeline = Pipeline(db_session, relevance_filter=relevance_filter)
+        new_items = await pipeline.process(raw_items, channel)
+
+        by_ext = {item.external_id: item for item in new_items}
+        assert len(new_items) == 3
+        assert by_ext["url-dup"].similar_to_id == existing.id
+        assert by_ext["semantic-dup"].similar_to_id == existing.id
+        assert by_ext["fresh"].similar_to_id is None
+        assert by_ext["url-dup"].url_normalized == "https://example.com/shared"
+
+        # One batched search for the items without a URL match
+        relevance_filter.find_duplicates_batch.assert_awaited_once()
+        searched = relevance_filter.find_duplicates_batch.call_args.args[0]
+        assert [i["title"] for i in searched] == ["Same story", "Fresh", "Fresh again"]
@@ -1,9 +1,11 @@
 """Tests for processor parsing and priority logic."""
 
+import json
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock
 
-from services.processor import ItemProcessor
+from services.processor import AnalysisJsonScanner, ItemProcessor
 from services.llm import LLMResponse
 
 
@@ -145,6 +147,36 @@ class TestParseAnalysisResponse:
         assert result["priority"] == "low"
 
 
+class TestAnalysisJsonScanner:
+    """Tests for incremental detection of a complete analysis JSON."""
+
+    def test_stops_when_object_closes(self):
+        """Scanner reports completion at the closing brace, ignoring fences and trailing text."""
+        scanner = AnalysisJsonScanner(required_fields=frozenset({"summary", "tags"}))
+        chunks = ["```json\n{", '"summary": "a } b",', ' "tags": ["x", {"y": 1}]', "}", "\n```"]
+        results = [scanner.feed(chunk) for chunk in chunks[:4]]
+        assert results == [False, False, False, True]
+        assert scanner.json_text == '{"summary": "a } b", "tags": ["x", {"y": 1}]}'
+
+    def test_stops_after_required_fields(self):
+        """Scanner should cut the stream once all required fields are closed."""
+        scanner = AnalysisJsonScanner(required_fields=frozenset({"summary", "relevant"}))
+        assert scanner.feed('{"summary": "Text with \\"quotes\\", commas",') is False
+        assert scanner.feed(' "relevant": true') is False
+        assert scanner.feed(', "extra": "verbose') is True
+        assert json.loads(scanner.json_text) == {
+            "summary": 'Text with "quotes", commas',
+            "relevant": True,
+        }
+
+    def test_nested_commas_do_not_close_fields(self):
+        """Commas inside arrays must not count as field boundaries."""
+        scanner = AnalysisJsonScanner(required_fields=frozenset({"tags", "priority"}))
+        assert scanner.feed('{"tags": ["a", "b", "c"], "priority"') is False
+        assert scanner.feed(': "high"}') is True
+        assert json.loads(scanner.json_text)["priority"] == "high"
+
+
 class TestDefaultAnalysis:
     """Tests for _default_analysis method."""
 
@@ -406,3 +438,33 @@ class TestAnalyzeMethod:
 
         assert result["priority"] == "low"
         assert result["relevant"] is False
+
+    @pytest.mark.asyncio
+    async def test_analyze_streaming_reports_metrics(self):
+        """Streaming mode should parse the closed JSON and attach call metrics."""
+        llm = MagicMock()
+        processor = ItemProcessor(llm_service=llm, streaming=True)
+        llm.stream_chat = AsyncMock(
+            return_value=LLMResponse(
+                text='{"summary": "S", "priority": "high"} noise',
+                model="test",
+                completion_tokens=12,
+                metadata={"streamed": True, "provider": "ollama", "ttft_ms": 150,
+                          "tokens_per_sec": 42.0, "stopped_early": True},
+            )
+        )
+
+        analysis, messages = await processor.analyze_from_data_with_messages(
+            {"title": "T", "content": "C", "source_name": "Q"}
+        )
+
+        llm.stream_chat.assert_awaited_once()
+        assert analysis["priority"] == "high"
+        assert analysis["llm_metrics"] == {
+            "provider": "ollama",
+            "ttft_ms": 150,
+            "tokens_per_sec": 42.0,
+            "stopped_early": True,
+            "completion_tokens": 12,
+        }
+        assert messages[-1]["role"] == "assistant"
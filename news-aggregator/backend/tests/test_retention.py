@@ -0,0 +1,81 @@
+"""Tests for the chunked retention purge."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from models import Priority
+from services.retention import delete_batch_statement, purge_items, retention_conditions
+
+CONFIG = {
+    "retention_days_high": 365,
+    "retention_days_medium": 180,
+    "retention_days_low": 90,
+    "retention_days_none": 30,
+    "exclude_starred": True,
+}
+
+
+class _FakeSession:
+    """Session returning scripted DELETE ... RETURNING batches."""
+
+    def __init__(self, batches: list[list[int]]):
+        self.batches = batches
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+    async def execute(self, stmt):
+        return [(i,) for i in self.batches.pop(0)]
+
+    async def commit(self):
+        pass
+
+
+def test_delete_batch_statement():
+    """Batches are selected oldest first with SKIP LOCKED and deleted with RETURNING id."""
+    conditions = retention_conditions(Priority.LOW, CONFIG, datetime(2024, 6, 1))
+    sql = str(delete_batch_statement(conditions, 500).compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith("DELETE FROM items WHERE items.id IN (SELECT items.id")
+    assert "ORDER BY items.fetched_at" in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert sql.endswith("RETURNING items.id")
+    assert "is_starred = false" in sql
+
+
+@pytest.mark.asyncio
+async def test_purge_in_batches_with_vector_cleanup():
+    """Each batch is deleted in its own session, sent to the vector indexes and reported."""
+    # high: 3 + 2, medium: none, low: 3 then empty, none: none
+    session = _FakeSession([[1, 2, 3], [4, 5], [], [6, 7, 8], [], []])
+    relevance_filter = MagicMock()
+    relevance_filter.delete_items = AsyncMock(side_effect=lambda ids: (len(ids), len(ids)))
+    published = []
+
+    async def publish(status):
+        published.append(dict(status))
+
+    create_filter = AsyncMock(return_value=relevance_filter)
+    with patch("services.retention.async_session_maker", return_value=session), \
+         patch("services.retention.count_expired", AsyncMock(side_effect=[5, 0, 3, 0])), \
+         patch("services.relevance_filter.create_relevance_filter", create_filter), \
+         patch("services.retention._publish", publish):
+        result = await purge_items(CONFIG, batch_size=3, pause=0)
+
+    assert result["deleted"] == 8
+    assert result["by_priority"] == {"high": 5, "low": 3}
+    assert result["batches"] == 3
+    assert result["vector_deleted"] == 8
+    assert [c.args[0] for c in relevance_filter.delete_items.await_args_list] == [
+        ["1", "2", "3"], ["4", "5"], ["6", "7", "8"],
+    ]
+    assert published[0]["running"] is True
+    assert published[0]["total"] == 8
+    assert published[-1]["running"] is False
+    assert published[-1]["deleted"] == 8
@@ -0,0 +1,108 @@
+"""Tests for the compiled rule engine."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from models import Priority, Rule, RuleType
+from services.rule_engine import CompiledRule, RuleEngine, compile_rules
+
+
+def _rule(rule_id: int, rule_type: RuleType, pattern: str, order: int = 0) -> CompiledRule:
+    return CompiledRule(
+        id=rule_id,
+        name=f"Rule {rule_id}",
+        rule_type=rule_type,
+        pattern=pattern,
+        priority_boost=10,
+        target_priority=None,
+        order=order,
+    )
+
+
+class TestCompiledRuleSet:
+    """Tests for keyword/regex matching."""
+
+    def test_keyword_hits_in_one_pass(self):
+        """All keyword rules hit by the text are returned, in rule order."""
+        rule_set = compile_rules([
+            _rule(1, RuleType.KEYWORD, "Kita, Pflege"),
+            _rule(2, RuleType.KEYWORD, "kitas"),
+            _rule(3, RuleType.KEYWORD, "haushalt"),
+            _rule(4, RuleType.KEYWORD, "pflegeheim"),
+        ])
+        hits = rule_set.match("Neue KITAS und Pflegeheime geplant")
+        assert [r.id for r in hits] == [1, 2, 4]
+        assert rule_set.match("Wetter morgen") == []
+
+    def test_overlapping_and_empty_keywords(self):
+        """Keywords inside longer keywords match; empty keywords are ignored."""
+        rule_set = compile_rules([
+            _rule(1, RuleType.KEYWORD, "tag, ,"),
+            _rule(2, RuleType.KEYWORD, "landtag"),
+        ])
+        assert [r.id for r in rule_set.match("Im Landtag")] == [1, 2]
+        assert [r.id for r in rule_set.match("Am Tag")] == [1]
+        assert rule_set.match("nichts") == []
+
+    def test_regex_rules_precompiled(self):
+        """Regex rules match case-insensitively; invalid patterns are dropped."""
+        rule_set = compile_rules([
+            _rule(1, RuleType.REGEX, r"\d+\s*(million|mio).*euro"),
+            _rule(2, RuleType.REGEX, r"(unclosed"),
+            _rule(3, RuleType.SEMANTIC, "Geht es um Kürzungen?"),
+        ])
+        assert [r.id for r in rule_set.match("Kosten: 50 Millionen EURO")] == [1]
+        assert [r.id for r in rule_set.semantic_rules] == [3]
+
+    def test_compiles_orm_rules(self):
+        """ORM Rule objects are snapshotted into CompiledRule."""
+        rule = Rule(
+            name="Budget",
+            rule_type=RuleType.KEYWORD,
+            pattern="haushalt",
+            priority_boost=20,
+            target_priority=Priority.HIGH,
+        )
+        rule_set = compile_rules([rule])
+        (hit,) = rule_set.match("Haushalt 2025")
+        assert hit.priority_boost == 20
+        assert hit.target_priority == Priority.HIGH
+
+
+class TestRuleEngine:
+    """Tests for rule set caching and invalidation."""
+
+    @staticmethod
+    def _db(rules: list[Rule]) -> MagicMock:
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = rules
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        return db
+
+    @pytest.mark.asyncio
+    async def test_rules_loaded_once_until_invalidated(self):
+        """The rule set is cached until invalidate() is called."""
+        engine = RuleEngine()
+        db = self._db([Rule(name="A", rule_type=RuleType.KEYWORD, pattern="a")])
+
+        first = await engine.get_rules(db)
+        second = await engine.get_rules(db)
+        assert first is second
+        assert db.execute.await_count == 1
+
+        engine.invalidate()
+        third = await engine.get_rules(db)
+        assert third is not first
+        assert db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rules_reloaded_after_ttl(self):
+        """An expired rule set is reloaded (changes made by other workers)."""
+        engine = RuleEngine(ttl=0)
+        db = self._db([])
+
+        await engine.get_rules(db)
+        await engine.get_rules(db)
+        assert db.execute.await_count == 2
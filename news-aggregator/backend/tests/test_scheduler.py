@@ -1,18 +1,21 @@
 """Tests for the scheduler service."""
 
-import pytest
+import asyncio
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from models import Channel, Source, ConnectorType
+from connectors import RawItem
+from models import Channel, ConnectorType, Item, Source
 
 
 @pytest.fixture
 async def channels_with_intervals(db_session: AsyncSession):
-    """Create test channels with different fetch intervals and last_fetch_at."""
+    """Create test channels with different fetch intervals and due times."""
     now = datetime.utcnow()
 
     # Create sources first
@@ -21,7 +24,7 @@ async def channels_with_intervals(db_session: AsyncSession):
     db_session.add_all([source_active, source_disabled])
     await db_session.flush()
 
-    # Channel 1: Due (last fetch was 2 hours ago, interval is 60 min)
+    # Channel 1: Due (last fetch was 2 hours ago, next fetch was due 1 hour ago)
     channel_due = Channel(
         source_id=source_active.id,
         name="Due Channel",
@@ -30,9 +33,10 @@ async def channels_with_intervals(db_session: AsyncSession):
         enabled=True,
         fetch_interval_minutes=60,
         last_fetch_at=now - timedelta(hours=2),
+        next_fetch_at=now - timedelta(hours=1),
     )
 
-    # Channel 2: Not due (last fetch was 30 min ago, interval is 60 min)
+    # Channel 2: Not due (last fetch was 30 min ago, next fetch in 30 min)
     channel_not_due = Channel(
         source_id=source_active.id,
         name="Not Due Channel",
@@ -41,6 +45,7 @@ async def channels_with_intervals(db_session: AsyncSession):
         enabled=True,
         fetch_interval_minutes=60,
         last_fetch_at=now - timedelta(minutes=30),
+        next_fetch_at=now + timedelta(minutes=30),
     )
 
     # Channel 3: Never fetched (NULL last_fetch_at) - always due
@@ -63,6 +68,7 @@ async def channels_with_intervals(db_session: AsyncSession):
         enabled=False,
         fetch_interval_minutes=60,
         last_fetch_at=now - timedelta(hours=24),
+        next_fetch_at=now - timedelta(hours=23),
     )
 
     # Channel 5: Enabled but parent source is disabled
@@ -74,6 +80,7 @@ async def channels_with_intervals(db_session: AsyncSession):
         enabled=True,
         fetch_interval_minutes=60,
         last_fetch_at=now - timedelta(hours=24),
+        next_fetch_at=now - timedelta(hours=23),
     )
 
     db_session.add_all([
@@ -97,6 +104,7 @@ class TestFetchDueChannels:
     @pytest.mark.asyncio
     async def test_identifies_due_channels(self, db_session: AsyncSession, channels_with_intervals):
         """Test that due channels are correctly identified."""
+        from services.fetch_queue import get_fetch_queue
         from services.scheduler import fetch_due_channels
 
         # Mock fetch_channel to track which channels are fetched
@@ -115,6 +123,7 @@ class TestFetchDueChannels:
             mock_session_maker.return_value.__aexit__ = AsyncMock(return_value=None)
 
             result = await fetch_due_channels()
+            await get_fetch_queue().join()
 
         # Should have fetched "due" and "never_fetched" channels
         assert result["due_channels"] == 2
@@ -127,6 +136,7 @@ class TestFetchDueChannels:
     @pytest.mark.asyncio
     async def test_skips_disabled_channels(self, db_session: AsyncSession, channels_with_intervals):
         """Test that disabled channels are never fetched."""
+        from services.fetch_queue import get_fetch_queue
         from services.scheduler import fetch_due_channels
 
         fetched_ids = []
@@ -142,6 +152,7 @@ class TestFetchDueChannels:
             mock_session_maker.return_value.__aexit__ = AsyncMock(return_value=None)
 
             await fetch_due_channels()
+            await get_fetch_queue().join()
 
         # Disabled channel and channel with disabled source should never be fetched
         assert channels_with_intervals["disabled"].id not in fetched_ids
@@ -150,6 +161,7 @@ class TestFetchDueChannels:
     @pytest.mark.asyncio
     async def test_null_last_fetch_always_due(self, db_session: AsyncSession, channels_with_intervals):
         """Test that channels with NULL last_fetch_at are always considered due."""
+        from services.fetch_queue import get_fetch_queue
         from services.scheduler import fetch_due_channels
 
         fetched_ids = []
@@ -165,30 +177,48 @@ class TestFetchDueChannels:
             mock_session_maker.return_value.__aexit__ = AsyncMock(return_value=None)
 
             await fetch_due_channels()
+            await get_fetch_queue().join()
 
         # Never fetched channel should always be due
         assert channels_with_intervals["never_fetched"].id in fetched_ids
 
     @pytest.mark.asyncio
-    async def test_fetch_in_progress_skips(self):
-        """Test that concurrent fetches are skipped."""
-        import services.scheduler as scheduler_module
+    async def test_queued_channels_not_dispatched_twice(
+        self, db_session: AsyncSession, channels_with_intervals
+    ):
+        """A due channel that is still queued or running is not queued again."""
+        from services.fetch_queue import get_fetch_queue
         from services.scheduler import fetch_due_channels
 
-        # Simulate a fetch already in progress
-        original_flag = scheduler_module._fetch_in_progress
-        scheduler_module._fetch_in_progress = True
+        release = asyncio.Event()
+        fetched_ids = []
 
-        try:
-            result = await fetch_due_channels()
-            assert result.get("skipped") is True
-            assert result.get("reason") == "fetch_in_progress"
-        finally:
-            scheduler_module._fetch_in_progress = original_flag
+        async def mock_fetch_channel(channel_id, training_mode=False):
+            fetched_ids.append(channel_id)
+            await release.wait()
+            return 0
+
+        with patch("services.scheduler.async_session_maker") as mock_session_maker, \
+             patch("services.scheduler.fetch_channel", mock_fetch_channel):
+
+            mock_session_maker.return_value.__aenter__ = AsyncMock(return_value=db_session)
+            mock_session_maker.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            first = await fetch_due_channels()
+            await asyncio.sleep(0)
+            second = await fetch_due_channels()
+            release.set()
+            await get_fetch_queue().join()
+
+        assert first["queued"] == 2
+        assert second["queued"] == 0
+        assert second["already_queued"] == 2
+        assert len(fetched_ids) == 2
 
     @pytest.mark.asyncio
     async def test_handles_fetch_errors(self, db_session: AsyncSession, channels_with_intervals):
         """Test that errors during fetch don't stop other channels."""
+        from services.fetch_queue import get_fetch_queue
         from services.scheduler import fetch_due_channels
 
         call_count = 0
@@ -207,14 +237,17 @@ class TestFetchDueChannels:
             mock_session_maker.return_value.__aexit__ = AsyncMock(return_value=None)
 
             result = await fetch_due_channels()
+            await get_fetch_queue().join()
 
         # Should have 1 error and 1 success (2 due channels)
-        assert result["errors"] == 1
-        assert result["fetched"] == 1
+        assert result["queued"] == 2
+        stats = get_fetch_queue().get_stats()["types"]["rss"]
+        assert stats["errors"] == 1
+        assert stats["fetched"] == 1
 
     @pytest.mark.asyncio
     async def test_fetches_oldest_first(self, db_session: AsyncSession):
-        """Test that channels are fetched oldest first."""
+        """Test that channels are fetched in order of how long they have been due."""
         now = datetime.utcnow()
 
         # Create source
@@ -231,6 +264,7 @@ class TestFetchDueChannels:
             enabled=True,
             fetch_interval_minutes=60,
             last_fetch_at=now - timedelta(hours=10),
+            next_fetch_at=now - timedelta(hours=9),
         )
         channel_newer = Channel(
             source_id=source.id,
@@ -240,11 +274,13 @@ class TestFetchDueChannels:
             enabled=True,
             fetch_interval_minutes=60,
             last_fetch_at=now - timedelta(hours=5),
+            next_fetch_at=now - timedelta(hours=4),
         )
 
         db_session.add_all([channel_newer, channel_oldest])  # Add in wrong order
         await db_session.commit()
 
+        from services.fetch_queue import get_fetch_queue
         from services.scheduler import fetch_due_channels
 
         fetch_order = []
@@ -260,6 +296,7 @@ class TestFetchDueChannels:
             mock_session_maker.return_value.__aexit__ = AsyncMock(return_value=None)
 
             await fetch_due_channels()
+            await get_fetch_queue().join()
 
         # Oldest should be fetched first
         assert fetch_order[0] == channel_oldest.id
@@ -273,5 +310,136 @@ class TestFetchDueSources:
     @pytest.mark.asyncio
     async def test_fetch_due_sources_alias_exists(self):
         """Test that fetch_due_sources is an alias to fetch_due_channels."""
-        from services.scheduler import fetch_due_sources, fetch_due_channels
+        from services.scheduler import fetch_due_channels, fetch_due_sources
         assert fetch_due_sources is fetch_due_channels
+
+
+class TestFeedCacheCounters:
+    """Tests for persisted conditional GET state."""
+
+    def test_updated_feed_cache_counts_hits(self):
+        """Validators are merged and request/hit counters incremented."""
+        from connectors import FeedValidators
+        from services.scheduler import _updated_feed_cache
+
+        validators = FeedValidators(url="https://example.com/feed", etag='"v2"', body_hash="abc")
+        cache = _updated_feed_cache({}, validators)
+        assert cache["etag"] == '"v2"'
+        assert (cache["requests"], cache["not_modified"], cache["unchanged"]) == (1, 0, 0)
+
+        cache = _updated_feed_cache(cache, validators, "not_modified")
+        cache = _updated_feed_cache(cache, validators, "unchanged")
+        assert (cache["requests"], cache["not_modified"], cache["unchanged"]) == (3, 1, 1)
+
+
+class _FakeConfig(BaseModel):
+    url: str = ""
+
+
+def _fake_connector(raw_items: list[RawItem], instances: list) -> type:
+    """Connector class returning raw_items; instances records each fetch."""
+
+    class FakeConnector:
+        config_schema = _FakeConfig
+        uses_known_entries = False
+        feed_validators = None
+        known_entries = None
+
+        async def fetch(self, config):
+            instances.append(self)
+            return raw_items
+
+    return FakeConnector
+
+
+@pytest.fixture
+async def fetch_channel_env(db_session: AsyncSession, monkeypatch):
+    """A stored channel plus patches so fetch_channel runs against db_session."""
+    from config import settings
+
+    source = Source(name="Fetch Source")
+    db_session.add(source)
+    await db_session.flush()
+    channel = Channel(
+        source_id=source.id,
+        connector_type=ConnectorType.RSS,
+        config={"url": "https://example.com/feed.xml"},
+        feed_cache={"url": "https://example.com/feed.xml", "etag": '"v1"'},
+    )
+    db_session.add(channel)
+    await db_session.flush()
+    db_session.add(Item(
+        channel_id=channel.id,
+        external_id="known-1",
+        title="Known Article",
+        content="Stored earlier",
+        url="https://example.com/known",
+        published_at=datetime.utcnow(),
+        content_hash="known-hash",
+    ))
+    await db_session.commit()
+
+    relevance_filter = MagicMock()
+    relevance_filter.ingest_batch = AsyncMock(side_effect=lambda items, threshold: [
+        {"should_process": True, "classification": None, "duplicates": [],
+         "index_handle": f"handle-{i}"}
+        for i in range(len(items))
+    ])
+    relevance_filter.confirm_index = AsyncMock(return_value=(1, []))
+    relevance_filter.discard_index = AsyncMock(return_value=0)
+    relevance_filter.index_items_batch = AsyncMock(return_value=0)
+
+    monkeypatch.setattr(settings, "classifier_enabled", True)
+    with patch("services.scheduler.async_session_maker") as mock_session_maker, \
+            patch("services.relevance_filter.create_relevance_filter",
+                  AsyncMock(return_value=relevance_filter)), \
+            patch("services.processor.create_processor_from_settings",
+                  AsyncMock(side_effect=RuntimeError("no LLM"))):
+        mock_session_maker.return_value.__aenter__ = AsyncMock(return_value=db_session)
+        mock_session_maker.return_value.__aexit__ = AsyncMock(return_value=None)
+        yield {"channel": channel, "relevance_filter": relevance_filter}
+
+
+class TestFetchChannel:
+    """Tests for fetch_channel around the connector and the pre-filter."""
+
+    @pytest.mark.asyncio
+    async def test_ingest_skips_stored_entries(self, fetch_channel_env):
+        """Only entries not stored in the channel are embedded by /ingest."""
+        from services.scheduler import fetch_channel
+
+        raw_items = [
+            RawItem(external_id="known-1", title="Known Article", content="Stored earlier",
+                    url="https://example.com/known", published_at=datetime.utcnow()),
+            RawItem(external_id="new-1", title="New Article", content="Fresh content",
+                    url="https://example.com/new", published_at=datetime.utcnow()),
+        ]
+        with patch("connectors.ConnectorRegistry.get", return_value=_fake_connector(raw_items, [])):
+            created = await fetch_channel(fetch_channel_env["channel"].id)
+
+        assert created == 1
+        relevance_filter = fetch_channel_env["relevance_filter"]
+        ingested = relevance_filter.ingest_batch.call_args.args[0]
+        assert [item["title"] for item in ingested] == ["New Article"]
+        confirmed = relevance_filter.confirm_index.call_args.args[0]
+        assert [item["handle"] for item in confirmed] == ["handle-0"]
+
+    @pytest.mark.asyncio
+    async def test_training_mode_fetches_without_validators(self, fetch_channel_env, db_session):
+        """Training fetches send no conditional GET and keep the stored validators."""
+        from services.scheduler import fetch_channel
+
+        instances = []
+        raw_items = [
+            RawItem(external_id="new-1", title="New Article", content="Fresh content",
+                    url="https://example.com/new", published_at=datetime.utcnow()),
+        ]
+        connector = _fake_connector(raw_items, instances)
+        with patch("connectors.ConnectorRegistry.get", return_value=connector):
+            created = await fetch_channel(fetch_channel_env["channel"].id, training_mode=True)
+
+        assert created == 1
+        assert instances[0].feed_validators is None
+        channel = await db_session.get(Channel, fetch_channel_env["channel"].id)
+        await db_session.refresh(channel)
+        assert channel.feed_cache == {"url": "https://example.com/feed.xml", "etag": '"v1"'}
@@ -0,0 +1,101 @@
+"""Tests for the item_stats_rollup table, its triggers and reconciliation."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Channel, Item, ItemStatsRollup, Priority
+from services.stats_rollup import reconcile_day_range
+
+
+async def _rollup(db: AsyncSession) -> dict[tuple, int]:
+    """Non-zero rollup buckets as {(priority, is_read, is_starred): count}."""
+    result = await db.execute(
+        select(
+            ItemStatsRollup.priority,
+            ItemStatsRollup.is_read,
+            ItemStatsRollup.is_starred,
+            func.sum(ItemStatsRollup.item_count),
+        )
+        .group_by(ItemStatsRollup.priority, ItemStatsRollup.is_read, ItemStatsRollup.is_starred)
+        .having(func.sum(ItemStatsRollup.item_count) != 0)
+    )
+    return {(row[0], row[1], row[2]): row[3] for row in result.all()}
+
+
+class TestRollupTriggers:
+    """The triggers on items keep the rollup in step with every write."""
+
+    @pytest.mark.asyncio
+    async def test_insert_counts_items(
+        self, db_session: AsyncSession, multiple_items_in_db: list[Item]
+    ):
+        assert await _rollup(db_session) == {
+            ("high", True, True): 1,
+            ("medium", False, False): 1,
+            ("low", True, False): 1,
+            ("none", False, False): 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_update_moves_items_between_buckets(
+        self, db_session: AsyncSession, multiple_items_in_db: list[Item]
+    ):
+        await db_session.execute(update(Item).values(is_read=True, is_starred=False))
+        # Columns outside the key leave the rollup alone
+        await db_session.execute(update(Item).values(summary="Zusammenfassung"))
+
+        assert await _rollup(db_session) == {
+            ("high", True, False): 1,
+            ("medium", True, False): 1,
+            ("low", True, False): 1,
+            ("none", True, False): 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_delete_decrements(
+        self, db_session: AsyncSession, multiple_items_in_db: list[Item]
+    ):
+        await db_session.execute(delete(Item).where(Item.priority != Priority.HIGH))
+
+        assert await _rollup(db_session) == {("high", True, True): 1}
+
+    @pytest.mark.asyncio
+    async def test_channel_deletion_drops_its_buckets(
+        self, db_session: AsyncSession, multiple_items_in_db: list[Item], channel_in_db: Channel
+    ):
+        await db_session.execute(delete(Channel).where(Channel.id == channel_in_db.id))
+
+        assert await _rollup(db_session) == {}
+
+
+class TestReconcile:
+    """Tests for recomputing the rollup from items."""
+
+    @pytest.mark.asyncio
+    async def test_consistent_rollup_is_left_alone(
+        self, db_session: AsyncSession, multiple_items_in_db: list[Item]
+    ):
+        today = datetime.utcnow().date()
+        start, end = today - timedelta(days=1), today + timedelta(days=1)
+        assert await reconcile_day_range(db_session, start, end) == 0
+
+    @pytest.mark.asyncio
+    async def test_drift_is_corrected(
+        self, db_session: AsyncSession, multiple_items_in_db: list[Item]
+    ):
+        before = await _rollup(db_session)
+        await db_session.execute(
+            update(ItemStatsRollup)
+            .where(ItemStatsRollup.priority == Priority.HIGH)
+            .values(item_count=7)
+        )
+
+        today = datetime.utcnow().date()
+        start, end = today - timedelta(days=1), today + timedelta(days=1)
+        corrected = await reconcile_day_range(db_session, start, end)
+
+        assert corrected == 1
+        assert await _rollup(db_session) == before
@@ -0,0 +1,180 @@
+"""Tests for work-queue claims shared by worker processes."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import select, true, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from models import Channel, ConnectorType, Item, Source, WorkClaim
+from services.work_claims import QUEUE_CLASSIFY, claim_items, make_worker_id
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _mock_db(rows):
+    result = MagicMock()
+    result.fetchall.return_value = rows
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+class TestClaimItems:
+    """Tests for claim_items."""
+
+    @pytest.mark.asyncio
+    async def test_claims_with_skip_locked_and_inserts_leases(self):
+        """Pending ids are locked with SKIP LOCKED, filtered by live claims, then leased."""
+        db = _mock_db([(3,), (1,)])
+        query = select(Item.id).where(Item.classified_at.is_(None)).limit(2)
+
+        claimed = await claim_items(db, QUEUE_CLASSIFY, query, "host:1:classifier")
+
+        assert claimed == [3, 1]
+        select_sql = _sql(db.execute.await_args_list[0].args[0])
+        assert "FOR UPDATE OF items SKIP LOCKED" in select_sql
+        assert "NOT (EXISTS (SELECT" in select_sql
+        assert "FROM work_claims" in select_sql
+        assert "work_claims.lease_until > timezone(" in select_sql
+        insert_sql = _sql(db.execute.await_args_list[1].args[0])
+        assert insert_sql.startswith("INSERT INTO work_claims")
+        assert "ON CONFLICT (queue, item_id) DO UPDATE" in insert_sql
+        assert "WHERE work_claims.lease_until <= timezone(" in insert_sql
+        assert "RETURNING work_claims.item_id" in insert_sql
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_claim(self):
+        """Without pending items nothing is inserted and the locks are dropped."""
+        db = _mock_db([])
+
+        claimed = await claim_items(db, QUEUE_CLASSIFY, select(Item.id), "host:1:classifier")
+
+        assert claimed == []
+        assert db.execute.await_count == 1
+        db.rollback.assert_awaited_once()
+        db.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_live_claim_committed_after_snapshot_is_kept(self, db_engine):
+        """A claim committed after the select's snapshot is not taken over.
+
+        The select of the second worker is made to miss the claim (as when its
+        snapshot predates the first worker's commit); the upsert must then
+        leave the live claim alone and report nothing claimed.
+        """
+        session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+        async with session_maker() as db:
+            source = Source(name="Claims Source")
+            db.add(source)
+            await db.flush()
+            channel = Channel(source_id=source.id, connector_type=ConnectorType.RSS, config={})
+            db.add(channel)
+            await db.flush()
+            item = Item(
+                channel_id=channel.id, external_id="claim-1", title="Claimed",
+                content="", url="https://test.com/claim/1",
+                published_at=datetime.utcnow(), content_hash="claim1",
+            )
+            db.add(item)
+            await db.commit()
+        query = select(Item.id).where(Item.id == item.id)
+
+        async with session_maker() as db_a, session_maker() as db_b:
+            assert await claim_items(db_a, QUEUE_CLASSIFY, query, "host:1:classifier") == [item.id]
+
+            with patch("services.work_claims._unclaimed", return_value=true()):
+                stolen = await claim_items(db_b, QUEUE_CLASSIFY, query, "host:2:classifier")
+            owner = await db_b.scalar(
+                select(WorkClaim.worker_id).where(WorkClaim.item_id == item.id)
+            )
+
+            assert stolen == []
+            assert owner == "host:1:classifier"
+
+            # Once the lease has expired the claim is taken over
+            await db_a.execute(
+                update(WorkClaim).values(lease_until=datetime.utcnow() - timedelta(seconds=1))
+            )
+            await db_a.commit()
+            taken = await claim_items(db_b, QUEUE_CLASSIFY, query, "host:2:classifier")
+            owner = await db_b.scalar(
+                select(WorkClaim.worker_id).where(WorkClaim.item_id == item.id)
+            )
+
+            assert taken == [item.id]
+            assert owner == "host:2:classifier"
+
+    def test_worker_ids_differ_per_worker(self):
+        """Classifier and LLM workers in one process hold separate claims."""
+        assert make_worker_id("classifier") != make_worker_id("llm")
+
+
+class TestSharedCommands:
+    """Commands are applied once by every worker process, not consumed by one."""
+
+    @pytest.mark.asyncio
+    async def test_new_command_is_returned_with_issue_time(self):
+        from services.worker_status import read_new_command
+
+        issued = datetime.utcnow()
+        value = {"action": "pause", "issued_at": issued.isoformat()}
+        with patch("services.worker_status._read", AsyncMock(return_value=value)), \
+             patch("services.worker_status.db_now", AsyncMock(return_value=issued)):
+            command = await read_new_command("llm", issued - timedelta(seconds=5))
+            # Already applied by this process
+            repeated = await read_new_command("llm", issued)
+
+        assert command == ("pause", issued)
+        assert repeated is None
+
+    @pytest.mark.asyncio
+    async def test_stale_command_is_ignored(self):
+        from services.worker_status import read_new_command
+
+        issued = datetime.utcnow()
+        value = {"action": "stop", "issued_at": issued.isoformat()}
+        db_time = AsyncMock(return_value=issued + timedelta(minutes=5))
+        with patch("services.worker_status._read", AsyncMock(return_value=value)), \
+             patch("services.worker_status.db_now", db_time):
+            command = await read_new_command("classifier", issued - timedelta(seconds=5))
+
+        assert command is None
+
+    @pytest.mark.asyncio
+    async def test_commands_use_database_clock(self):
+        """Issue and start times come from the database, not the local clock."""
+        from services.worker_status import read_new_command, write_command
+
+        db_time = datetime(2020, 1, 1, 12, 0, 0)
+        upsert = AsyncMock()
+        bus = MagicMock(publish=AsyncMock())
+        with patch("services.worker_status.db_now", AsyncMock(return_value=db_time)), \
+             patch("services.worker_status._upsert", upsert), \
+             patch("services.event_bus.get_event_bus", return_value=bus):
+            await write_command("llm", "pause")
+            value = upsert.await_args.args[1]
+            assert value["issued_at"] == db_time.isoformat()
+
+            # Years behind this host's clock, but fresh by the database clock
+            with patch("services.worker_status._read", AsyncMock(return_value=value)):
+                command = await read_new_command("llm", db_time - timedelta(seconds=1))
+
+        assert command == ("pause", db_time)
+
+    @pytest.mark.asyncio
+    async def test_db_now(self, db_engine):
+        """db_now() reads the database server's UTC time."""
+        from services.worker_status import db_now
+
+        session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+        with patch("services.worker_status.async_session_maker", session_maker):
+            now = await db_now()
+
+        assert now.tzinfo is None
+        assert abs(now - datetime.utcnow()) < timedelta(minutes=1)
@@ -245,6 +245,19 @@ export interface CleanupResult {
   by_priority: Record<string, number>
 }
 
+export interface CleanupStatus {
+  running: boolean
+  trigger?: string
+  total: number
+  deleted: number
+  by_priority?: Record<string, number>
+  batches?: number
+  vector_deleted?: number
+  started_at?: string | null
+  finished_at?: string | null
+  error?: string | null
+}
+
 export interface StorageStats {
   postgresql_size_bytes: number
   postgresql_size_human: string
@@ -332,6 +345,7 @@ export interface HealthCheckResponse {
   }
   items_count: number
   sources_count: number
+  browser_pool?: Record<string, unknown>
 }
 
 export const adminApi = {
@@ -371,6 +385,7 @@ export const adminApi = {
     api.put<HousekeepingConfig>('/admin/housekeeping', config),
   previewCleanup: () => api.post<CleanupPreview>('/admin/housekeeping/preview'),
   executeCleanup: () => api.post<CleanupResult>('/admin/housekeeping/cleanup'),
+  getCleanupStatus: () => api.get<CleanupStatus>('/admin/housekeeping/cleanup/status'),
   getStorage: () => api.get<StorageStats>('/admin/storage'),
 }
 
@@ -13,6 +13,14 @@ export interface Channel {
   enabled: boolean
   fetch_interval_minutes: number
   last_fetch_at: string | null
+  next_fetch_at?: string | null
+  // Adaptive scheduling state (effective interval, new items per fetch)
+  fetch_stats?: {
+    interval_minutes?: number
+    avg_new_items?: number
+    history?: number[]
+    fetches?: number
+  } | null
   last_error: string | null
   created_at: string
   updated_at: string
@@ -120,6 +128,8 @@ export interface Item {
   // Duplicate grouping
   similar_to_id: number | null
   duplicates: DuplicateBrief[]
+  // Highlighted match (<mark>) when listed with a search term
+  search_snippet?: string | null
 }
 
 export interface Rule {
@@ -177,6 +187,10 @@ export interface ChannelStats {
   unread_count: number
   last_fetch_at: string | null
   last_error: string | null
+  feed_requests: number
+  feed_not_modified: number
+  feed_unchanged: number
+  feed_cache_hit_rate: number | null
 }
 
 export interface PaginatedResponse<T> {
@@ -185,6 +199,7 @@ export interface PaginatedResponse<T> {
   page: number
   page_size: number
   total_pages: number
+  next_cursor?: string | null
 }
 
 export interface ConnectorInfo {
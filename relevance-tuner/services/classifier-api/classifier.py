@@ -5,6 +5,9 @@ Includes VectorStore for semantic search and similarity.
 """
 
 import pickle
+import time
+import uuid
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +16,8 @@ from chromadb.config import Settings
 import numpy as np
 import torch
 
+from embedding_cache import EmbeddingCache
+
 
 class BaseEmbedder:
     """Base class for embedders."""
@@ -23,6 +28,8 @@ class BaseEmbedder:
         self.task_prefix = task_prefix
         self._model = None
         self._embedding_dim = 768
+        # Optional shared cache; set by the API so all stores reuse embeddings
+        self.cache: Optional[EmbeddingCache] = None
 
     def _load_model(self):
         if self._model is None:
@@ -48,16 +55,43 @@ class BaseEmbedder:
         show_progress_bar: bool = False,
         batch_size: int = 16,
     ) -> list[list[float]]:
-        model = self._load_model()
         prefixed = [f"{self.task_prefix}{t[:self.max_length]}" for t in texts]
-        embeddings = model.encode(
+        if self.cache is None:
+            return self._encode_uncached(prefixed, show_progress_bar, batch_size).tolist()
+
+        # Look up every text; only embed the distinct misses, in one batch
+        keys = [EmbeddingCache.make_key(self.model_name, p) for p in prefixed]
+        vectors: list[Optional[np.ndarray]] = [self.cache.get(k) for k in keys]
+        missing: dict[str, str] = {}
+        for key, text, vector in zip(keys, prefixed, vectors):
+            if vector is None:
+                missing.setdefault(key, text)
+
+        if missing:
+            computed = self._encode_uncached(
+                list(missing.values()), show_progress_bar, batch_size
+            )
+            by_key = dict(zip(missing.keys(), computed))
+            for key, vector in by_key.items():
+                self.cache.put(key, vector)
+            vectors = [v if v is not None else by_key[k] for k, v in zip(keys, vectors)]
+
+        return [v.tolist() for v in vectors]
+
+    def _encode_uncached(
+        self,
+        prefixed: list[str],
+        show_progress_bar: bool,
+        batch_size: int,
+    ) -> np.ndarray:
+        model = self._load_model()
+        return model.encode(
             prefixed,
             show_progress_bar=show_progress_bar,
             convert_to_numpy=True,
             normalize_embeddings=True,
             batch_size=batch_size,
         )
-        return embeddings.tolist()
 
 
 class NomicV2Embedder(BaseEmbedder):
@@ -162,50 +196,90 @@ class EmbeddingClassifier:
                            priority_confidence, ak, ak_confidence,
                            aks (list), ak_confidences (dict) for multi-label
         """
-        # Combine text fields
-        text = f"{title} {content}"
+        return self.predict_batch([{"title": title, "content": content, "source": source}])[0]
+
+    def predict_batch(self, items: list[dict]) -> list[dict]:
+        """
+        Predict relevance, priority, and AK for multiple items at once.
+
+        All texts are encoded in a single embedder call and every sklearn
+        classifier runs once on the stacked embedding matrix, so cost grows
+        with batch size instead of with the number of requests.
 
-        # Get embedding
-        embedding = np.array(self.embedder.encode([text], show_progress_bar=False))
+        Args:
+            items: List of dicts with keys: title, content, source (optional)
+
+        Returns:
+            List of result dicts (same format as predict), in input order
+        """
+        if not items:
+            return []
+
+        # Combine text fields and embed everything in one forward pass
+        texts = [f"{item['title']} {item['content']}" for item in items]
+        embeddings = self.embedder.encode(texts, show_progress_bar=False)
+        return self.predict_embeddings(embeddings)
+
+    def predict_embeddings(self, embeddings: list[list[float]]) -> list[dict]:
+        """
+        Run the classifiers on precomputed NomicV2 embeddings.
+
+        Lets callers that already embedded the texts (e.g. /ingest, which
+        reuses the vectors for indexing) skip a second encode.
+        """
+        if len(embeddings) == 0:
+            return []
+        embeddings = np.array(embeddings)
 
-        # Predict relevance
-        relevance_proba = self.relevance_clf.predict_proba(embedding)[0]
+        # Predict relevance for all rows
+        relevance_proba = self.relevance_clf.predict_proba(embeddings)
         relevant_idx = list(self.relevance_clf.classes_).index(1)
-        relevance_confidence = relevance_proba[relevant_idx]
-        is_relevant = relevance_confidence > 0.5
-
-        result = {
-            "relevant": is_relevant,
-            "relevance_confidence": float(relevance_confidence),
-            "priority": None,
-            "priority_confidence": None,
-            "ak": None,
-            "ak_confidence": None,
-            "aks": [],
-            "ak_confidences": {},
-        }
+        relevance_confidences = relevance_proba[:, relevant_idx]
+
+        results = []
+        for confidence in relevance_confidences:
+            results.append({
+                "relevant": bool(confidence > 0.5),
+                "relevance_confidence": float(confidence),
+                "priority": None,
+                "priority_confidence": None,
+                "ak": None,
+                "ak_confidence": None,
+                "aks": [],
+                "ak_confidences": {},
+            })
 
-        # Only predict priority/AK if relevant
-        if is_relevant and self.priority_clf and self.ak_clf:
-            # Priority
-            priority_proba = self.priority_clf.predict_proba(embedding)[0]
-            priority_idx = int(np.argmax(priority_proba))
-            result["priority"] = self.PRIORITY_LABELS[priority_idx]
-            result["priority_confidence"] = float(priority_proba[priority_idx])
-
-            # AK prediction
-            if self.multilabel:
-                # Multi-label: predict multiple AKs
-                ak_preds = self.ak_clf.predict(embedding)[0]
-                ak_confidences = {}
+        # Only predict priority/AK for relevant rows
+        relevant_rows = [i for i, r in enumerate(results) if r["relevant"]]
+        if not relevant_rows or not (self.priority_clf and self.ak_clf):
+            return results
+
+        relevant_embeddings = embeddings[relevant_rows]
+
+        # Priority
+        priority_proba = self.priority_clf.predict_proba(relevant_embeddings)
+        for row, proba in zip(relevant_rows, priority_proba):
+            priority_idx = int(np.argmax(proba))
+            results[row]["priority"] = self.PRIORITY_LABELS[priority_idx]
+            results[row]["priority_confidence"] = float(proba[priority_idx])
 
-                # Get probabilities for each AK
+        # AK prediction
+        if self.multilabel:
+            # Multi-label: predict multiple AKs
+            ak_preds = self.ak_clf.predict(relevant_embeddings)
+
+            # Probabilities per AK estimator, one call per estimator for all rows
+            ak_probas = []
+            for estimator in self.ak_clf.estimators_:
+                prob = estimator.predict_proba(relevant_embeddings)
+                ak_probas.append(prob[:, 1] if prob.shape[1] > 1 else prob[:, 0])
+
+            for n, row in enumerate(relevant_rows):
+                ak_confidences = {}
                 predicted_aks = []
-                for i, estimator in enumerate(self.ak_clf.estimators_):
-                    prob = estimator.predict_proba(embedding)[0]
-                    conf = prob[1] if len(prob) > 1 else prob[0]
-                    ak_confidences[self.AK_LABELS[i]] = float(conf)
-                    if ak_preds[i] == 1:
+                for i in range(len(self.ak_clf.estimators_)):
+                    ak_confidences[self.AK_LABELS[i]] = float(ak_probas[i][n])
+                    if ak_preds[n][i] == 1:
                         predicted_aks.append(self.AK_LABELS[i])
 
                 # Fallback if no AK predicted
@@ -214,21 +288,24 @@ class EmbeddingClassifier:
                                    key=lambda i: ak_confidences[self.AK_LABELS[i]])
                     predicted_aks = [self.AK_LABELS[best_idx]]
 
+                result = results[row]
                 result["aks"] = predicted_aks
                 result["ak_confidences"] = ak_confidences
                 # Primary AK for backward compatibility
                 result["ak"] = predicted_aks[0] if predicted_aks else None
                 result["ak_confidence"] = ak_confidences.get(result["ak"], 0.0)
-            else:
-                # Single-label: predict one AK
-                ak_proba = self.ak_clf.predict_proba(embedding)[0]
-                ak_idx = int(np.argmax(ak_proba))
+        else:
+            # Single-label: predict one AK
+            ak_proba = self.ak_clf.predict_proba(relevant_embeddings)
+            for row, proba in zip(relevant_rows, ak_proba):
+                ak_idx = int(np.argmax(proba))
+                result = results[row]
                 result["ak"] = self.AK_LABELS[ak_idx]
-                result["ak_confidence"] = float(ak_proba[ak_idx])
+                result["ak_confidence"] = float(proba[ak_idx])
                 result["aks"] = [result["ak"]]
                 result["ak_confidences"] = {result["ak"]: result["ak_confidence"]}
 
-        return result
+        return results
 
     def is_gpu_available(self) -> bool:
         """Check if GPU is available."""
@@ -369,6 +446,18 @@ class VectorStore:
 
         return len(new_items)
 
+    def add_embeddings_batch(self, items: list[dict]) -> int:
+        """
+        Add items whose embeddings were computed earlier (see StagingArea).
+
+        Args:
+            items: List of dicts with keys: id, title, document, embedding, metadata
+
+        Returns:
+            Number of items added (existing IDs are skipped)
+        """
+        return _add_embedded(self.collection, items)
+
     def search(
         self,
         query: str,
@@ -627,28 +716,74 @@ class DuplicateStore:
         Returns:
             List of duplicates with id, title, score, metadata
         """
-        text = f"{title} {content}"
-        embedding = self.embedder.encode([text], show_progress_bar=False)[0]
+        return self.find_duplicates_batch(
+            [{"title": title, "content": content}], threshold, n_results
+        )[0]
+
+    def find_duplicates_batch(
+        self,
+        items: list[dict],
+        threshold: float = 0.75,
+        n_results: int = 5,
+    ) -> list[list[dict]]:
+        """
+        Find duplicates for several articles with one encode pass and one query.
+
+        Args:
+            items: List of dicts with title, content
+            threshold: Similarity threshold (default 0.75)
+            n_results: Max results per article
+
+        Returns:
+            One list of duplicates (same format as find_duplicates) per item
+        """
+        if not items:
+            return []
+        texts = [f"{item['title']} {item['content']}" for item in items]
+        embeddings = self.embedder.encode(texts, show_progress_bar=False)
+        return self.find_duplicates_by_embeddings(embeddings, threshold, n_results)
+
+    def find_duplicates_by_embeddings(
+        self,
+        embeddings: list[list[float]],
+        threshold: float = 0.75,
+        n_results: int = 5,
+    ) -> list[list[dict]]:
+        """
+        Find duplicates for several precomputed paraphrase embeddings in one query.
+
+        Returns:
+            One list of duplicates (same format as find_duplicates) per embedding
+        """
+        if not embeddings or self.collection.count() == 0:
+            return [[] for _ in embeddings]
 
         results = self.collection.query(
-            query_embeddings=[embedding],
+            query_embeddings=embeddings,
             n_results=n_results,
             include=["metadatas", "documents", "distances"],
         )
 
-        items = []
-        for i in range(len(results["ids"][0])):
-            score = 1 - results["distances"][0][i]
-            if score >= threshold:
-                items.append({
-                    "id": results["ids"][0][i],
-                    "title": results["metadatas"][0][i].get("title", ""),
-                    "score": score,
-                    "metadata": results["metadatas"][0][i],
-                    "snippet": results["documents"][0][i][:300] if results["documents"] else "",
-                })
-
-        return items
+        all_items = []
+        for q in range(len(embeddings)):
+            items = []
+            for i in range(len(results["ids"][q])):
+                score = 1 - results["distances"][q][i]
+                if score >= threshold:
+                    items.append({
+                        "id": results["ids"][q][i],
+                        "title": results["metadatas"][q][i].get("title", ""),
+                        "score": score,
+                        "metadata": results["metadatas"][q][i],
+                        "snippet": results["documents"][q][i][:300] if results["documents"] else "",
+                    })
+            all_items.append(items)
+
+        return all_items
+
+    def add_embeddings_batch(self, items: list[dict]) -> int:
+        """Add items with precomputed paraphrase embeddings (see StagingArea)."""
+        return _add_embedded(self.collection, items)
 
     def get_stats(self) -> dict:
         """Get duplicate store statistics."""
@@ -657,3 +792,86 @@ class DuplicateStore:
             "persist_dir": self.persist_dir,
             "model": self.embedder.model_name,
         }
+
+
+def _add_embedded(collection, items: list[dict]) -> int:
+    """Add pre-embedded items to a ChromaDB collection, skipping existing IDs."""
+    if not items:
+        return 0
+
+    ids = [str(item["id"]) for item in items]
+    existing = set(collection.get(ids=ids)["ids"])
+    new_items = [item for item in items if str(item["id"]) not in existing]
+    if not new_items:
+        return 0
+
+    metadatas = []
+    for item in new_items:
+        meta = dict(item.get("metadata") or {})
+        meta["title"] = item["title"][:500]
+        # Filter out None values - ChromaDB doesn't accept them
+        metadatas.append({k: v for k, v in meta.items() if v is not None})
+
+    collection.add(
+        ids=[str(item["id"]) for item in new_items],
+        embeddings=[item["embedding"] for item in new_items],
+        metadatas=metadatas,
+        documents=[item["document"][:2000] for item in new_items],
+    )
+    return len(new_items)
+
+
+class StagingArea:
+    """
+    Short-lived store for embeddings computed by /ingest.
+
+    /ingest embeds each item once per model and parks the vectors under an
+    opaque handle. Once the backend has committed the item and knows its
+    database ID, /index/confirm moves the staged vectors into both stores
+    without re-sending or re-embedding the text. Handles of items the backend
+    dropped are released by /index/discard; anything left over expires.
+
+    Vectors are kept as float32 arrays (a Python list of floats takes about
+    seven times the memory).
+    """
+
+    def __init__(self, ttl_seconds: int = 1800, max_items: int = 20000):
+        self.ttl_seconds = ttl_seconds
+        self.max_items = max_items
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+
+    def stage(self, title: str, document: str, search_embedding, duplicate_embedding) -> str:
+        """Stage embeddings for later indexing and return the handle."""
+        self._expire()
+        handle = uuid.uuid4().hex
+        self._entries[handle] = {
+            "title": title,
+            "document": document,
+            "search_embedding": np.array(search_embedding, dtype=np.float32),
+            "duplicate_embedding": np.array(duplicate_embedding, dtype=np.float32),
+            "staged_at": time.monotonic(),
+        }
+        while len(self._entries) > self.max_items:
+            self._entries.popitem(last=False)
+        return handle
+
+    def pop(self, handle: str) -> Optional[dict]:
+        """Remove and return a staged entry (None if unknown or expired)."""
+        self._expire()
+        return self._entries.pop(handle, None)
+
+    def discard(self, handles: list[str]) -> int:
+        """Drop staged entries that will never be confirmed; returns how many existed."""
+        self._expire()
+        return sum(1 for handle in handles if self._entries.pop(handle, None) is not None)
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self._entries:
+            entry = next(iter(self._entries.values()))
+            if entry["staged_at"] >= cutoff:
+                break
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
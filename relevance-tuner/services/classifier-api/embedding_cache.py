@@ -0,0 +1,199 @@
+"""
+Content-hash keyed embedding cache shared by all embedders.
+
+Keys are SHA-256 digests of (model name, exact text fed to the model), so each
+(model, text) pair is embedded once and reused by /classify, /index,
+/find-duplicates and the duplicate store. Hot entries live in an in-memory
+LRU; evicted entries can optionally spill to a memory-mapped file on disk.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    LRU embedding cache with optional memory-mapped disk spill.
+
+    The spill file is a fixed-size ring of float32 rows. Its key -> slot
+    index is written next to it on close() and reloaded on startup; after
+    an unclean shutdown the spill starts empty.
+    """
+
+    def __init__(
+        self,
+        max_items: int = 20000,
+        spill_dir: Optional[str] = None,
+        spill_items: int = 200000,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_items: Max embeddings held in memory (LRU evicted beyond this)
+            spill_dir: Directory for the memory-mapped spill file (None = disabled)
+            spill_items: Max embeddings held in the spill file (ring buffer)
+        """
+        self.max_items = max_items
+        self.spill_dir = spill_dir
+        self.spill_items = spill_items
+
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Spill state (memmap created lazily once the embedding dim is known)
+        self._spill: Optional[np.memmap] = None
+        self._spill_dim: Optional[int] = None
+        self._spill_index: dict[str, int] = {}
+        self._spill_slots: list[Optional[str]] = []
+        self._spill_next = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.spill_hits = 0
+
+        if self.spill_dir:
+            self._load_spill_index()
+
+    @staticmethod
+    def make_key(model_name: str, text: str) -> str:
+        """Build the cache key for a (model, text) pair."""
+        digest = hashlib.sha256()
+        digest.update(model_name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return the cached embedding for key, or None on a miss."""
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return vector
+
+            slot = self._spill_index.get(key)
+            if slot is not None and self._spill is not None:
+                vector = np.array(self._spill[slot])
+                self.hits += 1
+                self.spill_hits += 1
+                self._put_memory(key, vector)
+                return vector
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, vector: np.ndarray) -> None:
+        """Store an embedding."""
+        with self._lock:
+            self._put_memory(key, np.asarray(vector, dtype=np.float32))
+
+    def _put_memory(self, key: str, vector: np.ndarray) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            old_key, old_vector = self._memory.popitem(last=False)
+            self._spill_write(old_key, old_vector)
+
+    # ============== Disk spill ==============
+
+    def _spill_paths(self) -> tuple[Path, Path]:
+        base = Path(self.spill_dir)
+        return base / "embeddings.f32", base / "embeddings_index.json"
+
+    def _open_spill(self, dim: int, fresh: bool) -> None:
+        data_path, _ = self._spill_paths()
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        mode = "w+" if fresh or not data_path.exists() else "r+"
+        self._spill = np.memmap(
+            data_path, dtype=np.float32, mode=mode, shape=(self.spill_items, dim)
+        )
+        self._spill_dim = dim
+        if len(self._spill_slots) != self.spill_items:
+            self._spill_slots = [None] * self.spill_items
+
+    def _spill_write(self, key: str, vector: np.ndarray) -> None:
+        if not self.spill_dir or key in self._spill_index:
+            return
+        if self._spill is None:
+            self._open_spill(vector.shape[0], fresh=not self._spill_index)
+        if vector.shape[0] != self._spill_dim:
+            return
+
+        slot = self._spill_next
+        self._spill_next = (self._spill_next + 1) % self.spill_items
+
+        # Ring buffer: overwrite the oldest entry in this slot
+        previous = self._spill_slots[slot]
+        if previous is not None:
+            self._spill_index.pop(previous, None)
+
+        self._spill[slot] = vector
+        self._spill_slots[slot] = key
+        self._spill_index[key] = slot
+
+    def _load_spill_index(self) -> None:
+        data_path, index_path = self._spill_paths()
+        if not (data_path.exists() and index_path.exists()):
+            return
+        try:
+            with open(index_path) as f:
+                saved = json.load(f)
+            # Remove the index so a crash before the next close() starts clean
+            os.remove(index_path)
+            if saved.get("spill_items") != self.spill_items:
+                return
+            self._spill_index = dict(saved["index"])
+            self._spill_next = saved["next"]
+            self._spill_slots = [None] * self.spill_items
+            for key, slot in self._spill_index.items():
+                self._spill_slots[slot] = key
+            self._open_spill(saved["dim"], fresh=False)
+            print(f"EmbeddingCache: loaded {len(self._spill_index)} spilled embeddings")
+        except Exception as e:
+            print(f"EmbeddingCache: ignoring unreadable spill index: {e}")
+            self._spill_index = {}
+            self._spill_slots = []
+            self._spill_next = 0
+
+    def close(self) -> None:
+        """Flush in-memory entries and the spill index to disk (if spill enabled)."""
+        if not self.spill_dir:
+            return
+        with self._lock:
+            for key, vector in list(self._memory.items()):
+                self._spill_write(key, vector)
+            if self._spill is None:
+                return
+            self._spill.flush()
+            _, index_path = self._spill_paths()
+            with open(index_path, "w") as f:
+                json.dump({
+                    "dim": self._spill_dim,
+                    "spill_items": self.spill_items,
+                    "next": self._spill_next,
+                    "index": self._spill_index,
+                }, f)
+
+    def get_stats(self) -> dict:
+        """Get hit/miss counters and sizes."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "spill_hits": self.spill_hits,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "memory_items": len(self._memory),
+                "max_items": self.max_items,
+                "spill_items": len(self._spill_index),
+                "spill_enabled": bool(self.spill_dir),
+            }
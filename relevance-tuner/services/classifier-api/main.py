@@ -4,13 +4,15 @@ FastAPI service for news relevance classification and semantic search.
 """
 
 import logging
+import os
 from contextlib import asynccontextmanager
 from typing import Optional
 
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field
 
-from classifier import EmbeddingClassifier, VectorStore, DuplicateStore
+from classifier import EmbeddingClassifier, VectorStore, DuplicateStore, StagingArea
+from embedding_cache import EmbeddingCache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,15 +21,29 @@ logger = logging.getLogger(__name__)
 classifier: EmbeddingClassifier | None = None
 vector_store: VectorStore | None = None
 duplicate_store: DuplicateStore | None = None
+embedding_cache: EmbeddingCache | None = None
+# Embeddings computed by /ingest, waiting for /index/confirm
+staging_area = StagingArea(
+    ttl_seconds=int(os.environ.get("INGEST_STAGING_TTL", "1800")),
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Load classifier, vector store, and duplicate store on startup."""
-    global classifier, vector_store, duplicate_store
+    global classifier, vector_store, duplicate_store, embedding_cache
     logger.info("Loading embedding classifier...")
     try:
+        # Shared embedding cache: each (model, text) pair is embedded once and
+        # reused across /classify, /index and /find-duplicates
+        embedding_cache = EmbeddingCache(
+            max_items=int(os.environ.get("EMBEDDING_CACHE_SIZE", "20000")),
+            spill_dir=os.environ.get("EMBEDDING_CACHE_SPILL_DIR") or None,
+            spill_items=int(os.environ.get("EMBEDDING_CACHE_SPILL_SIZE", "200000")),
+        )
+
         classifier = EmbeddingClassifier.load("models/embedding_classifier_nomic-v2.pkl")
+        classifier.embedder.cache = embedding_cache
         info = classifier.get_info()
         logger.info(f"Classifier loaded: {info}")
 
@@ -44,6 +60,7 @@ async def lifespan(app: FastAPI):
         duplicate_store = DuplicateStore(
             persist_dir="/app/data/duplicatedb",
         )
+        duplicate_store.embedder.cache = embedding_cache
         logger.info(f"Duplicate store ready: {duplicate_store.get_stats()}")
 
         # Auto-sync: if duplicate store has fewer items than search store,
@@ -79,6 +96,8 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("Shutting down classifier service")
+    if embedding_cache is not None:
+        embedding_cache.close()
 
 
 app = FastAPI(
@@ -111,6 +130,16 @@ class ClassifyResponse(BaseModel):
     classifier_version: str | None = None  # Version for tracking
 
 
+class ClassifyBatchRequest(BaseModel):
+    """Request model for batch classification."""
+    items: list[ClassifyRequest]
+
+
+class ClassifyBatchResponse(BaseModel):
+    """Response model for batch classification (results in request order)."""
+    results: list[ClassifyResponse]
+
+
 class SearchRequest(BaseModel):
     """Request model for semantic search."""
     query: str
@@ -155,6 +184,24 @@ class DuplicateResponse(BaseModel):
     has_duplicates: bool
 
 
+class DuplicateBatchItem(BaseModel):
+    """One article in a batch duplicate search."""
+    title: str
+    content: str
+
+
+class DuplicateBatchRequest(BaseModel):
+    """Request model for batch duplicate search."""
+    items: list[DuplicateBatchItem]
+    threshold: float = 0.75
+    n_results: int = 5
+
+
+class DuplicateBatchResponse(BaseModel):
+    """Response model for batch duplicate search (results in request order)."""
+    results: list[list[SearchResult]]
+
+
 class IndexRequest(BaseModel):
     """Request model for indexing a single item."""
     id: str
@@ -174,6 +221,65 @@ class IndexResponse(BaseModel):
     total_in_store: int
 
 
+class IngestItem(BaseModel):
+    """Single item for combined ingest."""
+    title: str
+    content: str
+    source: str = ""
+
+
+class IngestRequest(BaseModel):
+    """Request model for combined classify + duplicate search + staging."""
+    items: list[IngestItem]
+    threshold: float = 0.75  # Duplicate similarity threshold (paraphrase model)
+    n_results: int = 5  # Top-k duplicate candidates per item
+    classify: bool = True
+
+
+class IngestResult(BaseModel):
+    """Per-item ingest result."""
+    classification: ClassifyResponse | None = None
+    duplicates: list[SearchResult] = []
+    index_handle: str
+
+
+class IngestResponse(BaseModel):
+    """Response model for ingest (results in request order)."""
+    results: list[IngestResult]
+
+
+class IndexConfirmItem(BaseModel):
+    """Staged item to index under its final database ID."""
+    handle: str
+    id: str
+    metadata: Optional[dict] = None
+
+
+class IndexConfirmRequest(BaseModel):
+    """Request model for confirming staged items."""
+    items: list[IndexConfirmItem]
+
+
+class IndexConfirmResponse(BaseModel):
+    """Response model for confirming staged items."""
+    indexed: int
+    missing_handles: list[str] = Field(
+        default_factory=list,
+        description="Handles that expired or were unknown; re-index these via /index/batch",
+    )
+    total_in_store: int
+
+
+class IndexDiscardRequest(BaseModel):
+    """Request model for dropping staged items that will not be indexed."""
+    handles: list[str]
+
+
+class IndexDiscardResponse(BaseModel):
+    """Response model for dropping staged items."""
+    discarded: int
+
+
 class HealthResponse(BaseModel):
     """Response model for health check."""
     status: str
@@ -193,6 +299,14 @@ class HealthResponse(BaseModel):
         description="Number of items indexed for duplicate detection (paraphrase embeddings)"
     )
     duplicate_model: str | None = None
+    embedding_cache: dict = Field(
+        default_factory=dict,
+        description="Shared embedding cache counters (hits, misses, hit_rate, sizes)"
+    )
+    staged_items: int = Field(
+        default=0,
+        description="Items embedded by /ingest still waiting for /index/confirm"
+    )
 
 
 class StorageSizeResponse(BaseModel):
@@ -244,6 +358,8 @@ async def health():
         search_index_items=vs_items,
         duplicate_index_items=ds_stats.get("total_items", 0),
         duplicate_model=ds_stats.get("model"),
+        embedding_cache=embedding_cache.get_stats() if embedding_cache else {},
+        staged_items=len(staging_area),
     )
 
 
@@ -271,6 +387,30 @@ async def classify(request: ClassifyRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/classify/batch", response_model=ClassifyBatchResponse)
+async def classify_batch(request: ClassifyBatchRequest):
+    """
+    Classify multiple news articles in one call.
+
+    Encodes all texts in a single embedder pass and runs the classifiers
+    on the stacked embedding matrix. Results are returned in request order.
+    """
+    if classifier is None:
+        raise HTTPException(status_code=503, detail="Classifier not loaded")
+
+    try:
+        results = classifier.predict_batch([
+            {"title": item.title, "content": item.content, "source": item.source}
+            for item in request.items
+        ])
+        for result in results:
+            result["classifier_version"] = classifier.VERSION
+        return ClassifyBatchResponse(results=[ClassifyResponse(**r) for r in results])
+    except Exception as e:
+        logger.error(f"Batch classification failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.post("/search", response_model=SearchResponse)
 async def search(request: SearchRequest):
     """
@@ -361,6 +501,31 @@ async def find_duplicates(request: DuplicateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/find-duplicates/batch", response_model=DuplicateBatchResponse)
+async def find_duplicates_batch(request: DuplicateBatchRequest):
+    """
+    Find semantic duplicates for multiple articles in one call.
+
+    Encodes all articles in a single pass and queries the duplicate index
+    once. Results are returned in request order.
+    """
+    if duplicate_store is None:
+        raise HTTPException(status_code=503, detail="Duplicate store not initialized")
+
+    try:
+        results = duplicate_store.find_duplicates_batch(
+            [{"title": item.title, "content": item.content} for item in request.items],
+            threshold=request.threshold,
+            n_results=request.n_results,
+        )
+        return DuplicateBatchResponse(
+            results=[[SearchResult(**r) for r in dups] for dups in results]
+        )
+    except Exception as e:
+        logger.error(f"Batch duplicate search failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.post("/index", response_model=IndexResponse)
 async def index_item(request: IndexRequest):
     """
@@ -436,6 +601,113 @@ async def index_batch(request: IndexBatchRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/ingest", response_model=IngestResponse)
+async def ingest(request: IngestRequest):
+    """
+    Classify, search duplicates and stage indexing for new items in one call.
+
+    Each text is embedded once per model: the nomic vectors feed the
+    classifier and are staged for the search index, the paraphrase vectors
+    drive the duplicate search and are staged for the duplicate index.
+    The returned index_handle is later passed to /index/confirm together
+    with the database ID, so indexing needs neither the text nor a re-embed.
+    """
+    if classifier is None or vector_store is None or duplicate_store is None:
+        raise HTTPException(status_code=503, detail="Classifier not loaded")
+
+    if not request.items:
+        return IngestResponse(results=[])
+
+    try:
+        texts = [f"{item.title} {item.content}" for item in request.items]
+        search_embeddings = classifier.embedder.encode(texts, show_progress_bar=False)
+        duplicate_embeddings = duplicate_store.embedder.encode(texts, show_progress_bar=False)
+
+        classifications: list[dict | None] = [None] * len(texts)
+        if request.classify:
+            classifications = classifier.predict_embeddings(search_embeddings)
+            for result in classifications:
+                result["classifier_version"] = classifier.VERSION
+
+        duplicates = duplicate_store.find_duplicates_by_embeddings(
+            duplicate_embeddings,
+            threshold=request.threshold,
+            n_results=request.n_results,
+        )
+
+        results = []
+        for i, item in enumerate(request.items):
+            handle = staging_area.stage(
+                title=item.title,
+                document=texts[i],
+                search_embedding=search_embeddings[i],
+                duplicate_embedding=duplicate_embeddings[i],
+            )
+            results.append(IngestResult(
+                classification=ClassifyResponse(**classifications[i]) if classifications[i] else None,
+                duplicates=[SearchResult(**d) for d in duplicates[i]],
+                index_handle=handle,
+            ))
+
+        return IngestResponse(results=results)
+    except Exception as e:
+        logger.error(f"Ingest failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/index/confirm", response_model=IndexConfirmResponse)
+async def index_confirm(request: IndexConfirmRequest):
+    """
+    Index items staged by /ingest under their database IDs.
+
+    Unknown or expired handles are reported back so the caller can fall
+    back to /index/batch for those items.
+    """
+    if vector_store is None or duplicate_store is None:
+        raise HTTPException(status_code=503, detail="Vector store not initialized")
+
+    try:
+        search_items = []
+        duplicate_items = []
+        missing = []
+        for item in request.items:
+            staged = staging_area.pop(item.handle)
+            if staged is None:
+                missing.append(item.handle)
+                continue
+            base = {
+                "id": item.id,
+                "title": staged["title"],
+                "document": staged["document"],
+                "metadata": item.metadata,
+            }
+            search_items.append({**base, "embedding": staged["search_embedding"].tolist()})
+            duplicate_items.append({**base, "embedding": staged["duplicate_embedding"].tolist()})
+
+        added = vector_store.add_embeddings_batch(search_items)
+        duplicate_store.add_embeddings_batch(duplicate_items)
+
+        return IndexConfirmResponse(
+            indexed=added,
+            missing_handles=missing,
+            total_in_store=vector_store.get_stats()["total_items"],
+        )
+    except Exception as e:
+        logger.error(f"Index confirm failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/index/discard", response_model=IndexDiscardResponse)
+async def index_discard(request: IndexDiscardRequest):
+    """
+    Drop items staged by /ingest that the backend did not store.
+
+    Duplicates and items rejected by the pipeline never get confirmed;
+    discarding them frees the staged vectors before they expire.
+    """
+    return IndexDiscardResponse(discarded=staging_area.discard(request.handles))
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API info."""
@@ -447,11 +719,16 @@ async def root():
             "/storage": "Storage sizes for search and duplicate indexes (GET)",
             "/sync-duplicate-store": "Sync search index to duplicate index (POST)",
             "/classify": "Classify article relevance (POST)",
+            "/classify/batch": "Classify multiple articles in one pass (POST)",
             "/search": "Semantic search in search index (POST)",
             "/similar": "Find similar articles (POST)",
             "/find-duplicates": "Find duplicate articles using paraphrase embeddings (POST)",
+            "/find-duplicates/batch": "Find duplicates for multiple articles in one pass (POST)",
             "/index": "Index single article to both indexes (POST)",
             "/index/batch": "Batch index articles to both indexes (POST)",
+            "/ingest": "Classify + duplicate search + stage indexing in one call (POST)",
+            "/index/confirm": "Index items staged by /ingest under their IDs (POST)",
+            "/index/discard": "Drop items staged by /ingest that were not stored (POST)",
         },
         "indexes": {
             "search_index": "ChromaDB with nomic embeddings for semantic search",